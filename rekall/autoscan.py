@@ -5,15 +5,28 @@ This module handles automatic periodic scanning of non-Claude connectors
 
 Claude URLs are captured in real-time via PostToolUse hook, but other
 CLIs require periodic scanning of their history files.
+
+Due scans run in a detached subprocess (`python -m rekall.autoscan`) so the
+command that triggered them returns immediately. A lock file next to the
+database keeps a single background scan per database; progress and timing
+are recorded in connector_imports.
 """
 
 from __future__ import annotations
 
+import argparse
+import os
+import site
+import subprocess
+import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
+    from rekall.connectors.base import BaseConnector
     from rekall.db import Database
 
 
@@ -25,9 +38,11 @@ class ScanResult:
     success: bool
     imported: int = 0
     quarantined: int = 0
+    duplicates: int = 0  # URLs already in the inbox for their conversation
     skipped: bool = False  # True if scan was skipped (not due yet)
     error: Optional[str] = None
     last_marker: Optional[str] = None
+    duration_ms: Optional[int] = None
 
 
 @dataclass
@@ -100,7 +115,6 @@ def scan_connector(
         ScanResult with import statistics
     """
     from rekall.connectors import get_connector
-    from rekall.models import ConnectorImport, InboxEntry, generate_ulid
 
     # Check if scan needed
     if not force and not needs_scan(db, connector_name, interval_hours):
@@ -126,66 +140,111 @@ def scan_connector(
             error=f"Connector '{connector_name}' not available (no history found)",
         )
 
-    # Get last import marker for CDC
-    import_record = db.get_connector_import(connector_name)
-    since_marker = import_record.last_file_marker if import_record else None
+    # Record progress (shown by `rekall sources stats`)
+    started_at = datetime.now()
+    start = time.perf_counter()
+    db.set_connector_scan_status(connector_name, "running", started_at=started_at)
 
-    # Extract URLs
+    # Everything after "running" records a failure, or the status would
+    # stay "running" (and the scan look stuck) after an error
     try:
-        extraction = connector.extract_urls(since_marker=since_marker)
+        return _run_scan(db, connector, connector_name, started_at, start)
     except Exception as e:
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        db.set_connector_scan_status(
+            connector_name,
+            "failed",
+            finished_at=datetime.now(),
+            duration_ms=duration_ms,
+            error=str(e),
+        )
         return ScanResult(
             connector=connector_name,
             success=False,
             error=str(e),
+            duration_ms=duration_ms,
         )
 
+
+def _run_scan(
+    db: "Database",
+    connector: "BaseConnector",
+    connector_name: str,
+    started_at: datetime,
+    start: float,
+) -> ScanResult:
+    """Extract and import the new URLs of a connector (errors propagate)."""
+    from rekall.models import ConnectorImport, InboxEntry, generate_ulid
+
+    # Get last import record and per-file read positions for CDC
+    import_record = db.get_connector_import(connector_name)
+    since_marker = import_record.last_file_marker if import_record else None
+    manifest = db.get_connector_files(connector_name)
+
+    # Extract URLs (only what was appended since the last scan)
+    extraction = connector.extract_urls(manifest=manifest)
+
     # Import to inbox
-    imported = 0
-    quarantined = 0
+    # Validate in one batch: each distinct hostname is resolved once
+    validations = connector.validate_urls([extracted.url for extracted in extraction.urls])
+    entries = []
     for extracted in extraction.urls:
-        is_valid, error = connector.validate_url(extracted.url)
-
-        entry = InboxEntry(
-            id=generate_ulid(),
-            url=extracted.url,
-            domain=extracted.domain,
-            cli_source=connector_name,
-            project=extracted.project,
-            conversation_id=extracted.conversation_id,
-            user_query=extracted.user_query,
-            assistant_snippet=extracted.assistant_snippet,
-            surrounding_text=extracted.surrounding_text,
-            captured_at=extracted.captured_at,
-            import_source="autoscan",
-            raw_json=extracted.raw_json,
-            is_valid=is_valid,
-            validation_error=error,
+        is_valid, error = validations[extracted.url]
+
+        entries.append(
+            InboxEntry(
+                id=generate_ulid(),
+                url=extracted.url,
+                domain=extracted.domain,
+                cli_source=connector_name,
+                project=extracted.project,
+                conversation_id=extracted.conversation_id,
+                user_query=extracted.user_query,
+                assistant_snippet=extracted.assistant_snippet,
+                surrounding_text=extracted.surrounding_text,
+                captured_at=extracted.captured_at,
+                import_source="autoscan",
+                raw_json=extracted.raw_json,
+                is_valid=is_valid,
+                validation_error=error,
+            )
         )
-        db.add_inbox_entry(entry)
 
-        if is_valid:
-            imported += 1
-        else:
-            quarantined += 1
+    # One transaction per scan: inbox rows, CDC positions and import record
+    with db.transaction():
+        imported = db.add_inbox_entries([e for e in entries if e.is_valid])
+        quarantined = db.add_inbox_entries([e for e in entries if not e.is_valid])
 
-    # Update CDC marker
-    now = datetime.now()
-    new_record = ConnectorImport(
-        connector=connector_name,
-        last_import=now,
-        last_file_marker=extraction.last_file_marker or since_marker,
-        entries_imported=(import_record.entries_imported if import_record else 0) + imported,
-        errors_count=(import_record.errors_count if import_record else 0) + len(extraction.errors),
-    )
-    db.upsert_connector_import(new_record)
+        # Update CDC positions once the URLs are in the inbox
+        db.upsert_connector_files(extraction.file_states)
+        db.delete_connector_files(connector_name, extraction.stale_files)
+
+        now = datetime.now()
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        new_record = ConnectorImport(
+            connector=connector_name,
+            last_import=now,
+            last_file_marker=extraction.last_file_marker or since_marker,
+            entries_imported=(import_record.entries_imported if import_record else 0) + imported,
+            errors_count=(
+                (import_record.errors_count if import_record else 0) + len(extraction.errors)
+            ),
+            scan_status="idle",
+            scan_started_at=started_at,
+            scan_finished_at=now,
+            last_duration_ms=duration_ms,
+            last_imported=imported,
+        )
+        db.upsert_connector_import(new_record)
 
     return ScanResult(
         connector=connector_name,
         success=True,
         imported=imported,
         quarantined=quarantined,
+        duplicates=len(entries) - imported - quarantined,
         last_marker=extraction.last_file_marker,
+        duration_ms=duration_ms,
     )
 
 
@@ -240,7 +299,95 @@ def autoscan(
     return result
 
 
-def autoscan_if_needed(db: "Database") -> Optional[AutoscanResult]:
+def autoscan_lock_path(db_path: Path) -> Path:
+    """Lock file of the background autoscan for a database."""
+    db_path = Path(db_path)
+    return db_path.with_name(db_path.name + ".autoscan.lock")
+
+
+def is_background_scan_running(db_path: Path) -> bool:
+    """Check if a background autoscan currently holds the lock."""
+    from rekall.filelock import FileLock
+
+    return FileLock(autoscan_lock_path(db_path)).is_held()
+
+
+def _child_env() -> dict[str, str]:
+    """Environment of the detached autoscan process.
+
+    An installed rekall is importable as is. From a source checkout, the
+    checkout is prepended to PYTHONPATH so the child imports this same
+    rekall; the parent's PYTHONPATH is otherwise left untouched.
+    """
+    env = os.environ.copy()
+    package_root = Path(__file__).resolve().parent.parent
+    site_dirs = {Path(p).resolve() for p in site.getsitepackages()}
+    if site.ENABLE_USER_SITE:
+        site_dirs.add(Path(site.getusersitepackages()).resolve())
+    if package_root not in site_dirs:
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (str(package_root), env.get("PYTHONPATH")) if p
+        )
+    return env
+
+
+def launch_background_autoscan(
+    db_path: Path,
+    connectors: list[str],
+    interval_hours: float,
+) -> Optional[int]:
+    """Start a detached autoscan process and return without waiting.
+
+    Args:
+        db_path: Database to import into
+        connectors: Connectors to scan (only the due ones are scanned)
+        interval_hours: Hours between scans
+
+    Returns:
+        PID of the started process, None if a scan or a watcher
+        (`rekall sources watch`, which scans on its own) is already running,
+        or if the process could not be started
+    """
+    from rekall.watcher import is_watcher_running
+
+    if is_background_scan_running(db_path) or is_watcher_running(db_path):
+        return None
+
+    cmd = [
+        sys.executable,
+        "-m",
+        "rekall.autoscan",
+        "--db",
+        str(db_path),
+        "--interval",
+        str(interval_hours),
+        *connectors,
+    ]
+
+    kwargs: dict = {
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+        "close_fds": True,
+        "env": _child_env(),
+    }
+    if os.name == "nt":
+        kwargs["creationflags"] = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:
+        kwargs["start_new_session"] = True
+
+    try:
+        return subprocess.Popen(cmd, **kwargs).pid
+    except OSError:
+        return None
+
+
+def autoscan_if_needed(
+    db: "Database",
+    background: Optional[bool] = None,
+) -> Optional[AutoscanResult]:
     """Run auto-scan if enabled and needed.
 
     This is the main entry point for automatic scanning.
@@ -248,9 +395,11 @@ def autoscan_if_needed(db: "Database") -> Optional[AutoscanResult]:
 
     Args:
         db: Database instance
+        background: Scan in a detached process (uses config if None)
 
     Returns:
-        AutoscanResult if scan was performed, None if disabled or all skipped
+        AutoscanResult if scan was performed, None if disabled, all skipped
+        or launched in the background
     """
     from rekall.config import get_autoscan_config
 
@@ -260,13 +409,51 @@ def autoscan_if_needed(db: "Database") -> Optional[AutoscanResult]:
         return None
 
     # Check if any connector needs scanning
-    any_needed = any(
-        needs_scan(db, connector, config.interval_hours)
+    due = [
+        connector
         for connector in config.connectors
-    )
+        if needs_scan(db, connector, config.interval_hours)
+    ]
+
+    if not due:
+        return None
 
-    if not any_needed:
+    if background is None:
+        background = config.background
+    if background:
+        launch_background_autoscan(db.db_path, due, config.interval_hours)
         return None
 
     # Run autoscan (will skip connectors that don't need it)
     return autoscan(db)
+
+
+def _run_background(argv: Optional[list[str]] = None) -> int:
+    """Entry point of the detached autoscan process."""
+    from rekall.db import Database
+    from rekall.filelock import FileLock
+
+    parser = argparse.ArgumentParser(prog="python -m rekall.autoscan")
+    parser.add_argument("--db", required=True, type=Path, help="Database path")
+    parser.add_argument("--interval", type=float, default=5.0, help="Hours between scans")
+    parser.add_argument("connectors", nargs="+", help="Connectors to scan")
+    args = parser.parse_args(argv)
+
+    lock = FileLock(autoscan_lock_path(args.db))
+    if not lock.acquire():
+        return 0  # Another background scan is running
+
+    try:
+        db = Database(args.db)
+        db.init()
+        try:
+            autoscan(db, connectors=args.connectors, interval_hours=args.interval)
+        finally:
+            db.close()
+    finally:
+        lock.release()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_run_background())
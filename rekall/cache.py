@@ -5,10 +5,13 @@ Feature 020: Performance optimization for semantic search.
 
 from __future__ import annotations
 
+import functools
 import logging
+import threading
 from collections import OrderedDict
+from collections.abc import Callable
 from time import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     import numpy as np
@@ -16,6 +19,19 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _locked(method: _F) -> _F:
+    """Serialize a cache method on the instance lock (thread safety)."""
+
+    @functools.wraps(method)
+    def wrapper(self: EmbeddingCache, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class EmbeddingCache:
     """LRU cache for embedding vectors with TTL and invalidation support.
@@ -25,6 +41,7 @@ class EmbeddingCache:
     - TTL-based expiration (lazy eviction on access)
     - Selective invalidation on entry modification
     - Batch retrieval as numpy matrix for vectorized operations
+    - Thread safety (MCP server worker threads share the cache)
 
     Attributes:
         maxsize: Maximum number of entries in cache
@@ -47,6 +64,12 @@ class EmbeddingCache:
         self._matrix_ids: list[str] | None = None
         self._matrix_valid: bool = False
 
+        # Identifies which encoder produced the cached vectors
+        self._namespace: str | None = None
+
+        self._lock = threading.RLock()
+
+    @_locked
     def get(self, entry_id: str) -> Any:
         """Get a cached embedding vector.
 
@@ -74,6 +97,7 @@ class EmbeddingCache:
         self._cache.move_to_end(entry_id)
         return vec
 
+    @_locked
     def put(self, entry_id: str, vector: Any) -> None:
         """Add or update a cached embedding vector.
 
@@ -102,6 +126,7 @@ class EmbeddingCache:
         # Add new entry
         self._cache[entry_id] = (vector.astype(np.float32), time())
 
+    @_locked
     def invalidate(self, entry_id: str) -> bool:
         """Remove a specific entry from cache.
 
@@ -120,6 +145,7 @@ class EmbeddingCache:
             return True
         return False
 
+    @_locked
     def clear(self) -> None:
         """Clear all cached entries."""
         self._cache.clear()
@@ -128,6 +154,25 @@ class EmbeddingCache:
         self._matrix_valid = False
         logger.debug("Cache cleared")
 
+    @_locked
+    def bind_namespace(self, namespace: str) -> None:
+        """Bind the cache to the encoder producing its vectors.
+
+        Clears the cache when the namespace changes, so vectors from
+        different encoders are never mixed in the same matrix.
+
+        Args:
+            namespace: Encoder identifier (e.g. "neural:384", "hashing:384")
+        """
+        if self._namespace == namespace:
+            return
+        if self._namespace is not None and self._cache:
+            logger.debug("Cache namespace changed (%s -> %s), clearing",
+                         self._namespace, namespace)
+            self.clear()
+        self._namespace = namespace
+
+    @_locked
     def get_all_as_matrix(self) -> tuple[Any, list[str]] | None:
         """Get all cached vectors as a single numpy matrix.
 
@@ -180,17 +225,18 @@ class EmbeddingCache:
         return entry_id in self._cache
 
     @property
-    def stats(self) -> dict[str, int | bool]:
+    def stats(self) -> dict[str, int | bool | str | None]:
         """Get cache statistics.
 
         Returns:
-            Dict with size, maxsize, ttl, matrix_valid
+            Dict with size, maxsize, ttl, matrix_valid, namespace
         """
         return {
             "size": len(self._cache),
             "maxsize": self.maxsize,
             "ttl": self.ttl,
             "matrix_valid": self._matrix_valid,
+            "namespace": self._namespace,
         }
 
 
@@ -225,6 +271,12 @@ def get_embedding_cache(
     return _embedding_cache
 
 
+def clear_embedding_cache() -> None:
+    """Clear the global embedding cache if it exists (without creating it)."""
+    if _embedding_cache is not None:
+        _embedding_cache.clear()
+
+
 def reset_embedding_cache() -> None:
     """Reset the global embedding cache (for testing)."""
     global _embedding_cache
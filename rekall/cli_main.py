@@ -462,19 +462,19 @@ def search(
             console.print("[dim]Install with: pip install sentence-transformers numpy[/dim]")
             raise typer.Exit(1)
 
-        sem_results = service.semantic_search(query, db, context=context, limit=limit)
+        sem_results = service.semantic_search(
+            query, db,
+            context=context,
+            limit=limit,
+            entry_type=entry_type,
+            project=project,
+            memory_type=memory_type,
+        )
 
         # Convert to SearchResult-like format for unified processing
         from rekall.db import SearchResult
         results = []
         for entry, score in sem_results:
-            # Apply filters
-            if entry_type and entry.type != entry_type:
-                continue
-            if project and entry.project != project:
-                continue
-            if memory_type and entry.memory_type != memory_type:
-                continue
             results.append(SearchResult(entry=entry, rank=None))
             semantic_scores[entry.id] = score
 
@@ -3055,13 +3055,15 @@ def sources_list_themes(
 
 @sources_app.command("stats")
 def sources_stats():
-    """Show global source statistics.
+    """Show global source statistics and connector scan progress.
 
     Examples:
         rekall sources stats
     """
     import json
 
+    from rekall.autoscan import is_background_scan_running
+
     db = get_db()
 
     # Total counts
@@ -3092,6 +3094,23 @@ def sources_stats():
         "SELECT COUNT(*) FROM sources WHERE status = 'inaccessible'"
     ).fetchone()[0]
 
+    # Connector scans (progress and timing of the last run)
+    def _iso(value):
+        return value.isoformat(timespec="seconds") if value else None
+
+    scans = {
+        record.connector: {
+            "status": record.scan_status,
+            "started_at": _iso(record.scan_started_at),
+            "finished_at": _iso(record.scan_finished_at),
+            "duration_ms": record.last_duration_ms,
+            "last_imported": record.last_imported,
+            "total_imported": record.entries_imported,
+            "last_error": record.last_error,
+        }
+        for record in db.list_connector_imports()
+    }
+
     result = {
         "total_sources": total,
         "seeds": seeds,
@@ -3101,6 +3120,8 @@ def sources_stats():
         "avg_score": round(avg_score, 1),
         "themes_count": themes_count,
         "inaccessible": inaccessible,
+        "background_scan_running": is_background_scan_running(db.db_path),
+        "scans": scans,
     }
     console.print(json.dumps(result, indent=2))
 
@@ -3404,7 +3425,20 @@ def sources_add_theme(
 
 
 @app.command("mcp-server")
-def mcp_server():
+def mcp_server(
+    transport: str = typer.Option(
+        "stdio", "--transport", "-t",
+        help="stdio (one client), http (streamable HTTP) or sse",
+    ),
+    host: str = typer.Option("127.0.0.1", "--host", help="HTTP bind host"),
+    port: int = typer.Option(8765, "--port", "-p", help="HTTP bind port"),
+    socket_path: Optional[str] = typer.Option(
+        None, "--socket", help="Serve HTTP on a unix socket instead of host/port"
+    ),
+    stats: bool = typer.Option(
+        False, "--stats", help="Show latency stats of running servers and exit"
+    ),
+):
     """Start the MCP (Model Context Protocol) server.
 
     Provides AI agent tools for interacting with Rekall:
@@ -3425,15 +3459,35 @@ def mcp_server():
             }
         }
 
+    With --transport http, one warm server (model, caches) is shared by
+    every local client; point them at http://127.0.0.1:8765/mcp.
+
     Examples:
         rekall mcp-server
+        rekall mcp-server --transport http --port 8765
+        rekall mcp-server --transport sse --socket /tmp/rekall.sock
+        rekall mcp-server --stats
     """
     import asyncio
 
+    if stats:
+        _show_mcp_stats()
+        return
+
     from rekall.mcp_server import MCPNotAvailable, run_server
 
+    if transport not in ("stdio", "http", "sse"):
+        console.print(f"[red]Error: unknown transport '{transport}' (stdio, http, sse)[/red]")
+        raise typer.Exit(1)
+
+    if transport != "stdio":
+        where = socket_path or f"http://{host}:{port}/{'mcp' if transport == 'http' else 'sse'}"
+        console.print(f"[dim]Rekall MCP server ({transport}) on {where}[/dim]")
+
     try:
-        asyncio.run(run_server())
+        asyncio.run(run_server(
+            transport=transport, host=host, port=port, socket_path=socket_path,
+        ))
     except MCPNotAvailable as e:
         console.print(f"[red]Error: {e}[/red]")
         console.print("[dim]Install with: pip install mcp[/dim]")
@@ -3442,6 +3496,56 @@ def mcp_server():
         console.print("\n[yellow]MCP server stopped.[/yellow]")
 
 
+def _show_mcp_stats() -> None:
+    """Print the latency snapshots written by running MCP servers."""
+    import time
+
+    from rich.table import Table
+
+    from rekall.metrics import read_snapshots
+
+    snapshots = read_snapshots(get_config().paths.cache_dir)
+    if not snapshots:
+        console.print("[dim]No running MCP server found.[/dim]")
+        return
+
+    for snapshot in snapshots:
+        age = time.time() - snapshot.get("updated_at", time.time())
+        uptime = int(time.time() - snapshot.get("started_at", time.time()))
+        table = Table(
+            title=(
+                f"MCP server pid {snapshot['pid']} ({snapshot.get('transport', '?')}) "
+                f"- up {uptime // 60}m, updated {age:.0f}s ago"
+            )
+        )
+        table.add_column("Stage")
+        for column in ("Count", "Errors", "p50 ms", "p95 ms", "p99 ms", "Max ms"):
+            table.add_column(column, justify="right")
+
+        for name, m in (snapshot.get("metrics") or {}).items():
+            errors = f"{m['errors']} ({m['error_rate']:.0%})" if m["errors"] else "0"
+            table.add_row(
+                name, str(m["count"]), errors,
+                f"{m['p50_ms']:.2f}", f"{m['p95_ms']:.2f}",
+                f"{m['p99_ms']:.2f}", f"{m['max_ms']:.2f}",
+            )
+        console.print(table)
+
+        cache = snapshot.get("response_cache")
+        if cache:
+            console.print(
+                f"  Response cache: {cache['hits']} hits / {cache['misses']} misses "
+                f"(hit rate {cache['hit_rate']:.0%}), {cache['size']}/{cache['maxsize']} entries"
+            )
+        dispatcher = snapshot.get("dispatcher")
+        if dispatcher:
+            console.print(
+                f"  Workers: {dispatcher['workers']} + {dispatcher['slow_workers']} slow, "
+                f"{dispatcher['cancelled']} cancelled calls"
+            )
+        console.print()
+
+
 # ============================================================================
 # Sources Medallion - Inbox Commands (Feature 013)
 # ============================================================================
@@ -3520,14 +3624,16 @@ def inbox_import(
         console.print(json.dumps(result, indent=2))
         raise typer.Exit(2)
 
-    # Get last import marker for CDC
+    # Get last import record for CDC: an explicit --since marker replaces
+    # the per-file read positions
     import_record = db.get_connector_import(cli)
-    effective_since = since or (import_record.last_file_marker if import_record else None)
+    manifest = None if since else db.get_connector_files(cli)
 
     # Extract URLs
     extraction = connector.extract_urls(
-        since_marker=effective_since,
+        since_marker=since,
         project_filter=project,
+        manifest=manifest,
     )
 
     if dry_run:
@@ -3546,54 +3652,61 @@ def inbox_import(
         return
 
     # Import to inbox
-    imported = 0
-    quarantined = 0
+    # Validate in one batch: each distinct hostname is resolved once
+    validations = connector.validate_urls([extracted.url for extracted in extraction.urls])
+    entries = []
     for extracted in extraction.urls:
-        is_valid, error = connector.validate_url(extracted.url)
-
-        entry = InboxEntry(
-            id=generate_ulid(),
-            url=extracted.url,
-            domain=extracted.domain,
-            cli_source=cli,
-            project=extracted.project,
-            conversation_id=extracted.conversation_id,
-            user_query=extracted.user_query,
-            assistant_snippet=extracted.assistant_snippet,
-            surrounding_text=extracted.surrounding_text,
-            captured_at=extracted.captured_at,
-            import_source="history_import",
-            raw_json=extracted.raw_json,
-            is_valid=is_valid,
-            validation_error=error,
+        is_valid, error = validations[extracted.url]
+
+        entries.append(
+            InboxEntry(
+                id=generate_ulid(),
+                url=extracted.url,
+                domain=extracted.domain,
+                cli_source=cli,
+                project=extracted.project,
+                conversation_id=extracted.conversation_id,
+                user_query=extracted.user_query,
+                assistant_snippet=extracted.assistant_snippet,
+                surrounding_text=extracted.surrounding_text,
+                captured_at=extracted.captured_at,
+                import_source="history_import",
+                raw_json=extracted.raw_json,
+                is_valid=is_valid,
+                validation_error=error,
+            )
         )
-        db.add_inbox_entry(entry)
-
-        if is_valid:
-            imported += 1
-        else:
-            quarantined += 1
-
-    # Update CDC marker
-    if extraction.last_file_marker:
-        from datetime import datetime
 
-        from rekall.models import ConnectorImport
-
-        new_record = ConnectorImport(
-            connector=cli,
-            last_import=datetime.now(),
-            last_file_marker=extraction.last_file_marker,
-            entries_imported=(import_record.entries_imported if import_record else 0) + imported,
-            errors_count=(import_record.errors_count if import_record else 0) + len(extraction.errors),
-        )
-        db.upsert_connector_import(new_record)
+    # One transaction: inbox rows (duplicates skipped), CDC positions and marker
+    with db.transaction():
+        imported = db.add_inbox_entries([e for e in entries if e.is_valid])
+        quarantined = db.add_inbox_entries([e for e in entries if not e.is_valid])
+
+        db.upsert_connector_files(extraction.file_states)
+        db.delete_connector_files(cli, extraction.stale_files)
+        if extraction.last_file_marker:
+            from dataclasses import replace
+            from datetime import datetime
+
+            from rekall.models import ConnectorImport
+
+            # Keep the autoscan progress fields of an existing record
+            record = import_record or ConnectorImport(connector=cli)
+            new_record = replace(
+                record,
+                last_import=datetime.now(),
+                last_file_marker=extraction.last_file_marker,
+                entries_imported=record.entries_imported + imported,
+                errors_count=record.errors_count + len(extraction.errors),
+            )
+            db.upsert_connector_import(new_record)
 
     result = {
         "status": "success",
         "connector": cli,
         "imported": imported,
         "quarantined": quarantined,
+        "duplicates": len(entries) - imported - quarantined,
         "files_processed": extraction.files_processed,
         "errors": extraction.errors[:5] if extraction.errors else [],
         "last_marker": extraction.last_file_marker,
@@ -3676,12 +3789,12 @@ def inbox_add(
         is_valid=is_valid,
         validation_error=error,
     )
-    db.add_inbox_entry(entry)
+    added = db.add_inbox_entries([entry])
 
     if not quiet:
         result = {
-            "status": "success",
-            "id": entry.id,
+            "status": "success" if added else "duplicate",
+            "id": entry.id if added else None,
             "url": url,
             "domain": domain,
             "is_valid": is_valid,
@@ -3923,16 +4036,25 @@ def staging_enrich(
         "-t",
         help="Timeout in seconds for each URL fetch",
     ),
+    concurrency: Optional[int] = typer.Option(
+        None,
+        "--concurrency",
+        "-j",
+        help="Concurrent fetches (default: performance.enrich_concurrency)",
+    ),
 ):
     """Enrich inbox URLs with metadata and move to staging.
 
     Fetches metadata (title, description) from URLs in the inbox
-    and creates/updates staging entries.
+    and creates/updates staging entries. URLs are fetched concurrently,
+    with per-host limits (performance.enrich_per_host and
+    performance.enrich_host_delay_ms).
 
     Examples:
         rekall sources staging enrich
         rekall sources staging enrich --batch 100
         rekall sources staging enrich --timeout 5
+        rekall sources staging enrich --batch 500 -j 32
     """
     import asyncio
     import json
@@ -3942,7 +4064,9 @@ def staging_enrich(
     db = get_db()
 
     # Run async enrichment
-    batch_result = asyncio.run(enrich_inbox_entries(db, limit=batch, timeout=timeout))
+    batch_result = asyncio.run(
+        enrich_inbox_entries(db, limit=batch, timeout=timeout, concurrency=concurrency)
+    )
 
     result = {
         "status": "success",
@@ -4460,6 +4584,92 @@ def sources_scan(
     console.print(json.dumps(output, indent=2))
 
 
+@sources_app.command("watch")
+def sources_watch(
+    connector: str = typer.Option(
+        None,
+        "--connector",
+        "-c",
+        help="Watch specific connector only (default: all configured)",
+    ),
+    debounce: float = typer.Option(
+        2.0,
+        "--debounce",
+        help="Seconds of quiet after a write before scanning",
+    ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Poll directories instead of using inotify",
+    ),
+    poll_interval: float = typer.Option(
+        2.0,
+        "--poll-interval",
+        help="Seconds between directory polls (with --poll or without inotify)",
+    ),
+):
+    """Watch connector history and import new URLs as they are written.
+
+    Runs until interrupted. Each burst of writes triggers an incremental
+    scan of the changed connectors a few seconds later, so URLs reach the
+    inbox without waiting for the autoscan interval. Only one watcher can
+    run per database.
+
+    Examples:
+        rekall sources watch              # Watch configured connectors
+        rekall sources watch -c cursor    # Watch only Cursor
+        rekall sources watch --poll       # Polling fallback (network drives)
+    """
+    import json
+    from datetime import datetime
+
+    from rekall.config import get_autoscan_config
+    from rekall.watcher import SourcesWatcher, acquire_watch_lock, create_watcher
+
+    db = get_db()
+    connectors = [connector] if connector else get_autoscan_config().connectors
+
+    try:
+        lock = acquire_watch_lock(db.db_path)
+    except BlockingIOError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    def report(results):
+        for r in results:
+            if r.success and not r.imported and not r.quarantined:
+                continue
+            line = {
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "connector": r.connector,
+                "success": r.success,
+                "imported": r.imported,
+                "quarantined": r.quarantined,
+                "error": r.error,
+            }
+            console.print(json.dumps(line), soft_wrap=True)
+
+    watcher = create_watcher(polling=poll, poll_interval=poll_interval)
+    daemon = SourcesWatcher(
+        db,
+        connectors,
+        debounce=debounce,
+        watcher=watcher,
+        on_scan=report,
+    )
+    console.print(
+        f"[dim]Watching {', '.join(connectors)} "
+        f"({type(watcher).__name__}, Ctrl+C to stop)[/dim]"
+    )
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+        lock.release()
+
+
 @sources_app.command("autoscan-config")
 def sources_autoscan_config(
     show: bool = typer.Option(True, "--show/--no-show", help="Show current configuration"),
@@ -4504,6 +4714,7 @@ def sources_autoscan_config(
             "enabled": config.enabled,
             "interval_hours": config.interval_hours,
             "connectors": config.connectors,
+            "background": config.background,
         }
         if updates_made:
             output["status"] = "updated"
@@ -47,7 +47,7 @@ class Config:
 
     # Smart embeddings settings (local all-MiniLM-L6-v2)
     smart_embeddings_enabled: bool = False  # Enable semantic features
-    smart_embeddings_model: str = "all-MiniLM-L6-v2"  # sentence-transformers model
+    smart_embeddings_model: str = "all-MiniLM-L6-v2"  # sentence-transformers model, or "hashing"
     smart_embeddings_dimensions: int = 384  # Matryoshka: 128, 384, or 768
     smart_embeddings_similarity_threshold: float = 0.75  # Min similarity for suggestions
     smart_embeddings_context_mode: str = "required"  # required | recommended | optional (Feature 007)
@@ -73,12 +73,29 @@ class Config:
     autoscan_enabled: bool = True  # Enable periodic auto-scan
     autoscan_interval_hours: float = 5.0  # Hours between auto-scans
     autoscan_connectors: str = "cursor"  # Comma-separated list of connectors to scan
+    autoscan_background: bool = True  # Run due scans in a detached process
 
     # Performance settings (Feature 020)
     perf_cache_max_size: int = 1000  # Max entries in embedding cache
     perf_cache_ttl_seconds: int = 600  # Cache TTL (10 min default)
     perf_model_idle_timeout_minutes: int = 10  # Unload model after N minutes idle
+    perf_memory_budget_mb: int = 0  # Unload model + vector caches above this RSS (0 = off)
+    perf_model_monitor_interval_seconds: int = 30  # Idle/memory checks in long-running processes
     perf_vector_backend: str = "auto"  # "auto", "sqlite-vec", "numpy"
+    perf_encode_batch_size: int = 32  # Max texts per batched forward pass (MCP server)
+    perf_encode_batch_wait_ms: float = 2.0  # Window to gather concurrent encode requests
+    perf_mcp_workers: int = 8  # MCP server threads for regular tool calls
+    perf_mcp_slow_workers: int = 2  # MCP server threads for long jobs (link checks, ...)
+    perf_mcp_response_cache_size: int = 512  # Cached read-only tool responses (0 = off)
+    perf_mcp_cursor_ttl_seconds: int = 300  # Lifetime of stored ranked lists behind cursors
+    perf_mcp_cursor_window: int = 100  # Max ranked results kept for cursor pagination
+    perf_mcp_warmup: bool = True  # Load DB pages, model and vectors in the background at start
+    perf_mcp_session_store: str = "memory"  # Mode 2 auto-capture sessions: "memory" or "sqlite"
+    perf_mcp_session_max_bytes: int = 4 * 1024 * 1024  # Budget of stored sessions (LRU eviction)
+    perf_scan_workers: int = 0  # Processes for large connector scans (0 = CPU count, 1 = off)
+    perf_enrich_concurrency: int = 16  # Concurrent URL fetches in `staging enrich`
+    perf_enrich_per_host: int = 2  # Concurrent fetches per host
+    perf_enrich_host_delay_ms: int = 250  # Minimum delay between requests to a host
 
     # Debug settings (Feature 022 - Open Core)
     debug_backends: bool = False  # Enable verbose logging for backend operations
@@ -275,6 +292,8 @@ def apply_toml_config(config: Config) -> Config:
         config.autoscan_interval_hours = float(autoscan["interval_hours"])
     if "connectors" in autoscan:
         config.autoscan_connectors = str(autoscan["connectors"])
+    if "background" in autoscan:
+        config.autoscan_background = bool(autoscan["background"])
 
     # Apply performance settings if present (Feature 020)
     perf = toml_data.get("performance", {})
@@ -284,10 +303,44 @@ def apply_toml_config(config: Config) -> Config:
         config.perf_cache_ttl_seconds = int(perf["cache_ttl_seconds"])
     if "model_idle_timeout_minutes" in perf:
         config.perf_model_idle_timeout_minutes = int(perf["model_idle_timeout_minutes"])
+    if "memory_budget_mb" in perf:
+        config.perf_memory_budget_mb = int(perf["memory_budget_mb"])
+    if "model_monitor_interval_seconds" in perf:
+        config.perf_model_monitor_interval_seconds = int(perf["model_monitor_interval_seconds"])
     if "vector_backend" in perf:
         backend = perf["vector_backend"]
         if backend in ("auto", "sqlite-vec", "numpy"):
             config.perf_vector_backend = backend
+    if "encode_batch_size" in perf:
+        config.perf_encode_batch_size = int(perf["encode_batch_size"])
+    if "encode_batch_wait_ms" in perf:
+        config.perf_encode_batch_wait_ms = float(perf["encode_batch_wait_ms"])
+    if "mcp_workers" in perf:
+        config.perf_mcp_workers = int(perf["mcp_workers"])
+    if "mcp_slow_workers" in perf:
+        config.perf_mcp_slow_workers = int(perf["mcp_slow_workers"])
+    if "mcp_response_cache_size" in perf:
+        config.perf_mcp_response_cache_size = int(perf["mcp_response_cache_size"])
+    if "mcp_cursor_ttl_seconds" in perf:
+        config.perf_mcp_cursor_ttl_seconds = int(perf["mcp_cursor_ttl_seconds"])
+    if "mcp_cursor_window" in perf:
+        config.perf_mcp_cursor_window = int(perf["mcp_cursor_window"])
+    if "mcp_warmup" in perf:
+        config.perf_mcp_warmup = bool(perf["mcp_warmup"])
+    if "mcp_session_store" in perf:
+        store = perf["mcp_session_store"]
+        if store in ("memory", "sqlite"):
+            config.perf_mcp_session_store = store
+    if "mcp_session_max_bytes" in perf:
+        config.perf_mcp_session_max_bytes = int(perf["mcp_session_max_bytes"])
+    if "scan_workers" in perf:
+        config.perf_scan_workers = int(perf["scan_workers"])
+    if "enrich_concurrency" in perf:
+        config.perf_enrich_concurrency = int(perf["enrich_concurrency"])
+    if "enrich_per_host" in perf:
+        config.perf_enrich_per_host = int(perf["enrich_per_host"])
+    if "enrich_host_delay_ms" in perf:
+        config.perf_enrich_host_delay_ms = int(perf["enrich_host_delay_ms"])
 
     return config
 
@@ -380,6 +433,7 @@ class AutoscanConfig:
     enabled: bool = True
     interval_hours: float = 5.0
     connectors: list[str] = field(default_factory=lambda: ["cursor"])
+    background: bool = True
 
 
 def get_autoscan_config() -> AutoscanConfig:
@@ -394,6 +448,7 @@ def get_autoscan_config() -> AutoscanConfig:
         enabled=config.autoscan_enabled,
         interval_hours=config.autoscan_interval_hours,
         connectors=connectors,
+        background=config.autoscan_background,
     )
 
 
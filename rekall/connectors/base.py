@@ -6,16 +6,39 @@ URLs from AI CLI tool histories (Claude Code, Cursor IDE, etc.).
 
 from __future__ import annotations
 
+import hashlib
 import ipaddress
 import re
-import socket
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Optional
 from urllib.parse import urlparse
 
+if TYPE_CHECKING:
+    from rekall.connectors.scanner import FileScan
+    from rekall.models import ConnectorFile
+
+# Bytes before a byte-offset read position kept as its fingerprint
+TAIL_DIGEST_BYTES = 256
+
+
+def tail_digest(f: BinaryIO, offset: int) -> str:
+    """Fingerprint the bytes just before a read offset.
+
+    Args:
+        f: File opened in binary mode
+        offset: Read position
+
+    Returns:
+        Hex digest of up to TAIL_DIGEST_BYTES bytes before offset
+    """
+    start = max(0, offset - TAIL_DIGEST_BYTES)
+    f.seek(start)
+    return hashlib.blake2b(f.read(offset - start), digest_size=8).hexdigest()
+
+
 # Private IP ranges to block (SSRF prevention)
 PRIVATE_IPV4_NETWORKS = [
     ipaddress.ip_network("10.0.0.0/8"),
@@ -54,25 +77,17 @@ def _is_private_ip(ip_str: str) -> bool:
 def _resolve_and_validate_ip(hostname: str) -> tuple[bool, str | None]:
     """Resolve hostname to IP and validate it's not private.
 
+    Results are cached per hostname (see rekall.connectors.resolver).
+
     Args:
         hostname: Hostname to resolve
 
     Returns:
         Tuple of (is_valid, error_message)
     """
-    try:
-        # Resolve hostname to IP addresses
-        _, _, ip_list = socket.gethostbyname_ex(hostname)
-        for ip_str in ip_list:
-            if _is_private_ip(ip_str):
-                return False, f"Hostname resolves to private IP: {ip_str}"
-        return True, None
-    except socket.gaierror:
-        # DNS resolution failed - could be temporary or invalid hostname
-        # Allow for now, will fail on actual fetch
-        return True, None
-    except Exception:
-        return False, "Failed to resolve hostname"
+    from rekall.connectors.resolver import get_host_resolver
+
+    return get_host_resolver().check(hostname)
 
 
 @dataclass
@@ -99,6 +114,10 @@ class ExtractionResult:
     errors: list[str] = field(default_factory=list)
     files_processed: int = 0
     last_file_marker: Optional[str] = None
+    # Per-file CDC (only when extract_urls() is given a manifest)
+    files_unchanged: int = 0
+    file_states: list["ConnectorFile"] = field(default_factory=list)
+    stale_files: list[str] = field(default_factory=list)
 
 
 class BaseConnector(ABC):
@@ -107,7 +126,8 @@ class BaseConnector(ABC):
     Each connector implements extraction logic for a specific AI CLI tool.
     Connectors should support:
     - Detection of tool availability
-    - Incremental import (CDC) via file markers
+    - Incremental import (CDC) via a per-file manifest of read positions
+      (or the legacy single file marker)
     - URL validation and filtering
     """
 
@@ -155,24 +175,239 @@ class BaseConnector(ABC):
         """
         ...
 
+    def get_watch_paths(self) -> list[Path]:
+        """Get directories to watch for history changes.
+
+        Used by `rekall sources watch`. Watches are not recursive: include
+        the parents where new history directories can appear.
+
+        Returns:
+            List of existing directories
+        """
+        return sorted({path.parent for path in self.get_history_paths()})
+
     @abstractmethod
     def extract_urls(
         self,
         since_marker: Optional[str] = None,
         project_filter: Optional[str] = None,
+        manifest: Optional[dict[str, "ConnectorFile"]] = None,
     ) -> ExtractionResult:
         """Extract URLs from CLI history.
 
+        With a manifest, every history file is checked and only the part
+        added since its recorded position is read; since_marker is ignored.
+        The updated positions are returned in ExtractionResult.file_states.
+
         Args:
             since_marker: Optional file marker for incremental import (CDC)
             project_filter: Optional project name to filter by
+            manifest: Optional read positions by file path (per-file CDC)
 
         Returns:
             ExtractionResult with extracted URLs and metadata
         """
         ...
 
-    def validate_url(self, url: str) -> tuple[bool, Optional[str]]:
+    def _file_signature(self, path: Path) -> tuple[int, int, int]:
+        """Identify the current version of a history file.
+
+        Args:
+            path: History file path
+
+        Returns:
+            Tuple of (inode, size, mtime_ns)
+        """
+        st = path.stat()
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def _checkpoint_for(
+        self,
+        path: Path,
+        manifest: dict[str, "ConnectorFile"],
+    ) -> Optional["ConnectorFile"]:
+        """Get the position to resume reading a history file from.
+
+        Args:
+            path: History file path
+            manifest: Read positions by file path
+
+        Returns:
+            ConnectorFile to read from (position 0 for a new, rotated,
+            truncated or rewritten file), or None if the file is unchanged
+            since the last scan
+        """
+        from rekall.models import ConnectorFile
+
+        inode, size, mtime_ns = self._file_signature(path)
+        previous = manifest.get(str(path))
+        if previous is not None and previous.matches(inode, size, mtime_ns):
+            return None
+
+        checkpoint = ConnectorFile(
+            connector=self.cli_source,
+            path=str(path),
+            inode=inode,
+            size=size,
+            mtime_ns=mtime_ns,
+            scanned_at=datetime.now(),
+        )
+        # Same file, only appended to: resume where the last scan stopped
+        if (
+            previous is not None
+            and previous.inode == inode
+            and size >= previous.size
+            and self._same_prefix(path, previous)
+        ):
+            checkpoint.position = previous.position
+            checkpoint.state = previous.state
+            checkpoint.tail_digest = previous.tail_digest
+        return checkpoint
+
+    @staticmethod
+    def _same_prefix(path: Path, previous: "ConnectorFile") -> bool:
+        """Check that the bytes before a byte-offset position are unchanged.
+
+        Positions without a digest (e.g. SQLite rowids) are trusted.
+
+        Args:
+            path: History file path
+            previous: Read position of the last scan
+
+        Returns:
+            False if the file was rewritten in place before the position
+        """
+        if not previous.tail_digest:
+            return True
+        with open(path, "rb") as f:
+            return tail_digest(f, previous.position) == previous.tail_digest
+
+    def _select_files(
+        self,
+        history_files: list[Path],
+        since_marker: Optional[str],
+        manifest: Optional[dict[str, "ConnectorFile"]],
+        result: ExtractionResult,
+    ) -> list[tuple[Path, Optional["ConnectorFile"]]]:
+        """Select the history files to read for an extraction.
+
+        Args:
+            history_files: History files sorted by modification time
+            since_marker: Optional file marker (used without a manifest)
+            manifest: Optional read positions by file path
+            result: ExtractionResult updated with unchanged and stale files
+
+        Returns:
+            List of (path, checkpoint) tuples; checkpoint is None without
+            a manifest (the whole file is read)
+        """
+        if manifest is None:
+            start_idx = self._marker_index(history_files, since_marker)
+            return [(path, None) for path in history_files[start_idx:]]
+
+        present = {str(path) for path in history_files}
+        result.stale_files = [path for path in manifest if path not in present]
+
+        selected = []
+        for path in history_files:
+            try:
+                checkpoint = self._checkpoint_for(path, manifest)
+            except OSError as e:
+                result.errors.append(f"Error processing {path}: {e}")
+                continue
+            if checkpoint is None:
+                result.files_unchanged += 1
+            else:
+                selected.append((path, checkpoint))
+        return selected
+
+    @abstractmethod
+    def scan_file(
+        self,
+        path: Path,
+        project: Optional[str],
+        checkpoint: Optional["ConnectorFile"] = None,
+        seen_urls: Optional[set[str]] = None,
+    ) -> "FileScan":
+        """Extract URLs from one history file.
+
+        Runs in a scan worker process for large scans: must not touch the
+        database. Errors are reported in FileScan.error, not raised.
+
+        Args:
+            path: History file path
+            project: Project identifier
+            checkpoint: Optional read position (a copy is updated and returned)
+            seen_urls: Optional URLs to skip, updated with the URLs found
+
+        Returns:
+            FileScan with the file's URLs and new read position
+        """
+        ...
+
+    def _extract_project_from_path(self, file_path: Path) -> Optional[str]:
+        """Extract project identifier from a history file path."""
+        return None
+
+    def _pending_bytes(self, path: Path, checkpoint: Optional["ConnectorFile"]) -> int:
+        """Estimate the bytes left to read in a history file."""
+        if checkpoint is not None:
+            return max(0, checkpoint.size - checkpoint.position)
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _extract_files(
+        self,
+        selected: list[tuple[Path, Optional["ConnectorFile"]]],
+        project_filter: Optional[str],
+        result: ExtractionResult,
+    ) -> None:
+        """Scan the selected history files into an ExtractionResult.
+
+        Large scans are spread over worker processes (see
+        rekall.connectors.scanner); URLs are deduplicated across files.
+
+        Args:
+            selected: (path, checkpoint) tuples from _select_files()
+            project_filter: Optional project name to filter by
+            result: ExtractionResult to fill
+        """
+        from rekall.connectors.scanner import ScanJob, scan_files
+
+        jobs = []
+        for path, checkpoint in selected:
+            result.files_processed += 1
+            result.last_file_marker = str(path)
+
+            project = self._extract_project_from_path(path)
+            if project_filter and project != project_filter:
+                continue
+            jobs.append(ScanJob(path, project, checkpoint, self._pending_bytes(path, checkpoint)))
+
+        for scan in scan_files(self, jobs):
+            if scan.error:
+                result.errors.append(f"Error processing {scan.path}: {scan.error}")
+                continue
+            result.urls.extend(scan.urls)
+            if scan.checkpoint is not None:
+                result.file_states.append(scan.checkpoint)
+
+    @staticmethod
+    def _marker_index(history_files: list[Path], since_marker: Optional[str]) -> int:
+        """Index of the first file after the legacy file marker."""
+        if since_marker:
+            try:
+                marker_path = Path(since_marker)
+                for idx, path in enumerate(history_files):
+                    if path == marker_path or str(path) == since_marker:
+                        return idx + 1  # Start after the marker
+            except Exception:
+                pass  # Invalid marker, start from beginning
+        return 0
+
+    def validate_url(self, url: str, resolve: bool = True) -> tuple[bool, Optional[str]]:
         """Validate a URL for inclusion in the inbox.
 
         SSRF hardening: validates hostname (not netloc) and resolves DNS
@@ -180,37 +415,88 @@ class BaseConnector(ABC):
 
         Args:
             url: URL to validate
+            resolve: Also check the resolved IPs (cached per hostname);
+                False for a syntax-only check
 
         Returns:
             Tuple of (is_valid, error_message)
             - is_valid: True if URL should be included, False if quarantined
             - error_message: Reason for quarantine if is_valid is False
         """
+        hostname, error = self._check_url(url)
+        if error:
+            return False, error
+
+        # SSRF protection: resolve DNS and validate IP is not private
+        if resolve:
+            is_valid, error = _resolve_and_validate_ip(hostname)
+            if not is_valid:
+                return False, error
+
+        return True, None
+
+    def validate_urls(self, urls: list[str]) -> dict[str, tuple[bool, Optional[str]]]:
+        """Validate a batch of URLs, resolving each distinct hostname once.
+
+        Uncached hostnames are resolved concurrently, so the time taken
+        depends on the number of distinct hosts, not URLs.
+
+        Args:
+            urls: URLs to validate
+
+        Returns:
+            Dict of URL -> (is_valid, error_message), as validate_url()
+        """
+        from rekall.connectors.resolver import get_host_resolver
+
+        results: dict[str, tuple[bool, Optional[str]]] = {}
+        hostnames: dict[str, str] = {}
+        for url in urls:
+            if url in results or url in hostnames:
+                continue
+            hostname, error = self._check_url(url)
+            if error:
+                results[url] = (False, error)
+            else:
+                hostnames[url] = hostname
+
+        checks = get_host_resolver().check_many(hostnames.values())
+        for url, hostname in hostnames.items():
+            is_valid, error = checks[hostname.lower()]
+            results[url] = (True, None) if is_valid else (False, error)
+        return results
+
+    def _check_url(self, url: str) -> tuple[Optional[str], Optional[str]]:
+        """Check a URL without DNS resolution.
+
+        Returns:
+            Tuple of (hostname, error_message); error_message is None if valid
+        """
         # Empty or whitespace URL
         if not url or not url.strip():
-            return False, "Empty URL"
+            return None, "Empty URL"
 
         url = url.strip()
 
         # Must have a scheme
         parsed = urlparse(url)
         if not parsed.scheme:
-            return False, "Missing URL scheme"
+            return None, "Missing URL scheme"
 
         # Only allow http/https schemes
         if parsed.scheme.lower() not in ("http", "https"):
-            return False, f"Invalid scheme: {parsed.scheme}"
+            return None, f"Invalid scheme: {parsed.scheme}"
 
         # Use hostname (not netloc) to avoid userinfo bypass attacks
         # e.g., https://localhost@evil.com/ would have netloc="localhost@evil.com"
         # but hostname="evil.com"
         hostname = parsed.hostname
         if not hostname:
-            return False, "Missing host"
+            return None, "Missing host"
 
         # Check for file:// that might have bypassed scheme check
         if url.lower().startswith("file:"):
-            return False, "file:// URLs not allowed"
+            return None, "file:// URLs not allowed"
 
         # Check quarantine patterns against hostname (not netloc)
         if self._quarantine_regex is None:
@@ -218,14 +504,9 @@ class BaseConnector(ABC):
             self._quarantine_regex = re.compile(pattern, re.IGNORECASE)
 
         if self._quarantine_regex.search(hostname):
-            return False, f"Quarantined host: {hostname}"
+            return None, f"Quarantined host: {hostname}"
 
-        # SSRF protection: resolve DNS and validate IP is not private
-        is_valid, error = _resolve_and_validate_ip(hostname)
-        if not is_valid:
-            return False, error
-
-        return True, None
+        return hostname, None
 
     def extract_domain(self, url: str) -> str:
         """Extract domain from a URL.
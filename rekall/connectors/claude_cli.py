@@ -8,11 +8,14 @@ from __future__ import annotations
 
 import json
 import re
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from rekall.connectors.base import BaseConnector, ExtractedURL, ExtractionResult
+from rekall.connectors.base import BaseConnector, ExtractedURL, ExtractionResult, tail_digest
+from rekall.connectors.scanner import FileScan
+from rekall.models import ConnectorFile
 
 
 class ClaudeCLIConnector(BaseConnector):
@@ -68,10 +71,26 @@ class ClaudeCLIConnector(BaseConnector):
         # Sort by modification time (oldest first for incremental processing)
         return sorted(jsonl_files, key=lambda p: p.stat().st_mtime)
 
+    def get_watch_paths(self) -> list[Path]:
+        """Get the projects directory, project directories and conversation directories."""
+        if not self.PROJECTS_DIR.exists():
+            return []
+
+        paths = [self.PROJECTS_DIR]
+        for project_dir in self.PROJECTS_DIR.iterdir():
+            if not project_dir.is_dir():
+                continue
+            paths.append(project_dir)
+            conversations_dir = project_dir / "conversations"
+            if conversations_dir.is_dir():
+                paths.append(conversations_dir)
+        return paths
+
     def extract_urls(
         self,
         since_marker: Optional[str] = None,
         project_filter: Optional[str] = None,
+        manifest: Optional[dict[str, ConnectorFile]] = None,
     ) -> ExtractionResult:
         """Extract URLs from Claude Code history.
 
@@ -81,6 +100,7 @@ class ClaudeCLIConnector(BaseConnector):
         Args:
             since_marker: Optional file path marker for CDC (skip files before this)
             project_filter: Optional project name to filter by
+            manifest: Optional byte offsets by file path (read only appended lines)
 
         Returns:
             ExtractionResult with extracted URLs
@@ -95,42 +115,36 @@ class ClaudeCLIConnector(BaseConnector):
         if not history_files:
             return result
 
-        # Find starting point for incremental import
-        start_idx = 0
-        if since_marker:
-            try:
-                marker_path = Path(since_marker)
-                for idx, path in enumerate(history_files):
-                    if path == marker_path or str(path) == since_marker:
-                        start_idx = idx + 1  # Start after the marker
-                        break
-            except Exception:
-                pass  # Invalid marker, start from beginning
-
-        # Process files
-        seen_urls: set[str] = set()  # Dedup within this extraction
-
-        for file_path in history_files[start_idx:]:
-            result.files_processed += 1
-            result.last_file_marker = str(file_path)
-
-            # Determine project from path
-            project = self._extract_project_from_path(file_path)
-            if project_filter and project != project_filter:
-                continue
+        selected = self._select_files(history_files, since_marker, manifest, result)
+        self._extract_files(selected, project_filter, result)
+        return result
 
-            # Extract conversation ID from filename
-            conversation_id = file_path.stem
+    def scan_file(
+        self,
+        path: Path,
+        project: Optional[str],
+        checkpoint: Optional[ConnectorFile] = None,
+        seen_urls: Optional[set[str]] = None,
+    ) -> FileScan:
+        """Extract URLs from one JSONL conversation file.
 
-            try:
-                urls = self._extract_urls_from_file(
-                    file_path, project, conversation_id, seen_urls
-                )
-                result.urls.extend(urls)
-            except Exception as e:
-                result.errors.append(f"Error processing {file_path}: {e}")
+        Args:
+            path: Path to the JSONL file
+            project: Project identifier
+            checkpoint: Optional byte offset (a copy is updated and returned)
+            seen_urls: Optional URLs to skip, updated with the URLs found
 
-        return result
+        Returns:
+            FileScan with the file's URLs and new read position
+        """
+        checkpoint = replace(checkpoint) if checkpoint is not None else None
+        if seen_urls is None:
+            seen_urls = set()
+        try:
+            urls = self._extract_urls_from_file(path, project, path.stem, seen_urls, checkpoint)
+        except Exception as e:
+            return FileScan(path, error=str(e))
+        return FileScan(path, urls, checkpoint)
 
     def _extract_project_from_path(self, file_path: Path) -> Optional[str]:
         """Extract project identifier from file path.
@@ -160,31 +174,59 @@ class ClaudeCLIConnector(BaseConnector):
         project: Optional[str],
         conversation_id: str,
         seen_urls: set[str],
+        checkpoint: Optional[ConnectorFile] = None,
     ) -> list[ExtractedURL]:
         """Extract URLs from a single JSONL conversation file.
 
+        With a checkpoint, reading starts at its byte offset (with the last
+        user query seen before it) and the checkpoint is moved past the last
+        complete line read. A trailing line still being written is left for
+        the next scan.
+
         Args:
             file_path: Path to the JSONL file
             project: Project identifier
             conversation_id: Conversation ID
             seen_urls: Set of already-seen URLs for deduplication
+            checkpoint: Optional read position, updated in place
 
         Returns:
             List of ExtractedURL objects
         """
         urls: list[ExtractedURL] = []
+        offset = checkpoint.position if checkpoint else 0
+        last_user_query = self._load_checkpoint_state(checkpoint)
+
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+
+            for raw_line in f:
+                line_offset = offset
+                offset += len(raw_line)
+
+                # Byte-level prefilter: most lines hold neither a URL nor a
+                # user query and need no JSON decoding (a last line still
+                # being written is always checked). URL_PATTERN ignores
+                # case, so the scheme is looked up in any case.
+                if (
+                    b"http" not in raw_line.lower()
+                    and not self._may_be_user_message(raw_line)
+                    and raw_line.endswith(b"\n")
+                ):
+                    continue
 
-        with open(file_path, encoding="utf-8") as f:
-            last_user_query: Optional[str] = None
-
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
+                line = raw_line.strip().decode("utf-8", errors="replace")
                 if not line:
                     continue
 
                 try:
                     entry = json.loads(line)
                 except json.JSONDecodeError:
+                    if not raw_line.endswith(b"\n"):
+                        offset = line_offset  # Partial line: re-read next scan
+                        break
+                    continue
+                if not isinstance(entry, dict):
                     continue
 
                 # Track user queries for context
@@ -198,7 +240,7 @@ class ClaudeCLIConnector(BaseConnector):
                     if url in seen_urls:
                         continue
 
-                    is_valid, error = self.validate_url(url)
+                    is_valid, error = self.validate_url(url, resolve=False)
                     extracted = ExtractedURL(
                         url=url,
                         domain=self.extract_domain(url),
@@ -215,7 +257,7 @@ class ClaudeCLIConnector(BaseConnector):
                     if not is_valid:
                         extracted.raw_json = json.dumps({
                             "validation_error": error,
-                            "original_line": line_num,
+                            "original_offset": line_offset,
                         })
 
                     urls.append(extracted)
@@ -230,7 +272,7 @@ class ClaudeCLIConnector(BaseConnector):
                             if url in seen_urls:
                                 continue
 
-                            is_valid, error = self.validate_url(url)
+                            is_valid, error = self.validate_url(url, resolve=False)
                             extracted = ExtractedURL(
                                 url=url,
                                 domain=self.extract_domain(url),
@@ -250,8 +292,32 @@ class ClaudeCLIConnector(BaseConnector):
                             urls.append(extracted)
                             seen_urls.add(url)
 
+            if checkpoint is not None:
+                checkpoint.tail_digest = tail_digest(f, offset)
+
+        if checkpoint is not None:
+            checkpoint.position = offset
+            checkpoint.state = (
+                json.dumps({"last_user_query": last_user_query[:500]}) if last_user_query else None
+            )
+
         return urls
 
+    @staticmethod
+    def _load_checkpoint_state(checkpoint: Optional[ConnectorFile]) -> Optional[str]:
+        """Get the last user query seen before a checkpoint."""
+        if checkpoint is None or not checkpoint.state:
+            return None
+        try:
+            return json.loads(checkpoint.state).get("last_user_query")
+        except (ValueError, AttributeError):
+            return None
+
+    @staticmethod
+    def _may_be_user_message(raw_line: bytes) -> bool:
+        """Cheap check that a raw JSONL line could be a user message."""
+        return b'"user"' in raw_line or b'"human"' in raw_line
+
     def _is_user_message(self, entry: dict) -> bool:
         """Check if entry is a user message."""
         return entry.get("role") == "user" or entry.get("type") == "human"
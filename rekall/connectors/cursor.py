@@ -6,16 +6,23 @@ stored in SQLite databases (state.vscdb) under workspaceStorage.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import platform
 import re
 import sqlite3
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from rekall.connectors.base import BaseConnector, ExtractedURL, ExtractionResult
+from rekall.connectors.scanner import FileScan
+from rekall.models import ConnectorFile
+
+# Values up to this size are decoded to find the conversation's user query
+CONTEXT_DECODE_MAX_CHARS = 1024 * 1024
 
 
 class CursorConnector(BaseConnector):
@@ -127,10 +134,18 @@ class CursorConnector(BaseConnector):
         # Sort by modification time (oldest first for incremental processing)
         return sorted(db_files, key=lambda p: p.stat().st_mtime)
 
+    def get_watch_paths(self) -> list[Path]:
+        """Get workspaceStorage and its workspace directories (state.vscdb and WAL)."""
+        ws_storage = self._get_workspace_storage_path()
+        if not ws_storage:
+            return []
+        return [ws_storage] + [ws_dir for ws_dir in ws_storage.iterdir() if ws_dir.is_dir()]
+
     def extract_urls(
         self,
         since_marker: Optional[str] = None,
         project_filter: Optional[str] = None,
+        manifest: Optional[dict[str, ConnectorFile]] = None,
     ) -> ExtractionResult:
         """Extract URLs from Cursor IDE history.
 
@@ -139,6 +154,7 @@ class CursorConnector(BaseConnector):
         Args:
             since_marker: Optional file path marker for CDC (skip files before this)
             project_filter: Optional project name to filter by
+            manifest: Optional max rowids by file path (read only new rows)
 
         Returns:
             ExtractionResult with extracted URLs
@@ -153,37 +169,59 @@ class CursorConnector(BaseConnector):
         if not history_files:
             return result
 
-        # Find starting point for incremental import
-        start_idx = 0
-        if since_marker:
-            try:
-                marker_path = Path(since_marker)
-                for idx, path in enumerate(history_files):
-                    if path == marker_path or str(path) == since_marker:
-                        start_idx = idx + 1  # Start after the marker
-                        break
-            except Exception:
-                pass  # Invalid marker, start from beginning
-
-        # Process files
-        seen_urls: set[str] = set()  # Dedup within this extraction
-
-        for file_path in history_files[start_idx:]:
-            result.files_processed += 1
-            result.last_file_marker = str(file_path)
-
-            # Determine workspace/project from path
-            project = self._extract_project_from_path(file_path)
-            if project_filter and project != project_filter:
-                continue
+        selected = self._select_files(history_files, since_marker, manifest, result)
+        self._extract_files(selected, project_filter, result)
+        return result
 
-            try:
-                urls = self._extract_urls_from_db(file_path, project, seen_urls)
-                result.urls.extend(urls)
-            except Exception as e:
-                result.errors.append(f"Error processing {file_path}: {e}")
+    def scan_file(
+        self,
+        path: Path,
+        project: Optional[str],
+        checkpoint: Optional[ConnectorFile] = None,
+        seen_urls: Optional[set[str]] = None,
+    ) -> FileScan:
+        """Extract URLs from one state.vscdb file.
 
-        return result
+        Args:
+            path: Path to the SQLite database
+            project: Project identifier
+            checkpoint: Optional max rowid (a copy is updated and returned)
+            seen_urls: Optional URLs to skip, updated with the URLs found
+
+        Returns:
+            FileScan with the file's URLs and new read position
+        """
+        checkpoint = replace(checkpoint) if checkpoint is not None else None
+        if seen_urls is None:
+            seen_urls = set()
+        try:
+            urls = self._extract_urls_from_db(path, project, seen_urls, checkpoint)
+        except Exception as e:
+            return FileScan(path, error=str(e))
+        return FileScan(path, urls, checkpoint)
+
+    def _pending_bytes(self, path: Path, checkpoint: Optional[ConnectorFile]) -> int:
+        """Estimate the bytes left to read (positions are rowids, not offsets)."""
+        if checkpoint is not None:
+            return checkpoint.size
+        return super()._pending_bytes(path, checkpoint)
+
+    def _file_signature(self, path: Path) -> tuple[int, int, int]:
+        """Identify the current version of a state.vscdb file.
+
+        Writes land in the write-ahead log first, so its size and mtime are
+        folded in: the main file alone can stay unchanged for a while.
+        """
+        st = path.stat()
+        size, mtime_ns = st.st_size, st.st_mtime_ns
+        wal = path.with_name(path.name + "-wal")
+        try:
+            wal_st = wal.stat()
+            size += wal_st.st_size
+            mtime_ns = max(mtime_ns, wal_st.st_mtime_ns)
+        except OSError:
+            pass
+        return st.st_ino, size, mtime_ns
 
     def _extract_project_from_path(self, file_path: Path) -> Optional[str]:
         """Extract project identifier from file path.
@@ -218,89 +256,157 @@ class CursorConnector(BaseConnector):
         db_path: Path,
         project: Optional[str],
         seen_urls: set[str],
+        checkpoint: Optional[ConnectorFile] = None,
     ) -> list[ExtractedURL]:
         """Extract URLs from a single state.vscdb file.
 
+        With a checkpoint, a watermark is kept per conversation key: the
+        rowid and a digest of the value last read. Keys are listed first
+        without their values; a value is only loaded when its rowid changed
+        (Cursor rewrites a key with INSERT OR REPLACE, which gives the row a
+        new rowid), and only scanned for URLs when its digest changed too.
+        Values are loaded one at a time.
+
         Args:
             db_path: Path to the SQLite database
             project: Project identifier
             seen_urls: Set of already-seen URLs for deduplication
+            checkpoint: Optional watermarks, updated in place
 
         Returns:
             List of ExtractedURL objects
         """
         urls: list[ExtractedURL] = []
+        known = self._load_watermarks(checkpoint)
+        watermarks: dict[str, list] = {}
 
         try:
             # Connect read-only to avoid locking issues
             conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-            cursor = conn.cursor()
-
-            # Find AI conversation entries
-            # Cursor stores conversations with keys like:
-            # - cursorDiskKV.aiconversation.conversations.*
-            # - cursorDiskKV.composerData.*
-            cursor.execute(
-                """SELECT key, value FROM ItemTable
-                   WHERE key LIKE '%aiconversation%'
-                      OR key LIKE '%composerData%'
-                      OR key LIKE '%chat%'"""
-            )
-
-            for key, value in cursor.fetchall():
-                if not value:
-                    continue
-
-                try:
-                    # Parse JSON value
-                    data = json.loads(value)
-                    conversation_urls = self._extract_urls_from_conversation(
-                        data, project, str(db_path), key, seen_urls
+            try:
+                # Find AI conversation entries
+                # Cursor stores conversations with keys like:
+                # - cursorDiskKV.aiconversation.conversations.*
+                # - cursorDiskKV.composerData.*
+                rows = conn.execute(
+                    """SELECT rowid, key FROM ItemTable
+                       WHERE key LIKE '%aiconversation%'
+                          OR key LIKE '%composerData%'
+                          OR key LIKE '%chat%'
+                       ORDER BY rowid"""
+                ).fetchall()
+
+                for rowid, key in rows:
+                    previous = known.get(key)
+                    if previous is not None and previous[0] == rowid:
+                        watermarks[key] = previous
+                        continue
+
+                    row = conn.execute(
+                        "SELECT value FROM ItemTable WHERE rowid = ?", (rowid,)
+                    ).fetchone()
+                    value = row[0] if row else None
+                    if isinstance(value, bytes):
+                        value = value.decode("utf-8", errors="replace")
+
+                    digest = self._digest(value)
+                    watermarks[key] = [rowid, digest]
+                    if previous is not None and previous[1] == digest:
+                        continue  # Rewritten with the same content
+
+                    urls.extend(
+                        self._extract_urls_from_value(value, project, str(db_path), key, seen_urls)
                     )
-                    urls.extend(conversation_urls)
-                except json.JSONDecodeError:
-                    # Not JSON, try direct URL extraction from text
-                    if isinstance(value, str):
-                        text_urls = self._extract_urls_from_text(
-                            value, project, str(db_path), key, seen_urls
-                        )
-                        urls.extend(text_urls)
-
-            conn.close()
+            finally:
+                conn.close()
         except sqlite3.Error as e:
             raise RuntimeError(f"SQLite error: {e}")
 
+        if checkpoint is not None:
+            checkpoint.position = max((mark[0] for mark in watermarks.values()), default=0)
+            checkpoint.state = json.dumps({"keys": watermarks}) if watermarks else None
+
         return urls
 
+    @staticmethod
+    def _load_watermarks(checkpoint: Optional[ConnectorFile]) -> dict[str, list]:
+        """Get the per-key (rowid, digest) watermarks of a checkpoint."""
+        if checkpoint is None or not checkpoint.state:
+            return {}
+        try:
+            keys = json.loads(checkpoint.state).get("keys")
+        except (ValueError, AttributeError):
+            return {}
+        return keys if isinstance(keys, dict) else {}
+
+    @staticmethod
+    def _digest(value: Optional[str]) -> str:
+        """Digest of an ItemTable value."""
+        data = value.encode("utf-8", errors="replace") if value else b""
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    def _extract_urls_from_value(
+        self,
+        value: Optional[str],
+        project: Optional[str],
+        source_file: str,
+        key: str,
+        seen_urls: set[str],
+    ) -> list[ExtractedURL]:
+        """Extract URLs from one ItemTable value.
+
+        URLs are searched in the raw JSON text: the value is not decoded and
+        re-encoded. Only values small enough are decoded, to find the user
+        query of the conversation.
+        """
+        # Skip values without any URL (in any case, like URL_PATTERN)
+        if not value or "http" not in value.lower():
+            return []
+
+        if value.lstrip()[:1] not in ("{", "["):
+            # Not JSON, direct URL extraction from text
+            return self._extract_urls_from_text(value, project, source_file, key, seen_urls)
+
+        return self._extract_urls_from_conversation(
+            value, self._find_user_query(value), project, source_file, key, seen_urls
+        )
+
+    def _find_user_query(self, value: str) -> Optional[str]:
+        """Find the user query of a JSON conversation value, if small enough."""
+        if len(value) > CONTEXT_DECODE_MAX_CHARS:
+            return None
+        try:
+            data = json.loads(value)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        # Try to find user query
+        user_query = (
+            data.get("query")
+            or data.get("userMessage")
+            or data.get("prompt")
+        )
+        if isinstance(user_query, dict):
+            user_query = user_query.get("text") or user_query.get("content")
+        return user_query if isinstance(user_query, str) else None
+
     def _extract_urls_from_conversation(
         self,
-        data: dict | list,
+        text: str,
+        user_query: Optional[str],
         project: Optional[str],
         source_file: str,
         conversation_key: str,
         seen_urls: set[str],
     ) -> list[ExtractedURL]:
-        """Extract URLs from a conversation data structure.
+        """Extract URLs from the JSON text of a conversation.
 
         Cursor conversation JSON can have various structures depending on version.
         """
         urls: list[ExtractedURL] = []
 
-        # Convert to string for URL extraction
-        text = json.dumps(data) if isinstance(data, (dict, list)) else str(data)
-
-        # Extract context for better understanding
-        user_query = None
-        if isinstance(data, dict):
-            # Try to find user query
-            user_query = (
-                data.get("query")
-                or data.get("userMessage")
-                or data.get("prompt")
-            )
-            if isinstance(user_query, dict):
-                user_query = user_query.get("text") or user_query.get("content")
-
         # Find all URLs
         found_urls = self.URL_PATTERN.findall(text)
 
@@ -313,7 +419,7 @@ class CursorConnector(BaseConnector):
             if url in seen_urls:
                 continue
 
-            is_valid, error = self.validate_url(url)
+            is_valid, error = self.validate_url(url, resolve=False)
             extracted = ExtractedURL(
                 url=url,
                 domain=self.extract_domain(url),
@@ -353,7 +459,7 @@ class CursorConnector(BaseConnector):
             if url in seen_urls:
                 continue
 
-            is_valid, error = self.validate_url(url)
+            is_valid, error = self.validate_url(url, resolve=False)
             extracted = ExtractedURL(
                 url=url,
                 domain=self.extract_domain(url),
@@ -0,0 +1,178 @@
+"""Cached, concurrent DNS checks for SSRF validation.
+
+Every extracted URL is checked against private IP ranges, which needs a DNS
+lookup of its hostname. A scan typically finds thousands of URLs on a few
+hundred hosts, so results are memoized per hostname: resolved hosts for
+POSITIVE_TTL seconds, failed lookups for NEGATIVE_TTL seconds. Batches of
+hostnames are resolved concurrently on a thread pool (getaddrinfo blocks
+and releases the GIL), so validation time scales with distinct hosts, not
+URLs.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from rekall.connectors.base import _is_private_ip
+
+# Cache lifetimes (seconds) of successful and failed lookups
+POSITIVE_TTL = 300.0
+NEGATIVE_TTL = 60.0
+
+# Hostnames kept in the cache (LRU)
+MAX_HOSTS = 4096
+
+# Concurrent lookups in check_many()
+RESOLVE_WORKERS = 16
+
+HostCheck = tuple[bool, Optional[str]]
+
+
+def _gethostbyname(hostname: str) -> list[str]:
+    """Resolve a hostname to its IP addresses."""
+    _, _, ip_list = socket.gethostbyname_ex(hostname)
+    return ip_list
+
+
+class HostResolver:
+    """Per-hostname cache of SSRF DNS checks, thread-safe."""
+
+    def __init__(
+        self,
+        resolve: Callable[[str], list[str]] = _gethostbyname,
+        ttl: float = POSITIVE_TTL,
+        negative_ttl: float = NEGATIVE_TTL,
+        maxsize: int = MAX_HOSTS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            resolve: Resolves a hostname to IP addresses (raises on failure)
+            ttl: Lifetime of successful lookups
+            negative_ttl: Lifetime of failed lookups
+            maxsize: Hostnames kept in the cache
+            clock: Time source (tests)
+        """
+        self._resolve = resolve
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._lock = threading.Lock()
+        # hostname -> (expires_at, result)
+        self._cache: OrderedDict[str, tuple[float, HostCheck]] = OrderedDict()
+
+    def _lookup(self, hostname: str) -> tuple[HostCheck, bool]:
+        """Resolve and check a hostname: ((is_valid, error), lookup_failed)."""
+        try:
+            ip_list = self._resolve(hostname)
+        except socket.gaierror:
+            # DNS resolution failed - could be temporary or invalid hostname
+            # Allow for now, will fail on actual fetch
+            return (True, None), True
+        except Exception:
+            return (False, "Failed to resolve hostname"), True
+
+        for ip_str in ip_list:
+            if _is_private_ip(ip_str):
+                return (False, f"Hostname resolves to private IP: {ip_str}"), False
+        return (True, None), False
+
+    def _cached(self, hostname: str) -> Optional[HostCheck]:
+        with self._lock:
+            item = self._cache.get(hostname)
+            if item is None:
+                return None
+            if item[0] <= self._clock():
+                del self._cache[hostname]
+                return None
+            self._cache.move_to_end(hostname)
+            return item[1]
+
+    def _store(self, hostname: str, result: HostCheck, failed: bool) -> None:
+        ttl = self.negative_ttl if failed else self.ttl
+        with self._lock:
+            self._cache[hostname] = (self._clock() + ttl, result)
+            self._cache.move_to_end(hostname)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def check(self, hostname: str) -> HostCheck:
+        """Check that a hostname does not resolve to a private IP.
+
+        Args:
+            hostname: Hostname to check
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        hostname = hostname.lower()
+        cached = self._cached(hostname)
+        if cached is not None:
+            return cached
+        result, failed = self._lookup(hostname)
+        self._store(hostname, result, failed)
+        return result
+
+    def check_many(
+        self,
+        hostnames: Iterable[str],
+        workers: int = RESOLVE_WORKERS,
+    ) -> dict[str, HostCheck]:
+        """Check hostnames, resolving the uncached ones concurrently.
+
+        Args:
+            hostnames: Hostnames to check (duplicates are resolved once)
+            workers: Maximum concurrent lookups
+
+        Returns:
+            Dict of lowercased hostname -> (is_valid, error_message)
+        """
+        results: dict[str, HostCheck] = {}
+        missing = []
+        for hostname in {h.lower() for h in hostnames}:
+            cached = self._cached(hostname)
+            if cached is None:
+                missing.append(hostname)
+            else:
+                results[hostname] = cached
+
+        if len(missing) == 1 or workers <= 1:
+            for hostname in missing:
+                results[hostname] = self.check(hostname)
+        elif missing:
+            with ThreadPoolExecutor(
+                max_workers=min(workers, len(missing)), thread_name_prefix="rekall-dns"
+            ) as pool:
+                for hostname, result in zip(missing, pool.map(self.check, missing), strict=True):
+                    results[hostname] = result
+        return results
+
+    def clear(self) -> None:
+        """Forget all cached lookups."""
+        with self._lock:
+            self._cache.clear()
+
+
+# Shared resolver (singleton)
+_host_resolver: Optional[HostResolver] = None
+
+
+def get_host_resolver() -> HostResolver:
+    """Get the shared hostname resolver."""
+    global _host_resolver
+    if _host_resolver is None:
+        _host_resolver = HostResolver()
+    return _host_resolver
+
+
+def reset_host_resolver() -> None:
+    """Reset the shared resolver (tests)."""
+    global _host_resolver
+    _host_resolver = None
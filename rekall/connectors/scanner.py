@@ -0,0 +1,122 @@
+"""Parallel scanning engine for connector history files.
+
+A first import can cover years of history: thousands of JSONL files or
+large SQLite databases, each parsed with json.loads line by line. Files are
+independent, so large scans fan them out to a process pool; each worker
+parses whole files and returns their URLs and new read positions.
+
+The calling process is the single writer: results are merged in file order
+(oldest first) and deduplicated across workers, so the output is the same
+as a sequential scan. Small scans (the usual incremental case) stay in
+process, where a pool would cost more than it saves.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from rekall.connectors.base import BaseConnector, ExtractedURL
+    from rekall.models import ConnectorFile
+
+# Below this many bytes to read, or this many files, scan in process
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+PARALLEL_MIN_FILES = 4
+
+
+@dataclass
+class ScanJob:
+    """A history file to read, with its CDC position."""
+
+    path: Path
+    project: Optional[str]
+    checkpoint: Optional["ConnectorFile"] = None
+    pending_bytes: int = 0
+
+
+@dataclass
+class FileScan:
+    """URLs found in one history file (deduplicated within the file)."""
+
+    path: Path
+    urls: list["ExtractedURL"] = field(default_factory=list)
+    checkpoint: Optional["ConnectorFile"] = None
+    error: Optional[str] = None
+
+
+def get_scan_workers() -> int:
+    """Get the number of scan processes (performance.scan_workers, 0 = CPUs)."""
+    workers = 0
+    try:
+        from rekall.config import get_config
+
+        workers = get_config().perf_scan_workers
+    except Exception:
+        pass
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def _should_parallelize(jobs: list[ScanJob], workers: int) -> bool:
+    """Check if a scan is large enough to pay for a process pool."""
+    if workers <= 1 or len(jobs) < PARALLEL_MIN_FILES:
+        return False
+    return sum(job.pending_bytes for job in jobs) >= PARALLEL_MIN_BYTES
+
+
+def scan_files(
+    connector: "BaseConnector",
+    jobs: list[ScanJob],
+    workers: Optional[int] = None,
+) -> Iterator[FileScan]:
+    """Scan history files and merge their URLs.
+
+    URLs already found in an earlier file of the scan are dropped, so each
+    URL is reported once, from its oldest file.
+
+    Args:
+        connector: Connector reading the files (must be picklable)
+        jobs: Files to read, oldest first
+        workers: Number of processes (None: performance.scan_workers)
+
+    Yields:
+        FileScan per file, in job order, with cross-file duplicates removed
+    """
+    if workers is None:
+        workers = get_scan_workers()
+
+    seen_urls: set[str] = set()
+    if not _should_parallelize(jobs, workers):
+        # In process: the connector skips URLs seen in earlier files itself
+        for job in jobs:
+            yield connector.scan_file(job.path, job.project, job.checkpoint, seen_urls)
+        return
+
+    # spawn: the MCP server and CLI may have threads running, unsafe to fork
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(jobs)), mp_context=context
+    ) as pool:
+        scans = pool.map(
+            connector.scan_file,
+            [job.path for job in jobs],
+            [job.project for job in jobs],
+            [job.checkpoint for job in jobs],
+            chunksize=max(1, len(jobs) // (workers * 4)),
+        )
+        # Single writer: merge in file order, dropping cross-worker duplicates
+        for scan in scans:
+            unique = []
+            for extracted in scan.urls:
+                if extracted.url not in seen_urls:
+                    seen_urls.add(extracted.url)
+                    unique.append(extracted)
+            scan.urls = unique
+            yield scan
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import json
+import math
 import sqlite3
 import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
+from typing import Any
 
 from rekall.cache import get_embedding_cache
 from rekall.models import (
@@ -41,8 +45,13 @@ from rekall.utils import secure_file_permissions
 #  10 = Saved filters (saved_filters table for persistent filter views)
 #  11 = Sources Medallion (inbox/staging tables for URL processing pipeline)
 #  12 = AI Source Enrichment (ai_* fields for enrichment metadata on sources)
+#  13 = Keyword document frequencies (keyword_stats table for IDF scoring)
+#  14 = Connector file manifest (connector_files table for per-file CDC)
+#  15 = Connector scan progress (scan_* columns on connector_imports)
+#  16 = Inbox dedup (url_hash column, unique per normalized URL and conversation)
+#  17 = Connector file fingerprint (tail_digest column on connector_files)
 
-CURRENT_SCHEMA_VERSION = 12
+CURRENT_SCHEMA_VERSION = 17
 
 # Migrations dict: version -> list of SQL statements
 # Each migration upgrades from version N-1 to version N
@@ -332,6 +341,61 @@ MIGRATIONS: dict[int, list[str]] = {
         "CREATE INDEX IF NOT EXISTS idx_sources_enrichment_status ON sources(enrichment_status)",
         "CREATE INDEX IF NOT EXISTS idx_sources_ai_confidence ON sources(ai_confidence)",
     ],
+    13: [
+        # Keyword document frequencies for IDF-weighted keyword scoring
+        """CREATE TABLE IF NOT EXISTS keyword_stats (
+            keyword TEXT PRIMARY KEY,
+            doc_freq INTEGER NOT NULL DEFAULT 0
+        )""",
+        # Backfill from existing keywords
+        """INSERT OR REPLACE INTO keyword_stats (keyword, doc_freq)
+        SELECT keyword, COUNT(*) FROM context_keywords GROUP BY keyword""",
+        # Keep frequencies in sync (also fires on ON DELETE CASCADE)
+        """CREATE TRIGGER IF NOT EXISTS context_keywords_ai AFTER INSERT ON context_keywords BEGIN
+            INSERT INTO keyword_stats (keyword, doc_freq) VALUES (NEW.keyword, 1)
+            ON CONFLICT(keyword) DO UPDATE SET doc_freq = doc_freq + 1;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS context_keywords_ad AFTER DELETE ON context_keywords BEGIN
+            UPDATE keyword_stats SET doc_freq = doc_freq - 1 WHERE keyword = OLD.keyword;
+            DELETE FROM keyword_stats WHERE keyword = OLD.keyword AND doc_freq <= 0;
+        END""",
+    ],
+    14: [
+        # Per-file CDC: read position of each connector history file
+        """CREATE TABLE IF NOT EXISTS connector_files (
+            connector TEXT NOT NULL,
+            path TEXT NOT NULL,
+            inode INTEGER NOT NULL DEFAULT 0,
+            size INTEGER NOT NULL DEFAULT 0,
+            mtime_ns INTEGER NOT NULL DEFAULT 0,
+            position INTEGER NOT NULL DEFAULT 0,
+            state TEXT,
+            scanned_at TEXT,
+            PRIMARY KEY (connector, path)
+        )""",
+    ],
+    15: [
+        # Background autoscan: progress and timing of the last scan per connector
+        # scan_status: idle, running, failed
+        "ALTER TABLE connector_imports ADD COLUMN scan_status TEXT DEFAULT 'idle'",
+        "ALTER TABLE connector_imports ADD COLUMN scan_started_at TEXT",
+        "ALTER TABLE connector_imports ADD COLUMN scan_finished_at TEXT",
+        "ALTER TABLE connector_imports ADD COLUMN last_duration_ms INTEGER",
+        "ALTER TABLE connector_imports ADD COLUMN last_imported INTEGER DEFAULT 0",
+        "ALTER TABLE connector_imports ADD COLUMN last_error TEXT",
+    ],
+    16: [
+        # Inbox dedup: hash of the normalized URL (backfilled by
+        # _backfill_inbox_url_hashes); NULL conversations compare equal
+        "ALTER TABLE sources_inbox ADD COLUMN url_hash TEXT",
+        """CREATE UNIQUE INDEX IF NOT EXISTS idx_inbox_url_conversation
+           ON sources_inbox(url_hash, IFNULL(conversation_id, ''))""",
+    ],
+    17: [
+        # Per-file CDC: digest of the bytes before a byte-offset position
+        # (detects files rewritten in place without rotation)
+        "ALTER TABLE connector_files ADD COLUMN tail_digest TEXT",
+    ],
 }
 
 # Expected columns for schema verification (Option C - hybrid)
@@ -345,7 +409,7 @@ EXPECTED_ENTRY_COLUMNS = {
     "centrality_score",  # Knowledge graph hub score
 }
 
-EXPECTED_TABLES = {"entries", "tags", "links", "entries_fts", "embeddings", "suggestions", "metadata", "context_keywords", "sources", "entry_sources", "source_themes", "known_domains", "sources_inbox", "sources_staging", "connector_imports"}
+EXPECTED_TABLES = {"entries", "tags", "links", "entries_fts", "embeddings", "suggestions", "metadata", "context_keywords", "sources", "entry_sources", "source_themes", "known_domains", "sources_inbox", "sources_staging", "connector_imports", "keyword_stats", "connector_files"}
 
 
 # SQL statements for schema creation
@@ -459,6 +523,23 @@ def decompress_context(data: bytes) -> str:
     return zlib.decompress(data).decode("utf-8")
 
 
+class _DeferredCommitConnection:
+    """Connection proxy used inside Database.transaction().
+
+    Database methods commit after each write; inside a transaction their
+    commit() is a no-op and the transaction commits (or rolls back) once.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def commit(self) -> None:
+        """Defer to the enclosing transaction."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
 class Database:
     """SQLite database with FTS5 for knowledge entries."""
 
@@ -476,18 +557,11 @@ class Database:
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Connect with row factory for dict-like access
-        self.conn = sqlite3.connect(str(self.db_path))
-        self.conn.row_factory = sqlite3.Row
+        self.connect()
 
         # Secure file permissions (rw------- for sensitive data)
         secure_file_permissions(self.db_path)
 
-        # Enable WAL mode for better concurrency
-        self.conn.execute("PRAGMA journal_mode=WAL")
-        self.conn.execute("PRAGMA synchronous=NORMAL")
-        self.conn.execute("PRAGMA foreign_keys=ON")
-
         # Create schema
         self.conn.executescript(SCHEMA_ENTRIES)
         self.conn.executescript(SCHEMA_TAGS)
@@ -503,6 +577,25 @@ class Database:
 
         self.conn.commit()
 
+    def connect(self, check_same_thread: bool = True) -> None:
+        """Open the connection without schema setup.
+
+        Used directly by long-running processes for additional connections
+        once init() has created and verified the schema.
+
+        Args:
+            check_same_thread: Passed to sqlite3.connect (False lets the
+                owner close the connection from another thread)
+        """
+        # Connect with row factory for dict-like access
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=check_same_thread)
+        self.conn.row_factory = sqlite3.Row
+
+        # Enable WAL mode for better concurrency
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+
     def _migrate_schema(self) -> None:
         """Apply schema migrations using PRAGMA user_version tracking.
 
@@ -529,13 +622,17 @@ class Database:
             version: Target version to migrate to
 
         Raises:
-            sqlite3.Error: If migration fails (transaction rolled back)
+            sqlite3.Error: If migration fails (transaction rolled back,
+                like for any other error)
         """
         statements = MIGRATIONS.get(version, [])
         if not statements:
             return
 
-        # Each migration in a transaction for atomicity
+        # Each migration in a transaction for atomicity (sqlite3 does not
+        # open one implicitly before DDL)
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
         try:
             for sql in statements:
                 # Handle ALTER TABLE failures gracefully (column may exist)
@@ -549,14 +646,72 @@ class Database:
                 else:
                     self.conn.execute(sql)
 
+            # Data migrations that need Python, before the version bump
+            if version == 16:
+                self._backfill_inbox_url_hashes()
+
             # Update version after successful migration
             self.conn.execute(f"PRAGMA user_version = {version}")
             self.conn.commit()
 
-        except sqlite3.Error:
+        except Exception:
             self.conn.rollback()
             raise
 
+    def _backfill_inbox_url_hashes(self) -> None:
+        """Hash existing inbox URLs and drop the duplicates (migration v16).
+
+        Of each group of rows with the same normalized URL and conversation,
+        the enriched one (or else the oldest) is kept; staging rows that
+        referenced a dropped row point to the kept one instead. Runs inside
+        the migration's transaction (does not commit).
+        """
+        from rekall.utils import url_hash
+
+        rows = self.conn.execute(
+            """SELECT id, url, conversation_id FROM sources_inbox
+               WHERE url_hash IS NULL
+               ORDER BY enriched_at IS NULL, captured_at, rowid"""
+        ).fetchall()
+        if not rows:
+            return
+
+        keep: dict[tuple[str, str], str] = {}
+        replaced: dict[str, str] = {}  # dropped id -> kept id
+        for row in rows:
+            key = (url_hash(row["url"]), row["conversation_id"] or "")
+            if key in keep:
+                replaced[row["id"]] = keep[key]
+            else:
+                keep[key] = row["id"]
+
+        self.conn.executemany(
+            "DELETE FROM sources_inbox WHERE id = ?", [(inbox_id,) for inbox_id in replaced]
+        )
+        self.conn.executemany(
+            "UPDATE sources_inbox SET url_hash = ? WHERE id = ?",
+            [(key[0], inbox_id) for key, inbox_id in keep.items()],
+        )
+        if replaced:
+            self._remap_staging_inbox_ids(replaced)
+
+    def _remap_staging_inbox_ids(self, replaced: dict[str, str]) -> None:
+        """Point staging inbox_ids lists at the inbox rows that were kept.
+
+        Args:
+            replaced: Dropped inbox ID -> kept inbox ID
+        """
+        updates = []
+        for row in self.conn.execute(
+            "SELECT id, inbox_ids FROM sources_staging WHERE inbox_ids IS NOT NULL"
+        ):
+            ids = [i for i in row["inbox_ids"].split(",") if i]
+            if not any(i in replaced for i in ids):
+                continue
+            remapped = sorted({replaced.get(i, i) for i in ids})
+            updates.append((",".join(remapped), row["id"]))
+        self.conn.executemany("UPDATE sources_staging SET inbox_ids = ? WHERE id = ?", updates)
+
     def _verify_schema(self) -> None:
         """Verify schema matches expected state after migrations.
 
@@ -585,6 +740,63 @@ class Database:
                 f"Schema verification failed: missing columns in entries: {missing_columns}"
             )
 
+    @contextmanager
+    def transaction(self) -> Iterator[Database]:
+        """Group several write operations into one transaction.
+
+        Commits made by Database methods inside the block are deferred:
+        the block commits once on success (one fsync) and rolls back
+        everything on error. Nested blocks join the outer transaction.
+
+        Yields:
+            This database
+        """
+        if isinstance(self.conn, _DeferredCommitConnection):
+            yield self
+            return
+
+        real_conn = self.conn
+        self.conn = _DeferredCommitConnection(real_conn)  # type: ignore[assignment]
+        try:
+            yield self
+        except BaseException:
+            real_conn.rollback()
+            # Vectors cached for rolled-back writes would be stale
+            get_embedding_cache().clear()
+            raise
+        else:
+            real_conn.commit()
+        finally:
+            self.conn = real_conn
+
+    @contextmanager
+    def savepoint(self, name: str) -> Iterator[Database]:
+        """Undo the writes of a block on error, keeping the transaction open.
+
+        Used inside transaction(): a failing step is rolled back to the
+        savepoint while earlier steps stay pending for the outer commit.
+
+        Args:
+            name: Savepoint name (SQL identifier)
+
+        Yields:
+            This database
+        """
+        # sqlite3 opens no transaction before SAVEPOINT, and releasing an
+        # outermost savepoint would commit
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        self.conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield self
+        except BaseException:
+            self.conn.execute(f"ROLLBACK TO {name}")
+            self.conn.execute(f"RELEASE {name}")
+            get_embedding_cache().clear()
+            raise
+        else:
+            self.conn.execute(f"RELEASE {name}")
+
     def get_schema_version(self) -> int:
         """Get current schema version.
 
@@ -735,6 +947,80 @@ class Database:
 
         return entry
 
+    def get_entries_by_ids(self, entry_ids: list[str]) -> dict[str, Entry]:
+        """Get several entries in bulk (no access tracking).
+
+        Uses one query for the entries and one for their tags per chunk,
+        instead of two queries per entry.
+
+        Args:
+            entry_ids: ULIDs of the entries
+
+        Returns:
+            Dict mapping entry_id to Entry (missing IDs are omitted)
+        """
+        entries: dict[str, Entry] = {}
+        unique_ids = list(dict.fromkeys(entry_ids))
+
+        # Stay below SQLite's default host parameter limit
+        for start in range(0, len(unique_ids), 500):
+            chunk = unique_ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+
+            tags: dict[str, list[str]] = {}
+            for tag_row in self.conn.execute(
+                f"SELECT entry_id, tag FROM tags WHERE entry_id IN ({placeholders})",
+                chunk,
+            ):
+                tags.setdefault(tag_row[0], []).append(tag_row[1])
+
+            for row in self.conn.execute(
+                f"SELECT * FROM entries WHERE id IN ({placeholders})", chunk
+            ):
+                entries[row["id"]] = self._row_to_entry(row, tags.get(row["id"], []))
+
+        return entries
+
+    def get_filtered_entry_ids(
+        self,
+        entry_type: str | None = None,
+        project: str | None = None,
+        memory_type: str | None = None,
+        include_obsolete: bool = False,
+    ) -> set[str]:
+        """Get IDs of entries matching search filters.
+
+        Used to push filters into vector search (candidate mask).
+
+        Args:
+            entry_type: Filter by type (optional)
+            project: Filter by project (optional)
+            memory_type: Filter by memory_type (optional)
+            include_obsolete: Include obsolete entries (default False)
+
+        Returns:
+            Set of matching entry IDs
+        """
+        sql = "SELECT id FROM entries WHERE 1=1"
+        params: list = []
+
+        if not include_obsolete:
+            sql += " AND status = 'active'"
+
+        if entry_type:
+            sql += " AND type = ?"
+            params.append(entry_type)
+
+        if project:
+            sql += " AND project = ?"
+            params.append(project)
+
+        if memory_type:
+            sql += " AND memory_type = ?"
+            params.append(memory_type)
+
+        return {row[0] for row in self.conn.execute(sql, params)}
+
     def update(self, entry: Entry) -> None:
         """Update an existing entry.
 
@@ -928,6 +1214,16 @@ class Database:
     # Access Tracking Methods (Phase 2)
     # =========================================================================
 
+    def record_access(self, entry_ids: list[str]) -> None:
+        """Update access tracking for several entries in one transaction.
+
+        Args:
+            entry_ids: ULIDs of the entries
+        """
+        with self.transaction():
+            for entry_id in entry_ids:
+                self._update_access_tracking(entry_id)
+
     def _update_access_tracking(self, entry_id: str) -> None:
         """Update access tracking for an entry.
 
@@ -1477,6 +1773,33 @@ class Database:
     # Stale and Review Methods (Phase 2)
     # =========================================================================
 
+    def get_stale_entry_ids(self, days: int = 30, limit: int = 20) -> list[str]:
+        """Get IDs of entries not accessed in the specified number of days.
+
+        Same order as get_stale_entries(), without loading the entries.
+
+        Args:
+            days: Number of days threshold
+            limit: Maximum IDs to return
+
+        Returns:
+            List of entry IDs, least recently accessed first
+        """
+        from datetime import timedelta
+
+        threshold = datetime.now() - timedelta(days=days)
+        cursor = self.conn.execute(
+            """
+            SELECT id FROM entries
+            WHERE status = 'active'
+            AND (last_accessed IS NULL OR last_accessed < ?)
+            ORDER BY last_accessed ASC
+            LIMIT ?
+            """,
+            (threshold.isoformat(), limit),
+        )
+        return [row[0] for row in cursor.fetchall()]
+
     def get_stale_entries(self, days: int = 30, limit: int = 20) -> list[Entry]:
         """Get entries not accessed in the specified number of days.
 
@@ -1756,7 +2079,11 @@ class Database:
         return embeddings
 
     def get_all_vectors_batch(
-        self, embedding_type: str = "summary"
+        self,
+        embedding_type: str = "summary",
+        dimensions: int | None = None,
+        model_names: list[str] | None = None,
+        exclude_model_names: bool = False,
     ) -> tuple[list[str], "ndarray"] | None:  # ndarray from numpy
         """Get all embedding vectors as a numpy matrix for batch operations.
 
@@ -1765,6 +2092,9 @@ class Database:
 
         Args:
             embedding_type: Filter by type (default: 'summary')
+            dimensions: Only vectors of this size (optional)
+            model_names: Only vectors from these models (optional)
+            exclude_model_names: Invert model_names (exclude these models)
 
         Returns:
             Tuple of (entry_ids list, vectors ndarray) or None if no embeddings
@@ -1772,10 +2102,20 @@ class Database:
         """
         import numpy as np
 
-        cursor = self.conn.execute(
-            "SELECT entry_id, vector FROM embeddings WHERE embedding_type = ?",
-            (embedding_type,),
-        )
+        sql = "SELECT entry_id, vector FROM embeddings WHERE embedding_type = ?"
+        params: list = [embedding_type]
+
+        if dimensions is not None:
+            sql += " AND dimensions = ?"
+            params.append(dimensions)
+
+        if model_names:
+            placeholders = ",".join("?" * len(model_names))
+            operator = "NOT IN" if exclude_model_names else "IN"
+            sql += f" AND LOWER(model_name) {operator} ({placeholders})"
+            params.extend(name.lower() for name in model_names)
+
+        cursor = self.conn.execute(sql, params)
 
         entry_ids: list[str] = []
         vectors: list[np.ndarray] = []
@@ -2283,6 +2623,91 @@ class Database:
             entries.append(self._row_to_entry(row, tags))
         return entries
 
+    def score_keywords(
+        self,
+        keywords: list[str],
+        limit: int = 40,
+        entry_type: str | None = None,
+        project: str | None = None,
+        memory_type: str | None = None,
+    ) -> list[tuple[str, float, list[str]]]:
+        """Score entries by IDF-weighted trigger keyword matches (v13+).
+
+        Runs entirely in SQL against the context_keywords index: each
+        matched keyword contributes its IDF, ``log(1 + N / doc_freq)`` with
+        N the number of entries and doc_freq from keyword_stats. Scores are
+        normalized by the total weight of the query keywords. Only exact
+        keyword matches count; obsolete entries are excluded.
+
+        Args:
+            keywords: Query keywords
+            limit: Maximum entries to return
+            entry_type: Filter by type (optional)
+            project: Filter by project (optional)
+            memory_type: Filter by memory_type (optional)
+
+        Returns:
+            List of (entry_id, score 0.0-1.0, matched_keywords), best first
+        """
+        keywords = list(dict.fromkeys(kw.lower().strip() for kw in keywords if kw.strip()))
+        if not keywords:
+            return []
+
+        placeholders = ",".join("?" * len(keywords))
+        doc_freqs = {
+            row[0]: row[1]
+            for row in self.conn.execute(
+                f"SELECT keyword, doc_freq FROM keyword_stats WHERE keyword IN ({placeholders})",
+                keywords,
+            )
+        }
+        if not doc_freqs:
+            return []
+
+        total_entries = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        weights = {
+            kw: math.log(1.0 + total_entries / max(doc_freqs.get(kw, 0), 1))
+            for kw in keywords
+        }
+        total_weight = sum(weights.values())
+
+        # Only keywords present in the corpus can match
+        matched = [kw for kw in keywords if kw in doc_freqs]
+        values = ",".join(["(?, ?)"] * len(matched))
+        params: list = []
+        for kw in matched:
+            params.extend([kw, weights[kw]])
+
+        sql = f"""
+            WITH q(keyword, weight) AS (VALUES {values})
+            SELECT ck.entry_id, SUM(q.weight) AS score,
+                   GROUP_CONCAT(ck.keyword, char(31)) AS matched
+            FROM q
+            JOIN context_keywords ck ON ck.keyword = q.keyword
+            JOIN entries e ON e.id = ck.entry_id
+            WHERE e.status = 'active'
+        """
+
+        if entry_type:
+            sql += " AND e.type = ?"
+            params.append(entry_type)
+
+        if project:
+            sql += " AND e.project = ?"
+            params.append(project)
+
+        if memory_type:
+            sql += " AND e.memory_type = ?"
+            params.append(memory_type)
+
+        sql += " GROUP BY ck.entry_id ORDER BY score DESC LIMIT ?"
+        params.append(limit)
+
+        return [
+            (row[0], min(row[1] / total_weight, 1.0), row[2].split("\x1f"))
+            for row in self.conn.execute(sql, params)
+        ]
+
     def get_entries_with_structured_context(
         self, limit: int = 100
     ) -> list[tuple[Entry, StructuredContext]]:
@@ -4368,39 +4793,67 @@ class Database:
     def add_inbox_entry(self, entry: "InboxEntry") -> str:
         """Add a new inbox entry (Bronze layer).
 
+        The entry is ignored if the inbox already has the same URL
+        (normalized) for the same conversation.
+
         Args:
             entry: InboxEntry to add
 
         Returns:
             The entry ID
         """
+        self.add_inbox_entries([entry])
+        return entry.id
 
-        self.conn.execute(
+    def add_inbox_entries(self, entries: list["InboxEntry"]) -> int:
+        """Add inbox entries in one statement, skipping duplicates.
+
+        A duplicate has the same normalized URL and conversation as an
+        entry already in the inbox (or earlier in the list). Use inside
+        transaction() to group a whole scan in one commit.
+
+        Args:
+            entries: InboxEntry objects to add
+
+        Returns:
+            Number of entries inserted
+        """
+        from rekall.utils import url_hash
+
+        if not entries:
+            return 0
+
+        cursor = self.conn.executemany(
             """INSERT INTO sources_inbox
-               (id, url, domain, cli_source, project, conversation_id, user_query,
+               (id, url, url_hash, domain, cli_source, project, conversation_id, user_query,
                 assistant_snippet, surrounding_text, captured_at, import_source,
                 raw_json, is_valid, validation_error, enriched_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                entry.id,
-                entry.url,
-                entry.domain,
-                entry.cli_source,
-                entry.project,
-                entry.conversation_id,
-                entry.user_query,
-                entry.assistant_snippet,
-                entry.surrounding_text,
-                entry.captured_at.isoformat() if entry.captured_at else None,
-                entry.import_source,
-                entry.raw_json,
-                1 if entry.is_valid else 0,
-                entry.validation_error,
-                entry.enriched_at.isoformat() if entry.enriched_at else None,
-            ),
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT DO NOTHING""",
+            [
+                (
+                    entry.id,
+                    entry.url,
+                    url_hash(entry.url),
+                    entry.domain,
+                    entry.cli_source,
+                    entry.project,
+                    entry.conversation_id,
+                    entry.user_query,
+                    entry.assistant_snippet,
+                    entry.surrounding_text,
+                    entry.captured_at.isoformat() if entry.captured_at else None,
+                    entry.import_source,
+                    entry.raw_json,
+                    1 if entry.is_valid else 0,
+                    entry.validation_error,
+                    entry.enriched_at.isoformat() if entry.enriched_at else None,
+                )
+                for entry in entries
+            ],
         )
         self.conn.commit()
-        return entry.id
+        return cursor.rowcount
 
     def get_inbox_entries(
         self,
@@ -4778,43 +5231,214 @@ class Database:
         Returns:
             ConnectorImport or None if not found
         """
-        from rekall.models import ConnectorImport
-
         cursor = self.conn.execute(
             "SELECT * FROM connector_imports WHERE connector = ?", (connector,)
         )
         row = cursor.fetchone()
         if row:
-            return ConnectorImport(
-                connector=row["connector"],
-                last_import=datetime.fromisoformat(row["last_import"]) if row["last_import"] else None,
-                last_file_marker=row["last_file_marker"],
-                entries_imported=row["entries_imported"] or 0,
-                errors_count=row["errors_count"] or 0,
-            )
+            return self._row_to_connector_import(row)
         return None
 
+    def list_connector_imports(self) -> list["ConnectorImport"]:
+        """Get import tracking info for all connectors.
+
+        Returns:
+            List of ConnectorImport ordered by connector name
+        """
+        rows = self.conn.execute(
+            "SELECT * FROM connector_imports ORDER BY connector"
+        ).fetchall()
+        return [self._row_to_connector_import(row) for row in rows]
+
+    def _row_to_connector_import(self, row: sqlite3.Row) -> "ConnectorImport":
+        """Convert a database row to ConnectorImport."""
+        from rekall.models import ConnectorImport
+
+        def _dt(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return ConnectorImport(
+            connector=row["connector"],
+            last_import=_dt(row["last_import"]),
+            last_file_marker=row["last_file_marker"],
+            entries_imported=row["entries_imported"] or 0,
+            errors_count=row["errors_count"] or 0,
+            scan_status=row["scan_status"] or "idle",
+            scan_started_at=_dt(row["scan_started_at"]),
+            scan_finished_at=_dt(row["scan_finished_at"]),
+            last_duration_ms=row["last_duration_ms"],
+            last_imported=row["last_imported"] or 0,
+            last_error=row["last_error"],
+        )
+
     def upsert_connector_import(self, info: "ConnectorImport") -> None:
         """Insert or update connector import tracking.
 
         Args:
             info: ConnectorImport to upsert
         """
+        def _iso(value: Optional[datetime]) -> Optional[str]:
+            return value.isoformat() if value else None
+
         self.conn.execute(
             """INSERT INTO connector_imports
-               (connector, last_import, last_file_marker, entries_imported, errors_count)
-               VALUES (?, ?, ?, ?, ?)
+               (connector, last_import, last_file_marker, entries_imported, errors_count,
+                scan_status, scan_started_at, scan_finished_at, last_duration_ms,
+                last_imported, last_error)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                ON CONFLICT(connector) DO UPDATE SET
                last_import = excluded.last_import,
                last_file_marker = excluded.last_file_marker,
                entries_imported = excluded.entries_imported,
-               errors_count = excluded.errors_count""",
+               errors_count = excluded.errors_count,
+               scan_status = excluded.scan_status,
+               scan_started_at = excluded.scan_started_at,
+               scan_finished_at = excluded.scan_finished_at,
+               last_duration_ms = excluded.last_duration_ms,
+               last_imported = excluded.last_imported,
+               last_error = excluded.last_error""",
             (
                 info.connector,
-                info.last_import.isoformat() if info.last_import else None,
+                _iso(info.last_import),
                 info.last_file_marker,
                 info.entries_imported,
                 info.errors_count,
+                info.scan_status,
+                _iso(info.scan_started_at),
+                _iso(info.scan_finished_at),
+                info.last_duration_ms,
+                info.last_imported,
+                info.last_error,
+            ),
+        )
+        self.conn.commit()
+
+    def set_connector_scan_status(
+        self,
+        connector: str,
+        status: str,
+        started_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None,
+        duration_ms: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record scan progress without touching the CDC fields.
+
+        A connector never scanned gets a row with no last_import, so it
+        stays due for needs_scan().
+
+        Args:
+            connector: Connector name
+            status: 'running' when a scan starts, 'failed' when it fails
+            started_at: Start of the scan (kept if None)
+            finished_at: End of the scan (kept if None)
+            duration_ms: Duration of the scan (kept if None)
+            error: Error message (cleared if None)
+        """
+        self.conn.execute(
+            """INSERT INTO connector_imports
+               (connector, scan_status, scan_started_at, scan_finished_at,
+                last_duration_ms, last_error)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(connector) DO UPDATE SET
+               scan_status = excluded.scan_status,
+               scan_started_at = COALESCE(excluded.scan_started_at, scan_started_at),
+               scan_finished_at = COALESCE(excluded.scan_finished_at, scan_finished_at),
+               last_duration_ms = COALESCE(excluded.last_duration_ms, last_duration_ms),
+               last_error = excluded.last_error""",
+            (
+                connector,
+                status,
+                started_at.isoformat() if started_at else None,
+                finished_at.isoformat() if finished_at else None,
+                duration_ms,
+                error,
             ),
         )
         self.conn.commit()
+
+    def get_connector_files(self, connector: str) -> dict[str, "ConnectorFile"]:
+        """Get the per-file read positions of a connector.
+
+        Args:
+            connector: Connector name (e.g., 'claude', 'cursor')
+
+        Returns:
+            Dict of file path -> ConnectorFile
+        """
+        from rekall.models import ConnectorFile
+
+        cursor = self.conn.execute(
+            "SELECT * FROM connector_files WHERE connector = ?", (connector,)
+        )
+        return {
+            row["path"]: ConnectorFile(
+                connector=row["connector"],
+                path=row["path"],
+                inode=row["inode"],
+                size=row["size"],
+                mtime_ns=row["mtime_ns"],
+                position=row["position"],
+                state=row["state"],
+                tail_digest=row["tail_digest"],
+                scanned_at=datetime.fromisoformat(row["scanned_at"]) if row["scanned_at"] else None,
+            )
+            for row in cursor.fetchall()
+        }
+
+    def upsert_connector_files(self, files: list["ConnectorFile"]) -> None:
+        """Insert or update per-file read positions in one transaction.
+
+        Args:
+            files: ConnectorFile records to upsert
+        """
+        if not files:
+            return
+        self.conn.executemany(
+            """INSERT INTO connector_files
+               (connector, path, inode, size, mtime_ns, position, state, tail_digest,
+                scanned_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(connector, path) DO UPDATE SET
+               inode = excluded.inode,
+               size = excluded.size,
+               mtime_ns = excluded.mtime_ns,
+               position = excluded.position,
+               state = excluded.state,
+               tail_digest = excluded.tail_digest,
+               scanned_at = excluded.scanned_at""",
+            [
+                (
+                    f.connector,
+                    f.path,
+                    f.inode,
+                    f.size,
+                    f.mtime_ns,
+                    f.position,
+                    f.state,
+                    f.tail_digest,
+                    f.scanned_at.isoformat() if f.scanned_at else None,
+                )
+                for f in files
+            ],
+        )
+        self.conn.commit()
+
+    def delete_connector_files(self, connector: str, paths: list[str]) -> int:
+        """Forget the read positions of history files that no longer exist.
+
+        Args:
+            connector: Connector name
+            paths: File paths to forget
+
+        Returns:
+            Number of records deleted
+        """
+        if not paths:
+            return 0
+        cursor = self.conn.executemany(
+            "DELETE FROM connector_files WHERE connector = ? AND path = ?",
+            [(connector, path) for path in paths],
+        )
+        self.conn.commit()
+        return cursor.rowcount
@@ -1,7 +1,8 @@
 """Embedding service for semantic similarity in Rekall.
 
 This module handles:
-- Loading and managing the embedding model (sentence-transformers)
+- Loading and managing the embedding model (sentence-transformers or the
+  built-in hashing encoder, see rekall.encoders)
 - Calculating embeddings for entries (summary and context)
 - Finding similar entries via cosine similarity
 - Graceful degradation when embeddings are not configured
@@ -12,14 +13,23 @@ The embedding model is loaded lazily on first use to avoid startup overhead.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from rekall.cache import get_embedding_cache
+from rekall.encoders import (
+    HASHING_MODEL_NAMES,
+    encoder_dependencies_available,
+    is_hashing_model,
+)
+from rekall.metrics import timed
 
 if TYPE_CHECKING:
     import numpy as np
 
     from rekall.db import Database
+    from rekall.encode_batcher import EncodeBatcher
+    from rekall.model_manager import ModelManager
     from rekall.models import Entry
 
 logger = logging.getLogger(__name__)
@@ -30,6 +40,9 @@ MAX_CONTEXT_CHARS = 8000
 # Valid Matryoshka dimensions
 VALID_DIMENSIONS = (128, 384, 768)
 
+# Reciprocal rank fusion smoothing constant (hybrid search)
+RRF_K = 60
+
 
 class EmbeddingModelNotAvailable(Exception):
     """Raised when the embedding model cannot be loaded."""
@@ -53,7 +66,8 @@ class EmbeddingService:
         """Initialize the embedding service.
 
         Args:
-            model_name: Name of the sentence-transformers model to use
+            model_name: Name of the sentence-transformers model to use,
+                or "hashing" for the built-in hashing encoder
             dimensions: Embedding dimensions (128, 384, or 768 for Matryoshka)
             similarity_threshold: Minimum cosine similarity for suggestions
         """
@@ -63,6 +77,7 @@ class EmbeddingService:
         self._model = None
         self._available: bool | None = None
         self._model_dimensions: int | None = None
+        self._batcher: EncodeBatcher | None = None
 
     @property
     def available(self) -> bool:
@@ -71,22 +86,46 @@ class EmbeddingService:
             self._available = self._check_availability()
         return self._available
 
+    @property
+    def uses_hashing(self) -> bool:
+        """Whether the built-in hashing encoder is configured."""
+        return is_hashing_model(self.model_name)
+
+    @property
+    def _install_command(self) -> str:
+        """Command installing the dependencies of the configured encoder."""
+        if self.uses_hashing:
+            return "pip install numpy"
+        return "pip install sentence-transformers numpy"
+
     def _check_availability(self) -> bool:
         """Check if required dependencies are available.
 
         Returns:
-            True if sentence-transformers and numpy are available
+            True if numpy (and sentence-transformers for neural models)
+            are available
         """
-        try:
-            import numpy  # noqa: F401
-            import sentence_transformers  # noqa: F401
+        return encoder_dependencies_available(self.model_name)
 
-            return True
-        except ImportError:
-            return False
+    def _get_manager(self) -> ModelManager:
+        """Get the process-wide ModelManager for this service's model."""
+        from rekall.model_manager import get_model_manager
+
+        return get_model_manager(model_name=self.model_name, target_dimensions=self.dimensions)
+
+    def _get_model(self) -> Any:
+        """Get the encoder to use for the next call.
+
+        The ModelManager owns the model (so idle/memory-pressure unloads
+        actually free it); ``_model`` is only set when a model is injected
+        directly (tests, embedding scripts).
+        """
+        if self._model is not None:
+            return self._model
+        return self._get_manager().get_model()
 
     def _load_model(self) -> None:
-        """Load the embedding model lazily.
+        """Load the embedding model lazily (through the ModelManager).
 
         Displays a user-visible message during first load (can take 5-10s).
 
@@ -101,12 +140,20 @@ class EmbeddingService:
         if not self.available:
             raise EmbeddingModelNotAvailable(
                 "Embedding dependencies not available. "
-                "Install with: pip install sentence-transformers numpy"
+                f"Install with: {self._install_command}"
             )
 
-        try:
-            from sentence_transformers import SentenceTransformer
+        manager = self._get_manager()
+        if manager.is_loaded():
+            return
+
+        if self.uses_hashing:
+            # Built-in encoder: nothing to download, no user-visible message
+            manager.get_model()
+            self._model_dimensions = manager.dimensions
+            return
 
+        try:
             # User-visible message for first load (Feature 020: T017)
             logger.info(f"Loading embedding model: {self.model_name}")
             print(
@@ -115,8 +162,8 @@ class EmbeddingService:
                 flush=True,
             )
 
-            self._model = SentenceTransformer(self.model_name)
-            self._model_dimensions = self._model.get_sentence_embedding_dimension()
+            manager.get_model()
+            self._model_dimensions = manager.dimensions
 
             logger.info(
                 f"Model loaded. Native dimensions: {self._model_dimensions}, "
@@ -134,18 +181,28 @@ class EmbeddingService:
         Returns:
             Dict with availability, model name, dimensions, etc.
         """
+        from rekall.model_manager import current_model_manager
+
+        manager = current_model_manager()
+        manager_loaded = (
+            manager is not None
+            and manager.model_name == self.model_name
+            and manager.is_loaded()
+        )
+
         status = {
             "available": self.available,
+            "encoder": "hashing" if self.uses_hashing else "sentence-transformers",
             "model_name": self.model_name,
             "target_dimensions": self.dimensions,
-            "model_loaded": self._model is not None,
-            "native_dimensions": self._model_dimensions,
+            "model_loaded": self._model is not None or manager_loaded,
+            "native_dimensions": (
+                manager.dimensions if manager_loaded else self._model_dimensions
+            ),
         }
 
         if not self.available:
-            status["install_instructions"] = (
-                "pip install sentence-transformers numpy"
-            )
+            status["install_instructions"] = self._install_command
 
         return status
 
@@ -218,8 +275,11 @@ class EmbeddingService:
         # Truncate long text
         text = self._truncate_text(text)
 
-        # Calculate embedding
-        vector = self._model.encode(text, convert_to_numpy=True)
+        # Calculate embedding (batched with concurrent callers if enabled)
+        if self._batcher is not None:
+            vector = self._batcher.encode(text)
+        else:
+            vector = self._get_model().encode(text, convert_to_numpy=True)
 
         # Ensure float32
         vector = vector.astype(np.float32)
@@ -234,6 +294,50 @@ class EmbeddingService:
 
         return vector
 
+    def _encode_batch(self, texts: list[str]) -> np.ndarray:
+        """Encode several texts in one forward pass (used by the batcher).
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Array of shape (N, native_dimensions)
+        """
+        self._load_model()
+        return self._get_model().encode(texts, convert_to_numpy=True)
+
+    def enable_batching(self, max_batch_size: int = 32, max_wait_ms: float = 2.0) -> None:
+        """Route calculate() through a micro-batching queue.
+
+        Intended for long-running processes (MCP server) where several
+        callers encode concurrently. Idempotent.
+
+        Args:
+            max_batch_size: Maximum texts per forward pass
+            max_wait_ms: Gathering window after the first request
+        """
+        if self._batcher is not None:
+            return
+
+        from rekall.encode_batcher import EncodeBatcher
+
+        self._batcher = EncodeBatcher(
+            self._encode_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+        )
+
+    def disable_batching(self) -> None:
+        """Stop the micro-batching queue (pending requests are completed)."""
+        if self._batcher is not None:
+            self._batcher.close()
+            self._batcher = None
+
+    @property
+    def batching_stats(self) -> dict | None:
+        """Micro-batching statistics, or None if batching is disabled."""
+        return self._batcher.stats if self._batcher is not None else None
+
     def calculate_for_entry(
         self,
         entry: Entry,
@@ -268,6 +372,84 @@ class EmbeddingService:
             "context": context_vec,
         }
 
+    def _is_compatible(self, model_name: str, dimensions: int) -> bool:
+        """Check if a stored vector can be compared with this encoder's vectors.
+
+        Hashing and neural vectors live in unrelated spaces, and vectors
+        of different sizes cannot be compared at all.
+
+        Args:
+            model_name: Model that produced the stored vector
+            dimensions: Stored vector dimensions
+
+        Returns:
+            True if the vector belongs to the same encoder family and size
+        """
+        return (
+            dimensions == self.dimensions
+            and is_hashing_model(model_name) == self.uses_hashing
+        )
+
+    def _load_vectors(self, db: Database) -> tuple[np.ndarray, list[str]] | None:
+        """Load summary vectors compatible with this encoder.
+
+        Leverages EmbeddingCache to avoid reloading vectors on each search.
+        The cache is bound to the encoder so vectors of different encoders
+        never share a matrix.
+
+        Args:
+            db: Database instance
+
+        Returns:
+            Tuple of (vectors_matrix, entry_ids), or None if no vectors
+        """
+        cache = get_embedding_cache()
+        cache.bind_namespace(self._vector_namespace)
+        cache_result = cache.get_all_as_matrix()
+
+        if cache_result is not None:
+            # Use cached vectors
+            vectors_matrix, entry_ids = cache_result
+            logger.debug("Using cached vectors (%d entries)", len(entry_ids))
+            return vectors_matrix, entry_ids
+
+        # Cache miss - load from DB and populate cache
+        batch_result = db.get_all_vectors_batch(
+            "summary",
+            dimensions=self.dimensions,
+            model_names=list(HASHING_MODEL_NAMES),
+            exclude_model_names=not self.uses_hashing,
+        )
+        if batch_result is None:
+            return None
+
+        entry_ids, vectors_matrix = batch_result
+        logger.debug("Loaded %d vectors from DB, populating cache", len(entry_ids))
+
+        # Populate cache for future searches
+        for i, eid in enumerate(entry_ids):
+            cache.put(eid, vectors_matrix[i])
+
+        return vectors_matrix, entry_ids
+
+    def preload_vectors(self, db: Database) -> int:
+        """Load the vector matrix into the embedding cache ahead of searches.
+
+        Args:
+            db: Database instance
+
+        Returns:
+            Number of cached vectors
+        """
+        vectors = self._load_vectors(db)
+        return 0 if vectors is None else len(vectors[1])
+
+    @property
+    def _vector_namespace(self) -> str:
+        """Cache namespace identifying the encoder family and dimensions."""
+        family = "hashing" if self.uses_hashing else "neural"
+        return f"{family}:{self.dimensions}"
+
     def find_similar(
         self,
         entry_id: str,
@@ -278,7 +460,7 @@ class EmbeddingService:
         """Find entries similar to the given entry.
 
         Uses vectorized numpy operations for ~50x faster performance.
-        Leverages EmbeddingCache to avoid reloading vectors on each search.
+        Only vectors produced by the same encoder are compared.
 
         Args:
             entry_id: ID of the entry to find similar entries for
@@ -300,26 +482,19 @@ class EmbeddingService:
 
         target_vec = target_emb.to_numpy()
 
-        # Try cache first for fast repeated searches
-        cache = get_embedding_cache()
-        cache_result = cache.get_all_as_matrix()
-
-        if cache_result is not None:
-            # Use cached vectors
-            vectors_matrix, entry_ids = cache_result
-            logger.debug("Using cached vectors (%d entries)", len(entry_ids))
-        else:
-            # Cache miss - load from DB and populate cache
-            batch_result = db.get_all_vectors_batch("summary")
-            if batch_result is None:
-                return []
-
-            entry_ids, vectors_matrix = batch_result
-            logger.debug("Loaded %d vectors from DB, populating cache", len(entry_ids))
+        # Never compare vectors produced by different encoders
+        if not self._is_compatible(target_emb.model_name, target_emb.dimensions):
+            logger.warning(
+                f"Embedding of {entry_id} ({target_emb.model_name}, "
+                f"{target_emb.dimensions}d) does not match encoder "
+                f"{self.model_name} ({self.dimensions}d)"
+            )
+            return []
 
-            # Populate cache for future searches
-            for i, eid in enumerate(entry_ids):
-                cache.put(eid, vectors_matrix[i])
+        vectors = self._load_vectors(db)
+        if vectors is None:
+            return []
+        vectors_matrix, entry_ids = vectors
 
         # Vectorized similarity calculation (~50x faster)
         results = batch_cosine_similarity(
@@ -331,14 +506,7 @@ class EmbeddingService:
             exclude_id=entry_id,  # Exclude the target entry itself
         )
 
-        # Fetch full entries
-        similar_entries: list[tuple[Entry, float]] = []
-        for eid, score in results:
-            entry = db.get(eid, update_access=False)
-            if entry:
-                similar_entries.append((entry, score))
-
-        return similar_entries
+        return _hydrate(db, results)
 
     def semantic_search(
         self,
@@ -347,11 +515,15 @@ class EmbeddingService:
         context: str | None = None,
         threshold: float = 0.0,
         limit: int = 20,
+        entry_type: str | None = None,
+        project: str | None = None,
+        memory_type: str | None = None,
     ) -> list[tuple[Entry, float]]:
         """Search entries by semantic similarity to query.
 
         Uses vectorized numpy operations for ~50x faster performance.
         Leverages EmbeddingCache to avoid reloading vectors on each search.
+        Filters are applied before scoring (only matching entries are compared).
 
         Args:
             query: Search query text
@@ -359,43 +531,64 @@ class EmbeddingService:
             context: Optional conversation context for better matching
             threshold: Minimum similarity score
             limit: Maximum number of results
+            entry_type: Filter by type
+            project: Filter by project
+            memory_type: Filter by memory type
 
         Returns:
             List of (Entry, similarity_score) tuples, sorted by score descending
         """
-        # Calculate query embedding
-        search_text = query
-        if context:
-            search_text = f"{context}\n\n{query}"
-
-        query_vec = self.calculate(search_text)
+        query_vec = self._timed_calculate(_search_text(query, context))
         if query_vec is None:
             logger.warning("Could not calculate query embedding")
             return []
 
-        # Try cache first for fast repeated searches
-        cache = get_embedding_cache()
-        cache_result = cache.get_all_as_matrix()
+        candidate_ids = None
+        if entry_type or project or memory_type:
+            candidate_ids = db.get_filtered_entry_ids(
+                entry_type=entry_type,
+                project=project,
+                memory_type=memory_type,
+                include_obsolete=True,
+            )
 
-        if cache_result is not None:
-            # Use cached vectors
-            vectors_matrix, entry_ids = cache_result
-            logger.debug("Using cached vectors (%d entries)", len(entry_ids))
-        else:
-            # Cache miss - load from DB and populate cache
-            batch_result = db.get_all_vectors_batch("summary")
-            if batch_result is None:
-                return []
+        results = self._rank_vectors(
+            query_vec, db, candidate_ids, threshold=threshold, limit=limit
+        )
+        return _hydrate(db, results)
+
+    def _timed_calculate(self, text: str) -> np.ndarray | None:
+        """Encode a search query, recording the encode latency."""
+        with timed("search.encode"):
+            return self.calculate(text)
+
+    def _rank_vectors(
+        self,
+        query_vec: np.ndarray,
+        db: Database,
+        candidate_ids: set[str] | None,
+        threshold: float = 0.0,
+        limit: int = 20,
+    ) -> list[tuple[str, float]]:
+        """Score stored vectors against a query vector.
 
-            entry_ids, vectors_matrix = batch_result
-            logger.debug("Loaded %d vectors from DB, populating cache", len(entry_ids))
+        Args:
+            query_vec: Query embedding
+            db: Database instance
+            candidate_ids: Restrict scoring to these entries (None = all)
+            threshold: Minimum similarity score
+            limit: Maximum number of results
 
-            # Populate cache for future searches
-            for i, eid in enumerate(entry_ids):
-                cache.put(eid, vectors_matrix[i])
+        Returns:
+            List of (entry_id, similarity_score), sorted by score descending
+        """
+        vectors = self._load_vectors(db)
+        if vectors is None:
+            return []
+        vectors_matrix, entry_ids = mask_vectors(*vectors, candidate_ids)
 
         # Vectorized similarity calculation (~50x faster)
-        results = batch_cosine_similarity(
+        return batch_cosine_similarity(
             query_vec=query_vec,
             vectors_matrix=vectors_matrix,
             entry_ids=entry_ids,
@@ -403,15 +596,6 @@ class EmbeddingService:
             limit=limit,
         )
 
-        # Fetch full entries
-        similar_entries: list[tuple[Entry, float]] = []
-        for eid, score in results:
-            entry = db.get(eid, update_access=False)
-            if entry:
-                similar_entries.append((entry, score))
-
-        return similar_entries
-
     def hybrid_search(
         self,
         query: str,
@@ -424,127 +608,118 @@ class EmbeddingService:
         entry_type: str | None = None,
         project: str | None = None,
         memory_type: str | None = None,
+        update_access: bool = True,
     ) -> list[tuple[Entry, float, float | None, list[str]]]:
         """Hybrid search combining FTS, semantic similarity, and keyword matching.
 
-        Uses three scoring components:
+        Uses three ranking legs:
         1. FTS (Full-Text Search) - traditional text matching
         2. Semantic - embedding cosine similarity
-        3. Keywords - structured context trigger_keywords matching
+        3. Keywords - IDF-weighted trigger_keywords matches, scored in SQL
+
+        Filters are pushed into every leg (SQL for FTS/keywords, a candidate
+        mask for vectors), so each leg only ranks entries that can be
+        returned. The query embedding (the slow part) is computed on a
+        worker thread while the SQL legs run; legs are fused with weighted
+        reciprocal rank fusion and the final entries loaded in bulk.
 
         Args:
             query: Search query text
             db: Database instance
             context: Optional conversation context
             limit: Maximum number of results
-            fts_weight: Weight for FTS score (default 0.5)
-            semantic_weight: Weight for semantic score (default 0.3)
-            keyword_weight: Weight for keyword score (default 0.2)
+            fts_weight: Weight of the FTS leg (default 0.5)
+            semantic_weight: Weight of the semantic leg (default 0.3)
+            keyword_weight: Weight of the keyword leg (default 0.2)
             entry_type: Filter by type
             project: Filter by project
             memory_type: Filter by memory type
+            update_access: Track access for the FTS candidates (default True)
 
         Returns:
-            List of (Entry, combined_score, semantic_score, matched_keywords) tuples
+            List of (Entry, fused_score, semantic_score, matched_keywords) tuples
         """
-        from rekall.context_extractor import (
-            calculate_keyword_score,
-            extract_keywords,
-            get_matching_keywords,
-        )
+        from rekall.context_extractor import extract_keywords
 
-        # Extract keywords from query for matching
-        query_keywords = extract_keywords(query, context or "", max_keywords=10)
+        candidate_limit = limit * 2  # Get more per leg for fusion
 
-        # Get FTS results
-        fts_results = db.search(
-            query,
-            entry_type=entry_type,
-            project=project,
-            memory_type=memory_type,
-            limit=limit * 2,  # Get more for merging
-        )
-
-        # Normalize FTS scores (rank to 0-1 score)
-        fts_scores: dict[str, float] = {}
-        for result in fts_results:
-            # BM25 rank: lower = better, normalize to 0-1
-            normalized = 1.0 / (1.0 + (result.rank or 0))
-            fts_scores[result.entry.id] = normalized
-
-        # Get semantic results if available
-        semantic_scores: dict[str, float] = {}
+        # Start the query embedding first so it overlaps with the SQL legs
+        # (SQLite connections are bound to their thread, so SQL stays here)
+        query_future = None
         if self.available:
-            semantic_results = self.semantic_search(
-                query, db, context=context, limit=limit * 2
+            query_future = _get_search_executor().submit(
+                self._timed_calculate, _search_text(query, context)
             )
-            for entry, score in semantic_results:
-                semantic_scores[entry.id] = score
-
-        # Get keyword scores from structured context
-        keyword_scores: dict[str, float] = {}
-        matched_keywords_map: dict[str, list[str]] = {}
-
-        # Get all entries with structured context
-        entries_with_context = db.get_entries_with_structured_context(limit=500)
-        for entry, structured_ctx in entries_with_context:
-            if structured_ctx and structured_ctx.trigger_keywords:
-                kw_score = calculate_keyword_score(
-                    query_keywords, structured_ctx.trigger_keywords
-                )
-                if kw_score > 0:
-                    keyword_scores[entry.id] = kw_score
-                    matched_keywords_map[entry.id] = get_matching_keywords(
-                        query_keywords, structured_ctx.trigger_keywords
-                    )
 
-        # Combine scores from all sources
-        all_entry_ids = (
-            set(fts_scores.keys())
-            | set(semantic_scores.keys())
-            | set(keyword_scores.keys())
-        )
-        combined: list[tuple[str, float, float | None, list[str]]] = []
-
-        for entry_id in all_entry_ids:
-            fts_score = fts_scores.get(entry_id, 0.0)
-            sem_score = semantic_scores.get(entry_id)
-            kw_score = keyword_scores.get(entry_id, 0.0)
-            matched_kws = matched_keywords_map.get(entry_id, [])
-
-            # Calculate combined score
-            if sem_score is not None:
-                final_score = (
-                    fts_weight * fts_score
-                    + semantic_weight * sem_score
-                    + keyword_weight * kw_score
+        try:
+            # FTS leg (filters in SQL)
+            with timed("search.fts"):
+                fts_results = db.search(
+                    query,
+                    entry_type=entry_type,
+                    project=project,
+                    memory_type=memory_type,
+                    limit=candidate_limit,
+                    update_access=update_access,
                 )
-            else:
-                # No semantic score - redistribute weight to FTS and keywords
-                adjusted_fts = fts_weight + semantic_weight * 0.6
-                adjusted_kw = keyword_weight + semantic_weight * 0.4
-                final_score = adjusted_fts * fts_score + adjusted_kw * kw_score
-
-            combined.append((entry_id, final_score, sem_score, matched_kws))
-
-        # Sort by combined score descending
-        combined.sort(key=lambda x: x[1], reverse=True)
-
-        # Limit and fetch entries
+            fts_ranked = [result.entry.id for result in fts_results]
+
+            # Keyword leg (IDF-weighted, scored in SQL on context_keywords)
+            with timed("search.keywords"):
+                query_keywords = extract_keywords(query, context or "", max_keywords=10)
+                keyword_results = db.score_keywords(
+                    query_keywords,
+                    limit=candidate_limit,
+                    entry_type=entry_type,
+                    project=project,
+                    memory_type=memory_type,
+                )
+            keyword_ranked = [entry_id for entry_id, _, _ in keyword_results]
+            matched_keywords_map = {
+                entry_id: matched for entry_id, _, matched in keyword_results
+            }
+
+            # Semantic leg (filters as candidate mask)
+            semantic_scores: dict[str, float] = {}
+            if query_future is not None:
+                candidate_ids = db.get_filtered_entry_ids(
+                    entry_type=entry_type, project=project, memory_type=memory_type
+                )
+                query_vec = query_future.result()
+                if query_vec is not None:
+                    with timed("search.semantic"):
+                        semantic_scores = dict(
+                            self._rank_vectors(
+                                query_vec, db, candidate_ids, limit=candidate_limit
+                            )
+                        )
+        finally:
+            if query_future is not None:
+                query_future.cancel()
+
+        fused = reciprocal_rank_fusion(
+            [
+                (fts_ranked, fts_weight),
+                (list(semantic_scores), semantic_weight),
+                (keyword_ranked, keyword_weight),
+            ]
+        )[:limit]
+
+        # Bulk hydration of the final page
+        with timed("search.hydrate"):
+            entries = db.get_entries_by_ids([entry_id for entry_id, _ in fused])
         results: list[tuple[Entry, float, float | None, list[str]]] = []
-        for entry_id, final_score, sem_score, matched_kws in combined[:limit]:
-            # Check filters if entry came from semantic only
-            entry = db.get(entry_id, update_access=False)
+        for entry_id, fused_score in fused:
+            entry = entries.get(entry_id)
             if entry:
-                # Apply filters for semantic-only results
-                if entry_id not in fts_scores:
-                    if entry_type and entry.type != entry_type:
-                        continue
-                    if project and entry.project != project:
-                        continue
-                    if memory_type and entry.memory_type != memory_type:
-                        continue
-                results.append((entry, final_score, sem_score, matched_kws))
+                results.append(
+                    (
+                        entry,
+                        fused_score,
+                        semantic_scores.get(entry_id),
+                        matched_keywords_map.get(entry_id, []),
+                    )
+                )
 
         return results
 
@@ -624,6 +799,60 @@ def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     return float(dot / (norm1 * norm2))
 
 
+def mask_vectors(
+    vectors_matrix: np.ndarray,
+    entry_ids: list[str],
+    candidate_ids: set[str] | None,
+) -> tuple[np.ndarray, list[str]]:
+    """Restrict a vector matrix to candidate entries.
+
+    Args:
+        vectors_matrix: Matrix of vectors (N, D)
+        entry_ids: Entry IDs of the matrix rows
+        candidate_ids: Entries to keep (None = keep all)
+
+    Returns:
+        Tuple of (masked matrix, masked entry IDs)
+    """
+    import numpy as np
+
+    if candidate_ids is None:
+        return vectors_matrix, entry_ids
+
+    mask = np.fromiter(
+        (eid in candidate_ids for eid in entry_ids), dtype=bool, count=len(entry_ids)
+    )
+    kept_ids = [eid for eid, keep in zip(entry_ids, mask, strict=True) if keep]
+    return vectors_matrix[mask], kept_ids
+
+
+def reciprocal_rank_fusion(
+    rankings: list[tuple[list[str], float]],
+    k: int = RRF_K,
+) -> list[tuple[str, float]]:
+    """Fuse ranked lists with weighted reciprocal rank fusion.
+
+    Each list contributes ``weight / (k + rank)`` (rank starting at 1) to
+    the score of its entries. Rank-based fusion needs no normalization of
+    the heterogeneous leg scores (BM25, cosine, keyword overlap).
+
+    Args:
+        rankings: List of (ranked entry IDs, weight) pairs
+        k: Smoothing constant (default: 60)
+
+    Returns:
+        List of (entry_id, fused_score), sorted by score descending
+    """
+    scores: dict[str, float] = {}
+    for ranked_ids, weight in rankings:
+        if weight <= 0:
+            continue
+        for rank, entry_id in enumerate(ranked_ids, start=1):
+            scores[entry_id] = scores.get(entry_id, 0.0) + weight / (k + rank)
+
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
 def batch_cosine_similarity(
     query_vec: np.ndarray,
     vectors_matrix: np.ndarray,
@@ -684,6 +913,34 @@ def batch_cosine_similarity(
     return results[:limit]
 
 
+def _search_text(query: str, context: str | None) -> str:
+    """Build the text embedded for a search query."""
+    if context:
+        return f"{context}\n\n{query}"
+    return query
+
+
+def _hydrate(db: Database, scored: list[tuple[str, float]]) -> list[tuple[Entry, float]]:
+    """Load entries for scored IDs in bulk, keeping the order."""
+    entries = db.get_entries_by_ids([eid for eid, _ in scored])
+    return [(entries[eid], score) for eid, score in scored if eid in entries]
+
+
+# Thread pool running query encodings alongside SQL search legs
+_search_executor: ThreadPoolExecutor | None = None
+
+
+def _get_search_executor() -> ThreadPoolExecutor:
+    """Get or create the search thread pool."""
+    global _search_executor
+
+    if _search_executor is None:
+        _search_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="rekall-search"
+        )
+    return _search_executor
+
+
 # Singleton instance for convenience
 _embedding_service: EmbeddingService | None = None
 
@@ -696,7 +953,7 @@ def get_embedding_service(
     """Get the global embedding service instance.
 
     Args:
-        model_name: Override default model name
+        model_name: Override model name (default: config smart_embeddings_model)
         dimensions: Override default dimensions
         similarity_threshold: Override default threshold
 
@@ -705,17 +962,35 @@ def get_embedding_service(
     """
     global _embedding_service
 
-    # Create new instance if params specified or none exists
-    if _embedding_service is None or any([model_name, dimensions, similarity_threshold]):
-        kwargs = {}
-        if model_name:
-            kwargs["model_name"] = model_name
-        if dimensions:
-            kwargs["dimensions"] = dimensions
-        if similarity_threshold:
-            kwargs["similarity_threshold"] = similarity_threshold
-
-        _embedding_service = EmbeddingService(**kwargs)
+    # Reuse the existing instance unless a requested param differs
+    # (recreating it would reload the model and drop the batch queue)
+    if _embedding_service is not None:
+        requested = {
+            "model_name": model_name,
+            "dimensions": dimensions,
+            "similarity_threshold": similarity_threshold,
+        }
+        if all(
+            getattr(_embedding_service, key) == value
+            for key, value in requested.items()
+            if value
+        ):
+            return _embedding_service
+        _embedding_service.disable_batching()
+
+    kwargs = {}
+    if not model_name:
+        from rekall.config import get_config
+
+        model_name = get_config().smart_embeddings_model
+    if model_name:
+        kwargs["model_name"] = model_name
+    if dimensions:
+        kwargs["dimensions"] = dimensions
+    if similarity_threshold:
+        kwargs["similarity_threshold"] = similarity_threshold
+
+    _embedding_service = EmbeddingService(**kwargs)
 
     return _embedding_service
 
@@ -723,4 +998,6 @@ def get_embedding_service(
 def reset_embedding_service() -> None:
     """Reset the global embedding service (for testing)."""
     global _embedding_service
+    if _embedding_service is not None:
+        _embedding_service.disable_batching()
     _embedding_service = None
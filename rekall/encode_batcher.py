@@ -0,0 +1,204 @@
+"""Dynamic micro-batching of encode requests.
+
+Feature 020 extension: in long-running processes (MCP server), concurrent
+callers each encode a single string. EncodeBatcher gathers requests that
+arrive within a short window (up to a maximum batch size), runs a single
+batched forward pass and resolves each caller's future.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Sentinel used to stop the worker thread
+_STOP = object()
+
+
+class EncodeBatcher:
+    """Queue in front of an encoder that batches concurrent requests.
+
+    A single daemon worker thread takes the first pending request, drains
+    requests already queued, then waits at most ``max_wait_ms`` for more
+    (until ``max_batch_size`` is reached) before calling ``encode_fn`` once
+    for the whole batch. A lone request therefore only pays the wait window
+    (a few milliseconds) on top of its forward pass.
+
+    Attributes:
+        max_batch_size: Maximum number of texts per forward pass
+        max_wait_ms: Maximum time to wait for more requests after the first
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[list[str]], Any],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            encode_fn: Function encoding a list of texts into an (N, D) array
+            max_batch_size: Maximum texts per batch (default: 32)
+            max_wait_ms: Gathering window after the first request (default: 2ms)
+        """
+        self._encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # Statistics
+        self._batches = 0
+        self._items = 0
+        self._largest_batch = 0
+
+    def submit(self, text: str) -> Future:
+        """Queue a text for encoding.
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            Future resolved with the 1D vector (or the encoder's exception)
+
+        Raises:
+            RuntimeError: If the batcher has been closed
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EncodeBatcher is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="rekall-encode-batcher", daemon=True
+                )
+                self._thread.start()
+            self._queue.put((text, future))
+        return future
+
+    def encode(self, text: str, timeout: float | None = None) -> np.ndarray:
+        """Encode a text through the batch queue (blocking).
+
+        Args:
+            text: Text to encode
+            timeout: Maximum seconds to wait for the result (default: no limit)
+
+        Returns:
+            Encoded vector
+        """
+        return self.submit(text).result(timeout=timeout)
+
+    def _gather(self, first: Any) -> tuple[list[tuple[str, Future]], bool]:
+        """Collect a batch starting with the first request.
+
+        Returns:
+            Tuple of (batch, stop_requested)
+        """
+        batch = [first]
+        deadline = monotonic() + self.max_wait_ms / 1000.0
+
+        while len(batch) < self.max_batch_size:
+            try:
+                # Drain requests already queued without waiting
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    def _run(self) -> None:
+        """Worker loop: gather, encode, resolve futures."""
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+
+            batch, stop = self._gather(first)
+
+            # Skip requests cancelled while waiting in the queue
+            live = [(t, f) for t, f in batch if f.set_running_or_notify_cancel()]
+            if live:
+                self._process(live)
+
+            if stop:
+                return
+
+    def _process(self, batch: list[tuple[str, Future]]) -> None:
+        """Run one forward pass and resolve the batch futures."""
+        texts = [text for text, _ in batch]
+        try:
+            vectors = self._encode_fn(texts)
+            if len(vectors) != len(texts):
+                raise ValueError(
+                    f"Encoder returned {len(vectors)} vectors for {len(texts)} texts"
+                )
+        except Exception as e:
+            logger.warning("Batched encode failed (%d texts): %s", len(texts), e)
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors, strict=True):
+            future.set_result(vector)
+
+        self._batches += 1
+        self._items += len(batch)
+        self._largest_batch = max(self._largest_batch, len(batch))
+        logger.debug("Encoded batch of %d texts", len(batch))
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Stop the worker thread after pending requests are processed.
+
+        Safe to call multiple times.
+
+        Args:
+            timeout: Maximum seconds to wait for the worker to exit
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout=timeout)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get batcher statistics.
+
+        Returns:
+            Dict with batches, items, avg_batch_size, largest_batch, settings
+        """
+        return {
+            "batches": self._batches,
+            "items": self._items,
+            "avg_batch_size": round(self._items / self._batches, 2) if self._batches else 0.0,
+            "largest_batch": self._largest_batch,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+        }
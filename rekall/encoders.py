@@ -0,0 +1,240 @@
+"""Pluggable text encoders for Rekall embeddings.
+
+Two backends share the same minimal contract (a subset of the
+sentence-transformers API, so a ``SentenceTransformer`` instance satisfies it
+as-is):
+
+- sentence-transformers models (neural, requires a model download)
+- ``HashingEncoder``: dependency-free feature hashing implemented in numpy,
+  no download, vectors in microseconds
+
+Select the hashing encoder with ``smart_embeddings_model = "hashing"``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Model names that select the built-in hashing encoder
+HASHING_MODEL_NAMES = ("hashing", "rekall-hashing")
+
+# Relative weights of the hashed feature families
+WORD_WEIGHT = 1.0
+BIGRAM_WEIGHT = 0.7
+TRIGRAM_WEIGHT = 0.3
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def is_hashing_model(model_name: str | None) -> bool:
+    """Check if a model name selects the built-in hashing encoder.
+
+    Args:
+        model_name: Configured model name
+
+    Returns:
+        True for "hashing" / "rekall-hashing" (case-insensitive)
+    """
+    if not model_name:
+        return False
+    return model_name.strip().lower() in HASHING_MODEL_NAMES
+
+
+class Encoder(ABC):
+    """Interface for text encoders.
+
+    Mirrors the subset of the sentence-transformers API used by
+    EmbeddingService, so neural models and built-in encoders are
+    interchangeable.
+    """
+
+    @abstractmethod
+    def encode(
+        self,
+        sentences: str | list[str],
+        convert_to_numpy: bool = True,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Encode one text (1D result) or a list of texts (2D result)."""
+        ...
+
+    @abstractmethod
+    def get_sentence_embedding_dimension(self) -> int:
+        """Return the native dimension of produced vectors."""
+        ...
+
+
+@lru_cache(maxsize=65536)
+def _hash_feature(feature: str, dimensions: int) -> tuple[int, float]:
+    """Map a feature string to a (bucket, sign) pair.
+
+    Uses crc32 (stable across processes, unlike ``hash()``): the low bit
+    gives the sign, the remaining bits the bucket.
+    """
+    h = zlib.crc32(feature.encode("utf-8"))
+    sign = 1.0 if h & 1 else -1.0
+    return (h >> 1) % dimensions, sign
+
+
+class HashingEncoder(Encoder):
+    """Feature-hashing encoder (no model, no download).
+
+    Each text is turned into weighted features (words, word bigrams and
+    character trigrams), hashed into a fixed number of buckets with a
+    signed hash, weighted with sublinear term frequency and L2-normalized.
+    Cosine similarity between vectors then approximates TF-weighted
+    lexical overlap, which is a reasonable fallback when no neural model
+    is available.
+
+    Attributes:
+        dimensions: Size of produced vectors
+    """
+
+    def __init__(self, dimensions: int = 384) -> None:
+        """Initialize the encoder.
+
+        Args:
+            dimensions: Output vector size (default: 384)
+        """
+        if dimensions <= 0:
+            raise ValueError(f"dimensions must be positive, got {dimensions}")
+        self.dimensions = dimensions
+
+    def _features(self, text: str) -> Counter[str]:
+        """Extract weighted features from text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Counter mapping feature string to accumulated weight
+        """
+        from rekall.context_extractor import STOPWORDS
+
+        words = [w for w in _TOKEN_RE.findall(text.lower()) if w not in STOPWORDS]
+        features: Counter[str] = Counter()
+
+        for word in words:
+            features["w:" + word] += WORD_WEIGHT
+            padded = f"<{word}>"
+            for i in range(len(padded) - 2):
+                features["c:" + padded[i : i + 3]] += TRIGRAM_WEIGHT
+
+        for first, second in zip(words, words[1:], strict=False):
+            features[f"b:{first} {second}"] += BIGRAM_WEIGHT
+
+        return features
+
+    def _encode_one(self, text: str) -> np.ndarray:
+        """Encode a single text into a normalized float32 vector."""
+        import numpy as np
+
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        features = self._features(text)
+        if not features:
+            return vector
+
+        indices = np.empty(len(features), dtype=np.int64)
+        values = np.empty(len(features), dtype=np.float32)
+        for i, (feature, weight) in enumerate(features.items()):
+            bucket, sign = _hash_feature(feature, self.dimensions)
+            indices[i] = bucket
+            # Sublinear TF dampens repeated terms
+            values[i] = sign * (1.0 + math.log(weight)) if weight >= 1.0 else sign * weight
+
+        np.add.at(vector, indices, values)
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def encode(
+        self,
+        sentences: str | list[str],
+        convert_to_numpy: bool = True,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Encode one text or a batch of texts.
+
+        Args:
+            sentences: Text or list of texts
+            convert_to_numpy: Accepted for API compatibility (always numpy)
+            **kwargs: Ignored (batch_size, show_progress_bar, ...)
+
+        Returns:
+            Array of shape (dimensions,) for a string, (N, dimensions) for a list
+        """
+        import numpy as np
+
+        if isinstance(sentences, str):
+            return self._encode_one(sentences)
+
+        if not sentences:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        return np.vstack([self._encode_one(s) for s in sentences])
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """Return the configured dimension."""
+        return self.dimensions
+
+
+def encoder_dependencies_available(model_name: str) -> bool:
+    """Check whether the dependencies of an encoder are installed.
+
+    Args:
+        model_name: Configured model name
+
+    Returns:
+        True if the encoder can be loaded
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+
+    if is_hashing_model(model_name):
+        return True
+
+    try:
+        import sentence_transformers  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def load_encoder(model_name: str, dimensions: int = 384) -> Any:
+    """Create the encoder for a model name.
+
+    Args:
+        model_name: "hashing" for the built-in encoder, otherwise a
+            sentence-transformers model name
+        dimensions: Output dimensions (used by the hashing encoder; neural
+            models are reduced later via Matryoshka truncation)
+
+    Returns:
+        Encoder-compatible object (HashingEncoder or SentenceTransformer)
+
+    Raises:
+        ImportError: If sentence-transformers is required but missing
+    """
+    if is_hashing_model(model_name):
+        logger.debug("Using hashing encoder (%d dimensions)", dimensions)
+        return HashingEncoder(dimensions=dimensions)
+
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
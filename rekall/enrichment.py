@@ -5,19 +5,33 @@ This module handles the Bronze → Silver transformation:
 - Classifies content type (documentation, repository, forum, etc.)
 - Detects language
 - Merges duplicate URLs into staging entries
+
+Batches are fetched concurrently through one pooled HTTP client, within a
+global concurrency limit and per-host limits with a politeness delay, and
+written back to the database in batched transactions.
 """
 
 from __future__ import annotations
 
+import asyncio
 import re
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import urlparse
 
 if TYPE_CHECKING:
     from rekall.db import Database
     from rekall.models import InboxEntry, StagingEntry
 
+USER_AGENT = "Rekall/1.0 (Knowledge Management)"
+
+# Enrichment results written per transaction
+WRITE_BATCH_SIZE = 25
+
 
 @dataclass
 class EnrichmentResult:
@@ -158,15 +172,46 @@ def detect_language(html: str) -> Optional[str]:
     return None
 
 
+def create_http_client(timeout: float = 10.0, max_connections: int = 16) -> Any:
+    """Create the pooled HTTP client shared by an enrichment run.
+
+    Args:
+        timeout: Request timeout in seconds
+        max_connections: Connection pool size (keep-alive connections included)
+
+    Returns:
+        httpx.AsyncClient (use as an async context manager)
+    """
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "httpx and beautifulsoup4 are required for enrichment. "
+            "Install with: pip install httpx beautifulsoup4"
+        ) from e
+
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    )
+
+
 async def fetch_metadata(
     url: str,
     timeout: float = 10.0,
+    client: Optional[Any] = None,
 ) -> tuple[Optional[str], Optional[str], Optional[str], Optional[str], bool, Optional[int]]:
     """Fetch metadata from a URL.
 
     Args:
         url: URL to fetch
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds (when no client is given)
+        client: Shared httpx.AsyncClient (a one-off client is created if None)
 
     Returns:
         Tuple of (title, description, content_type, language, is_accessible, http_status)
@@ -180,6 +225,14 @@ async def fetch_metadata(
             "Install with: pip install httpx beautifulsoup4"
         ) from e
 
+    if client is None:
+        async with httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+        ) as own_client:
+            return await fetch_metadata(url, timeout, client=own_client)
+
     title = None
     description = None
     content_type = None
@@ -188,47 +241,42 @@ async def fetch_metadata(
     http_status = None
 
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-            headers={"User-Agent": "Rekall/1.0 (Knowledge Management)"},
-        ) as client:
-            response = await client.get(url)
-            http_status = response.status_code
-
-            if response.status_code >= 400:
-                is_accessible = False
-                content_type = classify_content_type(url)
-                return title, description, content_type, language, is_accessible, http_status
-
-            # Parse HTML
-            html = response.text
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Extract title
-            if soup.title and soup.title.string:
-                title = soup.title.string.strip()
-            else:
-                # Try og:title
-                og_title = soup.find("meta", property="og:title")
-                if og_title and og_title.get("content"):
-                    title = og_title["content"].strip()
-
-            # Extract description
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            if meta_desc and meta_desc.get("content"):
-                description = meta_desc["content"].strip()
-            else:
-                # Try og:description
-                og_desc = soup.find("meta", property="og:description")
-                if og_desc and og_desc.get("content"):
-                    description = og_desc["content"].strip()
+        response = await client.get(url)
+        http_status = response.status_code
+
+        if response.status_code >= 400:
+            is_accessible = False
+            content_type = classify_content_type(url)
+            return title, description, content_type, language, is_accessible, http_status
+
+        # Parse HTML
+        html = response.text
+        soup = BeautifulSoup(html, "html.parser")
+
+        # Extract title
+        if soup.title and soup.title.string:
+            title = soup.title.string.strip()
+        else:
+            # Try og:title
+            og_title = soup.find("meta", property="og:title")
+            if og_title and og_title.get("content"):
+                title = og_title["content"].strip()
+
+        # Extract description
+        meta_desc = soup.find("meta", attrs={"name": "description"})
+        if meta_desc and meta_desc.get("content"):
+            description = meta_desc["content"].strip()
+        else:
+            # Try og:description
+            og_desc = soup.find("meta", property="og:description")
+            if og_desc and og_desc.get("content"):
+                description = og_desc["content"].strip()
 
-            # Detect language
-            language = detect_language(html)
+        # Detect language
+        language = detect_language(html)
 
-            # Classify content type
-            content_type = classify_content_type(url, title)
+        # Classify content type
+        content_type = classify_content_type(url, title)
 
     except httpx.TimeoutException:
         is_accessible = False
@@ -243,6 +291,42 @@ async def fetch_metadata(
     return title, description, content_type, language, is_accessible, http_status
 
 
+class HostThrottle:
+    """Per-host concurrency limit and politeness delay for fetches.
+
+    Example:
+        throttle = HostThrottle(per_host=2, delay=0.25)
+        async with throttle.slot("example.com"):
+            await client.get(url)
+    """
+
+    def __init__(self, per_host: int = 2, delay: float = 0.25):
+        """
+        Args:
+            per_host: Concurrent requests per host
+            delay: Minimum seconds between request starts on a host
+        """
+        self.per_host = max(per_host, 1)
+        self.delay = max(delay, 0.0)
+        self._semaphores: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_host)
+        )
+        self._next_start: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        """Hold one of the host's slots, waiting for its next start time."""
+        async with self._semaphores[host]:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            # Reserve the start time before sleeping, so waiters are spaced out
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.delay
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
 def merge_into_staging(
     db: "Database",
     inbox_entry: "InboxEntry",
@@ -338,10 +422,47 @@ def merge_into_staging(
         return new_entry, True
 
 
+def _apply_enrichment(
+    db: "Database",
+    inbox_entry: "InboxEntry",
+    metadata: tuple,
+) -> EnrichmentResult:
+    """Merge fetched metadata into staging and mark the inbox entry enriched."""
+    title, description, content_type, language, is_accessible, http_status = metadata
+
+    # Merge into staging
+    staging_entry, is_new = merge_into_staging(
+        db,
+        inbox_entry,
+        title,
+        description,
+        content_type,
+        language,
+        is_accessible,
+        http_status,
+    )
+
+    # Mark inbox entry as enriched
+    db.mark_inbox_enriched(inbox_entry.id)
+
+    return EnrichmentResult(
+        success=True,
+        staging_id=staging_entry.id,
+        title=title,
+        description=description,
+        content_type=content_type,
+        language=language,
+        is_accessible=is_accessible,
+        http_status=http_status,
+        is_new=is_new,
+    )
+
+
 async def enrich_inbox_entry(
     db: "Database",
     inbox_entry: "InboxEntry",
     timeout: float = 10.0,
+    client: Optional[Any] = None,
 ) -> EnrichmentResult:
     """Enrich a single inbox entry and move to staging.
 
@@ -349,42 +470,14 @@ async def enrich_inbox_entry(
         db: Database instance
         inbox_entry: Inbox entry to enrich
         timeout: Request timeout
+        client: Shared httpx.AsyncClient (optional)
 
     Returns:
         EnrichmentResult with enrichment details
     """
     try:
-        # Fetch metadata
-        title, description, content_type, language, is_accessible, http_status = await fetch_metadata(
-            inbox_entry.url, timeout
-        )
-
-        # Merge into staging
-        staging_entry, is_new = merge_into_staging(
-            db,
-            inbox_entry,
-            title,
-            description,
-            content_type,
-            language,
-            is_accessible,
-            http_status,
-        )
-
-        # Mark inbox entry as enriched
-        db.mark_inbox_enriched(inbox_entry.id)
-
-        return EnrichmentResult(
-            success=True,
-            staging_id=staging_entry.id,
-            title=title,
-            description=description,
-            content_type=content_type,
-            language=language,
-            is_accessible=is_accessible,
-            http_status=http_status,
-            is_new=is_new,
-        )
+        metadata = await fetch_metadata(inbox_entry.url, timeout, client=client)
+        return _apply_enrichment(db, inbox_entry, metadata)
 
     except Exception as e:
         return EnrichmentResult(
@@ -394,17 +487,42 @@ async def enrich_inbox_entry(
         )
 
 
+def _get_enrich_limits() -> tuple[int, int, float]:
+    """Get (concurrency, per_host, host_delay seconds) from performance config."""
+    concurrency, per_host, delay_ms = 16, 2, 250
+    try:
+        from rekall.config import get_config
+
+        config = get_config()
+        concurrency = config.perf_enrich_concurrency
+        per_host = config.perf_enrich_per_host
+        delay_ms = config.perf_enrich_host_delay_ms
+    except Exception:
+        pass
+    return max(concurrency, 1), max(per_host, 1), max(delay_ms, 0) / 1000
+
+
 async def enrich_inbox_entries(
     db: "Database",
     limit: int = 50,
     timeout: float = 10.0,
+    concurrency: Optional[int] = None,
+    per_host: Optional[int] = None,
+    host_delay: Optional[float] = None,
 ) -> BatchEnrichmentResult:
     """Enrich multiple inbox entries in batch.
 
+    URLs are fetched concurrently through one pooled client; results are
+    written as they arrive, WRITE_BATCH_SIZE per transaction.
+
     Args:
         db: Database instance
         limit: Maximum entries to process
         timeout: Request timeout per URL
+        concurrency: Concurrent fetches (performance.enrich_concurrency if None)
+        per_host: Concurrent fetches per host (performance.enrich_per_host if None)
+        host_delay: Seconds between requests to a host
+            (performance.enrich_host_delay_ms if None)
 
     Returns:
         BatchEnrichmentResult with batch statistics
@@ -414,10 +532,15 @@ async def enrich_inbox_entries(
     # Get pending entries
     entries = db.get_inbox_not_enriched(limit=limit)
     result.total_processed = len(entries)
+    if not entries:
+        return result
 
-    for entry in entries:
-        enrichment = await enrich_inbox_entry(db, entry, timeout)
+    default_concurrency, default_per_host, default_delay = _get_enrich_limits()
+    concurrency = concurrency or default_concurrency
+    per_host = per_host or default_per_host
+    host_delay = default_delay if host_delay is None else host_delay
 
+    def record(entry: "InboxEntry", enrichment: EnrichmentResult) -> None:
         if enrichment.success:
             if enrichment.is_new:
                 result.enriched += 1
@@ -428,4 +551,50 @@ async def enrich_inbox_entries(
             if enrichment.error:
                 result.errors.append(f"{entry.url}: {enrichment.error}")
 
+    def write(pending: list[tuple["InboxEntry", tuple]]) -> None:
+        with db.transaction():
+            for entry, metadata in pending:
+                try:
+                    # A failing entry must not leave half its writes behind
+                    with db.savepoint("enrich_entry"):
+                        enrichment = _apply_enrichment(db, entry, metadata)
+                except Exception as e:
+                    enrichment = EnrichmentResult(success=False, error=str(e), is_accessible=False)
+                record(entry, enrichment)
+
+    try:
+        client = create_http_client(timeout, max_connections=concurrency)
+    except ImportError as e:
+        for entry in entries:
+            record(entry, EnrichmentResult(success=False, error=str(e), is_accessible=False))
+        return result
+
+    throttle = HostThrottle(per_host, host_delay)
+    global_limit = asyncio.Semaphore(concurrency)
+
+    async def fetch(entry: "InboxEntry") -> tuple["InboxEntry", Any]:
+        host = (entry.domain or urlparse(entry.url).netloc).lower()
+        try:
+            # Wait for the host first, so busy hosts do not hold global slots
+            async with throttle.slot(host), global_limit:
+                return entry, await fetch_metadata(entry.url, timeout, client=client)
+        except Exception as e:
+            return entry, e
+
+    pending: list[tuple["InboxEntry", tuple]] = []
+    async with client:
+        for next_done in asyncio.as_completed([fetch(entry) for entry in entries]):
+            entry, metadata = await next_done
+            if isinstance(metadata, Exception):
+                failure = EnrichmentResult(success=False, error=str(metadata), is_accessible=False)
+                record(entry, failure)
+                continue
+            pending.append((entry, metadata))
+            if len(pending) >= WRITE_BATCH_SIZE:
+                write(pending)
+                pending = []
+
+    if pending:
+        write(pending)
+
     return result
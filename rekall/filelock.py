@@ -0,0 +1,125 @@
+"""Inter-process lock files.
+
+Long-running background jobs (the sources watcher, background autoscans)
+must not run twice against the same database. FileLock holds an OS-level
+lock on a file next to the data: the lock disappears with the process, so
+a crash never leaves a stale lock behind. The holder's PID is written in
+the file for diagnostics.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+class FileLock:
+    """Exclusive, non-blocking lock on a file.
+
+    Example:
+        lock = FileLock(data_dir / "watch.lock")
+        if not lock.acquire():
+            print(f"Already running (pid {lock.owner_pid()})")
+        try:
+            ...
+        finally:
+            lock.release()
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Lock file (created if missing, never deleted)
+        """
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+
+    @property
+    def locked(self) -> bool:
+        """True while this instance holds the lock."""
+        return self._fd is not None
+
+    def acquire(self) -> bool:
+        """Try to take the lock without waiting.
+
+        Returns:
+            True if the lock was taken, False if another process holds it
+        """
+        if self._fd is not None:
+            return True
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = self._try_lock()
+        if fd is None:
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        self._fd = fd
+        return True
+
+    def _try_lock(self) -> Optional[int]:
+        """Open and lock the file, returning the descriptor (None if held)."""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return None
+        return fd
+
+    @staticmethod
+    def _unlock(fd: int) -> None:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def release(self) -> None:
+        """Release the lock (no-op if not held)."""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        self._unlock(fd)
+
+    def is_held(self) -> bool:
+        """Check if any process (this one included) holds the lock."""
+        if self._fd is not None:
+            return True
+        if not self.path.exists():
+            return False
+        # Probe without writing our PID over the holder's
+        fd = self._try_lock()
+        if fd is None:
+            return True
+        self._unlock(fd)
+        return False
+
+    def owner_pid(self) -> Optional[int]:
+        """PID written by the last holder of the lock, if any."""
+        try:
+            return int(self.path.read_text(encoding="ascii").strip() or 0) or None
+        except (OSError, ValueError):
+            return None
+
+    def __enter__(self) -> "FileLock":
+        if not self.acquire():
+            raise BlockingIOError(f"Lock already held: {self.path}")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
@@ -0,0 +1,325 @@
+"""Continuation cursors for paginated MCP tool results.
+
+List-returning tools (rekall_search, rekall_stale, rekall_suggest,
+rekall_sources_verify) compute a ranked list once, return the first page
+and keep the rest in a CursorStore for a short TTL. The next page is a
+slice of the stored list plus a bulk hydration, instead of re-running the
+whole ranking with a bigger limit.
+
+Cursors are short opaque strings (tool, store key, offset and a digest of
+the original arguments); the arguments themselves stay server-side with
+the stored list. If the list expired (or the server restarted), the call
+must repeat the original arguments next to the cursor: they are checked
+against the digest, the ranking is recomputed once and pagination
+continues at the same offset.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+class CursorError(ValueError):
+    """Raised for malformed cursors or cursors of another tool."""
+
+
+def arguments_digest(arguments: dict) -> str:
+    """Short digest identifying the arguments of a call.
+
+    Args:
+        arguments: Tool arguments (without cursor)
+
+    Returns:
+        16 hex characters (None values ignored)
+    """
+    cleaned = {k: v for k, v in arguments.items() if v is not None}
+    canonical = json.dumps(cleaned, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(tool: str, key: str, offset: int, arguments: dict) -> str:
+    """Build an opaque cursor.
+
+    Args:
+        tool: Tool the cursor belongs to
+        key: CursorStore key of the ranked list
+        offset: Position of the next page
+        arguments: Arguments of the original call (without cursor), only
+            embedded as a digest
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(
+        {"t": tool, "k": key, "o": offset, "h": arguments_digest(arguments)},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(tool: str, cursor: str) -> tuple[str, int, str]:
+    """Decode a cursor built by encode_cursor.
+
+    Args:
+        tool: Tool receiving the cursor
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (store key, offset, digest of the original arguments)
+
+    Raises:
+        CursorError: If the cursor is malformed or belongs to another tool
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        key, offset, digest = data["k"], int(data["o"]), str(data["h"])
+        owner = data["t"]
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError) as e:
+        raise CursorError("Invalid cursor") from e
+
+    if owner != tool:
+        raise CursorError(f"Cursor belongs to {owner}, not {tool}")
+    if offset < 0:
+        raise CursorError("Invalid cursor")
+    return key, offset, digest
+
+
+@dataclass
+class Page:
+    """One page of a ranked result list.
+
+    Attributes:
+        items: Items of this page
+        offset: Position of the first item in the full list
+        total: Length of the full (windowed) list
+        next_cursor: Cursor for the next page, or None on the last page
+        arguments: Arguments of the original call (without cursor)
+        ranked: Full ranked list the page was sliced from
+    """
+
+    items: list[Any]
+    offset: int
+    total: int
+    next_cursor: str | None
+    arguments: dict
+    ranked: list[Any] = field(default_factory=list, repr=False)
+
+    def footer(self, tool: str) -> str:
+        """Describe the page position and how to get the next one."""
+        shown = f"Showing {self.offset + 1}-{self.offset + len(self.items)} of {self.total}"
+        if self.next_cursor is None:
+            if self.offset == 0:
+                return ""
+            return f"\n\n{shown} (last page)."
+        return f'\n\n{shown}. More: {tool}(cursor="{self.next_cursor}")'
+
+
+class CursorStore:
+    """Short-lived store of ranked result lists.
+
+    Attributes:
+        ttl: Seconds a stored list stays valid
+        maxsize: Maximum number of stored lists (oldest evicted first)
+    """
+
+    def __init__(self, ttl_seconds: int = 300, maxsize: int = 128) -> None:
+        """Initialize an empty store.
+
+        Args:
+            ttl_seconds: Lifetime of a stored list (default: 300)
+            maxsize: Maximum stored lists (default: 128)
+        """
+        self.ttl = ttl_seconds
+        self.maxsize = max(1, maxsize)
+        self._lists: OrderedDict[str, tuple[str, float, list[Any], dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._resumed = 0
+        self._recomputed = 0
+
+    def save(self, tool: str, items: list[Any], arguments: dict) -> str:
+        """Store a ranked list with the arguments that produced it.
+
+        Args:
+            tool: Tool that produced the list
+            items: Ranked items (IDs or small tuples)
+            arguments: Arguments of the ranking call (without cursor)
+
+        Returns:
+            Key of the stored list
+        """
+        key = secrets.token_urlsafe(9)
+        with self._lock:
+            self._lists[key] = (tool, time.monotonic() + self.ttl, items, arguments)
+            while len(self._lists) > self.maxsize:
+                self._lists.popitem(last=False)
+        return key
+
+    def load(self, tool: str, key: str) -> tuple[list[Any], dict] | None:
+        """Get a stored list if it has not expired.
+
+        Args:
+            tool: Tool asking for the list
+            key: Key returned by save()
+
+        Returns:
+            Tuple of (stored items, their arguments), or None if
+            unknown/expired
+        """
+        with self._lock:
+            stored = self._lists.get(key)
+            if stored is None:
+                return None
+            owner, expires_at, items, arguments = stored
+            if owner != tool or time.monotonic() > expires_at:
+                del self._lists[key]
+                return None
+            return items, arguments
+
+    def paginate(
+        self,
+        tool: str,
+        arguments: dict,
+        rank: Callable[[dict], list[Any]],
+        page_size: Callable[[dict], int],
+        consuming: bool = False,
+    ) -> Page:
+        """Get the page requested by a tool call.
+
+        Without ``cursor`` in arguments, ranks and returns the first page;
+        with one, slices the stored list. If the list expired, the other
+        arguments of the call must match the cursor's digest and are
+        used to re-rank.
+
+        Args:
+            tool: Tool name
+            arguments: Tool arguments (may contain ``cursor``)
+            rank: Computes the full ranked list from arguments
+            page_size: Page size for the original arguments
+            consuming: Processed items leave the ranking (e.g. verified
+                sources), so a recomputed list restarts at offset 0
+
+        Returns:
+            Requested page
+
+        Raises:
+            CursorError: If the cursor is invalid, or expired and the call
+                does not repeat its arguments
+        """
+        cursor = arguments.get("cursor")
+        call_args = {k: v for k, v in arguments.items() if k != "cursor"}
+        key: str | None = None
+
+        if cursor:
+            key, offset, digest = decode_cursor(tool, cursor)
+            if call_args and arguments_digest(call_args) != digest:
+                raise CursorError("Cursor does not match these arguments")
+            stored = self.load(tool, key)
+            if stored is None:
+                if arguments_digest(call_args) != digest:
+                    raise CursorError(
+                        "Cursor expired: repeat the original arguments with the cursor"
+                    )
+                base_args = call_args
+                items = rank(base_args)
+                key = None
+                if consuming:
+                    offset = 0
+                self._recomputed += 1
+            else:
+                items, base_args = stored
+                self._resumed += 1
+        else:
+            offset = 0
+            base_args = call_args
+            items = rank(base_args)
+
+        size = max(1, page_size(base_args))
+        page_items = items[offset : offset + size]
+        next_offset = offset + len(page_items)
+
+        next_cursor = None
+        if next_offset < len(items):
+            if key is None:
+                key = self.save(tool, items, base_args)
+            next_cursor = encode_cursor(tool, key, next_offset, base_args)
+
+        return Page(page_items, offset, len(items), next_cursor, base_args, items)
+
+    def next_cursor_at(self, tool: str, page: Page, consumed: int) -> str | None:
+        """Get a cursor resuming after the first ``consumed`` items of a page.
+
+        Used by tools that may stop early (cancellation), so pagination
+        resumes right after the last processed item.
+
+        Args:
+            tool: Tool name
+            page: Page returned by paginate()
+            consumed: Number of page items actually processed
+
+        Returns:
+            Cursor for the first unprocessed item, or None if none remain
+        """
+        if consumed >= len(page.items):
+            return page.next_cursor
+        key = self.save(tool, page.ranked, page.arguments)
+        return encode_cursor(tool, key, page.offset + consumed, page.arguments)
+
+    def clear(self) -> None:
+        """Drop all stored lists."""
+        with self._lock:
+            self._lists.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get store statistics.
+
+        Returns:
+            Dict with size, maxsize, ttl, resumed, recomputed
+        """
+        return {
+            "size": len(self._lists),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "resumed": self._resumed,
+            "recomputed": self._recomputed,
+        }
+
+
+# Global store (singleton pattern)
+_cursor_store: CursorStore | None = None
+
+
+def get_cursor_store() -> CursorStore:
+    """Get or create the global cursor store.
+
+    Returns:
+        Global CursorStore instance
+    """
+    global _cursor_store
+
+    if _cursor_store is None:
+        from rekall.config import get_config
+
+        _cursor_store = CursorStore(ttl_seconds=get_config().perf_mcp_cursor_ttl_seconds)
+
+    return _cursor_store
+
+
+def reset_cursor_store() -> None:
+    """Reset the global cursor store (for testing)."""
+    global _cursor_store
+    _cursor_store = None
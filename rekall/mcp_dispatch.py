@@ -0,0 +1,319 @@
+"""Non-blocking dispatch of MCP tool calls.
+
+The MCP tool handlers are ``async def`` but their bodies are blocking
+(sqlite, model inference, HTTP link checks). Run on the server's event loop,
+one slow call would freeze every other request on the stdio transport.
+ToolDispatcher runs each handler on a worker thread instead:
+
+- a pool for read tools (sqlite reads, encoding), served concurrently;
+  the access statistics of rekall_search and rekall_show are recorded
+  afterwards on the writer thread, and rekall_add encodes its entry here
+  before handing the insert to the writer through ``run_write()``
+- a single writer thread for mutating tools, so writes from every client
+  (HTTP transports serve many) are serialized instead of contending for
+  the sqlite write lock
+- a separate, smaller pool for long jobs (HTTP checks, generalization), so
+  they cannot exhaust the workers serving cheap reads nor hold the writer;
+  long jobs hand their final writes to the writer through ``run_write()``
+- per-tool concurrency limits (asyncio semaphores)
+- cooperative cancellation: when the client cancels a request (or
+  disconnects), the handler's cancel event is set and long loops stop at
+  their next ``tool_cancelled()`` check
+
+Threads (not processes) are used: sqlite and numpy/torch release the GIL,
+and the model and connections must stay in this process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Tools dispatched to the long-job pool (their writes go through run_write)
+SLOW_TOOLS = frozenset({"rekall_sources_verify", "rekall_generalize"})
+
+# Mutating tools, run one at a time on the writer thread
+WRITE_TOOLS = frozenset({
+    "rekall_link",
+    "rekall_unlink",
+    "rekall_deprecate",
+    "rekall_delete",
+    "rekall_batch",
+})
+
+# Maximum concurrent calls per tool (others are only bounded by their pool)
+TOOL_CONCURRENCY: dict[str, int] = {
+    "rekall_sources_verify": 1,
+    "rekall_generalize": 1,
+    "rekall_batch": 2,
+}
+
+# Cancel event of the tool call running in the current context
+_cancel_event: contextvars.ContextVar[threading.Event | None] = contextvars.ContextVar(
+    "rekall_tool_cancel_event", default=None
+)
+
+
+def tool_cancelled() -> bool:
+    """Check whether the current tool call has been cancelled.
+
+    Long-running handlers call this between units of work.
+
+    Returns:
+        True if the client cancelled the request (False outside dispatch)
+    """
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+class ToolDispatcher:
+    """Runs blocking tool handlers on bounded thread pools.
+
+    Attributes:
+        workers: Size of the regular pool
+        slow_workers: Size of the long-job pool
+    """
+
+    def __init__(self, workers: int = 8, slow_workers: int = 2) -> None:
+        """Initialize the dispatcher (threads start on first use).
+
+        Args:
+            workers: Threads for regular tools (default: 8)
+            slow_workers: Threads for long jobs (default: 2)
+        """
+        self.workers = max(1, workers)
+        self.slow_workers = max(1, slow_workers)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="rekall-mcp"
+        )
+        self._slow_executor = ThreadPoolExecutor(
+            max_workers=self.slow_workers, thread_name_prefix="rekall-mcp-slow"
+        )
+        self._writer = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="rekall-mcp-writer",
+            initializer=self._mark_writer,
+        )
+        self._writer_ident: int | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+        # One event loop per worker thread, reused across calls
+        self._thread_state = threading.local()
+        self._loops: list[asyncio.AbstractEventLoop] = []
+        self._loops_lock = threading.Lock()
+
+        self._cancelled = 0
+
+    def _semaphore(self, name: str) -> asyncio.Semaphore | None:
+        """Get the concurrency limiter of a tool (None if unlimited)."""
+        limit = TOOL_CONCURRENCY.get(name)
+        if limit is None:
+            return None
+        semaphore = self._semaphores.get(name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[name] = semaphore
+        return semaphore
+
+    def _mark_writer(self) -> None:
+        """Remember the writer thread (pool initializer)."""
+        self._writer_ident = threading.get_ident()
+
+    def _executor_for(self, name: str) -> ThreadPoolExecutor:
+        """Pick the pool of a tool."""
+        if name in WRITE_TOOLS:
+            return self._writer
+        if name in SLOW_TOOLS:
+            return self._slow_executor
+        return self._executor
+
+    def _run_in_thread(
+        self,
+        handler: Callable[[dict], Awaitable[Any]],
+        arguments: dict,
+    ) -> Any:
+        """Drive a handler coroutine to completion on this worker thread."""
+        loop = getattr(self._thread_state, "loop", None)
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            self._thread_state.loop = loop
+            with self._loops_lock:
+                self._loops.append(loop)
+        try:
+            return loop.run_until_complete(handler(arguments))
+        finally:
+            # A handler that raised between a write and its commit must not
+            # leave the thread's long-lived connection inside a transaction
+            from rekall.mcp_resources import get_server_resources
+
+            resources = get_server_resources()
+            if resources is not None:
+                resources.rollback_thread()
+
+    def _write_in_thread(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a write on the writer thread, never leaving it uncommitted."""
+        try:
+            return fn(*args)
+        finally:
+            from rekall.mcp_resources import get_server_resources
+
+            resources = get_server_resources()
+            if resources is not None:
+                resources.rollback_thread()
+
+    def run_write(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a blocking write on the writer thread and wait for it.
+
+        Called from worker threads, so long jobs keep their computation
+        off the writer and only queue the final write. Runs inline when
+        already on the writer thread (e.g. inside rekall_batch).
+
+        Args:
+            fn: Write to run (opens its own connection with get_db())
+            *args: Arguments for fn
+
+        Returns:
+            fn's result
+        """
+        if threading.get_ident() == self._writer_ident:
+            return fn(*args)
+        return self._writer.submit(self._write_in_thread, fn, *args).result()
+
+    async def write(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a blocking write on the writer thread from the event loop.
+
+        Args:
+            fn: Write to run
+            *args: Arguments for fn
+
+        Returns:
+            fn's result
+        """
+        future = self._writer.submit(self._write_in_thread, fn, *args)
+        return await asyncio.wrap_future(future)
+
+    async def run(
+        self,
+        name: str,
+        handler: Callable[[dict], Awaitable[Any]],
+        arguments: dict,
+    ) -> Any:
+        """Run a tool handler off the event loop.
+
+        Args:
+            name: Tool name (selects pool and concurrency limit)
+            handler: Async tool handler with a blocking body
+            arguments: Tool arguments
+
+        Returns:
+            The handler's result
+
+        Raises:
+            asyncio.CancelledError: If the request was cancelled (the
+                handler is signalled through tool_cancelled())
+        """
+        semaphore = self._semaphore(name)
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            cancel = threading.Event()
+            context = contextvars.copy_context()
+            context.run(_cancel_event.set, cancel)
+
+            executor = self._executor_for(name)
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                executor, context.run, self._run_in_thread, handler, arguments
+            )
+            try:
+                return await future
+            except asyncio.CancelledError:
+                cancel.set()
+                self._cancelled += 1
+                logger.info("Tool call cancelled: %s", name)
+                raise
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get dispatcher statistics."""
+        return {
+            "workers": self.workers,
+            "slow_workers": self.slow_workers,
+            "cancelled": self._cancelled,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the pools after running calls finish."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._slow_executor.shutdown(wait=True, cancel_futures=True)
+        self._writer.shutdown(wait=True, cancel_futures=True)
+        with self._loops_lock:
+            loops = self._loops
+            self._loops = []
+        for loop in loops:
+            loop.close()
+
+
+# Singleton set while the MCP server runs
+_tool_dispatcher: ToolDispatcher | None = None
+
+
+def start_tool_dispatcher(workers: int = 8, slow_workers: int = 2) -> ToolDispatcher:
+    """Create the server's dispatcher (called once by run_server).
+
+    Args:
+        workers: Threads for regular tools
+        slow_workers: Threads for long jobs
+
+    Returns:
+        ToolDispatcher instance
+    """
+    global _tool_dispatcher
+
+    if _tool_dispatcher is None:
+        _tool_dispatcher = ToolDispatcher(workers=workers, slow_workers=slow_workers)
+    return _tool_dispatcher
+
+
+def get_tool_dispatcher() -> ToolDispatcher | None:
+    """Get the running dispatcher, or None outside the MCP server."""
+    return _tool_dispatcher
+
+
+def run_write(fn: Callable[..., T], *args: Any) -> T:
+    """Run a write on the server's writer thread (inline without a dispatcher).
+
+    Args:
+        fn: Write to run
+        *args: Arguments for fn
+
+    Returns:
+        fn's result
+    """
+    dispatcher = _tool_dispatcher
+    if dispatcher is None:
+        return fn(*args)
+    return dispatcher.run_write(fn, *args)
+
+
+def stop_tool_dispatcher() -> None:
+    """Shut down the dispatcher (server shutdown, tests)."""
+    global _tool_dispatcher
+
+    if _tool_dispatcher is not None:
+        _tool_dispatcher.shutdown()
+
+    _tool_dispatcher = None
@@ -0,0 +1,158 @@
+"""HTTP transports for the MCP server (one warm process, many clients).
+
+With stdio, every IDE window or agent spawns its own Rekall process, each
+loading the embedding model and warming its own caches. Served over HTTP,
+one process (model, vector caches, sqlite page cache, response cache) is
+shared by every local client:
+
+- ``http``: MCP streamable HTTP at ``/mcp``
+- ``sse``: legacy HTTP+SSE (``GET /sse``, ``POST /messages/``)
+
+The server binds to localhost (or a unix socket) by default, with DNS
+rebinding protection for loopback hosts. Both transports require the MCP
+SDK's HTTP stack (starlette, uvicorn), installed with ``mcp``.
+"""
+
+from __future__ import annotations
+
+import logging
+import signal
+from contextlib import asynccontextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+HTTP_TRANSPORTS = ("http", "sse")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+_LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+def _security_settings(host: str | None) -> Any:
+    """Build DNS rebinding protection for loopback binds (None otherwise)."""
+    if host not in _LOOPBACK_HOSTS:
+        return None
+    try:
+        from mcp.server.transport_security import TransportSecuritySettings
+    except ImportError:  # Older SDKs without transport security
+        return None
+
+    return TransportSecuritySettings(
+        enable_dns_rebinding_protection=True,
+        allowed_hosts=["127.0.0.1:*", "localhost:*", "[::1]:*"],
+        allowed_origins=["http://127.0.0.1:*", "http://localhost:*", "http://[::1]:*"],
+    )
+
+
+class _StreamableHTTPEndpoint:
+    """ASGI endpoint forwarding requests to the session manager."""
+
+    def __init__(self, manager: Any) -> None:
+        self.manager = manager
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        await self.manager.handle_request(scope, receive, send)
+
+
+def create_http_app(server: Any, transport: str = "http", host: str | None = DEFAULT_HOST) -> Any:
+    """Build the ASGI app serving an MCP server.
+
+    Args:
+        server: MCP Server from create_mcp_server()
+        transport: "http" (streamable HTTP) or "sse"
+        host: Bind host (loopback hosts get DNS rebinding protection)
+
+    Returns:
+        Starlette application
+
+    Raises:
+        ValueError: If the transport is unknown
+    """
+    from starlette.applications import Starlette
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
+
+    security = _security_settings(host)
+
+    if transport == "http":
+        from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+
+        kwargs = {"security_settings": security} if security is not None else {}
+        manager = StreamableHTTPSessionManager(app=server, **kwargs)
+
+        @asynccontextmanager
+        async def lifespan(app: Any):
+            async with manager.run():
+                yield
+
+        return Starlette(
+            routes=[Route("/mcp", endpoint=_StreamableHTTPEndpoint(manager))],
+            lifespan=lifespan,
+        )
+
+    if transport == "sse":
+        from mcp.server.sse import SseServerTransport
+
+        kwargs = {"security_settings": security} if security is not None else {}
+        sse = SseServerTransport("/messages/", **kwargs)
+
+        async def handle_sse(request: Any) -> Any:
+            async with sse.connect_sse(
+                request.scope, request.receive, request._send
+            ) as (read_stream, write_stream):
+                await server.run(
+                    read_stream, write_stream, server.create_initialization_options()
+                )
+            return Response()
+
+        return Starlette(routes=[
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            Mount("/messages/", app=sse.handle_post_message),
+        ])
+
+    raise ValueError(f"Unknown MCP transport: {transport}")
+
+
+async def serve_http(
+    server: Any,
+    transport: str = "http",
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: str | None = None,
+) -> None:
+    """Serve an MCP server over HTTP until interrupted.
+
+    Args:
+        server: MCP Server from create_mcp_server()
+        transport: "http" (streamable HTTP) or "sse"
+        host: Bind host (default: 127.0.0.1)
+        port: Bind port (default: 8765)
+        socket_path: Unix socket path (overrides host/port)
+    """
+    import uvicorn
+
+    app = create_http_app(server, transport, host=None if socket_path else host)
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        uds=socket_path,
+        log_level="warning",
+    )
+
+    where = socket_path or f"http://{host}:{port}"
+    logger.info("Rekall MCP server (%s) listening on %s", transport, where)
+
+    # uvicorn re-raises the SIGTERM it caught once shut down: exit through
+    # SystemExit so run_server's cleanup still runs
+    previous = signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    try:
+        await uvicorn.Server(config).serve()
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+
+def _exit_on_sigterm(signum: int, frame: Any) -> None:
+    """Turn SIGTERM into SystemExit (runs finally blocks)."""
+    raise SystemExit(0)
@@ -0,0 +1,189 @@
+"""Process-lifetime resources for the MCP server.
+
+The MCP server is a long-running process: instead of opening (and
+schema-checking) a new SQLite connection for every tool call, it opens the
+database once at startup and keeps one connection per thread for its whole
+lifetime. This keeps SQLite's page cache and the per-connection prepared
+statement cache warm, so per-call latency is dominated by the query itself.
+
+One-shot processes (CLI) do not open these resources and keep the
+open/init/close pattern.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+from rekall.db import Database, _DeferredCommitConnection
+
+logger = logging.getLogger(__name__)
+
+
+class PooledDatabase(Database):
+    """Database connection owned by ServerResources.
+
+    Handlers keep calling ``close()`` when they are done; for a pooled
+    connection it only rolls back an unfinished write; the connection is
+    really closed by ``release()`` at server shutdown.
+    """
+
+    def connect(self, check_same_thread: bool = False) -> None:
+        """Open the connection (closable from the owner's thread).
+
+        Each pooled connection is still only used by the thread it was
+        created for; only release() may run elsewhere.
+        """
+        super().connect(check_same_thread=check_same_thread)
+
+    def close(self) -> None:
+        """Keep the connection open (owned by the server).
+
+        A write left uncommitted (handler failed before its commit) is
+        rolled back, so the long-lived connection does not keep the sqlite
+        write lock nor commit it later with an unrelated call.
+        """
+        self.rollback_pending()
+
+    def rollback_pending(self) -> bool:
+        """Roll back an open transaction, except inside transaction().
+
+        Returns:
+            True if uncommitted changes were discarded
+        """
+        conn = self.conn
+        # Inside Database.transaction() (rekall_batch) the block decides
+        if conn is None or isinstance(conn, _DeferredCommitConnection):
+            return False
+        if not conn.in_transaction:
+            return False
+        conn.rollback()
+        logger.warning("Rolled back an uncommitted write on a pooled connection")
+        return True
+
+    def release(self) -> None:
+        """Really close the connection."""
+        super().close()
+
+
+class ServerResources:
+    """Long-lived database connections for the MCP server.
+
+    The schema is created and verified once by ``open()``; every thread
+    then lazily gets its own connection (sqlite3 connections are bound to
+    the thread that created them) which stays open until ``close()``.
+
+    Attributes:
+        db_path: Path to the SQLite database
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize resources (nothing is opened yet).
+
+        Args:
+            db_path: Path to the SQLite database
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connections: list[PooledDatabase] = []
+        self._lock = threading.Lock()
+        self._opened = False
+
+    def open(self) -> None:
+        """Create/verify the schema once and keep the connection."""
+        db = PooledDatabase(self.db_path)
+        db.init()
+        self._register(db)
+        self._opened = True
+        logger.debug("MCP server database opened: %s", self.db_path)
+
+    def _register(self, db: PooledDatabase) -> None:
+        """Track a connection as the current thread's connection."""
+        self._local.db = db
+        with self._lock:
+            self._connections.append(db)
+
+    def get_db(self) -> Database:
+        """Get the current thread's long-lived connection.
+
+        Returns:
+            Database whose close() is a no-op
+        """
+        db = getattr(self._local, "db", None)
+        if db is None:
+            if not self._opened:
+                self.open()
+                return self._local.db
+            db = PooledDatabase(self.db_path)
+            db.connect()
+            self._register(db)
+        return db
+
+    def rollback_thread(self) -> bool:
+        """Roll back the current thread's uncommitted write, if any.
+
+        Returns:
+            True if uncommitted changes were discarded
+        """
+        db = getattr(self._local, "db", None)
+        return db.rollback_pending() if db is not None else False
+
+    @property
+    def connection_count(self) -> int:
+        """Number of open connections."""
+        return len(self._connections)
+
+    def close(self) -> None:
+        """Close every connection (call once worker threads are idle)."""
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+        for db in connections:
+            try:
+                db.release()
+            except Exception as e:
+                logger.debug("Closing pooled connection failed: %s", e)
+        self._local = threading.local()
+        self._opened = False
+
+
+# Singleton set while the MCP server runs
+_server_resources: ServerResources | None = None
+
+
+def open_server_resources(db_path: Path | None = None) -> ServerResources:
+    """Open the process-lifetime resources (called once by run_server).
+
+    Args:
+        db_path: Database path (default: config db_path)
+
+    Returns:
+        Opened ServerResources
+    """
+    global _server_resources
+
+    if _server_resources is None:
+        if db_path is None:
+            from rekall.config import get_config
+
+            db_path = get_config().db_path
+        _server_resources = ServerResources(db_path)
+        _server_resources.open()
+
+    return _server_resources
+
+
+def get_server_resources() -> ServerResources | None:
+    """Get the open server resources, or None outside the MCP server."""
+    return _server_resources
+
+
+def close_server_resources() -> None:
+    """Close the server resources (server shutdown, tests)."""
+    global _server_resources
+
+    if _server_resources is not None:
+        _server_resources.close()
+
+    _server_resources = None
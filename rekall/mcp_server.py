@@ -18,17 +18,22 @@ Tools provided:
 - rekall_stale: Find entries not accessed recently (Feature 015)
 - rekall_generalize: Create a pattern from multiple entries (Feature 015)
 - rekall_sources_verify: Check URL accessibility (Feature 015)
+- rekall_batch: Run several operations in one call and transaction
 
 Requires: pip install mcp
 """
 
 from __future__ import annotations
 
+import contextvars
 import logging
+import re
+import time
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from rekall.db import Database
+    from rekall.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +55,28 @@ class MCPNotAvailable(Exception):
     pass
 
 
+# Maximum operations accepted by rekall_batch
+MAX_BATCH_OPERATIONS = 50
+
+# "$N" references the entry created by batch operation N
+_BATCH_REF_RE = re.compile(r"^\$(\d+)$")
+
+# Database shared by the operations of the running rekall_batch call
+_batch_db: contextvars.ContextVar[Database | None] = contextvars.ContextVar(
+    "rekall_batch_db", default=None
+)
+
+# Entries shown by the running cacheable read (access recorded after caching)
+_accessed_entries: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar(
+    "rekall_accessed_entries", default=None
+)
+
+# Entry IDs created by the current batch operation
+_created_ids: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar(
+    "rekall_created_ids", default=None
+)
+
+
 # Help content for agents
 REKALL_HELP = """# Rekall - Developer Knowledge Management
 
@@ -92,10 +119,13 @@ REKALL_HELP = """# Rekall - Developer Knowledge Management
 - rekall_related: Explore entries linked to a given entry (depth 1-3)
 - rekall_similar: Find semantically similar entries (requires embeddings)
 - rekall_info: Get knowledge base statistics
+- rekall_stats: Server latency and cache diagnostics
 
 ### Maintenance Tools
 - rekall_stale: Find entries not accessed in N days
 - rekall_generalize: Create a pattern from multiple entries
+- rekall_batch: Run several add/link/show/... operations in one call
+  (reference an entry created by operation N with "$N")
 
 ### Source Management
 - rekall_sources_suggest: Suggest sources for an entry based on tags
@@ -110,18 +140,37 @@ When citing entries: [Title](rekall://entry_id)
 - Link related entries to build knowledge graph
 - Use rekall_info() to get an overview of the knowledge base
 - Use rekall_stale(days=90) to find maintenance candidates
+- Long result lists end with a cursor: pass it back (e.g.
+  `rekall_search(cursor="...")`) to get the next page
 """
 
 
 def get_db() -> Database:
-    """Get database instance for MCP server."""
-    from rekall.config import get_config
-    from rekall.db import Database
+    """Get database instance for MCP server.
 
-    config = get_config()
-    db = Database(config.db_path)
-    db.init()
-    return db
+    Inside rekall_batch, returns the batch's database (one transaction).
+    While the server runs, returns the calling thread's long-lived
+    connection (its close() is a no-op). Otherwise opens a new database.
+    """
+    batch_db = _batch_db.get()
+    if batch_db is not None:
+        return batch_db
+
+    from rekall.mcp_resources import get_server_resources
+    from rekall.metrics import timed
+
+    with timed("db.open"):
+        resources = get_server_resources()
+        if resources is not None:
+            return resources.get_db()
+
+        from rekall.config import get_config
+        from rekall.db import Database
+
+        config = get_config()
+        db = Database(config.db_path)
+        db.init()
+        return db
 
 
 def create_mcp_server() -> Any:
@@ -140,6 +189,16 @@ def create_mcp_server() -> Any:
 
     server = Server("rekall")
 
+    async def on_initialized(notification: Any) -> None:
+        """Start the background warm-up once the handshake is complete."""
+        from rekall.warmup import start_server_warmup
+
+        start_server_warmup()
+
+    from mcp.types import InitializedNotification
+
+    server.notification_handlers[InitializedNotification] = on_initialized
+
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """List available Rekall tools."""
@@ -160,7 +219,7 @@ def create_mcp_server() -> Any:
             ),
             Tool(
                 name="rekall_search",
-                description="Search the knowledge base. Returns compact results - use rekall_show for full content.",
+                description="Search the knowledge base. Returns compact results - use rekall_show for full content. Pass the returned cursor to get more results. Requires query (or cursor).",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -182,11 +241,14 @@ def create_mcp_server() -> Any:
                         },
                         "limit": {
                             "type": "integer",
-                            "description": "Max results (default: 10)",
+                            "description": "Results per page (default: 10)",
                             "default": 10,
                         },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Cursor from a previous response to get the next page (other arguments may be omitted, or must repeat the original call)",
+                        },
                     },
-                    "required": ["query"],
                 },
             ),
             Tool(
@@ -413,9 +475,13 @@ rekall_add(
                         },
                         "limit": {
                             "type": "integer",
-                            "description": "Max suggestions (default: 10)",
+                            "description": "Suggestions per page (default: 10)",
                             "default": 10,
                         },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Cursor from a previous response to get the next page (other arguments may be omitted, or must repeat the original call)",
+                        },
                     },
                 },
             ),
@@ -518,6 +584,14 @@ rekall_add(
                     "properties": {},
                 },
             ),
+            Tool(
+                name="rekall_stats",
+                description="Server diagnostics: per-tool and per-stage call counts, error rates and p50/p95/p99 latencies, cache hit rates.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                },
+            ),
             Tool(
                 name="rekall_stale",
                 description="Find entries that haven't been accessed recently, suggesting maintenance candidates.",
@@ -531,9 +605,13 @@ rekall_add(
                         },
                         "limit": {
                             "type": "integer",
-                            "description": "Maximum number of results (default: 20)",
+                            "description": "Results per page (default: 20)",
                             "default": 20,
                         },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Cursor from a previous response to get the next page (other arguments may be omitted, or must repeat the original call)",
+                        },
                     },
                 },
             ),
@@ -573,6 +651,10 @@ rekall_add(
                             "description": "Maximum number of URLs to check (default: 10)",
                             "default": 10,
                         },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Cursor from a previous response to get the next page (other arguments may be omitted, or must repeat the original call)",
+                        },
                     },
                 },
             ),
@@ -617,6 +699,40 @@ rekall_add(
                     "required": ["id", "confirm"],
                 },
             ),
+            Tool(
+                name="rekall_batch",
+                description=(
+                    "Run several operations (rekall_add, rekall_link, rekall_show, ...) "
+                    "in one call and one transaction. Results are returned per operation. "
+                    "Use \"$N\" as an argument value to reference the entry created by "
+                    "operation N (0-based), e.g. link two entries added in the same batch. "
+                    "If an operation fails, the whole batch is rolled back."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "operations": {
+                            "type": "array",
+                            "description": f"Operations to run in order (max {MAX_BATCH_OPERATIONS})",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "tool": {
+                                        "type": "string",
+                                        "enum": sorted(BATCH_TOOLS),
+                                    },
+                                    "arguments": {
+                                        "type": "object",
+                                        "description": "Arguments of the tool",
+                                    },
+                                },
+                                "required": ["tool"],
+                            },
+                        },
+                    },
+                    "required": ["operations"],
+                },
+            ),
         ]
 
     @server.call_tool()
@@ -627,54 +743,60 @@ rekall_add(
                 return [TextContent(type="text", text=REKALL_HELP)]
 
             elif name == "rekall_search":
-                return await _handle_search(arguments)
+                return await _dispatch(name, _handle_search, arguments)
 
             elif name == "rekall_show":
-                return await _handle_show(arguments)
+                return await _dispatch(name, _handle_show, arguments)
 
             elif name == "rekall_add":
-                return await _handle_add(arguments)
+                return await _dispatch(name, _handle_add, arguments)
 
             elif name == "rekall_link":
-                return await _handle_link(arguments)
+                return await _dispatch(name, _handle_link, arguments)
 
             elif name == "rekall_suggest":
-                return await _handle_suggest(arguments)
+                return await _dispatch(name, _handle_suggest, arguments)
 
             elif name == "rekall_get_context":
-                return await _handle_get_context(arguments)
+                return await _dispatch(name, _handle_get_context, arguments)
 
             # ===== Feature 015: MCP Tools Expansion =====
             elif name == "rekall_unlink":
-                return await _handle_unlink(arguments)
+                return await _dispatch(name, _handle_unlink, arguments)
 
             elif name == "rekall_related":
-                return await _handle_related(arguments)
+                return await _dispatch(name, _handle_related, arguments)
 
             elif name == "rekall_similar":
-                return await _handle_similar(arguments)
+                return await _dispatch(name, _handle_similar, arguments)
 
             elif name == "rekall_sources_suggest":
-                return await _handle_sources_suggest(arguments)
+                return await _dispatch(name, _handle_sources_suggest, arguments)
 
             elif name == "rekall_info":
-                return await _handle_info(arguments)
+                return await _dispatch(name, _handle_info, arguments)
+
+            elif name == "rekall_stats":
+                return await _dispatch(name, _handle_stats, arguments)
 
             elif name == "rekall_stale":
-                return await _handle_stale(arguments)
+                return await _dispatch(name, _handle_stale, arguments)
 
             elif name == "rekall_generalize":
-                return await _handle_generalize(arguments)
+                return await _dispatch(name, _handle_generalize, arguments)
 
             elif name == "rekall_sources_verify":
-                return await _handle_sources_verify(arguments)
+                return await _dispatch(name, _handle_sources_verify, arguments)
 
             # ===== Entry lifecycle management =====
             elif name == "rekall_deprecate":
-                return await _handle_deprecate(arguments)
+                return await _dispatch(name, _handle_deprecate, arguments)
 
             elif name == "rekall_delete":
-                return await _handle_delete(arguments)
+                return await _dispatch(name, _handle_delete, arguments)
+
+            elif name == "rekall_batch":
+                return await _dispatch(name, _handle_batch, arguments)
 
             else:
                 return [TextContent(type="text", text=f"Unknown tool: {name}")]
@@ -686,6 +808,140 @@ rekall_add(
     return server
 
 
+async def _dispatch(name: str, handler: Any, arguments: dict) -> list:
+    """Run a tool call, recording its latency and outcome as "tool.<name>".
+
+    Calls raising or answering with an "Error..." text count as errors.
+    """
+    from rekall.metrics import get_metrics
+    from rekall.warmup import start_server_warmup
+
+    # Fallback for clients that never send the initialized notification
+    start_server_warmup()
+
+    start = time.perf_counter()
+    error = True
+    try:
+        result = await _dispatch_cached(name, handler, arguments)
+        error = _is_error_response(result)
+        return result
+    finally:
+        get_metrics().record(f"tool.{name}", time.perf_counter() - start, error)
+
+
+def _is_error_response(result: list) -> bool:
+    """Check whether a tool response is an "Error..." text."""
+    return bool(result) and getattr(result[0], "text", "").startswith("Error")
+
+
+def _record_access(db: Database, entry_ids: list[str]) -> None:
+    """Record access to the entries shown by a read tool.
+
+    Inside a cacheable call the IDs are collected instead, and recorded by
+    the dispatcher on every hit and miss without invalidating the cache.
+    """
+    collected = _accessed_entries.get()
+    if collected is None:
+        db.record_access(entry_ids)
+    else:
+        collected.extend(entry_ids)
+
+
+async def _dispatch_cached(name: str, handler: Any, arguments: dict) -> list:
+    """Run a tool handler on the server's worker threads.
+
+    Read-only tools are answered from the response cache while the
+    database generation is unchanged; tools that may write count as
+    writes. Falls back to running inline when no dispatcher is running
+    (e.g. handlers called directly).
+    """
+    from rekall.response_cache import (
+        CACHEABLE_TOOLS,
+        PASSIVE_TOOLS,
+        UNCACHED_READ_TOOLS,
+        get_response_cache,
+    )
+
+    cache = get_response_cache()
+    if name in PASSIVE_TOOLS or name in UNCACHED_READ_TOOLS:
+        return await _run_handler(name, handler, arguments)
+
+    if name in CACHEABLE_TOOLS:
+        return await _run_cacheable(cache, name, handler, arguments)
+
+    if cache is None:
+        return await _run_handler(name, handler, arguments)
+
+    cache.note_write()
+    try:
+        return await _run_handler(name, handler, arguments)
+    finally:
+        cache.note_write()
+
+
+async def _run_cacheable(
+    cache: ResponseCache | None, name: str, handler: Any, arguments: dict
+) -> list:
+    """Answer a read-only tool from the cache, then record entry access.
+
+    A response is only cached if the database did not change while it was
+    computed, and never if it is an error. Access tracking is kept out of
+    the handler and runs on the writer thread for hits and misses alike.
+    """
+    cached = cache.get(name, arguments) if cache is not None else None
+    if cached is not None:
+        result, accessed = cached
+    else:
+        generation = cache.generation() if cache is not None else None
+        accessed = []
+        token = _accessed_entries.set(accessed)
+        try:
+            result = await _run_handler(name, handler, arguments)
+        finally:
+            _accessed_entries.reset(token)
+        if cache is not None and not _is_error_response(result):
+            cache.put(name, arguments, (result, accessed), generation)
+
+    if accessed:
+        record = cache.record_access if cache is not None else _write_access
+        try:
+            await _run_write(record, accessed)
+        except Exception:
+            # Statistics only: never fail the read for them
+            logger.warning("Could not record entry access", exc_info=True)
+    return result
+
+
+def _write_access(entry_ids: list[str]) -> None:
+    """Record entry access on the calling thread's connection."""
+    db = get_db()
+    try:
+        db.record_access(entry_ids)
+    finally:
+        db.close()
+
+
+async def _run_write(fn: Any, *args: Any) -> None:
+    """Run a write on the dispatcher's writer thread, or inline without one."""
+    from rekall.mcp_dispatch import get_tool_dispatcher
+
+    dispatcher = get_tool_dispatcher()
+    if dispatcher is None:
+        fn(*args)
+    else:
+        await dispatcher.write(fn, *args)
+
+
+async def _run_handler(name: str, handler: Any, arguments: dict) -> list:
+    """Run a handler through the dispatcher, or inline without one."""
+    from rekall.mcp_dispatch import get_tool_dispatcher
+
+    dispatcher = get_tool_dispatcher()
+    if dispatcher is None:
+        return await handler(arguments)
+    return await dispatcher.run(name, handler, arguments)
+
+
 def _auto_detect_git_files(cwd: str | None) -> list[str]:
     """
     Auto-detect modified files via git.
@@ -741,69 +997,122 @@ def _get_temporal_markers(
     return markers.time_of_day, markers.day_of_week
 
 
-async def _handle_search(args: dict) -> list:
-    """Handle rekall_search tool call."""
+def _cursor_window(limit: int) -> int:
+    """Number of ranked results kept for cursor pagination."""
+    from rekall.config import get_config
+
+    return max(limit, get_config().perf_mcp_cursor_window)
+
+
+def _cursor_error(e: Exception) -> list:
+    """Format an invalid-cursor response."""
     from mcp.types import TextContent
 
-    db = get_db()
-    query = args["query"]
-    context = args.get("context")
-    entry_type = args.get("type")
-    project = args.get("project")
-    limit = args.get("limit", 10)
+    return [TextContent(type="text", text=f"Error: {e}. Rerun the query without cursor.")]
 
-    # Use hybrid search if context provided
-    from rekall.config import get_config
 
-    cfg = get_config()
+async def _handle_search(args: dict) -> list:
+    """Handle rekall_search tool call.
 
-    if cfg.smart_embeddings_enabled and context:
-        from rekall.embeddings import get_embedding_service
+    The ranked ID list is computed once and kept behind a cursor; later
+    pages only hydrate their own entries.
+    """
+    from mcp.types import TextContent
 
-        service = get_embedding_service()
-        results = service.hybrid_search(
-            query, db, context=context, limit=limit,
-            entry_type=entry_type, project=project,
-        )
+    from rekall.config import get_config
+    from rekall.mcp_cursors import CursorError, get_cursor_store
+    from rekall.metrics import timed
+
+    if not args.get("query") and not args.get("cursor"):
+        return [TextContent(type="text", text="Error: query is required.")]
+
+    from rekall.warmup import semantic_ready
 
-        # Format results
-        output = []
-        for entry, _score, sem_score, matched_kws in results:
-            snippet = (entry.content or "")[:100] + "..." if entry.content else ""
-            # Build relevance info string
-            info_parts = []
-            if sem_score:
-                info_parts.append(f"semantic: {sem_score:.0%}")
-            if matched_kws:
-                info_parts.append(f"keywords: {', '.join(matched_kws)}")
-            relevance_info = f" ({'; '.join(info_parts)})" if info_parts else ""
-
-            output.append(
-                f"- [{entry.id}] {entry.type}: {entry.title}{relevance_info}\n"
-                f"  Tags: {', '.join(entry.tags) if entry.tags else 'none'}\n"
-                f"  {snippet}"
+    cfg = get_config()
+    db = get_db()
+    # Set when a hybrid search degraded to FTS while the server warms up
+    warming_up = False
+
+    def rank(call_args: dict) -> list[tuple[str, float | None, list[str]]]:
+        """Rank (entry_id, semantic score, matched keywords) for a query."""
+        nonlocal warming_up
+        limit = call_args.get("limit", 10)
+        window = _cursor_window(limit)
+        entry_type = call_args.get("type")
+        project = call_args.get("project")
+        context = call_args.get("context")
+
+        # Use hybrid search if context provided (FTS-only until the model
+        # and vectors are warm, instead of blocking on them)
+        hybrid = bool(cfg.smart_embeddings_enabled and context)
+        warming_up = hybrid and not semantic_ready()
+        if hybrid and not warming_up:
+            from rekall.embeddings import get_embedding_service
+
+            service = get_embedding_service()
+            results = service.hybrid_search(
+                call_args["query"], db, context=context, limit=window,
+                entry_type=entry_type, project=project, update_access=False,
             )
-    else:
-        # FTS search
-        results = db.search(query, entry_type=entry_type, project=project, limit=limit)
-        output = []
-        for result in results:
-            entry = result.entry
-            snippet = (entry.content or "")[:100] + "..." if entry.content else ""
-            output.append(
-                f"- [{entry.id}] {entry.type}: {entry.title}\n"
-                f"  Tags: {', '.join(entry.tags) if entry.tags else 'none'}\n"
-                f"  {snippet}"
+            return [(entry.id, sem, kws) for entry, _score, sem, kws in results]
+
+        # FTS search (access is tracked for the entries actually shown)
+        with timed("search.fts"):
+            results = db.search(
+                call_args["query"], entry_type=entry_type, project=project,
+                limit=window, update_access=False,
             )
+        return [(result.entry.id, None, []) for result in results]
+
+    try:
+        page = get_cursor_store().paginate(
+            "rekall_search", args, rank, lambda a: a.get("limit", 10)
+        )
+    except CursorError as e:
+        db.close()
+        return _cursor_error(e)
 
+    with timed("search.hydrate"):
+        entries = db.get_entries_by_ids([entry_id for entry_id, _, _ in page.items])
+        _record_access(db, list(entries))
     db.close()
 
+    with timed("search.format"):
+        text = _format_search_page(page, entries)
+    if warming_up:
+        text += "\n\n_Semantic search is warming up: showing keyword (FTS) results._"
+    return [TextContent(type="text", text=text)]
+
+
+def _format_search_page(page: Any, entries: dict) -> str:
+    """Format a page of search results with the cursor footer."""
+    output = []
+    for entry_id, sem_score, matched_kws in page.items:
+        entry = entries.get(entry_id)
+        if entry is None:
+            continue  # Deleted since the ranking was computed
+        snippet = (entry.content or "")[:100] + "..." if entry.content else ""
+        # Build relevance info string
+        info_parts = []
+        if sem_score:
+            info_parts.append(f"semantic: {sem_score:.0%}")
+        if matched_kws:
+            info_parts.append(f"keywords: {', '.join(matched_kws)}")
+        relevance_info = f" ({'; '.join(info_parts)})" if info_parts else ""
+
+        output.append(
+            f"- [{entry.id}] {entry.type}: {entry.title}{relevance_info}\n"
+            f"  Tags: {', '.join(entry.tags) if entry.tags else 'none'}\n"
+            f"  {snippet}"
+        )
+
     if not output:
-        return [TextContent(type="text", text="No results found.")]
+        return "No results found."
 
     text = f"Found {len(output)} result(s):\n\n" + "\n\n".join(output)
+    text += page.footer("rekall_search")
     text += "\n\nHint: Use rekall_show(id) for full content."
-    return [TextContent(type="text", text=text)]
+    return text
 
 
 async def _handle_show(args: dict) -> list:
@@ -813,8 +1122,10 @@ async def _handle_show(args: dict) -> list:
     db = get_db()
     entry_id = args["id"]
 
-    entry = db.get(entry_id)
-    if entry is None:
+    entry = db.get(entry_id, update_access=False)
+    if entry is not None:
+        _record_access(db, [entry.id])
+    else:
         # Try prefix match
         all_entries = db.list_all(limit=1000)
         matches = [e for e in all_entries if e.id.startswith(entry_id)]
@@ -857,6 +1168,77 @@ async def _handle_show(args: dict) -> list:
     return [TextContent(type="text", text=output)]
 
 
+def _insert_entry(
+    db: Database,
+    entry: Any,
+    structured_context: Any,
+    context_text: str | None,
+) -> list[tuple[str, str, float]]:
+    """Insert a new entry with its context and embeddings.
+
+    Encoding runs on the calling worker thread; only the inserts are handed
+    to the writer thread through ``run_write()``.
+
+    Args:
+        db: Connection of the calling thread (used for the similarity lookup)
+        entry: Entry to insert
+        structured_context: StructuredContext to store (or None)
+        context_text: Compressed context text (or None)
+
+    Returns:
+        (id, title, score) of up to 3 similar entries
+    """
+    from rekall.config import get_config
+    from rekall.mcp_dispatch import run_write
+
+    cfg = get_config()
+    service = None
+    embeddings: list[Any] = []
+    if cfg.smart_embeddings_enabled:
+        from rekall.embeddings import get_embedding_service
+        from rekall.models import Embedding
+
+        service = get_embedding_service(
+            dimensions=cfg.smart_embeddings_dimensions,
+        )
+
+        if service.available:
+            vectors = service.calculate_for_entry(entry, context=context_text)
+            for kind in ("summary", "context"):
+                if vectors[kind] is not None:
+                    embeddings.append(Embedding.from_numpy(
+                        entry.id, kind, vectors[kind], service.model_name
+                    ))
+
+    def write() -> None:
+        # Runs on the writer thread: entry, context and vectors in one transaction
+        write_db = get_db()
+        try:
+            with write_db.transaction():
+                write_db.add(entry)
+
+                # Store structured context if provided (Feature 006)
+                if structured_context:
+                    write_db.store_structured_context(entry.id, structured_context)
+
+                # Store compressed context for legacy compatibility
+                if context_text:
+                    write_db.store_context(entry.id, context_text)
+
+                for emb in embeddings:
+                    write_db.add_embedding(emb)
+        finally:
+            write_db.close()
+
+    run_write(write)
+    _note_created(entry.id)
+
+    if service is None or not service.available:
+        return []
+    similar = service.find_similar(entry.id, db, limit=3)
+    return [(e.id, e.title, score) for e, score in similar]
+
+
 async def _handle_add(args: dict) -> list:
     """Handle rekall_add tool call.
 
@@ -990,45 +1372,7 @@ async def _handle_add(args: dict) -> list:
         confidence=args.get("confidence", 2),
     )
 
-    db.add(entry)
-
-    # Store structured context if provided (Feature 006)
-    if structured_context:
-        db.store_structured_context(entry.id, structured_context)
-
-    # Store compressed context for legacy compatibility
-    if context_text:
-        db.store_context(entry.id, context_text)
-
-    # Calculate embeddings if enabled
-    similar_entries = []
-    if cfg.smart_embeddings_enabled:
-        from rekall.embeddings import get_embedding_service
-        from rekall.models import Embedding
-
-        service = get_embedding_service(
-            dimensions=cfg.smart_embeddings_dimensions,
-        )
-
-        if service.available:
-            embeddings = service.calculate_for_entry(entry, context=context_text)
-
-            if embeddings["summary"] is not None:
-                emb = Embedding.from_numpy(
-                    entry.id, "summary", embeddings["summary"], service.model_name
-                )
-                db.add_embedding(emb)
-
-            if embeddings["context"] is not None:
-                emb = Embedding.from_numpy(
-                    entry.id, "context", embeddings["context"], service.model_name
-                )
-                db.add_embedding(emb)
-
-            # Find similar entries
-            similar = service.find_similar(entry.id, db, limit=3)
-            similar_entries = [(e.id, e.title, score) for e, score in similar]
-
+    similar_entries = _insert_entry(db, entry, structured_context, context_text)
     db.close()
 
     output = f"Entry created: {entry.id}\n"
@@ -1157,6 +1501,8 @@ async def _handle_auto_capture_step1(args: dict) -> list:
         session_id="",  # Will be set by session manager
         total_exchanges=total,
         candidates=messages,
+        transcript_path=str(path),
+        transcript_format=detected_format,
     )
 
     # Create session for Step 2
@@ -1193,7 +1539,6 @@ async def _handle_auto_capture_step2(args: dict) -> list:
 
     from mcp.types import TextContent
 
-    from rekall.config import get_config
     from rekall.models import Entry, StructuredContext, generate_ulid
     from rekall.transcript import get_session_manager
 
@@ -1238,7 +1583,6 @@ async def _handle_auto_capture_step2(args: dict) -> list:
 
     # Create the entry using the standard flow
     db = get_db()
-    cfg = get_config()
 
     # Validate required fields
     if not context_arg.get("situation"):
@@ -1350,38 +1694,7 @@ async def _handle_auto_capture_step2(args: dict) -> list:
         confidence=args.get("confidence") or session.confidence or 2,
     )
 
-    db.add(entry)
-
-    # Store structured context
-    db.store_structured_context(entry.id, structured_context)
-    db.store_context(entry.id, context_text)
-
-    # Calculate embeddings if enabled
-    similar_entries = []
-    if cfg.smart_embeddings_enabled:
-        from rekall.embeddings import get_embedding_service
-        from rekall.models import Embedding
-
-        service = get_embedding_service(dimensions=cfg.smart_embeddings_dimensions)
-
-        if service.available:
-            embeddings = service.calculate_for_entry(entry, context=context_text)
-
-            if embeddings["summary"] is not None:
-                emb = Embedding.from_numpy(
-                    entry.id, "summary", embeddings["summary"], service.model_name
-                )
-                db.add_embedding(emb)
-
-            if embeddings["context"] is not None:
-                emb = Embedding.from_numpy(
-                    entry.id, "context", embeddings["context"], service.model_name
-                )
-                db.add_embedding(emb)
-
-            similar = service.find_similar(entry.id, db, limit=3)
-            similar_entries = [(e.id, e.title, score) for e, score in similar]
-
+    similar_entries = _insert_entry(db, entry, structured_context, context_text)
     db.close()
 
     # Cleanup session
@@ -1439,68 +1752,99 @@ async def _handle_link(args: dict) -> list:
 
 
 async def _handle_suggest(args: dict) -> list:
-    """Handle rekall_suggest tool call."""
+    """Handle rekall_suggest tool call.
+
+    Pending suggestions and consolidation clusters are ranked once (the
+    cluster analysis is the expensive part) and paged through a cursor;
+    ``limit`` is the page size.
+    """
     from mcp.types import TextContent
 
+    from rekall.mcp_cursors import CursorError, get_cursor_store
+
     db = get_db()
-    suggestion_type = args.get("type")
-    limit = args.get("limit", 10)
-    include_consolidation = args.get("include_consolidation", True)
 
-    output_parts = []
+    def rank(call_args: dict) -> list[tuple[str, str]]:
+        """Ranked ("suggestion", id) and ("cluster", rendered text) items."""
+        window = _cursor_window(call_args.get("limit", 10))
 
-    # Get existing suggestions from database
-    suggestions = db.get_suggestions(
-        status="pending",
-        suggestion_type=suggestion_type,
-        limit=limit,
-    )
+        # Get existing suggestions from database
+        suggestions = db.get_suggestions(
+            status="pending",
+            suggestion_type=call_args.get("type"),
+            limit=window,
+        )
+        items = [("suggestion", s.id) for s in suggestions]
+
+        # Add keyword-based consolidation opportunities
+        if call_args.get("include_consolidation", True):
+            from rekall.consolidation import find_consolidation_opportunities
+
+            opportunities = find_consolidation_opportunities(
+                db, min_cluster_size=2, min_score=0.4
+            )
+            for i, analysis in enumerate(opportunities[:window]):
+                kw_list = ", ".join(analysis.common_keywords[:5])
+                entry_titles = [e.title[:25] for e in analysis.entries[:3]]
+                items.append(("cluster", "\n".join([
+                    f"- Cluster {i+1} ({analysis.consolidation_score:.0%}): "
+                    f"{analysis.suggested_title[:40]}",
+                    f"  Keywords: {kw_list}",
+                    f"  Entries ({len(analysis.entries)}): "
+                    f"{', '.join(entry_titles)}",
+                    "",
+                ])))
+        return items
+
+    try:
+        page = get_cursor_store().paginate(
+            "rekall_suggest", args, rank, lambda a: a.get("limit", 10)
+        )
+    except CursorError as e:
+        db.close()
+        return _cursor_error(e)
+
+    suggestions = []
+    for kind, value in page.items:
+        if kind == "suggestion":
+            suggestion = db.get_suggestion(value)
+            # Skip suggestions accepted/rejected since the ranking
+            if suggestion is not None and suggestion.status == "pending":
+                suggestions.append(suggestion)
+    titles = {
+        eid: entry.title
+        for eid, entry in db.get_entries_by_ids(
+            [eid for s in suggestions for eid in s.entry_ids[:3]]
+        ).items()
+    }
+    clusters = [value for kind, value in page.items if kind == "cluster"]
+    db.close()
+
+    output_parts = []
 
     if suggestions:
         output_parts.append("Pending suggestions:\n")
         for s in suggestions:
-            entries = []
-            for eid in s.entry_ids[:3]:
-                entry = db.get(eid, update_access=False)
-                if entry:
-                    entries.append(f"{eid[:8]}...: {entry.title[:30]}")
-
+            entries = [
+                f"{eid[:8]}...: {titles[eid][:30]}"
+                for eid in s.entry_ids[:3]
+                if eid in titles
+            ]
             output_parts.append(f"- [{s.id}] {s.suggestion_type} ({s.score:.0%})")
             output_parts.append(f"  Entries: {', '.join(entries)}")
             if s.reason:
                 output_parts.append(f"  Reason: {s.reason}")
             output_parts.append("")
 
-    # Add keyword-based consolidation opportunities
-    if include_consolidation:
-        from rekall.consolidation import find_consolidation_opportunities
-
-        opportunities = find_consolidation_opportunities(
-            db, min_cluster_size=2, min_score=0.4
-        )
-
-        if opportunities:
-            output_parts.append("Consolidation opportunities (by keywords):\n")
-            for i, analysis in enumerate(opportunities[:5]):
-                kw_list = ", ".join(analysis.common_keywords[:5])
-                entry_titles = [e.title[:25] for e in analysis.entries[:3]]
-                output_parts.append(
-                    f"- Cluster {i+1} ({analysis.consolidation_score:.0%}): "
-                    f"{analysis.suggested_title[:40]}"
-                )
-                output_parts.append(f"  Keywords: {kw_list}")
-                output_parts.append(
-                    f"  Entries ({len(analysis.entries)}): "
-                    f"{', '.join(entry_titles)}"
-                )
-                output_parts.append("")
-
-    db.close()
+    if clusters:
+        output_parts.append("Consolidation opportunities (by keywords):\n")
+        output_parts.extend(clusters)
 
     if not output_parts:
         return [TextContent(type="text", text="No suggestions or consolidation opportunities found.")]
 
     output = "\n".join(output_parts)
+    output += page.footer("rekall_suggest")
     output += "\nUse rekall suggest --accept ID to accept a suggestion."
     return [TextContent(type="text", text=output)]
 
@@ -1728,6 +2072,8 @@ async def _handle_info(args: dict) -> list:
     """Handle rekall_info tool call - Get knowledge base statistics."""
     from mcp.types import TextContent
 
+    from rekall.warmup import get_server_warmup
+
     db = get_db()
 
     try:
@@ -1773,6 +2119,17 @@ async def _handle_info(args: dict) -> list:
         output += f"- Silver: {source_stats.get('silver', 0)}\n"
         output += f"- Gold: {source_stats.get('gold', 0)}\n"
 
+        warmup = get_server_warmup()
+        if warmup is not None:
+            output += "\n## Server warm-up\n"
+            for stage, status in warmup.status().items():
+                line = f"- {stage}: {status['state']}"
+                if status["seconds"] is not None:
+                    line += f" ({status['seconds']:.2f}s)"
+                if status["detail"]:
+                    line += f" - {status['detail']}"
+                output += line + "\n"
+
         return [TextContent(type="text", text=output)]
 
     except Exception as e:
@@ -1780,18 +2137,96 @@ async def _handle_info(args: dict) -> list:
         return [TextContent(type="text", text=f"Error getting statistics: {e}")]
 
 
+def collect_server_stats() -> dict[str, Any]:
+    """Collect the running server's diagnostics.
+
+    Returns:
+        Dict with started_at, metrics (per stage summaries) and the stats
+        of the response cache, dispatcher, cursor store and model manager
+        (None when not running)
+    """
+    from rekall.mcp_cursors import get_cursor_store
+    from rekall.mcp_dispatch import get_tool_dispatcher
+    from rekall.metrics import get_metrics
+    from rekall.model_manager import current_model_manager
+    from rekall.response_cache import get_response_cache
+
+    metrics = get_metrics()
+    cache = get_response_cache()
+    dispatcher = get_tool_dispatcher()
+    manager = current_model_manager()
+
+    return {
+        "started_at": metrics.started_at,
+        "metrics": metrics.snapshot(),
+        "response_cache": cache.stats if cache else None,
+        "dispatcher": dispatcher.stats if dispatcher else None,
+        "cursors": get_cursor_store().stats,
+        "model": manager.stats if manager else None,
+    }
+
+
+def format_server_stats(stats: dict[str, Any]) -> str:
+    """Format collected diagnostics as a text report."""
+    uptime = int(time.time() - stats.get("started_at", time.time()))
+    lines = [f"# Rekall MCP server stats (uptime {uptime // 60}m{uptime % 60:02d}s)", ""]
+
+    metrics = stats.get("metrics") or {}
+    if metrics:
+        lines.append(
+            f"{'stage':<32} {'count':>7} {'err%':>6} {'p50 ms':>9} {'p95 ms':>9} "
+            f"{'p99 ms':>9} {'max ms':>9}"
+        )
+        for name, m in metrics.items():
+            lines.append(
+                f"{name:<32} {m['count']:>7} {m['error_rate'] * 100:>5.1f}% "
+                f"{m['p50_ms']:>9.2f} {m['p95_ms']:>9.2f} {m['p99_ms']:>9.2f} "
+                f"{m['max_ms']:>9.2f}"
+            )
+    else:
+        lines.append("No calls recorded yet.")
+
+    for section in ("response_cache", "dispatcher", "cursors", "model"):
+        values = stats.get(section)
+        if values:
+            details = ", ".join(f"{k}={v}" for k, v in values.items())
+            lines.append("")
+            lines.append(f"{section}: {details}")
+
+    return "\n".join(lines)
+
+
+async def _handle_stats(args: dict) -> list:
+    """Handle rekall_stats tool call - Server diagnostics."""
+    from mcp.types import TextContent
+
+    return [TextContent(type="text", text=format_server_stats(collect_server_stats()))]
+
+
 async def _handle_stale(args: dict) -> list:
     """Handle rekall_stale tool call - Find stale entries."""
     from mcp.types import TextContent
 
+    from rekall.mcp_cursors import CursorError, get_cursor_store
+
     db = get_db()
-    days = args.get("days", 90)
-    limit = args.get("limit", 20)
+
+    def rank(call_args: dict) -> list[str]:
+        """Stale entry IDs, least recently accessed first."""
+        limit = call_args.get("limit", 20)
+        return db.get_stale_entry_ids(
+            days=call_args.get("days", 90), limit=_cursor_window(limit)
+        )
 
     try:
-        stale_entries = db.get_stale_entries(days=days, limit=limit)
+        page = get_cursor_store().paginate(
+            "rekall_stale", args, rank, lambda a: a.get("limit", 20)
+        )
+        entries = db.get_entries_by_ids(page.items)
         db.close()
+        days = page.arguments.get("days", 90)
 
+        stale_entries = [entries[eid] for eid in page.items if eid in entries]
         if not stale_entries:
             return [TextContent(
                 type="text",
@@ -1806,9 +2241,13 @@ async def _handle_stale(args: dict) -> list:
             output += f"    Type: {entry.type} | Last accessed: {last_access}\n"
 
         output += f"\nTotal: {len(stale_entries)} stale entries"
+        output += page.footer("rekall_stale")
         output += "\n\nConsider: rekall deprecate <id> to mark obsolete entries"
         return [TextContent(type="text", text=output)]
 
+    except CursorError as e:
+        db.close()
+        return _cursor_error(e)
     except Exception as e:
         db.close()
         return [TextContent(type="text", text=f"Error finding stale entries: {e}")]
@@ -1818,6 +2257,7 @@ async def _handle_generalize(args: dict) -> list:
     """Handle rekall_generalize tool call - Create pattern from entries."""
     from mcp.types import TextContent
 
+    from rekall.mcp_dispatch import run_write
     from rekall.models import Entry, generate_ulid
 
     entry_ids = args["entry_ids"]
@@ -1877,19 +2317,28 @@ async def _handle_generalize(args: dict) -> list:
             confidence=3,
         )
 
-        db.add(new_entry)
-
-        # Create derived_from links
-        for source in source_entries:
-            db.add_link(
-                new_entry.id,
-                source.id,
-                "derived_from",
-                reason=f"Generalized from {len(source_entries)} entries"
-            )
-
         db.close()
 
+        def write() -> None:
+            # Runs on the writer thread: entry and links in one transaction
+            write_db = get_db()
+            try:
+                with write_db.transaction():
+                    write_db.add(new_entry)
+
+                    # Create derived_from links
+                    for source in source_entries:
+                        write_db.add_link(
+                            new_entry.id,
+                            source.id,
+                            "derived_from",
+                            reason=f"Generalized from {len(source_entries)} entries"
+                        )
+            finally:
+                write_db.close()
+
+        run_write(write)
+
         output = f"Created generalized entry: {new_entry.id}\n"
         output += f"Title: {new_entry.title}\n"
         output += f"Type: {new_entry.type}\n"
@@ -1907,14 +2356,26 @@ async def _handle_sources_verify(args: dict) -> list:
     """Handle rekall_sources_verify tool call - Check source URL accessibility."""
     from mcp.types import TextContent
 
+    from rekall.mcp_cursors import CursorError, get_cursor_store
+
     db = get_db()
-    limit = args.get("limit", 10)
+    store = get_cursor_store()
+
+    def rank(call_args: dict) -> list[str]:
+        """IDs of sources to verify, never-checked first."""
+        window = _cursor_window(call_args.get("limit", 10))
+        return [source.id for source in db.get_sources_to_verify(limit=window)]
 
     try:
         # Get sources to verify
-        sources_to_check = db.get_sources_to_verify(limit=limit)
+        page = store.paginate(
+            "rekall_sources_verify", args, rank, lambda a: a.get("limit", 10),
+            consuming=True,
+        )
+        # Keep page positions (None for sources deleted since the ranking)
+        sources_to_check = [db.get_source(source_id) for source_id in page.items]
 
-        if not sources_to_check:
+        if not any(sources_to_check):
             db.close()
             return [TextContent(
                 type="text",
@@ -1923,24 +2384,42 @@ async def _handle_sources_verify(args: dict) -> list:
 
         # Import link rot checker
         from rekall.link_rot import LinkRotChecker
+        from rekall.mcp_dispatch import run_write, tool_cancelled
 
         checker = LinkRotChecker()
         results = []
+        consumed = 0
 
         for source in sources_to_check:
-            is_accessible, status_msg = checker.check_url(source.url)
+            # Stop early if the client cancelled the request
+            if tool_cancelled():
+                break
+            consumed += 1
+            if source is None:
+                continue
+
+            is_accessible, status_msg = checker.check_url_accessibility(source.url)
             results.append({
                 "source": source,
                 "accessible": is_accessible,
                 "status": status_msg,
             })
 
-            # Update source status in DB
-            new_status = "accessible" if is_accessible else "broken"
-            db.update_source_status(source.id, new_status)
-
         db.close()
 
+        def write_statuses() -> None:
+            # Runs on the writer thread: one transaction for the whole page
+            write_db = get_db()
+            try:
+                with write_db.transaction():
+                    for r in results:
+                        new_status = "accessible" if r["accessible"] else "broken"
+                        write_db.update_source_status(r["source"].id, new_status)
+            finally:
+                write_db.close()
+
+        run_write(write_statuses)
+
         # Format output
         accessible_count = sum(1 for r in results if r["accessible"])
         broken_count = len(results) - accessible_count
@@ -1965,8 +2444,15 @@ async def _handle_sources_verify(args: dict) -> list:
                     source = r["source"]
                     output += f"- [{source.id[:12]}...] {source.title or source.domain} ✓\n"
 
+        next_cursor = store.next_cursor_at("rekall_sources_verify", page, consumed)
+        if next_cursor:
+            output += f'\nMore sources to check: rekall_sources_verify(cursor="{next_cursor}")\n'
+
         return [TextContent(type="text", text=output)]
 
+    except CursorError as e:
+        db.close()
+        return _cursor_error(e)
     except Exception as e:
         db.close()
         return [TextContent(type="text", text=f"Error verifying sources: {e}")]
@@ -2071,13 +2557,274 @@ async def _handle_delete(args: dict) -> list:
         return [TextContent(type="text", text=f"Error deleting entry: {e}")]
 
 
-async def run_server() -> None:
-    """Run the MCP server."""
+# =============================================================================
+# Batch operations
+# =============================================================================
+
+# Tools allowed inside rekall_batch (fast, transactional operations)
+BATCH_TOOLS = frozenset({
+    "rekall_add",
+    "rekall_link",
+    "rekall_unlink",
+    "rekall_show",
+    "rekall_search",
+    "rekall_related",
+    "rekall_get_context",
+    "rekall_deprecate",
+})
+
+
+class _BatchError(Exception):
+    """Invalid batch operation (the batch is rolled back)."""
+
+    def __init__(self, index: int, message: str) -> None:
+        super().__init__(f"operation [{index}]: {message}")
+        self.index = index
+
+
+def _note_created(entry_id: str) -> None:
+    """Record an entry created by the current batch operation."""
+    created = _created_ids.get()
+    if created is not None:
+        created.append(entry_id)
+
+
+def _resolve_batch_refs(value: Any, created: list[str | None], index: int) -> Any:
+    """Replace "$N" references with IDs created by earlier operations."""
+    if isinstance(value, str):
+        match = _BATCH_REF_RE.match(value)
+        if not match:
+            return value
+        ref = int(match.group(1))
+        if ref >= index:
+            raise _BatchError(index, f"{value} must reference an earlier operation")
+        if created[ref] is None:
+            raise _BatchError(index, f"operation [{ref}] did not create an entry")
+        return created[ref]
+    if isinstance(value, dict):
+        return {k: _resolve_batch_refs(v, created, index) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve_batch_refs(v, created, index) for v in value]
+    return value
+
+
+def _batch_handlers() -> dict[str, Any]:
+    """Map batchable tool names to their handlers."""
+    return {
+        "rekall_add": _handle_add,
+        "rekall_link": _handle_link,
+        "rekall_unlink": _handle_unlink,
+        "rekall_show": _handle_show,
+        "rekall_search": _handle_search,
+        "rekall_related": _handle_related,
+        "rekall_get_context": _handle_get_context,
+        "rekall_deprecate": _handle_deprecate,
+    }
+
+
+async def _handle_batch(args: dict) -> list:
+    """Handle rekall_batch tool call - run operations in one transaction.
+
+    Every operation uses the same connection inside Database.transaction(),
+    so the batch commits once. Operations can reference entries created
+    earlier in the batch with "$N". Created entries are summarized with a
+    single bulk query.
+    """
+    from mcp.types import TextContent
+
+    operations = args.get("operations") or []
+    if not operations:
+        return [TextContent(type="text", text="Error: operations is empty.")]
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        return [TextContent(
+            type="text",
+            text=f"Error: at most {MAX_BATCH_OPERATIONS} operations per batch.",
+        )]
+
+    from rekall.mcp_resources import PooledDatabase, get_server_resources
+
+    resources = get_server_resources()
+    if resources is not None:
+        db = resources.get_db()
+        owned = False
+    else:
+        from rekall.config import get_config
+
+        db = PooledDatabase(get_config().db_path)
+        db.init()
+        owned = True
+
+    handlers = _batch_handlers()
+    created: list[str | None] = []
+    sections: list[str] = []
+    batch_token = _batch_db.set(db)
+
+    try:
+        try:
+            with db.transaction():
+                for index, operation in enumerate(operations):
+                    tool = operation.get("tool") if isinstance(operation, dict) else None
+                    handler = handlers.get(tool)
+                    if handler is None:
+                        raise _BatchError(index, f"unsupported tool '{tool}'")
+
+                    op_args = _resolve_batch_refs(
+                        operation.get("arguments") or {}, created, index
+                    )
+
+                    ids_token = _created_ids.set([])
+                    try:
+                        response = await handler(op_args)
+                        new_ids = _created_ids.get() or []
+                    finally:
+                        _created_ids.reset(ids_token)
+
+                    # Handlers report most failures as "Error..." text
+                    if _is_error_response(response):
+                        raise _BatchError(index, response[0].text)
+
+                    created.append(new_ids[0] if new_ids else None)
+                    text = "\n".join(item.text for item in response)
+                    sections.append(f"## [{index}] {tool}\n{text}")
+        except _BatchError as e:
+            return [TextContent(type="text", text=f"Batch rolled back: {e}")]
+        except Exception as e:
+            logger.exception("rekall_batch failed")
+            return [TextContent(
+                type="text",
+                text=f"Batch rolled back: operation [{len(sections)}] failed: {e}",
+            )]
+
+        # One hydration pass for the entries created by the batch
+        created_ids = [entry_id for entry_id in created if entry_id]
+        entries = db.get_entries_by_ids(created_ids)
+    finally:
+        _batch_db.reset(batch_token)
+        if owned:
+            db.release()
+
+    output = f"Batch committed: {len(sections)} operation(s)\n"
+    if created_ids:
+        output += "\nCreated entries:\n"
+        for index, entry_id in enumerate(created):
+            entry = entries.get(entry_id) if entry_id else None
+            if entry:
+                output += f"- ${index} = [{entry.id}] {entry.type}: {entry.title}\n"
+    output += "\n" + "\n\n".join(sections)
+
+    return [TextContent(type="text", text=output)]
+
+
+async def run_server(
+    transport: str = "stdio",
+    host: str | None = None,
+    port: int | None = None,
+    socket_path: str | None = None,
+) -> None:
+    """Run the MCP server.
+
+    Args:
+        transport: "stdio" (one client), or "http"/"sse" to share one warm
+            process between many local clients
+        host: HTTP bind host (default: 127.0.0.1)
+        port: HTTP bind port (default: 8765)
+        socket_path: Unix socket path for HTTP transports (overrides host/port)
+    """
+    from rekall.mcp_http import DEFAULT_HOST, DEFAULT_PORT, HTTP_TRANSPORTS
+
+    if transport != "stdio" and transport not in HTTP_TRANSPORTS:
+        raise ValueError(f"Unknown MCP transport: {transport}")
+
     if not MCP_AVAILABLE:
         raise MCPNotAvailable(
             "MCP SDK not installed. Install with: pip install mcp"
         )
 
+    from rekall.config import get_config
+    from rekall.mcp_dispatch import start_tool_dispatcher, stop_tool_dispatcher
+    from rekall.mcp_resources import close_server_resources, open_server_resources
+    from rekall.response_cache import start_response_cache, stop_response_cache
+
+    cfg = get_config()
+
+    # Long-lived connections: schema verified once, page cache kept warm
+    open_server_resources(cfg.db_path)
+
+    # Blocking handler bodies run on worker threads, not the event loop
+    start_tool_dispatcher(
+        workers=cfg.perf_mcp_workers,
+        slow_workers=cfg.perf_mcp_slow_workers,
+    )
+
+    # Repeated identical reads are served until the database changes
+    if cfg.perf_mcp_response_cache_size > 0:
+        start_response_cache(cfg.db_path, maxsize=cfg.perf_mcp_response_cache_size)
+
+    service = None
+    if cfg.smart_embeddings_enabled:
+        # Long-running process: batch concurrent encode requests
+        from rekall.embeddings import get_embedding_service
+
+        service = get_embedding_service(dimensions=cfg.smart_embeddings_dimensions)
+        service.enable_batching(
+            max_batch_size=cfg.perf_encode_batch_size,
+            max_wait_ms=cfg.perf_encode_batch_wait_ms,
+        )
+
+        if service.available:
+            # Unload the model when idle or above the memory budget
+            # (Feature 020); it is loaded by the warm-up below
+            from rekall.model_manager import get_model_manager
+
+            manager = get_model_manager(
+                model_name=service.model_name, target_dimensions=service.dimensions
+            )
+            manager.start_monitor(cfg.perf_model_monitor_interval_seconds)
+
+    # Warm the database pages, model and vectors in the background once a
+    # client is connected; searches degrade to FTS until they are ready
+    from rekall.response_cache import get_response_cache
+    from rekall.warmup import prepare_server_warmup, reset_server_warmup
+
+    def _on_warmup_progress() -> None:
+        # Cached responses (rekall_info status, degraded searches) are stale
+        cache = get_response_cache()
+        if cache is not None:
+            cache.note_write()
+
+    if cfg.perf_mcp_warmup:
+        prepare_server_warmup(cfg.db_path, get_db, service, on_progress=_on_warmup_progress)
+
+    # Latency snapshot for `rekall mcp-server --stats` (one file per server)
+    import os
+
+    from rekall.metrics import StatsWriter, stats_dir
+
+    stats_writer = StatsWriter(
+        stats_dir(cfg.paths.cache_dir) / f"{os.getpid()}.json",
+        lambda: {"transport": transport, "db_path": str(cfg.db_path), **collect_server_stats()},
+    )
+    stats_writer.start()
+
     server = create_mcp_server()
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    try:
+        if transport == "stdio":
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(read_stream, write_stream, server.create_initialization_options())
+        else:
+            # One process (model, caches, connections) shared by all clients
+            from rekall.mcp_http import serve_http
+
+            await serve_http(
+                server,
+                transport,
+                host=host or DEFAULT_HOST,
+                port=port or DEFAULT_PORT,
+                socket_path=socket_path,
+            )
+    finally:
+        stats_writer.stop()
+        reset_server_warmup()
+        stop_tool_dispatcher()
+        stop_response_cache()
+        close_server_resources()
@@ -0,0 +1,325 @@
+"""Lightweight latency instrumentation for long-running processes.
+
+Records counts, errors and latency distributions per named stage (MCP tool
+calls, DB open, search legs, formatting) in HDR-style histograms:
+log-linear buckets with 32 sub-buckets per power of two, so percentiles are
+within ~3% of the recorded values in constant memory, whatever the range.
+
+The MCP server exposes them through the ``rekall_stats`` tool and
+periodically writes a snapshot file read by ``rekall mcp-server --stats``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# 2^5 sub-buckets per power of two: <= 1/32 relative error
+_SUB_BITS = 5
+_SUB_COUNT = 1 << _SUB_BITS
+
+PERCENTILES = (50, 95, 99)
+
+
+def _bucket_index(value: int) -> int:
+    """Map a value (microseconds) to its log-linear bucket."""
+    if value < 2 * _SUB_COUNT:
+        return value
+    exponent = value.bit_length() - _SUB_BITS - 1
+    return exponent * _SUB_COUNT + (value >> exponent)
+
+
+def _bucket_value(index: int) -> float:
+    """Representative (midpoint) value of a bucket, in microseconds."""
+    if index < 2 * _SUB_COUNT:
+        return float(index)
+    exponent, mantissa = divmod(index, _SUB_COUNT)
+    mantissa += _SUB_COUNT
+    # divmod folds the mantissa's top bit into the exponent
+    exponent -= 1
+    low = mantissa << exponent
+    return low + ((1 << exponent) - 1) / 2
+
+
+class LatencyHistogram:
+    """HDR-style latency histogram (sparse log-linear buckets).
+
+    Not thread-safe on its own; MetricsRegistry serializes access.
+
+    Attributes:
+        count: Number of recorded calls
+        errors: Number of recorded failures
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.errors = 0
+        self._total_us = 0
+        self._max_us = 0
+
+    def record(self, seconds: float, error: bool = False) -> None:
+        """Record one call.
+
+        Args:
+            seconds: Duration of the call
+            error: Whether the call failed
+        """
+        value = max(0, int(seconds * 1_000_000))
+        index = _bucket_index(value)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self._total_us += value
+        self._max_us = max(self._max_us, value)
+        if error:
+            self.errors += 1
+
+    def percentile(self, q: float) -> float:
+        """Get a latency percentile.
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Latency in milliseconds (0.0 when empty)
+        """
+        if self.count == 0:
+            return 0.0
+        target = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= target:
+                return min(_bucket_value(index), self._max_us) / 1000
+        return self._max_us / 1000
+
+    def summary(self) -> dict[str, Any]:
+        """Summarize the histogram.
+
+        Returns:
+            Dict with count, errors, error_rate, mean_ms, p50_ms, p95_ms,
+            p99_ms, max_ms
+        """
+        summary: dict[str, Any] = {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.count, 4) if self.count else 0.0,
+            "mean_ms": round(self._total_us / self.count / 1000, 3) if self.count else 0.0,
+        }
+        for q in PERCENTILES:
+            summary[f"p{q}_ms"] = round(self.percentile(q), 3)
+        summary["max_ms"] = round(self._max_us / 1000, 3)
+        return summary
+
+
+class MetricsRegistry:
+    """Thread-safe set of named latency histograms."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(self, name: str, seconds: float, error: bool = False) -> None:
+        """Record one call of a stage.
+
+        Args:
+            name: Stage name (e.g. "tool.rekall_search", "search.fts")
+            seconds: Duration of the call
+            error: Whether the call failed
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(seconds, error)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Time a block; exceptions are recorded as errors and re-raised.
+
+        Args:
+            name: Stage name
+        """
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start, error)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Summarize every stage.
+
+        Returns:
+            Dict mapping stage name to its summary, sorted by name
+        """
+        with self._lock:
+            return {
+                name: self._histograms[name].summary()
+                for name in sorted(self._histograms)
+            }
+
+    def reset(self) -> None:
+        """Drop all recorded data."""
+        with self._lock:
+            self._histograms.clear()
+            self.started_at = time.time()
+
+
+# Global registry (singleton pattern)
+_metrics: MetricsRegistry | None = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get or create the global metrics registry."""
+    global _metrics
+
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    return _metrics
+
+
+def reset_metrics() -> None:
+    """Reset the global metrics registry (for testing)."""
+    global _metrics
+    _metrics = None
+
+
+def timed(name: str):
+    """Time a block in the global registry.
+
+    Example:
+        with timed("search.fts"):
+            results = db.search(query)
+    """
+    return get_metrics().timer(name)
+
+
+# =============================================================================
+# Snapshot files (read by `rekall mcp-server --stats`)
+# =============================================================================
+
+
+def stats_dir(cache_dir: Path) -> Path:
+    """Directory holding one snapshot file per running server."""
+    return cache_dir / "mcp_stats"
+
+
+def write_snapshot(path: Path, data: dict[str, Any]) -> None:
+    """Atomically write a stats snapshot.
+
+    Args:
+        path: Snapshot file
+        data: JSON-serializable stats
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_snapshots(cache_dir: Path) -> list[dict[str, Any]]:
+    """Read snapshots of running servers (stale files are removed).
+
+    Args:
+        cache_dir: Rekall cache directory
+
+    Returns:
+        List of snapshots, most recently updated first
+    """
+    snapshots = []
+    directory = stats_dir(cache_dir)
+    if not directory.is_dir():
+        return snapshots
+
+    for path in directory.glob("*.json"):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not _pid_alive(int(data.get("pid", 0))):
+            path.unlink(missing_ok=True)
+            continue
+        snapshots.append(data)
+
+    return sorted(snapshots, key=lambda s: s.get("updated_at", 0), reverse=True)
+
+
+class StatsWriter:
+    """Background thread periodically writing a stats snapshot file."""
+
+    def __init__(
+        self,
+        path: Path,
+        collect: Callable[[], dict[str, Any]],
+        interval_seconds: float = 10.0,
+    ) -> None:
+        """Initialize the writer (call start()).
+
+        Args:
+            path: Snapshot file (removed by stop())
+            collect: Returns the stats to write
+            interval_seconds: Seconds between writes (default: 10)
+        """
+        self.path = path
+        self.collect = collect
+        self.interval = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def write(self) -> None:
+        """Write one snapshot now."""
+        data = {"pid": os.getpid(), "updated_at": time.time(), **self.collect()}
+        write_snapshot(self.path, data)
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread = threading.Thread(
+            target=self._loop, name="rekall-stats-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _loop(self) -> None:
+        """Writer thread body."""
+        while True:
+            try:
+                self.write()
+            except Exception:
+                logger.debug("Writing stats snapshot failed", exc_info=True)
+            if self._stop.wait(self.interval):
+                return
+
+    def stop(self) -> None:
+        """Stop the thread and remove the snapshot file."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self.path.unlink(missing_ok=True)
@@ -1,52 +1,104 @@
 """Model lifecycle manager for sentence-transformers.
 
 Feature 020: Lazy load/unload to reduce memory footprint.
+
+The ModelManager is the single owner of the embedding model: EmbeddingService
+fetches the model from it on each use instead of keeping its own reference,
+so an unload actually releases the memory. Long-running processes can start
+a background monitor that unloads the model when idle or when the process
+RSS exceeds a configured budget.
 """
 
 from __future__ import annotations
 
 import gc
 import logging
+import os
+import threading
+from collections.abc import Callable
 from time import time
-from typing import TYPE_CHECKING, Any
-
-if TYPE_CHECKING:
-    pass
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+def get_rss_mb() -> float | None:
+    """Get the current resident set size of this process.
+
+    Uses psutil when installed, otherwise /proc/self/statm (Linux).
+
+    Returns:
+        RSS in megabytes, or None if it cannot be measured
+    """
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.debug("psutil RSS read failed: %s", e)
+
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
 class ModelManager:
     """Manages the lifecycle of sentence-transformers model.
 
     Features:
     - Lazy loading: Model only loaded on first use
     - Idle unload: Model unloaded after timeout period of inactivity
+    - Memory budget: Model unloaded and vector caches dropped when RSS
+      exceeds memory_budget_mb
+    - Background monitor: Periodic idle/memory checks (start_monitor)
+    - Background preload: Load ahead of the first query (preload)
     - Loading state tracking: Prevents concurrent loads, enables "loading" messages
 
     Attributes:
-        model_name: Name of the sentence-transformers model
+        model_name: Name of the sentence-transformers model (or "hashing")
         timeout_minutes: Minutes of inactivity before model is unloaded
+        memory_budget_mb: RSS budget in MB (0 = no budget)
+        target_dimensions: Output dimensions for the hashing encoder
     """
 
     def __init__(
         self,
         model_name: str = "all-MiniLM-L6-v2",
         timeout_minutes: int = 10,
+        memory_budget_mb: int = 0,
+        target_dimensions: int = 384,
     ) -> None:
         """Initialize the model manager.
 
         Args:
             model_name: sentence-transformers model name (default: all-MiniLM-L6-v2)
             timeout_minutes: Minutes of inactivity before unload (default: 10)
+            memory_budget_mb: Unload when process RSS exceeds this (default: 0 = off)
+            target_dimensions: Dimensions for the hashing encoder (default: 384)
         """
         self.model_name = model_name
         self.timeout_minutes = timeout_minutes
+        self.memory_budget_mb = memory_budget_mb
+        self.target_dimensions = target_dimensions
 
         self._model: Any = None  # SentenceTransformer instance
         self._last_used: float = 0.0
         self._loading: bool = False
         self._model_dimensions: int | None = None
+        self._lock = threading.RLock()
+
+        # Background monitor
+        self._monitor_thread: threading.Thread | None = None
+        self._monitor_stop = threading.Event()
+        self._monitor_interval: float | None = None
+        self._release_callbacks: list[Callable[[], None]] = []
+        self._pressure_unloads = 0
+        self._idle_unloads = 0
 
     def get_model(self) -> Any:
         """Get the model, loading it if necessary.
@@ -62,34 +114,40 @@ class ModelManager:
         """
         self._last_used = time()
 
-        if self._model is not None:
-            return self._model
-
-        # Load model
-        self._loading = True
-        try:
-            logger.info("Loading model: %s", self.model_name)
-            from sentence_transformers import SentenceTransformer
-
-            self._model = SentenceTransformer(self.model_name)
-            self._model_dimensions = self._model.get_sentence_embedding_dimension()
-            logger.info(
-                "Model loaded: %s (dimensions: %d)",
-                self.model_name,
-                self._model_dimensions,
-            )
-            return self._model
-        except ImportError:
-            logger.error("sentence-transformers not installed")
-            raise ImportError(
-                "sentence-transformers is required for embeddings. "
-                "Install with: pip install rekall[embeddings]"
-            )
-        except Exception as e:
-            logger.error("Failed to load model %s: %s", self.model_name, e)
-            raise RuntimeError(f"Failed to load model {self.model_name}: {e}") from e
-        finally:
-            self._loading = False
+        model = self._model
+        if model is not None:
+            return model
+
+        with self._lock:
+            # Another thread may have loaded it while we waited
+            if self._model is not None:
+                return self._model
+
+            # Load model
+            self._loading = True
+            try:
+                logger.info("Loading model: %s", self.model_name)
+                from rekall.encoders import load_encoder
+
+                self._model = load_encoder(self.model_name, self.target_dimensions)
+                self._model_dimensions = self._model.get_sentence_embedding_dimension()
+                logger.info(
+                    "Model loaded: %s (dimensions: %d)",
+                    self.model_name,
+                    self._model_dimensions,
+                )
+                return self._model
+            except ImportError:
+                logger.error("sentence-transformers not installed")
+                raise ImportError(
+                    "sentence-transformers is required for embeddings. "
+                    "Install with: pip install rekall[embeddings]"
+                )
+            except Exception as e:
+                logger.error("Failed to load model %s: %s", self.model_name, e)
+                raise RuntimeError(f"Failed to load model {self.model_name}: {e}") from e
+            finally:
+                self._loading = False
 
     def is_loaded(self) -> bool:
         """Check if the model is currently loaded in memory.
@@ -128,10 +186,119 @@ class ModelManager:
                 idle_seconds / 60,
             )
             self.unload()
+            self._idle_unloads += 1
             return True
 
         return False
 
+    def check_memory(self) -> bool:
+        """Check process RSS against the memory budget.
+
+        When the budget is exceeded, unloads the model and drops the vector
+        caches (embedding cache + registered release callbacks).
+
+        Returns:
+            True if memory was released, False otherwise
+        """
+        if not self.memory_budget_mb:
+            return False
+
+        rss = get_rss_mb()
+        if rss is None or rss <= self.memory_budget_mb:
+            return False
+
+        logger.warning(
+            "RSS %.0f MB exceeds budget %d MB, releasing model and vector caches",
+            rss,
+            self.memory_budget_mb,
+        )
+        self.release_memory()
+        self._pressure_unloads += 1
+        return True
+
+    def release_memory(self) -> None:
+        """Unload the model and drop all vector caches."""
+        from rekall.cache import clear_embedding_cache
+
+        clear_embedding_cache()
+        for callback in list(self._release_callbacks):
+            try:
+                callback()
+            except Exception as e:
+                logger.warning("Release callback failed: %s", e)
+        self.unload()
+
+    def add_release_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked when memory is released.
+
+        Lets other in-process caches (e.g. mapped vector matrices) drop
+        their data under memory pressure.
+
+        Args:
+            callback: Function without arguments
+        """
+        self._release_callbacks.append(callback)
+
+    def start_monitor(self, interval_seconds: float = 30.0) -> None:
+        """Start a background thread checking idle time and memory budget.
+
+        Idempotent: a running monitor is kept as-is.
+
+        Args:
+            interval_seconds: Seconds between checks (default: 30)
+        """
+        if self._monitor_thread is not None and self._monitor_thread.is_alive():
+            return
+
+        self._monitor_stop.clear()
+        self._monitor_interval = interval_seconds
+        self._monitor_thread = threading.Thread(
+            target=self._monitor_loop,
+            name="rekall-model-monitor",
+            daemon=True,
+        )
+        self._monitor_thread.start()
+        logger.debug("Model monitor started (every %.0fs)", interval_seconds)
+
+    def stop_monitor(self, timeout: float | None = 5.0) -> None:
+        """Stop the background monitor thread (safe if not running)."""
+        thread = self._monitor_thread
+        if thread is None:
+            return
+        self._monitor_stop.set()
+        thread.join(timeout=timeout)
+        self._monitor_thread = None
+        self._monitor_interval = None
+
+    def _monitor_loop(self) -> None:
+        """Monitor thread body: periodic idle and memory checks."""
+        while not self._monitor_stop.wait(self._monitor_interval or 30.0):
+            try:
+                if not self.check_memory():
+                    self.check_idle()
+            except Exception:
+                logger.exception("Model monitor check failed")
+
+    def preload(self) -> threading.Thread:
+        """Load the model on a background thread.
+
+        Lets a long-running process pay the load cost at startup instead
+        of on the first query. Failures are logged, not raised.
+
+        Returns:
+            The started (daemon) thread
+        """
+
+        def _load() -> None:
+            try:
+                self.get_model()
+            except Exception as e:
+                logger.warning("Model preload failed: %s", e)
+
+        thread = threading.Thread(target=_load, name="rekall-model-preload", daemon=True)
+        thread.start()
+        return thread
+
     def unload(self) -> None:
         """Force unload the model and free memory.
 
@@ -140,9 +307,12 @@ class ModelManager:
         if self._model is None:
             return
 
-        logger.info("Unloading model: %s", self.model_name)
-        self._model = None
-        self._model_dimensions = None
+        with self._lock:
+            if self._model is None:
+                return
+            logger.info("Unloading model: %s", self.model_name)
+            self._model = None
+            self._model_dimensions = None
 
         # Force garbage collection to release memory
         gc.collect()
@@ -172,8 +342,10 @@ class ModelManager:
         """Get model manager statistics.
 
         Returns:
-            Dict with model_name, is_loaded, is_loading, idle_seconds, dimensions
+            Dict with model_name, is_loaded, is_loading, idle_seconds, dimensions,
+            monitor and memory budget information
         """
+        rss = get_rss_mb()
         return {
             "model_name": self.model_name,
             "is_loaded": self.is_loaded(),
@@ -181,6 +353,11 @@ class ModelManager:
             "idle_seconds": round(self.idle_seconds, 1),
             "timeout_minutes": self.timeout_minutes,
             "dimensions": self._model_dimensions,
+            "monitor_running": self._monitor_thread is not None,
+            "memory_budget_mb": self.memory_budget_mb,
+            "rss_mb": round(rss, 1) if rss is not None else None,
+            "idle_unloads": self._idle_unloads,
+            "pressure_unloads": self._pressure_unloads,
         }
 
 
@@ -191,18 +368,35 @@ _model_manager: ModelManager | None = None
 def get_model_manager(
     model_name: str | None = None,
     timeout_minutes: int | None = None,
+    target_dimensions: int | None = None,
 ) -> ModelManager:
     """Get or create the global model manager.
 
+    There is a single model owner per process: requesting a different
+    model replaces (and unloads) the current one.
+
     Args:
-        model_name: Override model name (only on first call)
-        timeout_minutes: Override timeout (only on first call)
+        model_name: Model to manage (default: config smart_embeddings_model)
+        timeout_minutes: Override timeout (only on creation)
+        target_dimensions: Hashing encoder dimensions (only on creation)
 
     Returns:
         Global ModelManager instance
     """
     global _model_manager
 
+    if _model_manager is not None and model_name and not _manages(
+        _model_manager, model_name, target_dimensions
+    ):
+        monitor_interval = _model_manager._monitor_interval
+        callbacks = _model_manager._release_callbacks
+        _model_manager.stop_monitor()
+        _model_manager.unload()
+        _model_manager = None
+    else:
+        monitor_interval = None
+        callbacks = []
+
     if _model_manager is None:
         from rekall.config import get_config
 
@@ -210,19 +404,43 @@ def get_model_manager(
         _model_manager = ModelManager(
             model_name=model_name or config.smart_embeddings_model,
             timeout_minutes=timeout_minutes or config.perf_model_idle_timeout_minutes,
+            memory_budget_mb=config.perf_memory_budget_mb,
+            target_dimensions=target_dimensions or config.smart_embeddings_dimensions,
         )
+        _model_manager._release_callbacks.extend(callbacks)
+        if monitor_interval:
+            _model_manager.start_monitor(monitor_interval)
+
+    return _model_manager
+
+
+def _manages(manager: ModelManager, model_name: str, target_dimensions: int | None) -> bool:
+    """Check whether a manager already serves the requested model."""
+    from rekall.encoders import is_hashing_model
+
+    if manager.model_name != model_name:
+        return False
+    # Dimensions only matter for the hashing encoder (neural models are
+    # reduced afterwards via Matryoshka truncation)
+    if is_hashing_model(model_name) and target_dimensions:
+        return manager.target_dimensions == target_dimensions
+    return True
+
 
+def current_model_manager() -> ModelManager | None:
+    """Get the global model manager without creating it."""
     return _model_manager
 
 
 def reset_model_manager() -> None:
     """Reset the global model manager (for testing).
 
-    Also unloads any loaded model.
+    Also stops the monitor and unloads any loaded model.
     """
     global _model_manager
 
     if _model_manager is not None:
+        _model_manager.stop_monitor()
         _model_manager.unload()
 
     _model_manager = None
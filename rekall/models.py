@@ -811,8 +811,48 @@ class ConnectorImport:
     last_file_marker: str | None = None
     entries_imported: int = 0
     errors_count: int = 0
+    # Dernier scan (autoscan en arrière-plan) : idle, running ou failed
+    scan_status: str = "idle"
+    scan_started_at: datetime | None = None
+    scan_finished_at: datetime | None = None
+    last_duration_ms: int | None = None
+    last_imported: int = 0
+    last_error: str | None = None
 
     def __post_init__(self):
         """Valider les champs requis."""
         if not self.connector:
             raise ValueError("connector is required")
+
+
+@dataclass
+class ConnectorFile:
+    """Position de lecture d'un fichier d'historique (CDC par fichier).
+
+    Chaque scan ne relit que ce qui a été ajouté depuis `position` : octets
+    pour les fichiers JSONL, rowid pour les bases SQLite. Un changement
+    d'inode ou une taille plus petite (rotation, réécriture) fait repartir
+    du début, tout comme une empreinte `tail_digest` (octets précédant un
+    offset) qui ne correspond plus : fichier réécrit sur place.
+    """
+
+    connector: str
+    path: str
+    inode: int = 0
+    size: int = 0
+    mtime_ns: int = 0
+    position: int = 0  # Offset en octets (JSONL) ou rowid max (SQLite)
+    state: str | None = None  # JSON propre au connecteur (contexte de reprise)
+    tail_digest: str | None = None  # Empreinte des octets avant position (JSONL)
+    scanned_at: datetime | None = None
+
+    def __post_init__(self):
+        """Valider les champs requis."""
+        if not self.connector:
+            raise ValueError("connector is required")
+        if not self.path:
+            raise ValueError("path is required")
+
+    def matches(self, inode: int, size: int, mtime_ns: int) -> bool:
+        """Vrai si le fichier n'a pas changé depuis le dernier scan."""
+        return (self.inode, self.size, self.mtime_ns) == (inode, size, mtime_ns)
@@ -0,0 +1,257 @@
+"""Generation-keyed response cache for read-only MCP tools.
+
+Agents repeat identical read calls (rekall_search, rekall_show, ...) many
+times per session. ResponseCache stores tool responses keyed by tool name
+and normalized arguments, tagged with the database generation they were
+computed at:
+
+- ``PRAGMA data_version`` read on a dedicated, never-writing connection,
+  which changes whenever any connection (this process or another one,
+  e.g. the CLI) commits
+- an in-process write counter, bumped when a mutating tool starts and ends
+
+A response is only stored if the generation did not change while it was
+computed, and only served while it is still unchanged, so any write
+invalidates the whole cache without explicit bookkeeping. Access tracking
+of cached reads is written through the probe connection itself: SQLite
+does not change a connection's data_version for its own commits, so
+these writes do not invalidate the cache.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rekall.db import Database
+
+logger = logging.getLogger(__name__)
+
+# Read-only tools whose responses can be cached
+CACHEABLE_TOOLS = frozenset({
+    "rekall_search",
+    "rekall_show",
+    "rekall_info",
+    "rekall_related",
+    "rekall_stale",
+})
+
+
+# Tools that never touch the database (no cache, no invalidation)
+PASSIVE_TOOLS = frozenset({"rekall_help", "rekall_stats"})
+
+# Read-only tools answered fresh on every call (no cache, no invalidation)
+UNCACHED_READ_TOOLS = frozenset({
+    "rekall_suggest",
+    "rekall_similar",
+    "rekall_get_context",
+    "rekall_sources_suggest",
+})
+
+
+def normalize_arguments(arguments: dict | None) -> str:
+    """Build a stable cache key fragment from tool arguments.
+
+    Args:
+        arguments: Tool arguments
+
+    Returns:
+        JSON string with sorted keys (None values dropped)
+    """
+    cleaned = {k: v for k, v in (arguments or {}).items() if v is not None}
+    return json.dumps(cleaned, sort_keys=True, default=str)
+
+
+class ResponseCache:
+    """LRU cache of tool responses, invalidated by database generation.
+
+    Attributes:
+        db_path: Database whose generation is tracked
+        maxsize: Maximum number of cached responses
+    """
+
+    def __init__(self, db_path: Path, maxsize: int = 512) -> None:
+        """Initialize the cache (the probe connection opens lazily).
+
+        Args:
+            db_path: Path to the SQLite database
+            maxsize: Maximum cached responses (default: 512)
+        """
+        self.db_path = db_path
+        self.maxsize = max(1, maxsize)
+
+        self._entries: OrderedDict[tuple[str, str], tuple[tuple[int, int], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._probe: Database | None = None
+        self._writes = 0
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+
+    def _probe_db(self) -> Database:
+        """Get the probe connection, opening it on first use (lock held)."""
+        if self._probe is None:
+            from rekall.db import Database
+
+            probe = Database(self.db_path)
+            probe.connect(check_same_thread=False)
+            self._probe = probe
+        return self._probe
+
+    def _data_version(self) -> int:
+        """Read PRAGMA data_version on the probe connection (lock held)."""
+        return self._probe_db().conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def generation(self) -> tuple[int, int]:
+        """Get the current database generation.
+
+        Returns:
+            Tuple of (data_version, in-process write counter)
+        """
+        with self._lock:
+            return self._data_version(), self._writes
+
+    def note_write(self) -> None:
+        """Record an in-process write (call when a mutating tool starts and ends)."""
+        with self._lock:
+            self._writes += 1
+
+    def get(self, tool: str, arguments: dict | None) -> Any:
+        """Get a cached response if still valid.
+
+        Args:
+            tool: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Cached response, or None on miss
+        """
+        key = (tool, normalize_arguments(arguments))
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                generation, response = cached
+                if generation == (self._data_version(), self._writes):
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return response
+                del self._entries[key]
+                self._stale += 1
+            self._misses += 1
+            return None
+
+    def record_access(self, entry_ids: list[str]) -> None:
+        """Record access to entries shown by cached reads.
+
+        Written on the probe connection, so the commit does not change the
+        generation (other connections' commits still do).
+
+        Args:
+            entry_ids: ULIDs of the entries
+        """
+        with self._lock:
+            self._probe_db().record_access(entry_ids)
+
+    def put(
+        self,
+        tool: str,
+        arguments: dict | None,
+        response: Any,
+        generation: tuple[int, int],
+    ) -> bool:
+        """Store a response computed from the given generation.
+
+        The response is dropped if the database changed while it was
+        computed (the generation at put time differs).
+
+        Args:
+            tool: Tool name
+            arguments: Tool arguments
+            response: Tool response
+            generation: Value returned by generation() before the call
+
+        Returns:
+            True if stored
+        """
+        key = (tool, normalize_arguments(arguments))
+        with self._lock:
+            if (self._data_version(), self._writes) != generation:
+                return False
+            self._entries[key] = (generation, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return True
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with size, maxsize, hits, misses, stale, hit_rate
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self._hits,
+            "misses": self._misses,
+            "stale": self._stale,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close the probe connection and drop cached responses."""
+        with self._lock:
+            self._entries.clear()
+            if self._probe is not None:
+                self._probe.close()
+                self._probe = None
+
+
+# Singleton set while the MCP server runs
+_response_cache: ResponseCache | None = None
+
+
+def start_response_cache(db_path: Path, maxsize: int = 512) -> ResponseCache:
+    """Create the server's response cache (called once by run_server).
+
+    Args:
+        db_path: Path to the SQLite database
+        maxsize: Maximum cached responses
+
+    Returns:
+        ResponseCache instance
+    """
+    global _response_cache
+
+    if _response_cache is None:
+        _response_cache = ResponseCache(db_path, maxsize=maxsize)
+    return _response_cache
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Get the server's response cache, or None when disabled/not running."""
+    return _response_cache
+
+
+def stop_response_cache() -> None:
+    """Close the response cache (server shutdown, tests)."""
+    global _response_cache
+
+    if _response_cache is not None:
+        _response_cache.close()
+
+    _response_cache = None
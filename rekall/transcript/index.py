@@ -0,0 +1,277 @@
+"""
+Index incrémental des transcripts JSONL (curseurs persistés).
+
+Les transcripts sont en ajout seul : au lieu de tout relire à chaque appel
+d'auto-capture, on garde par transcript un curseur (TranscriptCursor) :
+inode, taille, mtime, position de la dernière ligne complète lue, nombre de
+messages et positions des derniers messages (ring buffer). Les appels
+suivants ne lisent que les octets ajoutés depuis.
+
+Une rotation (inode différent), une troncature (fichier plus court que la
+position) ou une réécriture (empreinte des derniers octets lus différente)
+invalident le curseur : le transcript est alors relu depuis le début.
+
+Les curseurs sont persistés en JSON dans le cache Rekall
+(``<cache_dir>/transcript_index``) et survivent aux redémarrages du serveur.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+logger = logging.getLogger(__name__)
+
+# Positions des derniers messages gardées par curseur
+RECENT_SIZE = 50
+
+# Transcripts dont la liste complète des messages (parse()) reste en mémoire
+MAX_MESSAGE_LISTS = 4
+
+# Octets avant la position du curseur servant d'empreinte
+_DIGEST_BYTES = 256
+
+_INDEX_VERSION = 1
+
+
+def _digest(f: BinaryIO, offset: int) -> str:
+    """Empreinte des derniers octets avant offset."""
+    start = max(0, offset - _DIGEST_BYTES)
+    f.seek(start)
+    return hashlib.blake2b(f.read(offset - start), digest_size=8).hexdigest()
+
+
+@dataclass
+class TranscriptCursor:
+    """
+    Position de lecture d'un transcript JSONL.
+
+    Attributes:
+        inode: Inode du fichier (détecte une rotation)
+        size: Taille du fichier à la dernière lecture
+        mtime_ns: Date de modification à la dernière lecture
+        offset: Fin de la dernière ligne complète lue
+        count: Nombre de messages avant offset
+        tail_digest: Empreinte des octets précédant offset
+        recent: Positions (début, longueur) des derniers messages
+        messages: Liste complète des messages (en mémoire seulement, parse())
+    """
+
+    inode: int
+    size: int = 0
+    mtime_ns: int = 0
+    offset: int = 0
+    count: int = 0
+    tail_digest: str = ""
+    recent: list[tuple[int, int]] = field(default_factory=list)
+    messages: Optional[list] = field(default=None, repr=False, compare=False)
+
+    def is_valid_for(self, f: BinaryIO, st: os.stat_result) -> bool:
+        """
+        Vérifie que le fichier est le même, seulement complété depuis.
+
+        Args:
+            f: Fichier ouvert en mode binaire
+            st: Résultat de os.fstat() sur ce fichier
+
+        Returns:
+            False après une rotation, une troncature ou une réécriture
+        """
+        if st.st_ino != self.inode or st.st_size < self.offset:
+            return False
+        if st.st_size == self.size and st.st_mtime_ns == self.mtime_ns:
+            return True
+        return _digest(f, self.offset) == self.tail_digest
+
+    def advance(
+        self,
+        f: BinaryIO,
+        st: os.stat_result,
+        offset: int,
+        lines: list[tuple[int, int]],
+    ) -> None:
+        """
+        Avance le curseur après lecture des octets ajoutés.
+
+        Args:
+            f: Fichier ouvert en mode binaire
+            st: Résultat de os.fstat() sur ce fichier
+            offset: Nouvelle fin de la dernière ligne complète lue
+            lines: Positions (début, longueur) des nouveaux messages
+        """
+        if offset != self.offset:
+            self.tail_digest = _digest(f, offset)
+        self.offset = offset
+        self.count += len(lines)
+        self.recent = (self.recent + lines)[-RECENT_SIZE:]
+        self.size = st.st_size
+        self.mtime_ns = st.st_mtime_ns
+
+    def to_dict(self) -> dict:
+        """Sérialise le curseur (sans la liste des messages)."""
+        return {
+            "version": _INDEX_VERSION,
+            "inode": self.inode,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "offset": self.offset,
+            "count": self.count,
+            "tail_digest": self.tail_digest,
+            "recent": [list(item) for item in self.recent],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["TranscriptCursor"]:
+        """Désérialise un curseur (None si format inconnu ou invalide)."""
+        if data.get("version") != _INDEX_VERSION:
+            return None
+        try:
+            return cls(
+                inode=int(data["inode"]),
+                size=int(data["size"]),
+                mtime_ns=int(data["mtime_ns"]),
+                offset=int(data["offset"]),
+                count=int(data["count"]),
+                tail_digest=str(data["tail_digest"]),
+                recent=[(int(start), int(length)) for start, length in data["recent"]],
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+class TranscriptIndex:
+    """
+    Curseurs des transcripts, en mémoire (LRU) et persistés sur disque.
+
+    Les parsers prennent ``lock`` pendant la lecture et la mise à jour d'un
+    curseur : le serveur MCP traite les appels sur plusieurs threads.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, maxsize: int = 64):
+        """
+        Args:
+            directory: Répertoire des curseurs persistés (None: mémoire seule)
+            maxsize: Nombre de curseurs gardés en mémoire
+        """
+        self.directory = directory
+        self.maxsize = maxsize
+        self.lock = threading.RLock()
+        self._cursors: OrderedDict[str, TranscriptCursor] = OrderedDict()
+
+    @staticmethod
+    def _key(path: Path, namespace: str) -> str:
+        return f"{namespace}:{os.path.abspath(path)}"
+
+    def _file_for(self, key: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{name}.json"
+
+    def load(self, path: Path, namespace: str = "") -> Optional[TranscriptCursor]:
+        """
+        Retourne le curseur d'un transcript (mémoire puis disque).
+
+        Args:
+            path: Chemin du transcript
+            namespace: Distingue les parsers qui indexent différemment
+
+        Returns:
+            TranscriptCursor ou None si le transcript n'est pas indexé
+        """
+        key = self._key(path, namespace)
+        with self.lock:
+            cursor = self._cursors.get(key)
+            if cursor is not None:
+                self._cursors.move_to_end(key)
+                return cursor
+
+            file = self._file_for(key)
+            if file is None:
+                return None
+            try:
+                data = json.loads(file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            return TranscriptCursor.from_dict(data) if isinstance(data, dict) else None
+
+    def save(
+        self,
+        path: Path,
+        cursor: TranscriptCursor,
+        namespace: str = "",
+        persist: bool = True,
+    ) -> None:
+        """
+        Enregistre le curseur d'un transcript.
+
+        Args:
+            path: Chemin du transcript
+            cursor: Curseur à enregistrer
+            namespace: Distingue les parsers qui indexent différemment
+            persist: Écrit aussi le curseur sur disque (False: inchangé)
+        """
+        key = self._key(path, namespace)
+        with self.lock:
+            self._cursors[key] = cursor
+            self._cursors.move_to_end(key)
+            while len(self._cursors) > self.maxsize:
+                self._cursors.popitem(last=False)
+
+            # Listes complètes gardées pour les transcripts les plus récents
+            kept = 0
+            for other in reversed(self._cursors.values()):
+                if other.messages is not None:
+                    kept += 1
+                    if kept > MAX_MESSAGE_LISTS:
+                        other.messages = None
+
+            file = self._file_for(key)
+            if file is None or not persist:
+                return
+            try:
+                file.parent.mkdir(parents=True, exist_ok=True)
+                tmp = file.with_suffix(".tmp")
+                tmp.write_text(json.dumps(cursor.to_dict()), encoding="utf-8")
+                os.replace(tmp, file)
+            except OSError as e:
+                logger.debug("Cannot persist transcript cursor %s: %s", file, e)
+
+    def clear(self) -> None:
+        """Oublie les curseurs en mémoire (les fichiers restent)."""
+        with self.lock:
+            self._cursors.clear()
+
+
+# Index partagé par les parsers (singleton)
+_transcript_index: Optional[TranscriptIndex] = None
+
+
+def get_transcript_index() -> TranscriptIndex:
+    """
+    Retourne l'index partagé, persisté dans le cache Rekall.
+
+    Reste en mémoire seule si le répertoire de cache est introuvable.
+    """
+    global _transcript_index
+    if _transcript_index is None:
+        directory: Optional[Path] = None
+        try:
+            from rekall.config import get_config
+
+            directory = get_config().paths.cache_dir / "transcript_index"
+        except Exception as e:
+            logger.debug("Transcript index kept in memory only: %s", e)
+        _transcript_index = TranscriptIndex(directory)
+    return _transcript_index
+
+
+def reset_transcript_index() -> None:
+    """Réinitialise l'index partagé (tests)."""
+    global _transcript_index
+    _transcript_index = None
@@ -0,0 +1,234 @@
+"""
+Lecture en flux des transcripts JSON (Cline, Continue.dev, générique).
+
+``json.load`` matérialise tout le fichier en objets Python, alors que seuls
+les N derniers messages sont utiles à l'auto-capture. JsonStreamReader lit
+le fichier par blocs et parcourt sa structure (objets, tableaux) sans la
+charger : seules les valeurs demandées sont décodées, une à la fois, par le
+décodeur C de ``json``. MessageTail ne garde que les N derniers messages.
+
+La mémoire utilisée est de l'ordre du plus gros message et des N messages
+gardés, au lieu de la taille du fichier.
+"""
+
+import json
+import re
+from collections import deque
+from collections.abc import Callable, Iterator
+from typing import Any, Optional, TextIO
+
+from rekall.transcript.models import TranscriptMessage
+
+# Taille des blocs lus (caractères)
+CHUNK_SIZE = 256 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStreamError(ValueError):
+    """JSON invalide ou structure inattendue."""
+
+
+class JsonStreamReader:
+    """
+    Lecteur JSON en flux, piloté par l'appelant.
+
+    L'appelant parcourt la structure avec peek(), iter_object() et
+    iter_array() et consomme chaque valeur rencontrée avec read_value(),
+    skip_value() ou un parcours imbriqué.
+
+    Example:
+        reader = JsonStreamReader(f)
+        for key in reader.iter_object():
+            if key == "messages":
+                for _ in reader.iter_array():
+                    handle(reader.read_value())
+            else:
+                reader.skip_value()
+        reader.finish()
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = CHUNK_SIZE):
+        """
+        Args:
+            f: Fichier ouvert en mode texte
+            chunk_size: Taille des blocs lus
+        """
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        # Position dans le fichier du début du buffer (messages d'erreur)
+        self._base = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int) -> bool:
+        """Lit un bloc de plus (False en fin de fichier)."""
+        if self._eof:
+            return False
+        chunk = self._f.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Oublie la partie déjà consommée
+        self._base += self._pos
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            match = _WHITESPACE.match(self._buf, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buf) or not self._fill(self._chunk_size):
+                return
+
+    def _error(self, message: str) -> JsonStreamError:
+        return JsonStreamError(f"{message}: char {self._base + self._pos}")
+
+    def peek(self) -> str:
+        """Retourne le prochain caractère significatif ("" en fin de fichier)."""
+        self._skip_whitespace()
+        return self._buf[self._pos] if self._pos < len(self._buf) else ""
+
+    def _consume(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """
+        Décode la valeur suivante (objet, tableau, chaîne, nombre...).
+
+        Raises:
+            JsonStreamError: Si la valeur est invalide
+        """
+        self._skip_whitespace()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                # Valeur coupée par la fin du buffer : relit plus grand
+                if self._fill(size):
+                    size *= 2
+                    continue
+                raise JsonStreamError(str(e)) from e
+            # Un nombre en fin de buffer peut continuer dans le bloc suivant
+            if end == len(self._buf) and self._fill(size):
+                size *= 2
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Passe la valeur suivante."""
+        self.read_value()
+
+    def iter_array(self) -> Iterator[int]:
+        """
+        Parcourt un tableau ; chaque élément doit être consommé par l'appelant.
+
+        Yields:
+            Position de l'élément dans le tableau
+        """
+        self._consume("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+
+        index = 0
+        while True:
+            yield index
+            index += 1
+            char = self.peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                self._pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Parcourt un objet ; chaque valeur doit être consommée par l'appelant.
+
+        Yields:
+            Clés de l'objet, dans l'ordre du fichier
+        """
+        self._consume("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expecting property name enclosed in double quotes")
+            key = self.read_value()
+            self._consume(":")
+            yield key
+            char = self.peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                self._pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def finish(self) -> None:
+        """
+        Vérifie qu'il ne reste rien après la valeur principale.
+
+        Raises:
+            JsonStreamError: Si des données suivent
+        """
+        if self.peek() != "":
+            raise self._error("Extra data")
+
+
+class MessageTail:
+    """
+    Derniers messages d'une séquence, avec les compteurs.
+
+    Attributes:
+        messages: Derniers messages valides (tous si n est None)
+        count: Nombre total de messages valides
+        seen: Nombre d'éléments parcourus (index du prochain élément)
+    """
+
+    def __init__(self, n: Optional[int] = None):
+        """
+        Args:
+            n: Nombre de messages gardés (None: tous)
+        """
+        self.messages: deque[TranscriptMessage] = deque(maxlen=n)
+        self.count = 0
+        self.seen = 0
+
+    def collect(
+        self,
+        reader: JsonStreamReader,
+        parse_message: Callable[[Any, int], Optional[TranscriptMessage]],
+    ) -> None:
+        """
+        Parse les éléments du tableau suivant (une valeur non tableau est passée).
+
+        Les index continuent d'un appel à l'autre (plusieurs sessions).
+
+        Args:
+            reader: Lecteur positionné sur le tableau
+            parse_message: Parse un élément brut en message (None si ignoré)
+        """
+        if reader.peek() != "[":
+            reader.skip_value()
+            return
+        for _ in reader.iter_array():
+            self.add(parse_message(reader.read_value(), self.seen))
+
+    def add(self, message: Optional[TranscriptMessage]) -> None:
+        """Ajoute le message d'un élément (None si l'élément est ignoré)."""
+        self.seen += 1
+        if message:
+            self.messages.append(message)
+            self.count += 1
@@ -36,6 +36,9 @@ class TranscriptMessage:
     content: str
     timestamp: Optional[datetime] = None
     index: int = 0  # Position dans le transcript original
+    # Position de la ligne source (JSONL), pour relire le message sans le copier
+    source_offset: Optional[int] = field(default=None, compare=False, repr=False)
+    source_length: Optional[int] = field(default=None, compare=False, repr=False)
 
     def to_dict(self) -> dict:
         """Convertit en dictionnaire pour réponse MCP."""
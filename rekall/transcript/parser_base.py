@@ -65,6 +65,26 @@ class TranscriptParser(ABC):
         """
         ...
 
+    def read_message_at(
+        self, path: Path, offset: int, length: int, index: int
+    ) -> Optional[TranscriptMessage]:
+        """
+        Relit un message depuis sa position dans le transcript.
+
+        Seuls les formats ligne à ligne (JSONL) le permettent ; les autres
+        retournent None.
+
+        Args:
+            path: Chemin vers le fichier de transcript
+            offset: Position de la ligne (TranscriptMessage.source_offset)
+            length: Longueur de la ligne (TranscriptMessage.source_length)
+            index: Index du message dans le transcript
+
+        Returns:
+            Le message, ou None s'il ne peut pas être relu
+        """
+        return None
+
     def validate(self, path: Path) -> bool:
         """
         Vérifie si le fichier est un transcript valide pour ce parser.
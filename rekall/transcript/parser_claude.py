@@ -6,13 +6,15 @@ où chaque ligne est un objet JSON représentant un message.
 """
 
 import json
-from collections import deque
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
+from rekall.transcript.index import TranscriptCursor, get_transcript_index
 from rekall.transcript.models import TranscriptFormat, TranscriptMessage
 from rekall.transcript.parser_base import ParserError, TranscriptParser
+from rekall.transcript.tail import iter_lines_reversed
 
 
 class ClaudeTranscriptParser(TranscriptParser):
@@ -41,32 +43,20 @@ class ClaudeTranscriptParser(TranscriptParser):
         return TranscriptFormat.CLAUDE_JSONL
 
     def parse(self, path: Path) -> list[TranscriptMessage]:
-        """Parse le fichier JSONL complet."""
+        """
+        Parse le fichier JSONL complet.
+
+        La liste des messages est gardée en mémoire avec le curseur du
+        transcript : les appels suivants ne lisent que les lignes ajoutées.
+        """
         if not path.exists():
             raise FileNotFoundError(f"Transcript not found: {path}")
 
-        messages = []
-        index = 0
-
+        index = get_transcript_index()
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        msg = self._parse_message(data, index)
-                        if msg:
-                            messages.append(msg)
-                            index += 1
-                    except json.JSONDecodeError as e:
-                        # Log warning mais continue le parsing
-                        continue
-                    except ValueError:
-                        # Message invalide, skip
-                        continue
+            with open(path, "rb") as f, index.lock:
+                cursor, trailing = self._sync(f, path, keep_messages=True)
+                messages = list(cursor.messages or [])
 
         except IOError as e:
             raise ParserError(
@@ -75,41 +65,33 @@ class ClaudeTranscriptParser(TranscriptParser):
                 format=self.format,
             )
 
+        if trailing:
+            messages.append(trailing)
         return messages
 
     def parse_last_n(
         self, path: Path, n: int = 20
     ) -> tuple[list[TranscriptMessage], int]:
         """
-        Parse les N derniers messages en utilisant une deque pour limiter la mémoire.
+        Parse les N derniers messages sans relire tout le fichier.
 
-        Pour les gros fichiers, cette méthode est plus efficace que parse()
-        car elle ne garde que les N derniers éléments en mémoire.
+        Le curseur du transcript donne le nombre total de messages et la
+        position des derniers messages ; seuls les octets ajoutés depuis le
+        dernier appel sont lus. Au-delà du ring buffer du curseur, le fichier
+        est lu à rebours par blocs jusqu'à trouver N messages.
         """
         if not path.exists():
             raise FileNotFoundError(f"Transcript not found: {path}")
 
-        # Utilise une deque pour garder seulement les N derniers
-        recent: deque[TranscriptMessage] = deque(maxlen=n)
-        total_count = 0
-        index = 0
-
+        index = get_transcript_index()
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        msg = self._parse_message(data, index)
-                        if msg:
-                            recent.append(msg)
-                            total_count += 1
-                            index += 1
-                    except (json.JSONDecodeError, ValueError):
-                        continue
+            with open(path, "rb") as f, index.lock:
+                cursor, trailing = self._sync(f, path)
+                total_count = cursor.count + (1 if trailing else 0)
+
+                # Messages attendus avant la dernière ligne incomplète
+                wanted = min(max(0, n - (1 if trailing else 0)), cursor.count)
+                recent = self._read_recent(f, cursor, wanted)
 
         except IOError as e:
             raise ParserError(
@@ -118,7 +100,135 @@ class ClaudeTranscriptParser(TranscriptParser):
                 format=self.format,
             )
 
-        return list(recent), total_count
+        if trailing and n > 0:
+            recent.append(trailing)
+        return recent, total_count
+
+    def _sync(
+        self, f: BinaryIO, path: Path, keep_messages: bool = False
+    ) -> tuple[TranscriptCursor, Optional[TranscriptMessage]]:
+        """
+        Met à jour le curseur du transcript avec les lignes ajoutées.
+
+        Relit depuis le début si le curseur est invalide (rotation,
+        troncature, réécriture) ou si la liste complète des messages est
+        demandée mais pas en mémoire. À appeler sous ``index.lock``.
+
+        Args:
+            f: Transcript ouvert en mode binaire
+            path: Chemin du transcript
+            keep_messages: Tient à jour la liste complète des messages
+
+        Returns:
+            Tuple (curseur à jour, message de la dernière ligne si incomplète)
+        """
+        index = get_transcript_index()
+        namespace = self.format.value
+        st = os.fstat(f.fileno())
+        # Taille figée : les lignes ajoutées pendant la lecture sont ignorées
+        end = st.st_size
+
+        cursor = index.load(path, namespace)
+        if cursor is None or not cursor.is_valid_for(f, st):
+            cursor = TranscriptCursor(inode=st.st_ino)
+        if keep_messages and cursor.messages is None:
+            if cursor.offset > 0:
+                cursor = TranscriptCursor(inode=st.st_ino)
+            cursor.messages = []
+
+        before = (cursor.offset, cursor.size, cursor.mtime_ns)
+        offset = cursor.offset
+        lines: list[tuple[int, int]] = []
+        trailing = None
+
+        f.seek(offset)
+        for line in f:
+            msg_index = cursor.count + len(lines)
+            if offset + len(line) > end or not line.endswith(b"\n"):
+                # Ligne en cours d'écriture : lue mais pas indexée
+                trailing = self._parse_line(line[: end - offset], msg_index, offset)
+                break
+            msg = self._parse_line(line, msg_index, offset)
+            if msg:
+                lines.append((offset, len(line)))
+                if cursor.messages is not None:
+                    cursor.messages.append(msg)
+            offset += len(line)
+
+        cursor.advance(f, st, offset, lines)
+        changed = (cursor.offset, cursor.size, cursor.mtime_ns) != before
+        index.save(path, cursor, namespace, persist=changed)
+        return cursor, trailing
+
+    def _read_recent(
+        self, f: BinaryIO, cursor: TranscriptCursor, wanted: int
+    ) -> list[TranscriptMessage]:
+        """
+        Lit les derniers messages indexés par le curseur.
+
+        Utilise les positions du ring buffer, ou lit le fichier à rebours
+        depuis la position du curseur s'il en faut davantage.
+        """
+        if wanted <= 0:
+            return []
+
+        first_index = cursor.count - wanted
+        if wanted <= len(cursor.recent):
+            recent = []
+            for i, (start, length) in enumerate(cursor.recent[-wanted:]):
+                f.seek(start)
+                msg = self._parse_line(f.read(length), first_index + i, start)
+                if msg:
+                    recent.append(msg)
+            if len(recent) == wanted:
+                return recent
+
+        recent = []
+        for start, line in iter_lines_reversed(f, cursor.offset):
+            if len(recent) >= wanted:
+                break
+            msg = self._parse_line(line, cursor.count - len(recent) - 1, start)
+            if msg:
+                recent.append(msg)
+        recent.reverse()
+        return recent
+
+    def read_message_at(
+        self, path: Path, offset: int, length: int, index: int
+    ) -> Optional[TranscriptMessage]:
+        """Relit un message depuis la position de sa ligne."""
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                return self._parse_line(f.read(length), index, offset)
+        except OSError:
+            return None
+
+    def _parse_line(
+        self, line: bytes, index: int, offset: Optional[int] = None
+    ) -> Optional[TranscriptMessage]:
+        """
+        Parse une ligne JSONL brute (None si vide, invalide ou ignorée).
+
+        Avec offset, le message garde la position de sa ligne.
+        """
+        raw_length = len(line)
+        line = line.strip()
+        if not line:
+            return None
+
+        try:
+            data = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        msg = self._parse_message(data, index)
+        if msg and offset is not None:
+            msg.source_offset = offset
+            msg.source_length = raw_length
+        return msg
 
     def _parse_message(self, data: dict, index: int) -> Optional[TranscriptMessage]:
         """
@@ -5,14 +5,17 @@ Cline stocke l'historique des conversations dans un fichier JSON
 api_conversation_history.json dans le dossier de la tâche.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from rekall.transcript.json_stream import JsonStreamError, JsonStreamReader, MessageTail
 from rekall.transcript.models import TranscriptFormat, TranscriptMessage
 from rekall.transcript.parser_base import ParserError, TranscriptParser
 
+# Clés contenant les messages dans la structure avec wrapper (par priorité)
+_MESSAGE_KEYS = ("messages", "conversation", "history")
+
 
 class ClineTranscriptParser(TranscriptParser):
     """
@@ -41,13 +44,56 @@ class ClineTranscriptParser(TranscriptParser):
 
     def parse(self, path: Path) -> list[TranscriptMessage]:
         """Parse le fichier JSON complet."""
+        messages, _ = self._stream(path, None)
+        return messages
+
+    def parse_last_n(
+        self, path: Path, n: int = 20
+    ) -> tuple[list[TranscriptMessage], int]:
+        """
+        Parse les N derniers messages.
+
+        Le fichier est lu en flux : seuls les N derniers messages sont
+        gardés en mémoire.
+        """
+        return self._stream(path, n)
+
+    def _stream(
+        self, path: Path, n: Optional[int]
+    ) -> tuple[list[TranscriptMessage], int]:
+        """
+        Lit le transcript en flux et garde les N derniers messages.
+
+        Structures reconnues : tableau direct, ou objet avec une clé
+        messages, conversation ou history (dans cet ordre de priorité).
+
+        Returns:
+            Tuple (N derniers messages ou tous si n est None, total)
+        """
         if not path.exists():
             raise FileNotFoundError(f"Transcript not found: {path}")
 
+        # Une séquence candidate par clé, choisie en fin de lecture
+        candidates: dict[str, MessageTail] = {}
+
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+                reader = JsonStreamReader(f)
+                start = reader.peek()
+                if start == "[":
+                    candidates[""] = MessageTail(n)
+                    candidates[""].collect(reader, self._parse_message)
+                elif start == "{":
+                    for key in reader.iter_object():
+                        if key in _MESSAGE_KEYS:
+                            candidates[key] = MessageTail(n)
+                            candidates[key].collect(reader, self._parse_message)
+                        else:
+                            reader.skip_value()
+                else:
+                    reader.skip_value()
+                reader.finish()
+        except JsonStreamError as e:
             raise ParserError(
                 f"Invalid JSON format: {e}",
                 path=path,
@@ -60,56 +106,16 @@ class ClineTranscriptParser(TranscriptParser):
                 format=self.format,
             )
 
-        # Extrait la liste des messages
-        messages_data = self._extract_messages_list(data)
-        if messages_data is None:
-            raise ParserError(
-                "Could not find messages in transcript",
-                path=path,
-                format=self.format,
-            )
-
-        messages = []
-        for index, msg_data in enumerate(messages_data):
-            msg = self._parse_message(msg_data, index)
-            if msg:
-                messages.append(msg)
-
-        return messages
+        for key in ("",) + _MESSAGE_KEYS:
+            if key in candidates:
+                tail = candidates[key]
+                return list(tail.messages), tail.count
 
-    def parse_last_n(
-        self, path: Path, n: int = 20
-    ) -> tuple[list[TranscriptMessage], int]:
-        """
-        Parse les N derniers messages.
-
-        Note: Pour JSON, on doit charger tout le fichier en mémoire,
-        mais on ne retourne que les N derniers messages.
-        """
-        all_messages = self.parse(path)
-        total = len(all_messages)
-
-        # Retourne les N derniers
-        last_n = all_messages[-n:] if len(all_messages) > n else all_messages
-
-        return last_n, total
-
-    def _extract_messages_list(self, data) -> Optional[list]:
-        """Extrait la liste des messages depuis différentes structures possibles."""
-        # Direct array
-        if isinstance(data, list):
-            return data
-
-        # Wrapper object
-        if isinstance(data, dict):
-            if "messages" in data:
-                return data["messages"]
-            if "conversation" in data:
-                return data["conversation"]
-            if "history" in data:
-                return data["history"]
-
-        return None
+        raise ParserError(
+            "Could not find messages in transcript",
+            path=path,
+            format=self.format,
+        )
 
     def _parse_message(self, data: dict, index: int) -> Optional[TranscriptMessage]:
         """Parse un objet message en TranscriptMessage."""
@@ -5,11 +5,11 @@ Continue.dev stocke les données de développement dans .continue/dev_data/
 avec un format JSON spécifique.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from rekall.transcript.json_stream import JsonStreamError, JsonStreamReader, MessageTail
 from rekall.transcript.models import TranscriptFormat, TranscriptMessage
 from rekall.transcript.parser_base import ParserError, TranscriptParser
 
@@ -45,13 +45,57 @@ class ContinueTranscriptParser(TranscriptParser):
 
     def parse(self, path: Path) -> list[TranscriptMessage]:
         """Parse le fichier JSON complet."""
+        messages, _ = self._stream(path, None)
+        return messages
+
+    def parse_last_n(
+        self, path: Path, n: int = 20
+    ) -> tuple[list[TranscriptMessage], int]:
+        """
+        Parse les N derniers messages.
+
+        Le fichier est lu en flux : seuls les N derniers messages sont
+        gardés en mémoire.
+        """
+        return self._stream(path, n)
+
+    def _stream(
+        self, path: Path, n: Optional[int]
+    ) -> tuple[list[TranscriptMessage], int]:
+        """
+        Lit le transcript en flux et garde les N derniers messages.
+
+        Les messages de toutes les sessions se suivent. Structures reconnues
+        par priorité : sessions, messages, history, ou tableau direct.
+
+        Returns:
+            Tuple (N derniers messages ou tous si n est None, total)
+        """
         if not path.exists():
             raise FileNotFoundError(f"Transcript not found: {path}")
 
+        candidates: dict[str, MessageTail] = {}
+
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+                reader = JsonStreamReader(f)
+                start = reader.peek()
+                if start == "[":
+                    candidates[""] = MessageTail(n)
+                    candidates[""].collect(reader, self._parse_message)
+                elif start == "{":
+                    for key in reader.iter_object():
+                        if key == "sessions":
+                            candidates[key] = self._collect_sessions(reader, n)
+                        elif key in ("messages", "history"):
+                            candidates[key] = MessageTail(n)
+                            candidates[key].collect(reader, self._parse_message)
+                        else:
+                            reader.skip_value()
+                else:
+                    reader.skip_value()
+                reader.finish()
+        except JsonStreamError as e:
             raise ParserError(
                 f"Invalid JSON format: {e}",
                 path=path,
@@ -64,47 +108,31 @@ class ContinueTranscriptParser(TranscriptParser):
                 format=self.format,
             )
 
-        # Extrait tous les messages de toutes les sessions
-        all_messages = self._extract_all_messages(data)
-
-        messages = []
-        for index, msg_data in enumerate(all_messages):
-            msg = self._parse_message(msg_data, index)
-            if msg:
-                messages.append(msg)
-
-        return messages
-
-    def parse_last_n(
-        self, path: Path, n: int = 20
-    ) -> tuple[list[TranscriptMessage], int]:
-        """Parse les N derniers messages."""
-        all_messages = self.parse(path)
-        total = len(all_messages)
-        last_n = all_messages[-n:] if len(all_messages) > n else all_messages
-        return last_n, total
-
-    def _extract_all_messages(self, data) -> list:
-        """Extrait tous les messages depuis la structure Continue.dev."""
-        messages = []
-
-        if isinstance(data, dict):
-            # Format avec sessions
-            if "sessions" in data:
-                for session in data["sessions"]:
-                    if isinstance(session, dict) and "messages" in session:
-                        messages.extend(session["messages"])
-            # Format direct avec messages
-            elif "messages" in data:
-                messages.extend(data["messages"])
-            # Format avec history
-            elif "history" in data:
-                messages.extend(data["history"])
-
-        elif isinstance(data, list):
-            messages = data
-
-        return messages
+        for key in ("", "sessions", "messages", "history"):
+            if key in candidates:
+                tail = candidates[key]
+                return list(tail.messages), tail.count
+        return [], 0
+
+    def _collect_sessions(
+        self, reader: JsonStreamReader, n: Optional[int]
+    ) -> MessageTail:
+        """Parse les messages de toutes les sessions, à la suite."""
+        tail = MessageTail(n)
+        if reader.peek() != "[":
+            reader.skip_value()
+            return tail
+
+        for _ in reader.iter_array():
+            if reader.peek() != "{":
+                reader.skip_value()
+                continue
+            for key in reader.iter_object():
+                if key == "messages":
+                    tail.collect(reader, self._parse_message)
+                else:
+                    reader.skip_value()
+        return tail
 
     def _parse_message(self, data: dict, index: int) -> Optional[TranscriptMessage]:
         """Parse un objet message en TranscriptMessage."""
@@ -5,14 +5,17 @@ Ce parser est utilisé comme fallback quand le format spécifique
 n'est pas reconnu. Il tente de parser différentes structures JSON courantes.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from rekall.transcript.json_stream import JsonStreamError, JsonStreamReader, MessageTail
 from rekall.transcript.models import TranscriptFormat, TranscriptMessage
 from rekall.transcript.parser_base import ParserError, TranscriptParser
 
+# Clés explorées en premier, par priorité
+_PRIORITY_KEYS = ("messages", "conversation", "history", "chat", "data")
+
 
 class GenericJsonParser(TranscriptParser):
     """
@@ -31,13 +34,44 @@ class GenericJsonParser(TranscriptParser):
 
     def parse(self, path: Path) -> list[TranscriptMessage]:
         """Parse le fichier JSON en essayant différentes structures."""
+        messages, _ = self._stream(path, None)
+        return messages
+
+    def parse_last_n(
+        self, path: Path, n: int = 20
+    ) -> tuple[list[TranscriptMessage], int]:
+        """
+        Parse les N derniers messages.
+
+        Le fichier est lu en flux : seuls les N derniers messages sont
+        gardés en mémoire.
+        """
+        return self._stream(path, n)
+
+    def _stream(
+        self, path: Path, n: Optional[int]
+    ) -> tuple[list[TranscriptMessage], int]:
+        """
+        Lit le transcript en flux et garde les N derniers messages.
+
+        Tous les tableaux qui ressemblent à des messages sont candidats ; le
+        premier dans l'ordre de recherche (clés prioritaires d'abord, puis
+        les autres clés dans l'ordre) est retenu.
+
+        Returns:
+            Tuple (N derniers messages ou tous si n est None, total)
+        """
         if not path.exists():
             raise FileNotFoundError(f"Transcript not found: {path}")
 
+        candidates: list[tuple[tuple, MessageTail]] = []
+
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+                reader = JsonStreamReader(f)
+                self._find_messages(reader, (), n, candidates)
+                reader.finish()
+        except JsonStreamError as e:
             raise ParserError(
                 f"Invalid JSON format: {e}",
                 path=path,
@@ -50,64 +84,54 @@ class GenericJsonParser(TranscriptParser):
                 format=self.format,
             )
 
-        # Tente d'extraire les messages
-        messages_data = self._find_messages(data)
-        if not messages_data:
+        if not candidates:
             raise ParserError(
                 "Could not find messages array in JSON",
                 path=path,
                 format=self.format,
             )
 
-        messages = []
-        for index, msg_data in enumerate(messages_data):
-            msg = self._parse_message(msg_data, index)
-            if msg:
-                messages.append(msg)
-
-        return messages
-
-    def parse_last_n(
-        self, path: Path, n: int = 20
-    ) -> tuple[list[TranscriptMessage], int]:
-        """Parse les N derniers messages."""
-        all_messages = self.parse(path)
-        total = len(all_messages)
-        last_n = all_messages[-n:] if len(all_messages) > n else all_messages
-        return last_n, total
+        _, tail = min(candidates, key=lambda candidate: candidate[0])
+        return list(tail.messages), tail.count
 
-    def _find_messages(self, data) -> Optional[list]:
+    def _find_messages(
+        self,
+        reader: JsonStreamReader,
+        rank: tuple,
+        n: Optional[int],
+        candidates: list[tuple[tuple, MessageTail]],
+    ) -> None:
         """
-        Cherche la liste des messages dans différentes structures possibles.
+        Cherche les tableaux de messages dans la valeur suivante.
 
-        Explore récursivement si nécessaire.
+        Explore récursivement les objets. Le rang d'un candidat encode
+        l'ordre de recherche : à chaque niveau, les clés prioritaires
+        (par priorité) avant les autres clés (dans l'ordre du fichier).
         """
-        # Direct array
-        if isinstance(data, list):
-            # Vérifie que ça ressemble à des messages
-            if data and isinstance(data[0], dict):
-                if any(
-                    key in data[0] for key in ("role", "type", "sender", "from")
-                ):
-                    return data
-
-        # Object avec clé connue
-        if isinstance(data, dict):
-            # Clés prioritaires
-            for key in ("messages", "conversation", "history", "chat", "data"):
-                if key in data:
-                    found = self._find_messages(data[key])
-                    if found:
-                        return found
-
-            # Cherche dans les sous-objets
-            for value in data.values():
-                if isinstance(value, (list, dict)):
-                    found = self._find_messages(value)
-                    if found:
-                        return found
-
-        return None
+        start = reader.peek()
+
+        if start == "[":
+            # Tableau retenu si le premier élément ressemble à un message
+            tail: Optional[MessageTail] = None
+            for index in reader.iter_array():
+                value = reader.read_value()
+                if index == 0 and isinstance(value, dict):
+                    if any(key in value for key in ("role", "type", "sender", "from")):
+                        tail = MessageTail(n)
+                        candidates.append((rank, tail))
+                if tail is not None:
+                    tail.add(self._parse_message(value, index))
+
+        elif start == "{":
+            for position, key in enumerate(reader.iter_object()):
+                if key in _PRIORITY_KEYS:
+                    key_rank = (0, _PRIORITY_KEYS.index(key))
+                else:
+                    key_rank = (1, position)
+                self._find_messages(reader, rank + (key_rank,), n, candidates)
+
+        else:
+            reader.skip_value()
 
     def _parse_message(self, data: dict, index: int) -> Optional[TranscriptMessage]:
         """
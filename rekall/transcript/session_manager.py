@@ -6,16 +6,39 @@ Ce module gère les sessions éphémères utilisées lors du workflow en deux é
 - Step 2: L'agent fournit les indices → session récupérée et finalisée
 
 Les sessions expirent automatiquement après un délai configurable (défaut: 5 min).
+
+Les sessions sont stockées sous forme compacte : un candidat relisible depuis
+le transcript (JSONL) est gardé comme position dans le fichier plutôt que
+comme copie de son contenu. Deux stockages :
+- MemorySessionStore : en mémoire, borné en octets (éviction LRU)
+- SqliteSessionStore : fichier SQLite, survit à un redémarrage du serveur et
+  est partagé entre les processus qui l'utilisent
 """
 
+import hashlib
+import json
+import logging
+import sqlite3
 import threading
 import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
-from rekall.transcript.models import CandidateExchanges, TranscriptMessage
+from rekall.transcript.models import (
+    CandidateExchanges,
+    TranscriptFormat,
+    TranscriptMessage,
+)
+
+logger = logging.getLogger(__name__)
+
+# Budget par défaut des sessions stockées (octets sérialisés)
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
 
 
 @dataclass
@@ -39,18 +62,341 @@ class SessionData:
         return age > ttl_seconds
 
 
+# =============================================================================
+# Sérialisation compacte
+# =============================================================================
+
+
+def _content_digest(content: str) -> str:
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _serialize_session(session: SessionData) -> str:
+    """
+    Sérialise une session en JSON compact.
+
+    Les messages qui ont une position dans le transcript sont stockés comme
+    (offset, longueur, empreinte du contenu) au lieu de leur contenu.
+    """
+    exchanges = session.candidates
+    candidates = []
+    for msg in exchanges.candidates:
+        item: dict = {
+            "role": msg.role,
+            "index": msg.index,
+            "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
+        }
+        if msg.source_offset is not None and exchanges.transcript_path:
+            item["offset"] = msg.source_offset
+            item["length"] = msg.source_length
+            item["digest"] = _content_digest(msg.content)
+        else:
+            item["content"] = msg.content
+        candidates.append(item)
+
+    return json.dumps({
+        "session_id": session.session_id,
+        "created_at": session.created_at.isoformat(),
+        "entry_type": session.entry_type,
+        "title": session.title,
+        "context": session.context,
+        "tags": session.tags,
+        "project": session.project,
+        "confidence": session.confidence,
+        "total_exchanges": exchanges.total_exchanges,
+        "transcript_path": exchanges.transcript_path,
+        "transcript_format": exchanges.transcript_format.value,
+        "candidates": candidates,
+    }, separators=(",", ":"))
+
+
+def _deserialize_session(payload: str) -> Optional[SessionData]:
+    """
+    Reconstruit une session ; les messages stockés par position sont relus.
+
+    Returns:
+        SessionData, ou None si un message ne peut plus être relu à
+        l'identique (transcript réécrit ou supprimé)
+    """
+    data = json.loads(payload)
+    transcript_path = data["transcript_path"]
+    transcript_format = TranscriptFormat(data["transcript_format"])
+
+    parser = None
+    messages = []
+    for item in data["candidates"]:
+        timestamp = datetime.fromisoformat(item["timestamp"]) if item["timestamp"] else None
+        if "content" in item:
+            msg: Optional[TranscriptMessage] = TranscriptMessage(
+                role=item["role"],
+                content=item["content"],
+                timestamp=timestamp,
+                index=item["index"],
+            )
+        else:
+            if parser is None:
+                from rekall.transcript.detector import get_parser
+
+                parser = get_parser(transcript_format)
+            msg = parser.read_message_at(
+                Path(transcript_path), item["offset"], item["length"], item["index"]
+            )
+            if msg is None or _content_digest(msg.content) != item["digest"]:
+                logger.warning(
+                    "Session %s: transcript changed since step 1", data["session_id"]
+                )
+                return None
+        messages.append(msg)
+
+    return SessionData(
+        session_id=data["session_id"],
+        candidates=CandidateExchanges(
+            session_id=data["session_id"],
+            total_exchanges=data["total_exchanges"],
+            candidates=messages,
+            transcript_path=transcript_path,
+            transcript_format=transcript_format,
+        ),
+        created_at=datetime.fromisoformat(data["created_at"]),
+        entry_type=data["entry_type"],
+        title=data["title"],
+        context=data["context"],
+        tags=data["tags"],
+        project=data["project"],
+        confidence=data["confidence"],
+    )
+
+
+# =============================================================================
+# Stockages
+# =============================================================================
+
+
+class SessionStore(ABC):
+    """
+    Stockage des sessions sérialisées.
+
+    Les sessions sont identifiées par leur ID et datées (timestamp Unix)
+    pour l'expiration.
+    """
+
+    @abstractmethod
+    def put(self, session_id: str, created_at: float, payload: str) -> None:
+        """Enregistre une session (éviction LRU au-delà du budget)."""
+        ...
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[tuple[float, str]]:
+        """Retourne (created_at, payload) ou None."""
+        ...
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """Supprime une session ; True si elle existait."""
+        ...
+
+    @abstractmethod
+    def purge(self, created_before: float) -> None:
+        """Supprime les sessions créées avant created_before."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Supprime toutes les sessions."""
+        ...
+
+    @abstractmethod
+    def count(self) -> int:
+        """Nombre de sessions stockées."""
+        ...
+
+
+class MemorySessionStore(SessionStore):
+    """Sessions en mémoire, bornées en octets avec éviction LRU."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._sessions: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, session_id: str, created_at: float, payload: str) -> None:
+        with self._lock:
+            self._remove(session_id)
+            self._sessions[session_id] = (created_at, payload)
+            self._bytes += len(payload)
+            # Garde au moins la session ajoutée
+            while self._bytes > self.max_bytes and len(self._sessions) > 1:
+                self._remove(next(iter(self._sessions)))
+
+    def _remove(self, session_id: str) -> bool:
+        item = self._sessions.pop(session_id, None)
+        if item is None:
+            return False
+        self._bytes -= len(item[1])
+        return True
+
+    def get(self, session_id: str) -> Optional[tuple[float, str]]:
+        with self._lock:
+            item = self._sessions.get(session_id)
+            if item is not None:
+                self._sessions.move_to_end(session_id)
+            return item
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._remove(session_id)
+
+    def purge(self, created_before: float) -> None:
+        with self._lock:
+            expired = [
+                sid for sid, (created_at, _) in self._sessions.items()
+                if created_at < created_before
+            ]
+            for sid in expired:
+                self._remove(sid)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+            self._bytes = 0
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    @property
+    def size_bytes(self) -> int:
+        """Octets utilisés par les sessions stockées."""
+        with self._lock:
+            return self._bytes
+
+
+class SqliteSessionStore(SessionStore):
+    """
+    Sessions dans un fichier SQLite, bornées en octets avec éviction LRU.
+
+    Survit aux redémarrages et se partage entre processus : le Step 2 peut
+    être servi par un autre processus que le Step 1.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    payload TEXT NOT NULL
+                )
+                """
+            )
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def put(self, session_id: str, created_at: float, payload: str) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)",
+                    (session_id, created_at, time.time(), payload),
+                )
+                # Éviction des sessions les moins récemment utilisées
+                total = conn.execute(
+                    "SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM sessions"
+                ).fetchone()[0]
+                if total > self.max_bytes:
+                    rows = conn.execute(
+                        "SELECT session_id, LENGTH(payload) FROM sessions "
+                        "WHERE session_id != ? ORDER BY accessed_at",
+                        (session_id,),
+                    ).fetchall()
+                    for sid, size in rows:
+                        if total <= self.max_bytes:
+                            break
+                        conn.execute("DELETE FROM sessions WHERE session_id = ?", (sid,))
+                        total -= size
+        finally:
+            conn.close()
+
+    def get(self, session_id: str) -> Optional[tuple[float, str]]:
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT created_at, payload FROM sessions WHERE session_id = ?",
+                    (session_id,),
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE sessions SET accessed_at = ? WHERE session_id = ?",
+                        (time.time(), session_id),
+                    )
+            return (row[0], row[1]) if row else None
+        finally:
+            conn.close()
+
+    def delete(self, session_id: str) -> bool:
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+                )
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def purge(self, created_before: float) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM sessions WHERE created_at < ?", (created_before,))
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM sessions")
+        finally:
+            conn.close()
+
+    def count(self) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+        finally:
+            conn.close()
+
+
+# =============================================================================
+# Gestionnaire
+# =============================================================================
+
+
 class SessionManager:
     """
     Gestionnaire thread-safe des sessions temporaires Mode 2.
 
     Utilise un singleton pour maintenir les sessions entre les appels MCP.
-    Les sessions sont nettoyées périodiquement via un thread de background.
+    Les sessions expirées sont purgées à l'accès (au plus une fois par
+    cleanup_interval), sans thread de fond.
     """
 
     _instance: Optional["SessionManager"] = None
     _lock = threading.Lock()
 
-    def __new__(cls) -> "SessionManager":
+    def __new__(cls, *args, **kwargs) -> "SessionManager":
         """Singleton pattern pour partager les sessions."""
         with cls._lock:
             if cls._instance is None:
@@ -58,25 +404,34 @@ class SessionManager:
                 cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, ttl_seconds: int = 300, cleanup_interval: int = 60):
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        cleanup_interval: int = 60,
+        store: Optional[SessionStore] = None,
+    ):
         """
         Initialise le gestionnaire.
 
         Args:
             ttl_seconds: Durée de vie des sessions (défaut: 5 min)
-            cleanup_interval: Intervalle de nettoyage (défaut: 60s)
+            cleanup_interval: Intervalle minimal entre deux purges (défaut: 60s)
+            store: Stockage des sessions (défaut: mémoire, 4 Mo)
         """
         if self._initialized:
             return
 
-        self._sessions: dict[str, SessionData] = {}
-        self._sessions_lock = threading.Lock()
+        self._store = store if store is not None else MemorySessionStore()
         self._ttl_seconds = ttl_seconds
         self._cleanup_interval = cleanup_interval
-        self._cleanup_thread: Optional[threading.Thread] = None
-        self._stop_cleanup = threading.Event()
+        self._last_cleanup = 0.0
         self._initialized = True
 
+    @property
+    def store(self) -> SessionStore:
+        """Stockage des sessions."""
+        return self._store
+
     def create_session(
         self,
         candidates: CandidateExchanges,
@@ -118,11 +473,10 @@ class SessionManager:
             confidence=confidence,
         )
 
-        with self._sessions_lock:
-            self._sessions[session_id] = session
-
-        # Démarre le nettoyage si pas encore actif
-        self._ensure_cleanup_running()
+        self._cleanup_expired()
+        self._store.put(
+            session_id, session.created_at.timestamp(), _serialize_session(session)
+        )
 
         return session_id
 
@@ -136,14 +490,15 @@ class SessionManager:
         Returns:
             SessionData si trouvée et non expirée, None sinon
         """
-        with self._sessions_lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                return None
-            if session.is_expired(self._ttl_seconds):
-                del self._sessions[session_id]
-                return None
-            return session
+        item = self._store.get(session_id)
+        if item is None:
+            return None
+
+        created_at, payload = item
+        if time.time() - created_at > self._ttl_seconds:
+            self._store.delete(session_id)
+            return None
+        return _deserialize_session(payload)
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -155,11 +510,7 @@ class SessionManager:
         Returns:
             True si supprimée, False si non trouvée
         """
-        with self._sessions_lock:
-            if session_id in self._sessions:
-                del self._sessions[session_id]
-                return True
-            return False
+        return self._store.delete(session_id)
 
     def get_selected_messages(
         self, session_id: str, indices: list[int]
@@ -199,48 +550,25 @@ class SessionManager:
 
         return session.candidates.format_as_excerpt(indices)
 
-    def _ensure_cleanup_running(self) -> None:
-        """Démarre le thread de nettoyage si nécessaire."""
-        if self._cleanup_thread is None or not self._cleanup_thread.is_alive():
-            self._stop_cleanup.clear()
-            self._cleanup_thread = threading.Thread(
-                target=self._cleanup_loop, daemon=True
-            )
-            self._cleanup_thread.start()
-
-    def _cleanup_loop(self) -> None:
-        """Boucle de nettoyage des sessions expirées."""
-        while not self._stop_cleanup.is_set():
-            self._cleanup_expired()
-            time.sleep(self._cleanup_interval)
-
     def _cleanup_expired(self) -> None:
-        """Supprime toutes les sessions expirées."""
-        with self._sessions_lock:
-            expired = [
-                sid
-                for sid, session in self._sessions.items()
-                if session.is_expired(self._ttl_seconds)
-            ]
-            for sid in expired:
-                del self._sessions[sid]
+        """Supprime les sessions expirées (au plus une fois par intervalle)."""
+        now = time.time()
+        if now - self._last_cleanup < self._cleanup_interval:
+            return
+        self._last_cleanup = now
+        self._store.purge(now - self._ttl_seconds)
 
     def stop_cleanup(self) -> None:
-        """Arrête le thread de nettoyage (pour les tests)."""
-        self._stop_cleanup.set()
-        if self._cleanup_thread and self._cleanup_thread.is_alive():
-            self._cleanup_thread.join(timeout=1)
+        """Conservé pour compatibilité : la purge est faite à l'accès."""
 
     def clear_all(self) -> None:
         """Vide toutes les sessions (pour les tests)."""
-        with self._sessions_lock:
-            self._sessions.clear()
+        self._store.clear()
 
     @property
     def session_count(self) -> int:
         """Nombre de sessions actives."""
-        with self._sessions_lock:
-            return len(self._sessions)
+        return self._store.count()
 
 
 # Singleton global pour accès facile
@@ -248,8 +576,34 @@ _session_manager: Optional[SessionManager] = None
 
 
 def get_session_manager() -> SessionManager:
-    """Obtient l'instance singleton du SessionManager."""
+    """
+    Obtient l'instance singleton du SessionManager.
+
+    Le stockage suit la configuration ([performance] mcp_session_store,
+    mcp_session_max_bytes) : "memory" (défaut) ou "sqlite" dans le cache.
+    """
     global _session_manager
     if _session_manager is None:
-        _session_manager = SessionManager()
+        _session_manager = SessionManager(store=_store_from_config())
     return _session_manager
+
+
+def _store_from_config() -> Optional[SessionStore]:
+    """Crée le stockage configuré (None: stockage par défaut)."""
+    try:
+        from rekall.config import get_config
+
+        cfg = get_config()
+    except Exception as e:
+        logger.debug("Session store falls back to memory: %s", e)
+        return None
+
+    if cfg.perf_mcp_session_store == "sqlite":
+        try:
+            return SqliteSessionStore(
+                cfg.paths.cache_dir / "mcp_sessions.db",
+                max_bytes=cfg.perf_mcp_session_max_bytes,
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Cannot open SQLite session store, using memory: %s", e)
+    return MemorySessionStore(max_bytes=cfg.perf_mcp_session_max_bytes)
@@ -0,0 +1,63 @@
+"""
+Lecture de la fin des transcripts JSONL sans relire tout le fichier.
+
+Les transcripts Claude Code atteignent facilement plusieurs centaines de Mo.
+Pour extraire les N derniers messages, on lit le fichier à rebours depuis la
+fin par blocs (iter_lines_reversed) : seule la fin utile est décodée.
+
+Le nombre total de messages et les positions des derniers messages viennent
+de l'index des transcripts (voir rekall.transcript.index).
+"""
+
+from collections.abc import Iterator
+from typing import BinaryIO
+
+# Taille des blocs lus à rebours depuis la fin du fichier
+BLOCK_SIZE = 64 * 1024
+
+
+def iter_lines_reversed(
+    f: BinaryIO, end: int, block_size: int = BLOCK_SIZE
+) -> Iterator[tuple[int, bytes]]:
+    """
+    Itère sur les lignes d'un fichier binaire, de la dernière à la première.
+
+    Les lignes sont rendues sans leur "\\n" final ; une ligne vide est
+    rendue pour un fichier terminé par "\\n".
+
+    Args:
+        f: Fichier ouvert en mode binaire
+        end: Position de fin de lecture (taille du fichier)
+        block_size: Taille des blocs lus
+
+    Yields:
+        Tuples (offset de début de ligne, contenu de la ligne)
+    """
+    pos = end
+    # Morceaux de la ligne en cours, du plus récent (fin) au plus ancien
+    pending: list[bytes] = []
+
+    while pos > 0:
+        size = min(block_size, pos)
+        pos -= size
+        f.seek(pos)
+        block = f.read(size)
+
+        parts = block.split(b"\n")
+        if len(parts) == 1:
+            pending.append(block)
+            continue
+
+        # parts[-1] est le début de la ligne en cours
+        line_start = pos + len(block) - len(parts[-1])
+        pending.append(parts[-1])
+        yield line_start, b"".join(reversed(pending))
+
+        # Lignes complètes contenues dans le bloc
+        for part in reversed(parts[1:-1]):
+            line_start -= len(part) + 1
+            yield line_start, part
+
+        pending = [parts[0]]
+
+    yield 0, b"".join(reversed(pending))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 from pathlib import Path
@@ -168,6 +169,29 @@ def normalize_url(url: str) -> str:
     return result
 
 
+def url_hash(url: str) -> str:
+    """Hash a URL after normalization, to deduplicate captured URLs.
+
+    http(s) URLs go through normalize_url() (scheme, case, trailing slash,
+    tracking parameters, fragment); other URLs are hashed as-is.
+
+    Args:
+        url: URL to hash
+
+    Returns:
+        32-character hex digest
+
+    Examples:
+        >>> url_hash("http://Example.com/a/?utm_source=x") == url_hash("https://example.com/a")
+        True
+    """
+    key = url.strip()
+    scheme, sep, rest = key.partition("://")
+    if sep and scheme.lower() in ("http", "https"):
+        key = normalize_url(f"{scheme.lower()}://{rest}")
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def is_valid_url(url: str) -> bool:
     """Check if a string is a valid URL.
 
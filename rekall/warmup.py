@@ -0,0 +1,245 @@
+"""Background warm-up of the MCP server.
+
+Without warm-up, the first semantic search after server start pays for the
+model load and a full vector read, and can time out the agent call that
+happens to come first. ServerWarmup runs these costs on a background
+thread as soon as a client has completed the handshake:
+
+1. database: read the database file (and its WAL) once so the FTS, index
+   and table pages are in the OS page cache
+2. model: load the embedding model through the ModelManager
+3. vectors: load the vector matrix into the embedding cache
+
+Until the model and vectors are ready, searches degrade to FTS-only
+instead of blocking (see ``semantic_ready()``).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rekall.db import Database
+    from rekall.embeddings import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("database", "model", "vectors")
+
+# Stop reading the database file after this many bytes
+READ_LIMIT_BYTES = 512 * 1024 * 1024
+_READ_CHUNK = 1024 * 1024
+
+# Stage states after which the stage no longer blocks anything
+_SETTLED = ("done", "failed", "skipped")
+
+
+def _read_through(path: Path, limit: int) -> int:
+    """Read a file sequentially so its pages land in the OS page cache.
+
+    Returns:
+        Number of bytes read
+    """
+    total = 0
+    try:
+        with open(path, "rb", buffering=0) as f:
+            while total < limit:
+                chunk = f.read(_READ_CHUNK)
+                if not chunk:
+                    break
+                total += len(chunk)
+    except FileNotFoundError:
+        pass
+    return total
+
+
+class ServerWarmup:
+    """Runs warm-up stages on a background thread and tracks their status.
+
+    Attributes:
+        db_path: Path to the SQLite database
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        get_db: Callable[[], Database],
+        service: EmbeddingService | None = None,
+        on_progress: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the warm-up (call start()).
+
+        Args:
+            db_path: Path to the SQLite database
+            get_db: Returns a database connection for the warm-up thread
+            service: Embedding service to warm (None skips model/vectors)
+            on_progress: Called after each stage (e.g. to invalidate caches)
+        """
+        self.db_path = db_path
+        self._get_db = get_db
+        self._service = service
+        self._on_progress = on_progress
+        self._stages: dict[str, dict[str, Any]] = {
+            name: {"state": "pending", "seconds": None, "detail": ""}
+            for name in STAGES
+        }
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._done = threading.Event()
+
+    @property
+    def started(self) -> bool:
+        """Whether start() was called."""
+        return self._thread is not None
+
+    def start(self) -> bool:
+        """Start the warm-up thread (only once).
+
+        Returns:
+            True if this call started it
+        """
+        with self._lock:
+            if self._thread is not None:
+                return False
+            self._thread = threading.Thread(
+                target=self._run, name="rekall-warmup", daemon=True
+            )
+        self._thread.start()
+        return True
+
+    def _set(self, name: str, **values: Any) -> None:
+        with self._lock:
+            self._stages[name].update(values)
+
+    def _run(self) -> None:
+        """Warm-up thread body: run stages in order."""
+        stages: list[tuple[str, Callable[[], str]]] = [("database", self._warm_database)]
+        if self._service is not None and self._service.available:
+            stages += [("model", self._warm_model), ("vectors", self._warm_vectors)]
+        else:
+            self._set("model", state="skipped", detail="embeddings disabled")
+            self._set("vectors", state="skipped", detail="embeddings disabled")
+
+        for name, stage in stages:
+            self._set(name, state="running")
+            start = time.perf_counter()
+            try:
+                detail = stage()
+                self._set(name, state="done", detail=detail)
+            except Exception as e:
+                logger.warning("Warm-up stage %s failed: %s", name, e)
+                self._set(name, state="failed", detail=str(e))
+            finally:
+                self._set(name, seconds=round(time.perf_counter() - start, 3))
+                if self._on_progress is not None:
+                    self._on_progress()
+
+        self._done.set()
+        logger.debug("Warm-up finished: %s", self.status())
+
+    def _warm_database(self) -> str:
+        """Page the database file (and WAL) into the OS page cache."""
+        read = _read_through(self.db_path, READ_LIMIT_BYTES)
+        wal = self.db_path.with_name(self.db_path.name + "-wal")
+        read += _read_through(wal, max(0, READ_LIMIT_BYTES - read))
+        return f"{read // 1024} KiB read"
+
+    def _warm_model(self) -> str:
+        """Load the embedding model."""
+        from rekall.model_manager import get_model_manager
+
+        service: EmbeddingService = self._service  # type: ignore[assignment]
+        manager = get_model_manager(
+            model_name=service.model_name, target_dimensions=service.dimensions
+        )
+        manager.get_model()
+        return service.model_name
+
+    def _warm_vectors(self) -> str:
+        """Load the vector matrix into the embedding cache."""
+        service: EmbeddingService = self._service  # type: ignore[assignment]
+        count = service.preload_vectors(self._get_db())
+        return f"{count} vectors"
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the warm-up to finish.
+
+        Returns:
+            True if finished
+        """
+        return self._done.wait(timeout)
+
+    def semantic_ready(self) -> bool:
+        """Whether semantic search can run without waiting on warm-up."""
+        with self._lock:
+            return all(
+                self._stages[name]["state"] in _SETTLED for name in ("model", "vectors")
+            )
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        """Get the status of every stage.
+
+        Returns:
+            Dict mapping stage name to {state, seconds, detail}
+        """
+        with self._lock:
+            return {name: dict(values) for name, values in self._stages.items()}
+
+
+# Singleton prepared by run_server
+_server_warmup: ServerWarmup | None = None
+
+
+def prepare_server_warmup(
+    db_path: Path,
+    get_db: Callable[[], Database],
+    service: EmbeddingService | None = None,
+    on_progress: Callable[[], None] | None = None,
+) -> ServerWarmup:
+    """Create the server's warm-up (started by start_server_warmup()).
+
+    Args:
+        db_path: Path to the SQLite database
+        get_db: Returns a database connection for the warm-up thread
+        service: Embedding service to warm (None skips model/vectors)
+        on_progress: Called after each stage
+
+    Returns:
+        ServerWarmup instance
+    """
+    global _server_warmup
+
+    _server_warmup = ServerWarmup(db_path, get_db, service, on_progress)
+    return _server_warmup
+
+
+def start_server_warmup() -> None:
+    """Start the prepared warm-up if not started yet (cheap when started)."""
+    warmup = _server_warmup
+    if warmup is not None and not warmup.started:
+        warmup.start()
+
+
+def get_server_warmup() -> ServerWarmup | None:
+    """Get the server's warm-up, or None outside the MCP server."""
+    return _server_warmup
+
+
+def semantic_ready() -> bool:
+    """Whether semantic search can run without blocking on warm-up.
+
+    Always True outside the MCP server (load on demand).
+    """
+    warmup = _server_warmup
+    return warmup is None or warmup.semantic_ready()
+
+
+def reset_server_warmup() -> None:
+    """Forget the server's warm-up (server shutdown, tests)."""
+    global _server_warmup
+    _server_warmup = None
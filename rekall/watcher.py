@@ -0,0 +1,406 @@
+"""File-watch driven connector scans (`rekall sources watch`).
+
+Instead of waiting for the autoscan interval, the watcher follows the
+connector history directories and ingests new URLs a few seconds after
+they are written:
+
+- inotify on Linux, polling of directory snapshots elsewhere
+- bursts of writes are debounced: a scan runs once the files have been
+  quiet for `debounce` seconds (or `max_delay` after the first write)
+- only the connectors whose directories changed are scanned, and the
+  per-file CDC manifest limits the scan to the files that changed
+- a lock file next to the database allows a single watcher per database
+  (background autoscans are not launched while it is held)
+- a connector whose scan raises is reported as failed; the loop goes on
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+from rekall.filelock import FileLock
+
+if TYPE_CHECKING:
+    from rekall.autoscan import ScanResult
+    from rekall.db import Database
+
+# Quiet period after the last write before scanning (seconds)
+DEBOUNCE_SECONDS = 2.0
+
+# Maximum wait after the first write of a burst (seconds)
+MAX_DELAY_SECONDS = 30.0
+
+# Directory snapshot interval of the polling watcher (seconds)
+POLL_INTERVAL = 2.0
+
+# Longest blocking wait, so stop requests are honoured quickly (seconds)
+WAIT_STEP = 1.0
+
+# inotify events (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+logger = logging.getLogger(__name__)
+
+
+def watch_lock_path(db_path: Path) -> Path:
+    """Lock file of the watcher for a database."""
+    db_path = Path(db_path)
+    return db_path.with_name(db_path.name + ".watch.lock")
+
+
+def is_watcher_running(db_path: Path) -> bool:
+    """Check if a watcher currently holds the lock of a database."""
+    return FileLock(watch_lock_path(db_path)).is_held()
+
+
+class InotifyWatcher:
+    """Directory watcher backed by Linux inotify (non-recursive)."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        self._paths: dict[Path, int] = {}
+        self._tags: dict[int, set[str]] = {}
+
+    def add(self, path: Path, tag: str) -> bool:
+        """Watch a directory; its events are reported as `tag`.
+
+        Returns:
+            False if the directory could not be watched
+        """
+        path = Path(path)
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            return False
+        self._paths[path] = wd
+        self._tags.setdefault(wd, set()).add(tag)
+        return True
+
+    def watched(self) -> set[Path]:
+        """Directories currently watched."""
+        return set(self._paths)
+
+    def wait(self, timeout: float) -> set[str]:
+        """Wait for events.
+
+        Args:
+            timeout: Maximum wait in seconds
+
+        Returns:
+            Tags of the directories that changed (empty on timeout)
+        """
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not ready:
+            return set()
+
+        changed: set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+            if not data:
+                break
+            changed |= self._parse(data)
+        return changed
+
+    def _parse(self, data: bytes) -> set[str]:
+        changed: set[str] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size + name_len
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost: consider everything changed
+                for tags in self._tags.values():
+                    changed |= tags
+                continue
+
+            tags = self._tags.get(wd)
+            if not tags:
+                continue
+            changed |= tags
+            if mask & IN_IGNORED:
+                # Directory deleted or unmounted: the kernel dropped the watch
+                del self._tags[wd]
+                self._paths = {p: w for p, w in self._paths.items() if w != wd}
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher:
+    """Portable watcher comparing directory snapshots (mtime, size)."""
+
+    def __init__(self, interval: float = POLL_INTERVAL):
+        self.interval = interval
+        self._next_poll = 0.0
+        self._tags: dict[Path, set[str]] = {}
+        self._snapshots: dict[Path, Optional[dict[str, tuple[int, int]]]] = {}
+
+    @staticmethod
+    def _snapshot(path: Path) -> Optional[dict[str, tuple[int, int]]]:
+        try:
+            with os.scandir(path) as it:
+                snapshot = {}
+                for entry in it:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    snapshot[entry.name] = (st.st_mtime_ns, st.st_size)
+                return snapshot
+        except OSError:
+            return None
+
+    def add(self, path: Path, tag: str) -> bool:
+        """Watch a directory; its changes are reported as `tag`."""
+        path = Path(path)
+        if path not in self._snapshots:
+            snapshot = self._snapshot(path)
+            if snapshot is None:
+                return False
+            self._snapshots[path] = snapshot
+        self._tags.setdefault(path, set()).add(tag)
+        return True
+
+    def watched(self) -> set[Path]:
+        """Directories currently watched."""
+        return set(self._snapshots)
+
+    def poll(self) -> set[str]:
+        """Compare every watched directory with its last snapshot."""
+        changed: set[str] = set()
+        for path in list(self._snapshots):
+            snapshot = self._snapshot(path)
+            if snapshot == self._snapshots[path]:
+                continue
+            changed |= self._tags[path]
+            if snapshot is None:
+                del self._snapshots[path]
+                del self._tags[path]
+            else:
+                self._snapshots[path] = snapshot
+        return changed
+
+    def wait(self, timeout: float) -> set[str]:
+        """Wait up to `timeout` seconds, polling once per interval."""
+        delay = self._next_poll - time.monotonic()
+        if delay > timeout:
+            time.sleep(max(timeout, 0))
+            return set()
+        time.sleep(max(delay, 0))
+        self._next_poll = time.monotonic() + self.interval
+        return self.poll()
+
+    def close(self) -> None:
+        self._snapshots.clear()
+        self._tags.clear()
+
+
+Watcher = Union[InotifyWatcher, PollingWatcher]
+
+
+def create_watcher(polling: bool = False, poll_interval: float = POLL_INTERVAL) -> Watcher:
+    """Create the best watcher for this platform.
+
+    Args:
+        polling: Force the polling watcher
+        poll_interval: Snapshot interval of the polling watcher
+
+    Returns:
+        InotifyWatcher on Linux, PollingWatcher otherwise or on failure
+    """
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(poll_interval)
+
+
+class SourcesWatcher:
+    """Debounced watch loop scanning connectors when their history changes.
+
+    Example:
+        watcher = SourcesWatcher(db, ["claude", "cursor"])
+        watcher.run(stop_event)
+    """
+
+    def __init__(
+        self,
+        db: "Database",
+        connectors: Iterable[str],
+        debounce: float = DEBOUNCE_SECONDS,
+        max_delay: float = MAX_DELAY_SECONDS,
+        watcher: Optional[Watcher] = None,
+        on_scan: Optional[Callable[[list["ScanResult"]], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            db: Database receiving the inbox entries
+            connectors: Connector names to watch
+            debounce: Quiet period after the last write before scanning
+            max_delay: Maximum delay after the first write of a burst
+            watcher: Directory watcher (default: create_watcher())
+            on_scan: Called with the results of each scan
+            clock: Time source (tests)
+        """
+        self.db = db
+        self.connectors = list(connectors)
+        self.debounce = debounce
+        self.max_delay = max(max_delay, debounce)
+        self.watcher = watcher if watcher is not None else create_watcher()
+        self.on_scan = on_scan
+        self._clock = clock
+
+    def refresh_watches(self) -> int:
+        """Watch the current history directories of every connector.
+
+        New project or workspace directories appear over time, so this
+        runs after each scan.
+
+        Returns:
+            Number of directories added
+        """
+        from rekall.connectors import get_connector
+
+        watched = self.watcher.watched()
+        added = 0
+        for name in self.connectors:
+            try:
+                connector = get_connector(name)
+                if connector is None or not connector.is_available():
+                    continue
+                paths = connector.get_watch_paths()
+            except OSError:
+                continue
+            except Exception:
+                logger.exception("Could not list the directories of %s", name)
+                continue
+            for path in paths:
+                if path not in watched and self.watcher.add(path, name):
+                    added += 1
+        return added
+
+    def scan(self, connectors: Iterable[str]) -> list["ScanResult"]:
+        """Scan connectors now (only their changed files are read).
+
+        A connector whose scan raises is reported as a failed ScanResult,
+        so one broken connector does not stop the watch loop.
+        """
+        from rekall.autoscan import ScanResult, scan_connector
+
+        names = set(connectors)
+        results = []
+        for name in self.connectors:
+            if name not in names:
+                continue
+            try:
+                results.append(scan_connector(self.db, name, force=True))
+            except Exception as e:
+                logger.exception("Scan of %s failed", name)
+                results.append(ScanResult(connector=name, success=False, error=str(e)))
+
+        self.refresh_watches()
+        if self.on_scan is not None:
+            self.on_scan(results)
+        return results
+
+    def run(self, stop: Optional[threading.Event] = None) -> None:
+        """Scan once, then scan again on every debounced burst of changes.
+
+        Args:
+            stop: Set to leave the loop (default: run until interrupted)
+        """
+        stop = stop or threading.Event()
+        self.refresh_watches()
+        self.scan(self.connectors)
+
+        pending: set[str] = set()
+        first_event = last_event = 0.0
+        while not stop.is_set():
+            timeout = WAIT_STEP
+            if pending:
+                now = self._clock()
+                due = min(last_event + self.debounce, first_event + self.max_delay)
+                timeout = min(timeout, max(due - now, 0))
+
+            changed = self.watcher.wait(timeout)
+            now = self._clock()
+            if changed:
+                if not pending:
+                    first_event = now
+                pending |= changed
+                last_event = now
+
+            if pending and (
+                now - last_event >= self.debounce or now - first_event >= self.max_delay
+            ):
+                connectors, pending = pending, set()
+                self.scan(connectors)
+
+    def close(self) -> None:
+        self.watcher.close()
+
+
+def acquire_watch_lock(db_path: Path) -> FileLock:
+    """Take the single-watcher lock of a database.
+
+    Raises:
+        BlockingIOError: If another watcher holds the lock
+    """
+    lock = FileLock(watch_lock_path(db_path))
+    if not lock.acquire():
+        pid = lock.owner_pid()
+        owner = f" (pid {pid})" if pid else ""
+        raise BlockingIOError(f"Another watcher is already running on this database{owner}")
+    return lock
@@ -0,0 +1,160 @@
+"""Tests for auto-scan and the detached background scan."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rekall.config import AutoscanConfig
+
+
+@pytest.fixture
+def db(temp_db_path: Path):
+    from rekall.db import Database
+
+    db = Database(temp_db_path)
+    db.init()
+    yield db
+    db.close()
+
+
+def _config(background: bool) -> AutoscanConfig:
+    return AutoscanConfig(
+        enabled=True, interval_hours=5.0, connectors=["cursor"], background=background
+    )
+
+
+class TestScanProgress:
+    """Tests for progress and timing recorded by scan_connector."""
+
+    def test_successful_scan_records_timing(self, db):
+        """A scan should leave an idle status with its duration and import count."""
+        from rekall.autoscan import scan_connector
+        from rekall.connectors.base import ExtractionResult
+
+        connector = MagicMock()
+        connector.extract_urls.return_value = ExtractionResult(urls=[])
+        connector.validate_urls.return_value = {}
+        with patch("rekall.connectors.get_connector", return_value=connector):
+            result = scan_connector(db, "cursor", force=True)
+
+        assert result.success
+        record = db.get_connector_import("cursor")
+        assert record.scan_status == "idle"
+        assert record.last_duration_ms == result.duration_ms
+        assert record.scan_started_at <= record.scan_finished_at
+        assert record.last_imported == 0
+
+    def test_failed_scan_records_error(self, db):
+        """A failing extraction should be recorded as failed, not as imported."""
+        from rekall.autoscan import needs_scan, scan_connector
+
+        connector = MagicMock()
+        connector.extract_urls.side_effect = RuntimeError("database is locked")
+        with patch("rekall.connectors.get_connector", return_value=connector):
+            result = scan_connector(db, "cursor", force=True)
+
+        assert not result.success
+        record = db.get_connector_import("cursor")
+        assert record.scan_status == "failed"
+        assert record.last_error == "database is locked"
+        assert needs_scan(db, "cursor")
+
+
+    def test_failed_import_records_error(self, db):
+        """An error after extraction (validation, ingestion) should be recorded too."""
+        from rekall.autoscan import scan_connector
+        from rekall.connectors.base import ExtractionResult
+
+        connector = MagicMock()
+        connector.extract_urls.return_value = ExtractionResult(urls=[])
+        connector.validate_urls.return_value = {}
+        with patch("rekall.connectors.get_connector", return_value=connector), patch.object(
+            db, "add_inbox_entries", side_effect=RuntimeError("disk I/O error")
+        ):
+            result = scan_connector(db, "cursor", force=True)
+
+        assert not result.success
+        assert result.error == "disk I/O error"
+        record = db.get_connector_import("cursor")
+        assert record.scan_status == "failed"
+        assert record.last_error == "disk I/O error"
+        assert record.last_duration_ms == result.duration_ms
+
+
+class TestBackgroundAutoscan:
+    """Tests for autoscan_if_needed() in background mode."""
+
+    def test_due_scan_is_launched_detached(self, db):
+        """The caller should not run the scan itself."""
+        from rekall.autoscan import autoscan_if_needed
+
+        with patch("rekall.config.get_autoscan_config", return_value=_config(True)), patch(
+            "rekall.autoscan.subprocess.Popen"
+        ) as popen, patch("rekall.autoscan.autoscan") as run_inline:
+            assert autoscan_if_needed(db) is None
+
+        run_inline.assert_not_called()
+        cmd = popen.call_args.args[0]
+        assert cmd[1:3] == ["-m", "rekall.autoscan"]
+        assert str(db.db_path) in cmd
+        assert cmd[-1] == "cursor"
+
+    def test_no_launch_while_a_scan_holds_the_lock(self, db):
+        """Only one background scan should run per database."""
+        from rekall.autoscan import autoscan_lock_path, launch_background_autoscan
+        from rekall.filelock import FileLock
+
+        with FileLock(autoscan_lock_path(db.db_path)), patch(
+            "rekall.autoscan.subprocess.Popen"
+        ) as popen:
+            assert launch_background_autoscan(db.db_path, ["cursor"], 5.0) is None
+        popen.assert_not_called()
+
+    def test_pythonpath_only_for_source_checkout(self, monkeypatch):
+        """An installed rekall should not have its directory put on PYTHONPATH."""
+        import rekall.autoscan as autoscan_module
+
+        package_root = str(Path(autoscan_module.__file__).resolve().parent.parent)
+        monkeypatch.setenv("PYTHONPATH", "/custom")
+
+        monkeypatch.setattr(autoscan_module.site, "getsitepackages", lambda: [package_root])
+        assert autoscan_module._child_env()["PYTHONPATH"] == "/custom"
+
+        monkeypatch.setattr(autoscan_module.site, "getsitepackages", lambda: [])
+        paths = autoscan_module._child_env()["PYTHONPATH"].split(os.pathsep)
+        assert paths == [package_root, "/custom"]
+
+    def test_inline_when_background_disabled(self, db):
+        """autoscan.background = false keeps the synchronous behaviour."""
+        from rekall.autoscan import AutoscanResult, autoscan_if_needed
+
+        with patch("rekall.config.get_autoscan_config", return_value=_config(False)), patch(
+            "rekall.autoscan.subprocess.Popen"
+        ) as popen, patch("rekall.autoscan.autoscan", return_value=AutoscanResult()):
+            assert autoscan_if_needed(db) is not None
+        popen.assert_not_called()
+
+    def test_background_process_runs(self, temp_db_path: Path):
+        """The detached process should start, take the lock and exit."""
+        from rekall.autoscan import (
+            autoscan_lock_path,
+            is_background_scan_running,
+            launch_background_autoscan,
+        )
+        from rekall.filelock import FileLock
+
+        pid = launch_background_autoscan(temp_db_path, ["missing-connector"], 5.0)
+        assert pid
+
+        lock = FileLock(autoscan_lock_path(temp_db_path))
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if lock.owner_pid() == pid and not is_background_scan_running(temp_db_path):
+                break
+            time.sleep(0.1)
+
+        assert lock.owner_pid() == pid
+        assert temp_db_path.exists()
@@ -29,6 +29,10 @@ class TestBaseConnectorValidation:
                 from rekall.connectors.base import ExtractionResult
                 return ExtractionResult()
 
+            def scan_file(self, path, project, checkpoint=None, seen_urls=None):
+                from rekall.connectors.scanner import FileScan
+                return FileScan(path)
+
         connector = TestConnector()
 
         # Valid URLs
@@ -59,6 +63,10 @@ class TestBaseConnectorValidation:
                 from rekall.connectors.base import ExtractionResult
                 return ExtractionResult()
 
+            def scan_file(self, path, project, checkpoint=None, seen_urls=None):
+                from rekall.connectors.scanner import FileScan
+                return FileScan(path)
+
         connector = TestConnector()
 
         is_valid, error = connector.validate_url("http://example.com/page")
@@ -84,6 +92,10 @@ class TestBaseConnectorValidation:
                 from rekall.connectors.base import ExtractionResult
                 return ExtractionResult()
 
+            def scan_file(self, path, project, checkpoint=None, seen_urls=None):
+                from rekall.connectors.scanner import FileScan
+                return FileScan(path)
+
         connector = TestConnector()
 
         is_valid, error = connector.validate_url("http://localhost:8000/api")
@@ -113,6 +125,10 @@ class TestBaseConnectorValidation:
                 from rekall.connectors.base import ExtractionResult
                 return ExtractionResult()
 
+            def scan_file(self, path, project, checkpoint=None, seen_urls=None):
+                from rekall.connectors.scanner import FileScan
+                return FileScan(path)
+
         connector = TestConnector()
 
         is_valid, error = connector.validate_url("file:///Users/test/secret.txt")
@@ -138,6 +154,10 @@ class TestBaseConnectorValidation:
                 from rekall.connectors.base import ExtractionResult
                 return ExtractionResult()
 
+            def scan_file(self, path, project, checkpoint=None, seen_urls=None):
+                from rekall.connectors.scanner import FileScan
+                return FileScan(path)
+
         connector = TestConnector()
 
         # 192.168.x.x
@@ -171,6 +191,10 @@ class TestBaseConnectorValidation:
                 from rekall.connectors.base import ExtractionResult
                 return ExtractionResult()
 
+            def scan_file(self, path, project, checkpoint=None, seen_urls=None):
+                from rekall.connectors.scanner import FileScan
+                return FileScan(path)
+
         connector = TestConnector()
 
         is_valid, error = connector.validate_url("")
@@ -198,6 +222,10 @@ class TestBaseConnectorValidation:
                 from rekall.connectors.base import ExtractionResult
                 return ExtractionResult()
 
+            def scan_file(self, path, project, checkpoint=None, seen_urls=None):
+                from rekall.connectors.scanner import FileScan
+                return FileScan(path)
+
         connector = TestConnector()
 
         is_valid, error = connector.validate_url("example.com/page")
@@ -415,6 +443,160 @@ class TestClaudeCLIConnectorCDC:
         assert "conv1.jsonl" in result.last_file_marker
 
 
+class TestClaudeCLIConnectorManifest:
+    """Tests for per-file CDC with a manifest of byte offsets."""
+
+    WEBFETCH = '{{"type": "tool_use", "name": "WebFetch", "input": {{"url": "{}"}}}}\n'
+
+    @pytest.fixture
+    def conv_dir(self, tmp_path: Path) -> Path:
+        conv_dir = tmp_path / ".claude" / "projects" / "test-project" / "conversations"
+        conv_dir.mkdir(parents=True)
+        return conv_dir
+
+    def _extract(self, tmp_path: Path, manifest: dict):
+        """Run an extraction and record the new positions in the manifest."""
+        from rekall.connectors.claude_cli import ClaudeCLIConnector
+
+        connector = ClaudeCLIConnector()
+        with patch.object(connector, "CLAUDE_DIR", tmp_path / ".claude"):
+            with patch.object(connector, "PROJECTS_DIR", tmp_path / ".claude" / "projects"):
+                result = connector.extract_urls(manifest=manifest)
+        for state in result.file_states:
+            manifest[state.path] = state
+        for path in result.stale_files:
+            del manifest[path]
+        return result
+
+    def test_reads_only_appended_lines(self, tmp_path: Path, conv_dir: Path):
+        """Lines appended to any file should be read, and nothing else."""
+        old_file = conv_dir / "old.jsonl"
+        old_file.write_text(
+            '{"type": "human", "content": "Which HTTP client?"}\n'
+            + self.WEBFETCH.format("https://old.com/")
+        )
+        (conv_dir / "new.jsonl").write_text(self.WEBFETCH.format("https://new.com/"))
+        manifest: dict = {}
+
+        first = self._extract(tmp_path, manifest)
+        assert {u.url for u in first.urls} == {"https://old.com/", "https://new.com/"}
+        assert manifest[str(old_file)].position == old_file.stat().st_size
+
+        # Nothing changed: no file is opened
+        second = self._extract(tmp_path, manifest)
+        assert second.urls == []
+        assert second.files_processed == 0
+        assert second.files_unchanged == 2
+
+        # Appended to the oldest file (before the legacy marker)
+        with open(old_file, "a") as f:
+            f.write(self.WEBFETCH.format("https://appended.com/"))
+        third = self._extract(tmp_path, manifest)
+        assert [u.url for u in third.urls] == ["https://appended.com/"]
+        assert third.files_processed == 1
+        # Context from lines read by an earlier scan is kept
+        assert third.urls[0].user_query == "Which HTTP client?"
+
+    def test_prefilter_ignores_scheme_case(self, tmp_path: Path, conv_dir: Path):
+        """Lines whose only URL has a mixed-case scheme should not be skipped."""
+        conv = conv_dir / "conv.jsonl"
+        conv.write_text(
+            '{"type": "assistant", "content": "See Https://docs.example.com/x"}\n'
+        )
+
+        result = self._extract(tmp_path, {})
+        assert [u.url.lower() for u in result.urls] == ["https://docs.example.com/x"]
+
+    def test_partial_line_is_read_next_scan(self, tmp_path: Path, conv_dir: Path):
+        """A line still being written should not move the offset past it."""
+        conv = conv_dir / "conv.jsonl"
+        line = self.WEBFETCH.format("https://partial.com/")
+        conv.write_text(self.WEBFETCH.format("https://first.com/") + line[:20])
+        manifest: dict = {}
+
+        first = self._extract(tmp_path, manifest)
+        assert [u.url for u in first.urls] == ["https://first.com/"]
+
+        with open(conv, "a") as f:
+            f.write(line[20:])
+        second = self._extract(tmp_path, manifest)
+        assert [u.url for u in second.urls] == ["https://partial.com/"]
+        assert manifest[str(conv)].position == conv.stat().st_size
+
+    def test_rewritten_file_is_read_again(self, tmp_path: Path, conv_dir: Path):
+        """A shorter file (truncated or rewritten) should be read from the start."""
+        conv = conv_dir / "conv.jsonl"
+        conv.write_text(
+            self.WEBFETCH.format("https://one.com/") + self.WEBFETCH.format("https://two.com/")
+        )
+        manifest: dict = {}
+        self._extract(tmp_path, manifest)
+
+        conv.write_text(self.WEBFETCH.format("https://three.com/"))
+        result = self._extract(tmp_path, manifest)
+        assert [u.url for u in result.urls] == ["https://three.com/"]
+
+    def test_file_rewritten_in_place_is_read_again(self, tmp_path: Path, conv_dir: Path):
+        """A same-inode file rewritten with more bytes should be read from the start."""
+        conv = conv_dir / "conv.jsonl"
+        conv.write_text(self.WEBFETCH.format("https://one.com/"))
+        manifest: dict = {}
+        self._extract(tmp_path, manifest)
+        inode = conv.stat().st_ino
+
+        conv.write_text(
+            self.WEBFETCH.format("https://three.com/") + self.WEBFETCH.format("https://four.com/")
+        )
+        assert conv.stat().st_ino == inode
+        result = self._extract(tmp_path, manifest)
+        assert [u.url for u in result.urls] == ["https://three.com/", "https://four.com/"]
+
+    def test_deleted_file_is_stale(self, tmp_path: Path, conv_dir: Path):
+        """Files gone from the history should be reported as stale."""
+        conv = conv_dir / "conv.jsonl"
+        conv.write_text(self.WEBFETCH.format("https://one.com/"))
+        manifest: dict = {}
+        self._extract(tmp_path, manifest)
+
+        conv.unlink()
+        (conv_dir / "other.jsonl").write_text(self.WEBFETCH.format("https://two.com/"))
+        result = self._extract(tmp_path, manifest)
+        assert result.stale_files == [str(conv)]
+        assert list(manifest) == [str(conv_dir / "other.jsonl")]
+
+    def test_scan_connector_persists_positions(
+        self, tmp_path: Path, conv_dir: Path, temp_db_path: Path
+    ):
+        """scan_connector should import only new lines on each run."""
+        from rekall.autoscan import scan_connector
+        from rekall.connectors.claude_cli import ClaudeCLIConnector
+        from rekall.db import Database
+
+        conv = conv_dir / "conv.jsonl"
+        conv.write_text(self.WEBFETCH.format("https://one.com/"))
+
+        from rekall.connectors.resolver import HostResolver
+
+        connector = ClaudeCLIConnector()
+        connector.PROJECTS_DIR = tmp_path / ".claude" / "projects"
+        resolver = HostResolver(resolve=lambda hostname: ["93.184.216.34"])
+
+        db = Database(temp_db_path)
+        db.init()
+        with patch("rekall.connectors.get_connector", return_value=connector), patch(
+            "rekall.connectors.resolver._host_resolver", resolver
+        ):
+            assert scan_connector(db, "claude", force=True).imported == 1
+            assert scan_connector(db, "claude", force=True).imported == 0
+
+            with open(conv, "a") as f:
+                f.write(self.WEBFETCH.format("https://two.com/"))
+            assert scan_connector(db, "claude", force=True).imported == 1
+
+        assert db.get_connector_files("claude")[str(conv)].position == conv.stat().st_size
+        db.close()
+
+
 class TestConnectorRegistry:
     """Tests for connector registry."""
 
@@ -233,6 +233,124 @@ class TestCursorConnectorCDC:
         assert result2.files_processed >= 1
 
 
+class TestCursorConnectorManifest:
+    """Tests for per-file CDC with a manifest of max rowids."""
+
+    def _extract(self, connector, ws_storage: Path, manifest: dict):
+        with patch.object(connector, "_get_workspace_storage_path", return_value=ws_storage):
+            result = connector.extract_urls(manifest=manifest)
+        for state in result.file_states:
+            manifest[state.path] = state
+        return result
+
+    def test_reads_only_new_rows(self, mock_cursor_db):
+        """Only rows written since the last scan should be read."""
+        from rekall.connectors.cursor import CursorConnector
+
+        connector = CursorConnector()
+        ws_storage = mock_cursor_db / "workspaceStorage"
+        db_path = ws_storage / "abc123" / "state.vscdb"
+        manifest: dict = {}
+
+        first = self._extract(connector, ws_storage, manifest)
+        assert len(first.urls) == 4
+        assert manifest[str(db_path)].position == 3
+
+        second = self._extract(connector, ws_storage, manifest)
+        assert second.urls == []
+        assert second.files_unchanged == 1
+
+        # Cursor rewrites a conversation with INSERT OR REPLACE (new rowid)
+        value = json.dumps({"response": "See https://new-url.com/page"})
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO ItemTable (key, value) VALUES (?, ?)",
+            ("cursorDiskKV.composerData.chat.1", value),
+        )
+        conn.commit()
+        conn.close()
+
+        third = self._extract(connector, ws_storage, manifest)
+        assert [u.url for u in third.urls] == ["https://new-url.com/page"]
+        assert manifest[str(db_path)].position == 4
+
+
+class TestCursorKeyWatermarks:
+    """Tests for per-key watermarks in state.vscdb extraction."""
+
+    def _checkpoint(self, db_path: Path):
+        from rekall.models import ConnectorFile
+
+        return ConnectorFile(connector="cursor", path=str(db_path))
+
+    def _write(self, db_path: Path, key: str, value: str) -> None:
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT OR REPLACE INTO ItemTable (key, value) VALUES (?, ?)", (key, value))
+        conn.commit()
+        conn.close()
+
+    def test_only_changed_values_are_loaded(self, mock_cursor_db, monkeypatch):
+        """Unchanged keys should be skipped without loading their value."""
+        from rekall.connectors.cursor import CursorConnector
+
+        connector = CursorConnector()
+        db_path = mock_cursor_db / "workspaceStorage" / "abc123" / "state.vscdb"
+        checkpoint = self._checkpoint(db_path)
+        loaded = []
+        digest = CursorConnector._digest
+
+        def counting_digest(value):
+            loaded.append(value)
+            return digest(value)
+
+        monkeypatch.setattr(CursorConnector, "_digest", staticmethod(counting_digest))
+
+        first = connector._extract_urls_from_db(db_path, "p", set(), checkpoint)
+        assert len(first) == 4
+        assert len(loaded) == 3
+
+        # Same content rewritten (new rowid): loaded, but not scanned again
+        same = json.dumps({
+            "userMessage": {"text": "Explain asyncio"},
+            "response": "Check https://docs.python.org/3/library/asyncio.html",
+        })
+        self._write(db_path, "cursorDiskKV.composerData.chat.1", same)
+        # New content for another key
+        self._write(
+            db_path,
+            "cursorDiskKV.aiconversation.conversations.0",
+            json.dumps({"query": "Follow-up", "response": "See https://www.encode.io/"}),
+        )
+        loaded.clear()
+
+        second = connector._extract_urls_from_db(db_path, "p", set(), checkpoint)
+        assert [u.url for u in second] == ["https://www.encode.io/"]
+        assert second[0].user_query == "Follow-up"
+        assert len(loaded) == 2
+
+        keys = json.loads(checkpoint.state)["keys"]
+        assert set(keys) == {
+            "cursorDiskKV.aiconversation.conversations.0",
+            "cursorDiskKV.aiconversation.conversations.2",
+            "cursorDiskKV.composerData.chat.1",
+        }
+        assert checkpoint.position == 5
+
+    def test_large_values_are_not_decoded(self, mock_cursor_db, monkeypatch):
+        """URLs should come from the raw JSON text of large values."""
+        from rekall.connectors import cursor as cursor_module
+        from rekall.connectors.cursor import CursorConnector
+
+        monkeypatch.setattr(cursor_module, "CONTEXT_DECODE_MAX_CHARS", 10)
+        connector = CursorConnector()
+        db_path = mock_cursor_db / "workspaceStorage" / "abc123" / "state.vscdb"
+
+        urls = connector._extract_urls_from_db(db_path, "p", set())
+
+        assert "https://www.python-httpx.org/quickstart/" in {u.url for u in urls}
+        assert all(u.user_query is None for u in urls)
+
+
 class TestCursorConnectorRegistry:
     """Tests for connector registry integration (T105)."""
 
@@ -0,0 +1,140 @@
+"""Tests for cached, concurrent DNS checks (SSRF validation)."""
+
+import socket
+import threading
+import time
+
+import pytest
+
+from rekall.connectors.resolver import HostResolver, get_host_resolver, reset_host_resolver
+
+
+class FakeDNS:
+    """Resolver stand-in counting lookups per hostname."""
+
+    def __init__(self, records: dict[str, list[str]], delay: float = 0.0):
+        self.records = records
+        self.delay = delay
+        self.lookups: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, hostname: str) -> list[str]:
+        with self._lock:
+            self.lookups.append(hostname)
+        time.sleep(self.delay)
+        if hostname not in self.records:
+            raise socket.gaierror("unknown host")
+        return self.records[hostname]
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _reset_resolver():
+    reset_host_resolver()
+    yield
+    reset_host_resolver()
+
+
+class TestHostResolver:
+    """Tests for HostResolver."""
+
+    def test_private_and_public_hosts(self):
+        """Hosts resolving to private IPs should be rejected."""
+        resolver = HostResolver(FakeDNS({"docs.io": ["151.101.1.1"], "intranet.io": ["10.0.0.5"]}))
+
+        assert resolver.check("docs.io") == (True, None)
+        assert resolver.check("intranet.io") == (False, "Hostname resolves to private IP: 10.0.0.5")
+        # Unresolvable hosts are allowed, as before
+        assert resolver.check("nowhere.io") == (True, None)
+
+    def test_results_are_cached_with_ttl(self):
+        """Lookups should be memoized, failures for a shorter time."""
+        dns = FakeDNS({"docs.io": ["151.101.1.1"]})
+        clock = Clock()
+        resolver = HostResolver(dns, ttl=300, negative_ttl=60, clock=clock)
+
+        for _ in range(3):
+            resolver.check("docs.io")
+            resolver.check("DOCS.io")
+            resolver.check("nowhere.io")
+        assert dns.lookups == ["docs.io", "nowhere.io"]
+
+        clock.now = 61
+        resolver.check("docs.io")
+        resolver.check("nowhere.io")
+        assert dns.lookups == ["docs.io", "nowhere.io", "nowhere.io"]
+
+        clock.now = 301
+        resolver.check("docs.io")
+        assert dns.lookups.count("docs.io") == 2
+
+    def test_check_many_resolves_distinct_hosts_concurrently(self):
+        """A batch should resolve each distinct hostname once, in parallel."""
+        hosts = [f"host{i}.io" for i in range(8)]
+        dns = FakeDNS({host: ["151.101.1.1"] for host in hosts}, delay=0.2)
+        resolver = HostResolver(dns)
+
+        start = time.monotonic()
+        results = resolver.check_many(hosts * 5, workers=8)
+        elapsed = time.monotonic() - start
+
+        assert sorted(dns.lookups) == sorted(hosts)
+        assert set(results) == set(hosts)
+        assert elapsed < 1.0  # 8 x 0.2 s if sequential
+
+    def test_maxsize_evicts_oldest(self):
+        """The cache should stay bounded."""
+        dns = FakeDNS({})
+        resolver = HostResolver(dns, maxsize=2)
+        for host in ("a.io", "b.io", "c.io", "a.io"):
+            resolver.check(host)
+        assert dns.lookups == ["a.io", "b.io", "c.io", "a.io"]
+
+
+class TestValidateUrls:
+    """Tests for BaseConnector.validate_urls()."""
+
+    def test_batch_matches_validate_url(self, monkeypatch):
+        """Batch validation should agree with validate_url, one lookup per host."""
+        from rekall.connectors import resolver as resolver_module
+        from rekall.connectors.claude_cli import ClaudeCLIConnector
+
+        dns = FakeDNS({"docs.io": ["151.101.1.1"], "intranet.io": ["192.168.1.20"]})
+        monkeypatch.setattr(resolver_module, "_host_resolver", HostResolver(dns))
+        connector = ClaudeCLIConnector()
+        urls = [
+            "https://docs.io/a",
+            "https://docs.io/b",
+            "https://intranet.io/admin",
+            "http://localhost:8000/",
+            "ftp://docs.io/file",
+            "https://docs.io/a",
+        ]
+
+        results = connector.validate_urls(urls)
+
+        assert results == {url: connector.validate_url(url) for url in urls}
+        assert results["https://intranet.io/admin"][0] is False
+        assert results["http://localhost:8000/"] == (False, "Quarantined host: localhost")
+        assert sorted(dns.lookups) == ["docs.io", "intranet.io"]
+        assert get_host_resolver() is resolver_module._host_resolver
+
+    def test_syntax_only_validation(self, monkeypatch):
+        """resolve=False should not touch DNS."""
+        from rekall.connectors import resolver as resolver_module
+        from rekall.connectors.claude_cli import ClaudeCLIConnector
+
+        dns = FakeDNS({})
+        monkeypatch.setattr(resolver_module, "_host_resolver", HostResolver(dns))
+        connector = ClaudeCLIConnector()
+
+        assert connector.validate_url("https://docs.io/", resolve=False) == (True, None)
+        assert connector.validate_url("file:///etc/passwd", resolve=False)[0] is False
+        assert dns.lookups == []
@@ -0,0 +1,119 @@
+"""Tests for the parallel connector scanning engine."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+WEBFETCH = '{{"type": "tool_use", "name": "WebFetch", "input": {{"url": "{}"}}}}\n'
+
+
+@pytest.fixture
+def history(tmp_path: Path) -> Path:
+    """Claude history with URLs shared between conversations."""
+    conv_dir = tmp_path / ".claude" / "projects" / "test-project" / "conversations"
+    conv_dir.mkdir(parents=True)
+    for i in range(6):
+        (conv_dir / f"conv{i}.jsonl").write_text(
+            '{"type": "human", "content": "Docs please"}\n'
+            + WEBFETCH.format(f"https://site{i}.com/")
+            + WEBFETCH.format("https://shared.com/")
+            + '{"type": "assistant", "content": "Done"}\n' * 20
+        )
+    return tmp_path
+
+
+def _connector(tmp_path: Path):
+    from rekall.connectors.claude_cli import ClaudeCLIConnector
+
+    connector = ClaudeCLIConnector()
+    connector.PROJECTS_DIR = tmp_path / ".claude" / "projects"
+    return connector
+
+
+def _jobs(connector):
+    from rekall.connectors.scanner import ScanJob
+
+    return [ScanJob(path, "test-project") for path in connector.get_history_paths()]
+
+
+class TestScanFiles:
+    """Tests for scan_files()."""
+
+    def test_in_process_dedups_across_files(self, history: Path):
+        """Each URL should be reported once, from the oldest file."""
+        from rekall.connectors.scanner import scan_files
+
+        connector = _connector(history)
+        jobs = _jobs(connector)
+        scans = list(scan_files(connector, jobs, workers=1))
+
+        assert [scan.path for scan in scans] == [job.path for job in jobs]
+        urls = [u.url for scan in scans for u in scan.urls]
+        assert urls.count("https://shared.com/") == 1
+        assert "https://shared.com/" in {u.url for u in scans[0].urls}
+        assert len(urls) == 7
+
+    def test_process_pool_matches_in_process(self, history: Path, monkeypatch):
+        """Worker processes should give the same merged result."""
+        from rekall.connectors import scanner
+
+        monkeypatch.setattr(scanner, "PARALLEL_MIN_BYTES", 0)
+        connector = _connector(history)
+        jobs = _jobs(connector)
+        assert scanner._should_parallelize(jobs, 2)
+
+        parallel = [
+            [u.url for u in scan.urls] for scan in scanner.scan_files(connector, jobs, workers=2)
+        ]
+        sequential = [
+            [u.url for u in scan.urls] for scan in scanner.scan_files(connector, jobs, workers=1)
+        ]
+        assert parallel == sequential
+
+    def test_small_scans_stay_in_process(self, history: Path):
+        """Incremental scans should not start a pool."""
+        from rekall.connectors.scanner import _should_parallelize
+
+        jobs = _jobs(_connector(history))
+        assert not _should_parallelize(jobs, 8)
+        assert not _should_parallelize(jobs[:2], 8)
+
+    def test_errors_are_reported_per_file(self, tmp_path: Path):
+        """A failing file should not stop the scan."""
+        from rekall.connectors.scanner import ScanJob, scan_files
+
+        connector = _connector(tmp_path)
+        scans = list(scan_files(connector, [ScanJob(tmp_path / "missing.jsonl", None)], workers=1))
+
+        assert scans[0].error
+        assert scans[0].urls == []
+
+
+class TestLinePrefilter:
+    """Tests for the byte-level prefilter of JSONL lines."""
+
+    def test_lines_without_url_are_not_decoded(self, history: Path, monkeypatch):
+        """Only lines with a URL or a user query should reach json.loads."""
+        from rekall.connectors import claude_cli
+
+        decoded = []
+
+        def loads(line):
+            decoded.append(line)
+            return json.loads(line)
+
+        fake_json = SimpleNamespace(
+            loads=loads, dumps=json.dumps, load=json.load, JSONDecodeError=json.JSONDecodeError
+        )
+        monkeypatch.setattr(claude_cli, "json", fake_json)
+        connector = _connector(history)
+        path = connector.get_history_paths()[0]
+
+        with patch.object(connector, "validate_url", return_value=(True, None)):
+            scan = connector.scan_file(path, "test-project")
+
+        assert len(decoded) == 3  # user query + 2 WebFetch calls, not 20 replies
+        assert scan.urls[0].user_query == "Docs please"
@@ -199,6 +199,49 @@ class TestCRUD:
         db.close()
 
 
+    def test_get_entries_by_ids(self, temp_db_path: Path):
+        """Should load several entries with their tags in bulk."""
+        from rekall.db import Database
+        from rekall.models import Entry, generate_ulid
+
+        db = Database(temp_db_path)
+        db.init()
+
+        first = Entry(id=generate_ulid(), title="First", type="bug", tags=["a", "b"])
+        second = Entry(id=generate_ulid(), title="Second", type="pattern")
+        db.add(first)
+        db.add(second)
+
+        entries = db.get_entries_by_ids([second.id, first.id, "missing"])
+        assert set(entries) == {first.id, second.id}
+        assert sorted(entries[first.id].tags) == ["a", "b"]
+        assert entries[second.id].tags == []
+        db.close()
+
+    def test_get_filtered_entry_ids(self, temp_db_path: Path):
+        """Should return IDs of active entries matching filters."""
+        from rekall.db import Database
+        from rekall.models import Entry, generate_ulid
+
+        db = Database(temp_db_path)
+        db.init()
+
+        kept = Entry(id=generate_ulid(), title="Kept", type="bug", project="p")
+        other = Entry(id=generate_ulid(), title="Other", type="bug", project="q")
+        obsolete = Entry(
+            id=generate_ulid(), title="Old", type="bug", project="p", status="obsolete"
+        )
+        for entry in (kept, other, obsolete):
+            db.add(entry)
+
+        assert db.get_filtered_entry_ids(project="p") == {kept.id}
+        assert db.get_filtered_entry_ids(project="p", include_obsolete=True) == {
+            kept.id,
+            obsolete.id,
+        }
+        db.close()
+
+
 class TestFTS5:
     """Tests for FTS5 full-text search (T012)."""
 
@@ -1964,6 +2007,16 @@ class TestEntrySourcesCRUD:
 class TestUtilsFunctions:
     """Tests for utility functions (Feature 009)."""
 
+    def test_url_hash_normalizes(self):
+        """Equivalent URLs should share a hash, different ones should not."""
+        from rekall.utils import url_hash
+
+        base = url_hash("https://example.com/docs")
+        assert url_hash("HTTP://Example.com/docs/") == base
+        assert url_hash("https://example.com/docs?utm_source=x#intro") == base
+        assert url_hash("https://example.com/docs?page=2") != base
+        assert url_hash("file:///tmp/docs") != url_hash("file:///tmp/other")
+
     def test_extract_domain_simple(self):
         """Should extract domain from various URL formats."""
         from rekall.utils import extract_domain
@@ -3360,6 +3413,140 @@ class TestMigrationV11:
         db.close()
 
 
+class TestKeywordScoring:
+    """Tests for migration v13 and SQL keyword scoring."""
+
+    def _add_with_keywords(self, db, keywords, project=None):
+        from rekall.models import Entry, StructuredContext, generate_ulid
+
+        entry = Entry(id=generate_ulid(), title="Entry", type="bug", project=project)
+        db.add(entry)
+        db.store_structured_context(
+            entry.id,
+            StructuredContext(
+                situation="Some problem happened",
+                solution="Fixed the problem",
+                trigger_keywords=keywords,
+            ),
+        )
+        return entry
+
+    def test_keyword_stats_tracks_document_frequency(self, temp_db_path: Path):
+        """keyword_stats should follow inserts, updates and deletes."""
+        from rekall.db import Database
+
+        db = Database(temp_db_path)
+        db.init()
+
+        first = self._add_with_keywords(db, ["nginx", "timeout"])
+        self._add_with_keywords(db, ["nginx"])
+
+        def doc_freqs():
+            rows = db.conn.execute("SELECT keyword, doc_freq FROM keyword_stats")
+            return {row[0]: row[1] for row in rows}
+
+        assert doc_freqs() == {"nginx": 2, "timeout": 1}
+
+        db.delete(first.id)
+        assert doc_freqs() == {"nginx": 1}
+        db.close()
+
+    def test_rare_keywords_weigh_more(self, temp_db_path: Path):
+        """Entries matching rarer keywords should score higher."""
+        from rekall.db import Database
+
+        db = Database(temp_db_path)
+        db.init()
+
+        common = [self._add_with_keywords(db, ["python"]) for _ in range(4)]
+        rare = self._add_with_keywords(db, ["python", "asyncio"])
+        only_rare = self._add_with_keywords(db, ["asyncio"])
+
+        results = db.score_keywords(["python", "asyncio"])
+        ids = [entry_id for entry_id, _, _ in results]
+
+        assert ids[0] == rare.id
+        assert ids[1] == only_rare.id
+        assert set(ids[2:]) == {e.id for e in common}
+        assert results[0][1] == pytest.approx(1.0)
+        assert sorted(results[0][2]) == ["asyncio", "python"]
+        db.close()
+
+    def test_filters_and_unknown_keywords(self, temp_db_path: Path):
+        """Should apply filters and ignore keywords absent from the corpus."""
+        from rekall.db import Database
+
+        db = Database(temp_db_path)
+        db.init()
+
+        self._add_with_keywords(db, ["docker"], project="a")
+        wanted = self._add_with_keywords(db, ["docker"], project="b")
+
+        assert db.score_keywords(["unknown"]) == []
+        results = db.score_keywords(["docker", "unknown"], project="b")
+        assert [entry_id for entry_id, _, _ in results] == [wanted.id]
+        assert results[0][1] < 1.0
+        db.close()
+
+
+class TestTransaction:
+    """Tests for Database.transaction()."""
+
+    def _entry(self, title="Entry"):
+        from rekall.models import Entry, generate_ulid
+
+        return Entry(id=generate_ulid(), title=title, type="bug")
+
+    def test_commits_once(self, temp_db_path: Path):
+        """Writes inside the block should be committed together at the end."""
+        from rekall.db import Database
+
+        db = Database(temp_db_path)
+        db.init()
+
+        with db.transaction():
+            db.add(self._entry("first"))
+            db.add(self._entry("second"))
+            assert db.conn.in_transaction
+
+        assert not db.conn.in_transaction
+        assert len(db.list_all()) == 2
+        db.close()
+
+    def test_rolls_back_on_error(self, temp_db_path: Path):
+        """An exception should undo every write of the block."""
+        from rekall.db import Database
+
+        db = Database(temp_db_path)
+        db.init()
+        kept = self._entry("kept")
+        db.add(kept)
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.add(self._entry("lost"))
+                raise RuntimeError("boom")
+
+        assert [e.id for e in db.list_all()] == [kept.id]
+        db.close()
+
+    def test_nested_joins_outer(self, temp_db_path: Path):
+        """A nested block should not commit before the outer one ends."""
+        from rekall.db import Database
+
+        db = Database(temp_db_path)
+        db.init()
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                with db.transaction():
+                    db.add(self._entry())
+                raise RuntimeError("boom")
+
+        assert db.list_all() == []
+        db.close()
+
+
 class TestInboxCRUD:
     """Tests for inbox CRUD operations (T024)."""
 
@@ -3535,6 +3722,129 @@ class TestInboxCRUD:
         db.close()
 
 
+    def test_add_inbox_entries_skips_duplicates(self, temp_db_path: Path):
+        """Same normalized URL in the same conversation should be stored once."""
+        from rekall.db import Database
+        from rekall.models import InboxEntry, generate_ulid
+
+        db = Database(temp_db_path)
+        db.init()
+
+        def entry(url, conversation_id):
+            return InboxEntry(
+                id=generate_ulid(),
+                url=url,
+                domain="example.com",
+                cli_source="claude",
+                conversation_id=conversation_id,
+            )
+
+        with db.transaction():
+            inserted = db.add_inbox_entries([
+                entry("https://example.com/a", "conv1"),
+                entry("http://example.com/a/", "conv1"),  # same URL, normalized
+                entry("https://example.com/a", "conv2"),
+                entry("https://example.com/a", None),
+            ])
+        assert inserted == 3
+
+        # Rescans add nothing, including for entries without conversation
+        assert db.add_inbox_entries([
+            entry("https://example.com/a#top", "conv1"),
+            entry("https://example.com/a", None),
+        ]) == 0
+        assert len(db.get_inbox_entries()) == 3
+        db.close()
+
+    def test_migration_v16_dedups_existing_inbox(self, temp_db_path: Path):
+        """Upgrading should hash existing rows and keep the enriched duplicate."""
+        from rekall.db import Database
+
+        db = Database(temp_db_path)
+        db.init()
+        db.conn.execute("DROP INDEX idx_inbox_url_conversation")
+        db.conn.execute("UPDATE sources_inbox SET url_hash = NULL")
+        rows = [
+            ("a", "https://example.com/x", "conv1", None),
+            ("b", "https://EXAMPLE.com/x/", "conv1", "2026-01-01T00:00:00"),
+            ("c", "https://example.com/x", "conv2", None),
+        ]
+        db.conn.executemany(
+            """INSERT INTO sources_inbox (id, url, cli_source, conversation_id, enriched_at)
+               VALUES (?, ?, 'claude', ?, ?)""",
+            rows,
+        )
+        db.conn.execute("PRAGMA user_version = 15")
+        db.conn.commit()
+        db.close()
+
+        db = Database(temp_db_path)
+        db.init()
+        ids = [r["id"] for r in db.conn.execute("SELECT id FROM sources_inbox ORDER BY id")]
+        assert ids == ["b", "c"]
+        assert db.conn.execute(
+            "SELECT COUNT(*) FROM sources_inbox WHERE url_hash IS NULL"
+        ).fetchone()[0] == 0
+        db.close()
+
+    def _v15_database(self, temp_db_path: Path):
+        """Database downgraded to v15 with duplicate inbox rows and staging refs."""
+        from rekall.db import Database
+
+        db = Database(temp_db_path)
+        db.init()
+        db.conn.execute("DROP INDEX idx_inbox_url_conversation")
+        db.conn.execute("ALTER TABLE sources_inbox DROP COLUMN url_hash")
+        db.conn.executemany(
+            """INSERT INTO sources_inbox (id, url, cli_source, conversation_id, enriched_at)
+               VALUES (?, ?, 'claude', 'conv1', ?)""",
+            [
+                ("a", "https://example.com/x", None),
+                ("b", "https://example.com/x/", "2026-01-01T00:00:00"),
+                ("c", "https://example.com/y", None),
+            ],
+        )
+        db.conn.execute(
+            """INSERT INTO sources_staging (id, url, domain, inbox_ids)
+               VALUES ('s1', 'https://example.com/x', 'example.com', 'a,c')"""
+        )
+        db.conn.execute("PRAGMA user_version = 15")
+        db.conn.commit()
+        db.close()
+
+    def test_migration_v16_remaps_staging_inbox_ids(self, temp_db_path: Path):
+        """Staging rows should reference the kept row instead of a dropped duplicate."""
+        from rekall.db import Database
+
+        self._v15_database(temp_db_path)
+        db = Database(temp_db_path)
+        db.init()
+        row = db.conn.execute("SELECT inbox_ids FROM sources_staging WHERE id = 's1'").fetchone()
+        assert row["inbox_ids"] == "b,c"
+        db.close()
+
+    def test_migration_v16_is_atomic(self, temp_db_path: Path):
+        """A failing backfill should leave the database at v15, without the new column."""
+        import sqlite3
+        from unittest.mock import patch
+
+        from rekall.db import Database
+
+        self._v15_database(temp_db_path)
+        db = Database(temp_db_path)
+        with patch("rekall.utils.url_hash", side_effect=ValueError("boom")):
+            with pytest.raises(ValueError):
+                db.init()
+        db.close()
+
+        conn = sqlite3.connect(str(temp_db_path))
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(sources_inbox)")}
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 15
+        assert "url_hash" not in columns
+        assert conn.execute("SELECT COUNT(*) FROM sources_inbox").fetchone()[0] == 3
+        conn.close()
+
+
 class TestStagingCRUD:
     """Tests for staging CRUD operations (T025)."""
 
@@ -3787,3 +4097,94 @@ class TestConnectorImportsCRUD:
         not_found = db.get_connector_import("nonexistent")
         assert not_found is None
         db.close()
+
+    def test_set_connector_scan_status(self, temp_db_path: Path):
+        """Scan progress should not touch the CDC fields."""
+        from datetime import datetime
+
+        from rekall.autoscan import needs_scan
+        from rekall.db import Database
+        from rekall.models import ConnectorImport
+
+        db = Database(temp_db_path)
+        db.init()
+
+        # A first scan in progress keeps the connector due
+        started = datetime(2026, 1, 1, 12, 0, 0)
+        db.set_connector_scan_status("cursor", "running", started_at=started)
+        record = db.get_connector_import("cursor")
+        assert record.scan_status == "running"
+        assert record.scan_started_at == started
+        assert record.last_import is None
+        assert needs_scan(db, "cursor")
+
+        db.upsert_connector_import(
+            ConnectorImport(connector="cursor", last_import=datetime.now(), entries_imported=5)
+        )
+        db.set_connector_scan_status(
+            "cursor", "failed", finished_at=started, duration_ms=42, error="boom"
+        )
+        record = db.get_connector_import("cursor")
+        assert record.scan_status == "failed"
+        assert record.last_duration_ms == 42
+        assert record.last_error == "boom"
+        assert record.entries_imported == 5
+        assert [r.connector for r in db.list_connector_imports()] == ["cursor"]
+        db.close()
+
+
+class TestConnectorFilesCRUD:
+    """Tests for connector_files (per-file CDC positions)."""
+
+    def test_upsert_and_get_connector_files(self, temp_db_path: Path):
+        """Should store one read position per connector and file."""
+        from datetime import datetime
+
+        from rekall.db import Database
+        from rekall.models import ConnectorFile
+
+        db = Database(temp_db_path)
+        db.init()
+
+        record = ConnectorFile(
+            connector="claude",
+            path="/history/a.jsonl",
+            inode=42,
+            size=100,
+            mtime_ns=7,
+            position=90,
+            state='{"last_user_query": "q"}',
+            scanned_at=datetime.now(),
+        )
+        db.upsert_connector_files([record, ConnectorFile(connector="cursor", path="/ws/state.vscdb")])
+
+        record.position = 100
+        db.upsert_connector_files([record])
+
+        files = db.get_connector_files("claude")
+        assert list(files) == ["/history/a.jsonl"]
+        assert files["/history/a.jsonl"].position == 100
+        assert files["/history/a.jsonl"].state == '{"last_user_query": "q"}'
+        assert files["/history/a.jsonl"].matches(42, 100, 7)
+        assert db.get_connector_files("unknown") == {}
+        db.close()
+
+    def test_delete_connector_files(self, temp_db_path: Path):
+        """Should forget only the given files of the given connector."""
+        from rekall.db import Database
+        from rekall.models import ConnectorFile
+
+        db = Database(temp_db_path)
+        db.init()
+        db.upsert_connector_files([
+            ConnectorFile(connector="claude", path="/a"),
+            ConnectorFile(connector="claude", path="/b"),
+            ConnectorFile(connector="cursor", path="/a"),
+        ])
+
+        assert db.delete_connector_files("claude", ["/a"]) == 1
+        assert db.delete_connector_files("claude", []) == 0
+
+        assert list(db.get_connector_files("claude")) == ["/b"]
+        assert list(db.get_connector_files("cursor")) == ["/a"]
+        db.close()
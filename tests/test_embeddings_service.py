@@ -325,6 +325,90 @@ class TestFindSimilar:
         db.close()
 
 
+class TestReciprocalRankFusion:
+    """Tests for reciprocal rank fusion."""
+
+    def test_entries_in_several_legs_rank_first(self):
+        """Should favor entries ranked by several legs."""
+        from rekall.embeddings import reciprocal_rank_fusion
+
+        fused = reciprocal_rank_fusion([(["a", "b"], 1.0), (["b", "c"], 1.0)])
+        assert fused[0][0] == "b"
+        assert {eid for eid, _ in fused} == {"a", "b", "c"}
+
+    def test_zero_weight_leg_ignored(self):
+        """Should ignore legs with zero weight."""
+        from rekall.embeddings import reciprocal_rank_fusion
+
+        fused = reciprocal_rank_fusion([(["a"], 1.0), (["b"], 0.0)])
+        assert [eid for eid, _ in fused] == ["a"]
+
+    def test_mask_vectors(self):
+        """Should keep only candidate rows."""
+        from rekall.embeddings import mask_vectors
+
+        matrix = np.eye(3, dtype=np.float32)
+        masked, ids = mask_vectors(matrix, ["a", "b", "c"], {"a", "c"})
+        assert ids == ["a", "c"]
+        assert masked.shape == (2, 3)
+
+
+class TestHybridSearch:
+    """Tests for hybrid search filter pushdown (hashing encoder)."""
+
+    @pytest.fixture
+    def db(self, tmp_path: Path):
+        from rekall.cache import reset_embedding_cache
+        from rekall.db import Database
+
+        reset_embedding_cache()
+        db = Database(tmp_path / "test.db")
+        db.init()
+        yield db
+        db.close()
+        reset_embedding_cache()
+
+    def _add(self, db, service, title, project):
+        from rekall.models import Embedding, Entry, generate_ulid
+
+        entry = Entry(id=generate_ulid(), title=title, type="bug", project=project)
+        db.add(entry)
+        db.add_embedding(Embedding.from_numpy(
+            entry.id, "summary", service.calculate(title), service.model_name
+        ))
+        return entry
+
+    def test_filters_pushed_into_every_leg(self, db):
+        """Should return `limit` results from the filtered project only."""
+        from rekall.embeddings import EmbeddingService
+
+        service = EmbeddingService(model_name="hashing")
+        for i in range(5):
+            self._add(db, service, f"nginx timeout variant {i}", "other")
+        wanted = [
+            self._add(db, service, f"nginx timeout fix {i}", "target")
+            for i in range(3)
+        ]
+
+        results = service.hybrid_search(
+            "nginx timeout", db, context="proxy", limit=3, project="target"
+        )
+
+        assert {entry.id for entry, *_ in results} == {e.id for e in wanted}
+        assert all(sem is not None for _, _, sem, _ in results)
+
+    def test_semantic_search_filters(self, db):
+        """Should only score entries matching the filters."""
+        from rekall.embeddings import EmbeddingService
+
+        service = EmbeddingService(model_name="hashing")
+        self._add(db, service, "cors error safari", "other")
+        wanted = self._add(db, service, "cors error chrome", "target")
+
+        results = service.semantic_search("cors error", db, project="target")
+        assert [entry.id for entry, _ in results] == [wanted.id]
+
+
 class TestSingleton:
     """Tests for singleton pattern."""
 
@@ -362,3 +446,17 @@ class TestExceptionClass:
         from rekall.embeddings import EmbeddingModelNotAvailable
 
         assert issubclass(EmbeddingModelNotAvailable, Exception)
+
+    def test_install_hint_matches_encoder(self):
+        """The load error should only ask for what the encoder needs."""
+        from rekall.embeddings import EmbeddingModelNotAvailable, EmbeddingService
+
+        hashing = EmbeddingService(model_name="hashing")
+        hashing._available = False
+        with pytest.raises(EmbeddingModelNotAvailable, match="Install with: pip install numpy$"):
+            hashing._load_model()
+
+        transformer = EmbeddingService()
+        transformer._available = False
+        with pytest.raises(EmbeddingModelNotAvailable, match="sentence-transformers numpy"):
+            transformer._load_model()
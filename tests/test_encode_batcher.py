@@ -0,0 +1,133 @@
+"""Tests for EncodeBatcher (micro-batching of encode requests)."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from rekall.encode_batcher import EncodeBatcher
+
+
+def _fake_encode(calls: list[int]):
+    """Encoder returning [len(text)] per text and recording batch sizes."""
+
+    def encode(texts: list[str]) -> np.ndarray:
+        calls.append(len(texts))
+        return np.array([[float(len(t))] for t in texts], dtype=np.float32)
+
+    return encode
+
+
+class TestEncodeBatcher:
+    """Tests for EncodeBatcher."""
+
+    def test_single_request(self) -> None:
+        calls: list[int] = []
+        batcher = EncodeBatcher(_fake_encode(calls), max_wait_ms=0)
+        try:
+            assert batcher.encode("abc")[0] == 3.0
+            assert calls == [1]
+        finally:
+            batcher.close()
+
+    def test_concurrent_requests_are_batched(self) -> None:
+        calls: list[int] = []
+        gate = threading.Event()
+
+        def slow_encode(texts: list[str]) -> np.ndarray:
+            gate.wait(timeout=2)
+            return _fake_encode(calls)(texts)
+
+        batcher = EncodeBatcher(slow_encode, max_batch_size=16, max_wait_ms=50)
+        try:
+            futures = [batcher.submit("x" * i) for i in range(1, 11)]
+            gate.set()
+            results = [f.result(timeout=2)[0] for f in futures]
+            assert results == [float(i) for i in range(1, 11)]
+            assert sum(calls) == 10
+            assert len(calls) < 10
+            assert batcher.stats["largest_batch"] > 1
+        finally:
+            batcher.close()
+
+    def test_max_batch_size_respected(self) -> None:
+        calls: list[int] = []
+        batcher = EncodeBatcher(_fake_encode(calls), max_batch_size=3, max_wait_ms=20)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(batcher.encode, ["a"] * 8))
+            assert max(calls) <= 3
+            assert sum(calls) == 8
+        finally:
+            batcher.close()
+
+    def test_exception_propagates_to_callers(self) -> None:
+        def failing(texts: list[str]) -> np.ndarray:
+            raise RuntimeError("boom")
+
+        batcher = EncodeBatcher(failing, max_wait_ms=0)
+        try:
+            with pytest.raises(RuntimeError, match="boom"):
+                batcher.encode("text", timeout=2)
+        finally:
+            batcher.close()
+
+    def test_short_encoder_output_fails_every_caller(self) -> None:
+        gate = threading.Event()
+
+        def short(texts: list[str]) -> np.ndarray:
+            gate.wait(timeout=2)
+            return np.zeros((len(texts) - 1, 1), dtype=np.float32)
+
+        batcher = EncodeBatcher(short, max_batch_size=8, max_wait_ms=50)
+        try:
+            futures = [batcher.submit(t) for t in ("a", "b", "c")]
+            gate.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="vectors for"):
+                    future.result(timeout=2)
+        finally:
+            batcher.close()
+
+    def test_submit_after_close_raises(self) -> None:
+        batcher = EncodeBatcher(_fake_encode([]))
+        batcher.close()
+        batcher.close()  # idempotent
+        with pytest.raises(RuntimeError):
+            batcher.submit("text")
+
+
+class TestServiceBatching:
+    """Tests for EmbeddingService micro-batching integration."""
+
+    def test_calculate_through_batcher(self) -> None:
+        from rekall.embeddings import EmbeddingService
+
+        service = EmbeddingService(model_name="hashing", dimensions=128)
+        service.enable_batching(max_wait_ms=0)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                vectors = list(pool.map(service.calculate, ["nginx timeout"] * 8))
+            expected = EmbeddingService(model_name="hashing", dimensions=128).calculate(
+                "nginx timeout"
+            )
+            for vec in vectors:
+                assert np.allclose(vec, expected)
+            assert service.batching_stats["items"] == 8
+        finally:
+            service.disable_batching()
+        assert service.batching_stats is None
+
+    def test_singleton_reused_when_params_match(self) -> None:
+        from rekall.embeddings import get_embedding_service, reset_embedding_service
+
+        reset_embedding_service()
+        try:
+            first = get_embedding_service(model_name="hashing", dimensions=128)
+            assert get_embedding_service(dimensions=128) is first
+            assert get_embedding_service(dimensions=384) is not first
+        finally:
+            reset_embedding_service()
@@ -0,0 +1,116 @@
+"""Tests for pluggable encoders (hashing encoder backend)."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+class TestIsHashingModel:
+    """Tests for model name detection."""
+
+    def test_hashing_names(self):
+        from rekall.encoders import is_hashing_model
+
+        assert is_hashing_model("hashing")
+        assert is_hashing_model("Rekall-Hashing")
+
+    def test_neural_names(self):
+        from rekall.encoders import is_hashing_model
+
+        assert not is_hashing_model("all-MiniLM-L6-v2")
+        assert not is_hashing_model(None)
+
+
+class TestHashingEncoder:
+    """Tests for HashingEncoder."""
+
+    def test_single_text_shape_and_norm(self):
+        from rekall.encoders import HashingEncoder
+
+        vec = HashingEncoder(dimensions=384).encode("nginx 504 gateway timeout")
+        assert vec.shape == (384,)
+        assert vec.dtype == np.float32
+        assert np.linalg.norm(vec) == pytest.approx(1.0, abs=1e-5)
+
+    def test_batch_shape(self):
+        from rekall.encoders import HashingEncoder
+
+        matrix = HashingEncoder(dimensions=128).encode(["first text", "second text"])
+        assert matrix.shape == (2, 128)
+
+    def test_deterministic(self):
+        from rekall.encoders import HashingEncoder
+
+        a = HashingEncoder().encode("CORS error on Safari")
+        b = HashingEncoder().encode("CORS error on Safari")
+        assert np.array_equal(a, b)
+
+    def test_lexical_overlap_scores_higher(self):
+        from rekall.encoders import HashingEncoder
+
+        encoder = HashingEncoder()
+        query = encoder.encode("nginx proxy timeout")
+        close = encoder.encode("nginx proxy_read_timeout for long requests")
+        far = encoder.encode("react component rendering twice")
+        assert float(query @ close) > float(query @ far)
+
+    def test_empty_text_is_zero_vector(self):
+        from rekall.encoders import HashingEncoder
+
+        vec = HashingEncoder().encode("the and of")
+        assert not vec.any()
+
+    def test_invalid_dimensions(self):
+        from rekall.encoders import HashingEncoder
+
+        with pytest.raises(ValueError):
+            HashingEncoder(dimensions=0)
+
+
+class TestHashingEmbeddingService:
+    """Tests for EmbeddingService configured with the hashing encoder."""
+
+    def test_available_without_sentence_transformers(self):
+        from rekall.embeddings import EmbeddingService
+
+        service = EmbeddingService(model_name="hashing")
+        assert service.available is True
+        assert service.get_model_status()["encoder"] == "hashing"
+
+    def test_calculate(self):
+        from rekall.embeddings import EmbeddingService
+
+        service = EmbeddingService(model_name="hashing", dimensions=128)
+        vec = service.calculate("Fix 504 gateway timeout")
+        assert vec is not None
+        assert vec.shape == (128,)
+
+    def test_vectors_from_other_encoders_are_ignored(self, tmp_path: Path):
+        from rekall.cache import reset_embedding_cache
+        from rekall.db import Database
+        from rekall.embeddings import EmbeddingService
+        from rekall.models import Embedding, Entry, generate_ulid
+
+        reset_embedding_cache()
+        db = Database(tmp_path / "test.db")
+        db.init()
+        service = EmbeddingService(model_name="hashing")
+
+        hashed = Entry(id=generate_ulid(), title="nginx timeout", type="bug")
+        neural = Entry(id=generate_ulid(), title="nginx timeout too", type="bug")
+        db.add(hashed)
+        db.add(neural)
+        db.add_embedding(Embedding.from_numpy(
+            hashed.id, "summary", service.calculate("nginx timeout"), service.model_name
+        ))
+        db.add_embedding(Embedding.from_numpy(
+            neural.id, "summary", service.calculate("nginx timeout too"),
+            "all-MiniLM-L6-v2",
+        ))
+
+        results = service.semantic_search("nginx timeout", db)
+        assert [entry.id for entry, _ in results] == [hashed.id]
+
+        db.close()
+        reset_embedding_cache()
@@ -395,6 +395,173 @@ class TestEnrichBatch:
         db.close()
 
 
+class FakeClient:
+    """Async HTTP client recording concurrency per host."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = []
+        self.active = {}
+        self.max_active = 0
+        self.max_per_host = 0
+        self.entered = 0
+
+    async def __aenter__(self):
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def get(self, url):
+        import asyncio
+        from urllib.parse import urlparse
+
+        host = urlparse(url).netloc
+        self.calls.append(url)
+        self.active[host] = self.active.get(host, 0) + 1
+        self.max_active = max(self.max_active, sum(self.active.values()))
+        self.max_per_host = max(self.max_per_host, self.active[host])
+        await asyncio.sleep(self.delay)
+        self.active[host] -= 1
+
+        response = MagicMock()
+        response.status_code = 200
+        response.text = f"<html lang='en'><head><title>{url}</title></head></html>"
+        return response
+
+
+class TestConcurrentEnrichment:
+    """Tests for concurrent enrichment with a shared client."""
+
+    def _add_inbox(self, db, urls):
+        from urllib.parse import urlparse
+
+        from rekall.models import InboxEntry, generate_ulid
+
+        for url in urls:
+            db.add_inbox_entry(
+                InboxEntry(
+                    id=generate_ulid(),
+                    url=url,
+                    domain=urlparse(url).netloc,
+                    cli_source="claude",
+                )
+            )
+
+    def test_fetches_in_parallel_within_limits(self, temp_db_path):
+        """One client, global and per-host limits respected, all results written."""
+        import asyncio
+
+        from rekall.db import Database
+        from rekall.enrichment import enrich_inbox_entries
+
+        db = Database(temp_db_path)
+        db.init()
+        urls = [f"https://site{i % 5}.com/page{i}" for i in range(30)]
+        self._add_inbox(db, urls)
+
+        client = FakeClient()
+        with patch("rekall.enrichment.create_http_client", return_value=client):
+            result = asyncio.run(
+                enrich_inbox_entries(db, limit=100, concurrency=4, per_host=1, host_delay=0)
+            )
+
+        assert client.entered == 1
+        assert sorted(client.calls) == sorted(urls)
+        assert 1 < client.max_active <= 4
+        assert client.max_per_host == 1
+        assert result.enriched == 30
+        assert db.get_inbox_not_enriched(limit=100) == []
+        assert db.get_staging_by_url(urls[0]).title == urls[0]
+        db.close()
+
+    def test_fetch_errors_are_counted(self, temp_db_path):
+        """A failing fetch should not stop the batch nor mark the entry enriched."""
+        import asyncio
+
+        from rekall.db import Database
+        from rekall.enrichment import enrich_inbox_entries
+
+        db = Database(temp_db_path)
+        db.init()
+        self._add_inbox(db, ["https://ok.com/", "https://broken.com/"])
+
+        async def fake_fetch(url, timeout=10.0, client=None):
+            if "broken" in url:
+                raise RuntimeError("boom")
+            return "Title", None, "other", None, True, 200
+
+        with patch("rekall.enrichment.create_http_client", return_value=FakeClient()), patch(
+            "rekall.enrichment.fetch_metadata", fake_fetch
+        ):
+            result = asyncio.run(enrich_inbox_entries(db, limit=10))
+
+        assert result.enriched == 1
+        assert result.failed == 1
+        assert "boom" in result.errors[0]
+        assert [e.url for e in db.get_inbox_not_enriched()] == ["https://broken.com/"]
+        db.close()
+
+    def test_failed_write_is_rolled_back(self, temp_db_path):
+        """An entry failing mid-write should leave no staging row behind."""
+        import asyncio
+
+        from rekall.db import Database
+        from rekall.enrichment import enrich_inbox_entries
+
+        db = Database(temp_db_path)
+        db.init()
+        self._add_inbox(db, ["https://ok.com/", "https://broken.com/"])
+        inbox = {e.url: e.id for e in db.get_inbox_not_enriched()}
+
+        async def fake_fetch(url, timeout=10.0, client=None):
+            return "Title", None, "other", None, True, 200
+
+        mark_enriched = db.mark_inbox_enriched
+
+        def failing_mark(inbox_id):
+            if inbox_id == inbox["https://broken.com/"]:
+                raise RuntimeError("disk full")
+            mark_enriched(inbox_id)
+
+        with patch("rekall.enrichment.create_http_client", return_value=FakeClient()), patch(
+            "rekall.enrichment.fetch_metadata", fake_fetch
+        ), patch.object(db, "mark_inbox_enriched", failing_mark):
+            result = asyncio.run(enrich_inbox_entries(db, limit=10))
+
+        assert result.enriched == 1
+        assert result.failed == 1
+        assert db.get_staging_by_url("https://ok.com/") is not None
+        assert db.get_staging_by_url("https://broken.com/") is None
+        assert [e.url for e in db.get_inbox_not_enriched()] == ["https://broken.com/"]
+        db.close()
+
+    def test_host_throttle_spaces_requests(self):
+        """Requests to one host should start at least `delay` apart."""
+        import asyncio
+
+        from rekall.enrichment import HostThrottle
+
+        async def run():
+            throttle = HostThrottle(per_host=3, delay=0.05)
+            loop = asyncio.get_running_loop()
+            starts = []
+
+            async def request(host):
+                async with throttle.slot(host):
+                    starts.append((host, loop.time()))
+
+            await asyncio.gather(*(request("a.com") for _ in range(3)), request("b.com"))
+            return starts
+
+        starts = asyncio.run(run())
+        a_starts = sorted(t for host, t in starts if host == "a.com")
+        assert all(b - a >= 0.045 for a, b in zip(a_starts, a_starts[1:]))
+        b_start = next(t for host, t in starts if host == "b.com")
+        assert b_start < a_starts[1]
+
+
 # Fixture for temp database
 @pytest.fixture
 def temp_db_path(tmp_path):
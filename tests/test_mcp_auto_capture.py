@@ -195,6 +195,111 @@ class TestSessionManager:
         assert manager.get_session(session_id) is None
 
 
+# =============================================================================
+# Session store Tests
+# =============================================================================
+
+
+def _new_manager(store, ttl_seconds=300):
+    """Create a SessionManager outside the singleton."""
+    manager = object.__new__(SessionManager)
+    manager._initialized = False
+    manager.__init__(ttl_seconds=ttl_seconds, store=store)
+    return manager
+
+
+def _candidates(contents):
+    return CandidateExchanges(
+        session_id="",
+        total_exchanges=len(contents),
+        candidates=[
+            TranscriptMessage(role="human", content=content, index=i)
+            for i, content in enumerate(contents)
+        ],
+    )
+
+
+class TestSessionStores:
+    """Tests for bounded and persistent session stores."""
+
+    def test_memory_store_evicts_least_recently_used(self):
+        from rekall.transcript.session_manager import MemorySessionStore
+
+        store = MemorySessionStore(max_bytes=2000)
+        manager = _new_manager(store)
+
+        first = manager.create_session(_candidates(["a" * 600]))
+        second = manager.create_session(_candidates(["b" * 600]))
+        assert manager.get_session(first) is not None  # first is now most recent
+        third = manager.create_session(_candidates(["c" * 600]))
+
+        assert manager.get_session(second) is None
+        assert manager.get_session(first) is not None
+        assert manager.get_session(third) is not None
+        assert store.size_bytes <= 2000
+
+    def test_sqlite_store_survives_restart(self, tmp_path):
+        from rekall.transcript.session_manager import SqliteSessionStore
+
+        path = tmp_path / "sessions.db"
+        session_id = _new_manager(SqliteSessionStore(path)).create_session(
+            _candidates(["question", "answer"]), title="Title", tags=["t"]
+        )
+
+        # Another process (or a restarted server) opens the same file
+        restarted = _new_manager(SqliteSessionStore(path))
+        session = restarted.get_session(session_id)
+
+        assert session is not None
+        assert session.title == "Title"
+        assert session.tags == ["t"]
+        assert session.candidates.format_as_excerpt([0, 1]) == "Human: question\n\nHuman: answer"
+        assert restarted.delete_session(session_id)
+        assert restarted.session_count == 0
+
+    def test_sqlite_store_expires_sessions(self, tmp_path):
+        from rekall.transcript.session_manager import SqliteSessionStore
+
+        manager = _new_manager(SqliteSessionStore(tmp_path / "sessions.db"), ttl_seconds=-1)
+        session_id = manager.create_session(_candidates(["x"]))
+
+        assert manager.get_session(session_id) is None
+
+    def test_jsonl_candidates_are_stored_as_offsets(self, tmp_path, monkeypatch):
+        from rekall.transcript import ClaudeTranscriptParser, TranscriptFormat, index
+        from rekall.transcript.session_manager import MemorySessionStore
+
+        monkeypatch.setattr(index, "_transcript_index", index.TranscriptIndex())
+
+        transcript = tmp_path / "transcript.jsonl"
+        long_answer = "detailed answer " * 200
+        transcript.write_text(
+            json.dumps({"type": "human", "message": {"content": "question"}}) + "\n"
+            + json.dumps({"type": "assistant", "message": {"content": long_answer}}) + "\n"
+        )
+        messages, total = ClaudeTranscriptParser().parse_last_n(transcript, n=20)
+        store = MemorySessionStore()
+        manager = _new_manager(store)
+
+        session_id = manager.create_session(CandidateExchanges(
+            session_id="",
+            total_exchanges=total,
+            candidates=messages,
+            transcript_path=str(transcript),
+            transcript_format=TranscriptFormat.CLAUDE_JSONL,
+        ))
+
+        assert store.size_bytes < len(long_answer)
+        session = manager.get_session(session_id)
+        assert session.candidates.get_by_indices([1])[0].content == long_answer
+
+        # A rewritten transcript cannot serve the stored offsets anymore
+        transcript.write_text(
+            json.dumps({"type": "human", "message": {"content": "other"}}) + "\n" * 3000
+        )
+        assert manager.get_session(session_id) is None
+
+
 # =============================================================================
 # MCP Handler Integration Tests
 # =============================================================================
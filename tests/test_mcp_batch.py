@@ -0,0 +1,90 @@
+"""Tests for the rekall_batch MCP tool."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from rekall.mcp_server import MAX_BATCH_OPERATIONS, _handle_batch  # noqa: E402
+
+
+@pytest.fixture
+def batch_db(temp_db_path: Path):
+    """Point the MCP handlers at a temporary database."""
+    from rekall.config import set_config
+    from rekall.db import Database
+
+    from conftest import make_config_with_db_path
+
+    set_config(make_config_with_db_path(temp_db_path, context_mode="optional"))
+    db = Database(temp_db_path)
+    db.init()
+    yield db
+    db.close()
+
+
+def _run(operations: list[dict]) -> str:
+    result = asyncio.run(_handle_batch({"operations": operations}))
+    return result[0].text
+
+
+def _add(title: str) -> dict:
+    return {"tool": "rekall_add", "arguments": {"type": "bug", "title": title}}
+
+
+class TestBatch:
+    """Tests for _handle_batch."""
+
+    def test_add_and_link_with_references(self, batch_db):
+        """Should resolve $N to entries created earlier in the batch."""
+        text = _run([
+            _add("first"),
+            _add("second"),
+            {
+                "tool": "rekall_link",
+                "arguments": {"source_id": "$0", "target_id": "$1"},
+            },
+        ])
+
+        assert text.startswith("Batch committed: 3 operation(s)")
+        entries = {e.title: e for e in batch_db.list_all()}
+        assert set(entries) == {"first", "second"}
+        assert "$0 = [" + entries["first"].id + "]" in text
+
+        links = batch_db.get_links(entries["first"].id, direction="outgoing")
+        assert [link.target_id for link in links] == [entries["second"].id]
+
+    def test_failure_rolls_back(self, batch_db):
+        """A failing operation should undo the whole batch."""
+        text = _run([
+            _add("first"),
+            {"tool": "rekall_link", "arguments": {"source_id": "$0"}},
+        ])
+
+        assert text.startswith("Batch rolled back: operation [1]")
+        assert batch_db.list_all() == []
+
+    def test_handled_error_rolls_back(self, batch_db):
+        """An operation answering with an "Error..." text should undo the batch."""
+        text = _run([
+            _add("first"),
+            {"tool": "rekall_link", "arguments": {"source_id": "$0", "target_id": "NOPE"}},
+        ])
+
+        assert text.startswith("Batch rolled back: operation [1]: Error:")
+        assert "NOPE" in text
+        assert batch_db.list_all() == []
+
+    def test_rejects_invalid_operations(self, batch_db):
+        """Should reject unknown tools, forward references and oversized batches."""
+        assert "unsupported tool" in _run([{"tool": "rekall_delete"}])
+        assert "earlier operation" in _run([
+            {"tool": "rekall_show", "arguments": {"id": "$0"}},
+        ])
+        too_many = [_add(str(i)) for i in range(MAX_BATCH_OPERATIONS + 1)]
+        assert _run(too_many).startswith("Error:")
+        assert batch_db.list_all() == []
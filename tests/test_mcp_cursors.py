@@ -0,0 +1,175 @@
+"""Tests for cursor pagination of MCP tool results."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from rekall.mcp_cursors import (
+    CursorError,
+    CursorStore,
+    decode_cursor,
+    encode_cursor,
+    reset_cursor_store,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_store():
+    """Start every test with an empty global store."""
+    reset_cursor_store()
+    yield
+    reset_cursor_store()
+
+
+class TestCursorStore:
+    """Tests for CursorStore.paginate()."""
+
+    def test_pages_reuse_ranking(self):
+        """Later pages should slice the stored list without re-ranking."""
+        store = CursorStore()
+        calls = []
+
+        def rank(args):
+            calls.append(args)
+            return list(range(25))
+
+        first = store.paginate("t", {"q": "x", "limit": 10}, rank, lambda a: a["limit"])
+        second = store.paginate("t", {"cursor": first.next_cursor}, rank, lambda a: a["limit"])
+        third = store.paginate("t", {"cursor": second.next_cursor}, rank, lambda a: a["limit"])
+
+        assert first.items == list(range(10))
+        assert second.items == list(range(10, 20))
+        assert third.items == list(range(20, 25))
+        assert third.next_cursor is None
+        assert calls == [{"q": "x", "limit": 10}]
+        assert store.stats["resumed"] == 2
+
+    def test_single_page_not_stored(self):
+        """A result fitting in one page should not be stored."""
+        store = CursorStore()
+        page = store.paginate("t", {"limit": 10}, lambda a: [1, 2], lambda a: a["limit"])
+
+        assert page.next_cursor is None
+        assert page.footer("t") == ""
+        assert store.stats["size"] == 0
+
+    def test_expired_list_is_recomputed(self):
+        """An expired cursor should re-rank from the repeated arguments."""
+        store = CursorStore(ttl_seconds=0)
+        calls = []
+
+        def rank(args):
+            calls.append(args)
+            return list(range(5))
+
+        first = store.paginate("t", {"limit": 2}, rank, lambda a: a["limit"])
+        time.sleep(0.01)
+        second = store.paginate(
+            "t", {"cursor": first.next_cursor, "limit": 2}, rank, lambda a: a["limit"]
+        )
+
+        assert second.items == [2, 3]
+        assert calls == [{"limit": 2}, {"limit": 2}]
+        assert store.stats["recomputed"] == 1
+
+    def test_expired_cursor_needs_arguments(self):
+        """Without the original arguments, an expired cursor cannot be resumed."""
+        store = CursorStore(ttl_seconds=0)
+        first = store.paginate("t", {"limit": 2}, lambda a: list(range(5)), lambda a: a["limit"])
+        time.sleep(0.01)
+
+        with pytest.raises(CursorError, match="expired"):
+            store.paginate("t", {"cursor": first.next_cursor}, lambda a: [], lambda a: 2)
+
+    def test_cursor_does_not_embed_arguments(self):
+        """Cursors should stay short and reject mismatched arguments."""
+        store = CursorStore()
+        query = "x" * 2000
+        first = store.paginate(
+            "t", {"q": query, "limit": 2}, lambda a: list(range(5)), lambda a: a["limit"]
+        )
+
+        assert len(first.next_cursor) < 120
+        assert query not in str(decode_cursor("t", first.next_cursor))
+        with pytest.raises(CursorError, match="does not match"):
+            store.paginate(
+                "t", {"cursor": first.next_cursor, "q": "other"}, lambda a: [], lambda a: 2
+            )
+
+    def test_invalid_cursors(self):
+        """Should reject garbage and cursors of another tool."""
+        with pytest.raises(CursorError):
+            decode_cursor("t", "not a cursor")
+        with pytest.raises(CursorError):
+            decode_cursor("other", encode_cursor("t", "key", 0, {}))
+
+    def test_next_cursor_after_partial_page(self):
+        """Should resume right after the last processed item."""
+        store = CursorStore()
+        page = store.paginate("t", {"limit": 3}, lambda a: list(range(5)), lambda a: a["limit"])
+
+        cursor = store.next_cursor_at("t", page, 1)
+        resumed = store.paginate("t", {"cursor": cursor}, lambda a: [], lambda a: a["limit"])
+
+        assert resumed.items == [1, 2, 3]
+
+
+class TestPaginatedTools:
+    """Tests for paginated MCP handlers."""
+
+    @pytest.fixture
+    def db(self, temp_db_path: Path):
+        pytest.importorskip("mcp")
+        from conftest import make_config_with_db_path
+
+        from rekall.config import set_config
+        from rekall.db import Database
+
+        set_config(make_config_with_db_path(temp_db_path))
+        db = Database(temp_db_path)
+        db.init()
+        yield db
+        db.close()
+
+    def test_search_pages(self, db):
+        """rekall_search should page through FTS results with a cursor."""
+        from rekall.mcp_server import _handle_search
+        from rekall.models import Entry, generate_ulid
+
+        for i in range(5):
+            db.add(Entry(id=generate_ulid(), title=f"nginx issue {i}", type="bug"))
+
+        first = asyncio.run(_handle_search({"query": "nginx", "limit": 2}))[0].text
+        assert "Showing 1-2 of 5" in first
+
+        seen = set()
+        text = first
+        while True:
+            seen.update(line.split("]")[0] for line in text.splitlines() if line.startswith("- ["))
+            if 'cursor="' not in text:
+                break
+            cursor = text.split('cursor="')[1].split('"')[0]
+            text = asyncio.run(_handle_search({"cursor": cursor}))[0].text
+
+        assert len(seen) == 5
+        assert "(last page)" in text
+
+    def test_stale_pages(self, db):
+        """rekall_stale should page through stale entries."""
+        from rekall.mcp_server import _handle_stale
+        from rekall.models import Entry, generate_ulid
+
+        for i in range(3):
+            db.add(Entry(id=generate_ulid(), title=f"old {i}", type="bug"))
+
+        first = asyncio.run(_handle_stale({"days": 0, "limit": 2}))[0].text
+        cursor = first.split('cursor="')[1].split('"')[0]
+        second = asyncio.run(_handle_stale({"cursor": cursor}))[0].text
+
+        assert "Total: 2 stale entries" in first
+        assert "Total: 1 stale entries" in second
+        assert "Showing 3-3 of 3 (last page)" in second
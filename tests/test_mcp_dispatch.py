@@ -0,0 +1,191 @@
+"""Tests for non-blocking MCP tool dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from rekall.mcp_dispatch import ToolDispatcher, tool_cancelled
+
+
+@pytest.fixture
+def dispatcher():
+    """Dispatcher shut down after the test."""
+    dispatcher = ToolDispatcher(workers=4, slow_workers=2)
+    yield dispatcher
+    dispatcher.shutdown()
+
+
+class TestToolDispatcher:
+    """Tests for ToolDispatcher."""
+
+    def test_runs_handler_on_worker_thread(self, dispatcher):
+        """Handler bodies should not run on the event loop thread."""
+
+        async def handler(args):
+            return threading.current_thread().name
+
+        async def main():
+            return await dispatcher.run("rekall_search", handler, {})
+
+        assert asyncio.run(main()).startswith("rekall-mcp")
+
+    def test_slow_tools_use_separate_pool(self, dispatcher):
+        """Long jobs should run on the slow pool."""
+
+        async def handler(args):
+            return threading.current_thread().name
+
+        async def main():
+            return await dispatcher.run("rekall_sources_verify", handler, {})
+
+        assert asyncio.run(main()).startswith("rekall-mcp-slow")
+
+    def test_slow_job_does_not_block_reads(self, dispatcher):
+        """A blocking long job should not delay a cheap read."""
+        release = threading.Event()
+
+        async def slow(args):
+            release.wait(timeout=5)
+            return "slow"
+
+        async def fast(args):
+            return "fast"
+
+        async def main():
+            slow_task = asyncio.create_task(
+                dispatcher.run("rekall_sources_verify", slow, {})
+            )
+            fast_result = await asyncio.wait_for(
+                dispatcher.run("rekall_show", fast, {}), timeout=2
+            )
+            release.set()
+            return fast_result, await slow_task
+
+        assert asyncio.run(main()) == ("fast", "slow")
+
+    def test_per_tool_concurrency_limit(self, dispatcher):
+        """Tools with a limit of 1 should never run concurrently."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        async def handler(args):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return args["i"]
+
+        async def main():
+            return await asyncio.gather(
+                *(dispatcher.run("rekall_generalize", handler, {"i": i}) for i in range(3))
+            )
+
+        assert asyncio.run(main()) == [0, 1, 2]
+        assert peak == 1
+
+    def test_cancellation_signals_handler(self, dispatcher):
+        """Cancelling the request should be visible through tool_cancelled()."""
+        started = threading.Event()
+        observed = threading.Event()
+
+        async def handler(args):
+            started.set()
+            for _ in range(100):
+                if tool_cancelled():
+                    observed.set()
+                    return "stopped"
+                time.sleep(0.02)
+            return "finished"
+
+        async def main():
+            task = asyncio.create_task(dispatcher.run("rekall_search", handler, {}))
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert observed.wait(timeout=2)
+        assert dispatcher.stats["cancelled"] == 1
+
+    def test_exceptions_propagate(self, dispatcher):
+        """Handler exceptions should reach the caller."""
+
+        async def handler(args):
+            raise ValueError("boom")
+
+        async def main():
+            await dispatcher.run("rekall_show", handler, {})
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(main())
+
+    def test_not_cancelled_outside_dispatch(self):
+        """tool_cancelled() should be False outside a dispatched call."""
+        assert tool_cancelled() is False
+
+    def test_writes_use_single_writer(self, dispatcher):
+        """Mutating tools should run one at a time on the writer thread."""
+
+        async def handler(args):
+            time.sleep(0.02)
+            return threading.current_thread().name
+
+        async def main():
+            return await asyncio.gather(
+                *(dispatcher.run(name, handler, {}) for name in ("rekall_link", "rekall_unlink", "rekall_delete"))
+            )
+
+        names = asyncio.run(main())
+        assert len(set(names)) == 1
+        assert names[0].startswith("rekall-mcp-writer")
+
+    def test_long_job_writes_on_writer(self, dispatcher):
+        """Long jobs should compute on the slow pool and write on the writer."""
+
+        async def handler(args):
+            computed = threading.current_thread().name
+            written = dispatcher.run_write(lambda: threading.current_thread().name)
+            return computed, written
+
+        async def main():
+            return await dispatcher.run("rekall_generalize", handler, {})
+
+        computed, written = asyncio.run(main())
+        assert computed.startswith("rekall-mcp-slow")
+        assert written.startswith("rekall-mcp-writer")
+
+    def test_add_encodes_off_writer(self, dispatcher):
+        """rekall_add should encode on the read pool and only insert on the writer."""
+
+        async def handler(args):
+            computed = threading.current_thread().name
+            written = dispatcher.run_write(lambda: threading.current_thread().name)
+            return computed, written
+
+        async def main():
+            return await dispatcher.run("rekall_add", handler, {})
+
+        computed, written = asyncio.run(main())
+        assert computed.startswith("rekall-mcp_")
+        assert written.startswith("rekall-mcp-writer")
+
+    def test_run_write_inline_on_writer(self, dispatcher):
+        """run_write() from the writer thread (rekall_batch) should not deadlock."""
+
+        async def handler(args):
+            return dispatcher.run_write(threading.get_ident) == threading.get_ident()
+
+        async def main():
+            return await asyncio.wait_for(dispatcher.run("rekall_batch", handler, {}), timeout=2)
+
+        assert asyncio.run(main()) is True
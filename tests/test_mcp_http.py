@@ -0,0 +1,70 @@
+"""Tests for the MCP server HTTP transports."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("starlette")
+
+from starlette.testclient import TestClient  # noqa: E402
+
+from rekall.mcp_http import create_http_app  # noqa: E402
+from rekall.mcp_server import create_mcp_server  # noqa: E402
+
+HEADERS = {"Accept": "application/json, text/event-stream"}
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-03-26",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1"},
+    },
+}
+
+
+class TestStreamableHTTP:
+    """Tests for the streamable HTTP app."""
+
+    def test_session_lists_tools(self):
+        """A client should initialize a session and list tools over /mcp."""
+        app = create_http_app(create_mcp_server(), "http")
+
+        with TestClient(app, base_url="http://127.0.0.1:8765") as client:
+            response = client.post("/mcp", json=INITIALIZE, headers=HEADERS)
+            assert response.status_code == 200
+            session = {"mcp-session-id": response.headers["mcp-session-id"], **HEADERS}
+
+            client.post(
+                "/mcp",
+                json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+                headers=session,
+            )
+            response = client.post(
+                "/mcp",
+                json={"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+                headers=session,
+            )
+
+        assert response.status_code == 200
+        assert '"rekall_search"' in response.text
+
+    def test_rejects_foreign_host(self):
+        """Loopback binds should reject DNS-rebinding Host headers."""
+        app = create_http_app(create_mcp_server(), "http")
+
+        with TestClient(app, base_url="http://127.0.0.1:8765") as client:
+            response = client.post(
+                "/mcp", json=INITIALIZE, headers={**HEADERS, "Host": "evil.example"}
+            )
+
+        assert response.status_code == 421
+
+
+def test_unknown_transport():
+    """Should reject unknown transports."""
+    with pytest.raises(ValueError):
+        create_http_app(create_mcp_server(), "carrier-pigeon")
@@ -0,0 +1,167 @@
+"""Tests for process-lifetime MCP server resources."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from rekall.mcp_resources import (
+    ServerResources,
+    close_server_resources,
+    get_server_resources,
+    open_server_resources,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_resources():
+    """Close server resources between tests."""
+    close_server_resources()
+    yield
+    close_server_resources()
+
+
+class TestServerResources:
+    """Tests for ServerResources connection ownership."""
+
+    def test_same_connection_per_thread(self, temp_db_path: Path):
+        """Should return the same long-lived connection on one thread."""
+        resources = ServerResources(temp_db_path)
+        resources.open()
+
+        first = resources.get_db()
+        first.close()  # No-op for pooled connections
+        second = resources.get_db()
+
+        assert first is second
+        assert second.conn is not None
+        second.conn.execute("SELECT 1")
+        resources.close()
+
+    def test_schema_initialized_once(self, temp_db_path: Path, monkeypatch):
+        """Should not re-run init() for later connections."""
+        from rekall.db import Database
+
+        resources = ServerResources(temp_db_path)
+        resources.open()
+
+        calls = []
+        monkeypatch.setattr(Database, "init", lambda self: calls.append(self))
+
+        other: list = []
+        thread = threading.Thread(target=lambda: other.append(resources.get_db()))
+        thread.start()
+        thread.join()
+
+        assert calls == []
+        assert other[0] is not resources.get_db()
+        assert resources.connection_count == 2
+        resources.close()
+        assert resources.connection_count == 0
+
+    def test_connection_usable_across_calls(self, temp_db_path: Path):
+        """Writes through the pooled connection should persist."""
+        from rekall.models import Entry, generate_ulid
+
+        resources = ServerResources(temp_db_path)
+        resources.open()
+        db = resources.get_db()
+
+        entry = Entry(id=generate_ulid(), title="Kept", type="bug")
+        db.add(entry)
+        db.close()
+
+        assert resources.get_db().get(entry.id) is not None
+        resources.close()
+
+
+class TestServerResourcesSingleton:
+    """Tests for the server resources singleton and get_db()."""
+
+    def test_get_db_uses_server_connection(self, temp_db_path: Path):
+        """mcp_server.get_db() should reuse the server connection."""
+        from rekall.mcp_server import get_db
+
+        resources = open_server_resources(temp_db_path)
+
+        assert get_server_resources() is resources
+        assert get_db() is get_db()
+
+    def test_close_resets(self, temp_db_path: Path):
+        """close_server_resources() should clear the singleton."""
+        open_server_resources(temp_db_path)
+        close_server_resources()
+        assert get_server_resources() is None
+
+
+class TestUncommittedWrites:
+    """A failed handler must not leave its write pending on the pooled connection."""
+
+    def _insert(self, db, key: str) -> None:
+        db.conn.execute("INSERT INTO metadata (key, value) VALUES (?, 'x')", (key,))
+
+    def _keys(self, temp_db_path: Path) -> list[str]:
+        import sqlite3
+
+        conn = sqlite3.connect(str(temp_db_path), timeout=0.5)
+        try:
+            # Would raise "database is locked" if the write lock were still held
+            conn.execute("INSERT INTO metadata (key, value) VALUES ('probe', 'x')")
+            conn.commit()
+            return [row[0] for row in conn.execute("SELECT key FROM metadata")]
+        finally:
+            conn.close()
+
+    def test_close_rolls_back(self, temp_db_path: Path):
+        """close() should discard a write that was never committed."""
+        resources = open_server_resources(temp_db_path)
+        db = resources.get_db()
+        self._insert(db, "half-done")
+        db.close()
+
+        assert "half-done" not in self._keys(temp_db_path)
+        assert resources.get_db() is db
+
+    def test_failing_handler_is_rolled_back(self, temp_db_path: Path):
+        """A handler raising after a write should not commit it later."""
+        import asyncio
+
+        from rekall.mcp_dispatch import ToolDispatcher
+
+        resources = open_server_resources(temp_db_path)
+        dispatcher = ToolDispatcher(workers=1, slow_workers=1)
+
+        async def failing(args):
+            self._insert(resources.get_db(), "half-done")
+            raise RuntimeError("boom")
+
+        async def committing(args):
+            db = resources.get_db()
+            self._insert(db, "next-call")
+            db.conn.commit()
+            return "ok"
+
+        async def main():
+            with pytest.raises(RuntimeError):
+                await dispatcher.run("rekall_link", failing, {})
+            return await dispatcher.run("rekall_link", committing, {})
+
+        try:
+            assert asyncio.run(main()) == "ok"
+        finally:
+            dispatcher.shutdown()
+
+        keys = self._keys(temp_db_path)
+        assert "next-call" in keys
+        assert "half-done" not in keys
+
+    def test_batch_transaction_is_kept(self, temp_db_path: Path):
+        """close() inside transaction() should leave the batch to commit."""
+        resources = open_server_resources(temp_db_path)
+        db = resources.get_db()
+        with db.transaction():
+            self._insert(db, "in-batch")
+            db.close()
+        assert "in-batch" in self._keys(temp_db_path)
@@ -0,0 +1,116 @@
+"""Tests for latency instrumentation."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+
+import pytest
+
+from rekall.metrics import (
+    LatencyHistogram,
+    MetricsRegistry,
+    get_metrics,
+    read_snapshots,
+    reset_metrics,
+    stats_dir,
+    write_snapshot,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    """Fresh global registry per test."""
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_within_bucket_precision(self):
+        """Percentiles should be within ~3% of the exact values."""
+        rng = random.Random(42)
+        values = sorted(rng.uniform(0.0005, 0.5) for _ in range(5000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for q in (50, 95, 99):
+            exact_ms = values[int(q / 100 * len(values)) - 1] * 1000
+            assert histogram.percentile(q) == pytest.approx(exact_ms, rel=0.035)
+
+    def test_summary_counts_errors(self):
+        """Should report count, errors and error rate."""
+        histogram = LatencyHistogram()
+        histogram.record(0.010)
+        histogram.record(0.020, error=True)
+
+        summary = histogram.summary()
+
+        assert summary["count"] == 2
+        assert summary["errors"] == 1
+        assert summary["error_rate"] == 0.5
+        assert summary["max_ms"] == pytest.approx(20.0)
+
+    def test_empty(self):
+        """An empty histogram should report zeros."""
+        assert LatencyHistogram().summary()["p99_ms"] == 0.0
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_timer_records_errors(self):
+        """Exceptions inside a timed block should count as errors."""
+        registry = MetricsRegistry()
+
+        with registry.timer("stage"):
+            pass
+        with pytest.raises(RuntimeError):
+            with registry.timer("stage"):
+                raise RuntimeError("boom")
+
+        assert registry.snapshot()["stage"]["errors"] == 1
+        assert registry.snapshot()["stage"]["count"] == 2
+
+    def test_snapshots_of_dead_servers_are_removed(self, tmp_path):
+        """Only snapshots of live processes should be read."""
+        directory = stats_dir(tmp_path)
+        write_snapshot(directory / "live.json", {"pid": os.getpid(), "updated_at": 1})
+        write_snapshot(directory / "dead.json", {"pid": 2**22 + 12345, "updated_at": 2})
+
+        snapshots = read_snapshots(tmp_path)
+
+        assert [s["pid"] for s in snapshots] == [os.getpid()]
+        assert not (directory / "dead.json").exists()
+
+
+class TestServerStats:
+    """Tests for MCP tool instrumentation."""
+
+    def test_dispatch_records_tool_latency(self):
+        """Tool calls and error answers should be recorded per tool."""
+        pytest.importorskip("mcp")
+        from mcp.types import TextContent
+
+        from rekall.mcp_server import _dispatch, collect_server_stats, format_server_stats
+
+        async def ok(args):
+            return [TextContent(type="text", text="fine")]
+
+        async def failing(args):
+            return [TextContent(type="text", text="Error: nope")]
+
+        asyncio.run(_dispatch("rekall_help", ok, {}))
+        asyncio.run(_dispatch("rekall_help", failing, {}))
+
+        metrics = get_metrics().snapshot()["tool.rekall_help"]
+        assert metrics["count"] == 2
+        assert metrics["errors"] == 1
+
+        report = format_server_stats(collect_server_stats())
+        assert "tool.rekall_help" in report
+        assert "p95 ms" in report
@@ -317,3 +317,149 @@ class TestModelManagerSingleton:
 
             # Old manager should have been unloaded
             assert manager.is_loaded() is False
+
+
+class TestModelManagerMemoryBudget:
+    """Test memory budget and background monitor."""
+
+    def test_check_memory_disabled_by_default(self, mock_sentence_transformers) -> None:
+        """Test check_memory does nothing without a budget."""
+        manager = ModelManager()
+        manager.get_model()
+
+        assert manager.check_memory() is False
+        assert manager.is_loaded() is True
+
+    def test_check_memory_unloads_over_budget(self, mock_sentence_transformers) -> None:
+        """Test exceeding the budget unloads the model and runs callbacks."""
+        manager = ModelManager(memory_budget_mb=100)
+        manager.get_model()
+        released = []
+        manager.add_release_callback(lambda: released.append(True))
+
+        with patch("rekall.model_manager.get_rss_mb", return_value=500.0):
+            assert manager.check_memory() is True
+
+        assert manager.is_loaded() is False
+        assert released == [True]
+        assert manager.stats["pressure_unloads"] == 1
+
+    def test_check_memory_under_budget(self, mock_sentence_transformers) -> None:
+        """Test staying under the budget keeps the model."""
+        manager = ModelManager(memory_budget_mb=1000)
+        manager.get_model()
+
+        with patch("rekall.model_manager.get_rss_mb", return_value=200.0):
+            assert manager.check_memory() is False
+
+        assert manager.is_loaded() is True
+
+    def test_release_clears_embedding_cache(self, mock_sentence_transformers) -> None:
+        """Test memory release drops the vector cache."""
+        import numpy as np
+
+        from rekall.cache import get_embedding_cache, reset_embedding_cache
+
+        reset_embedding_cache()
+        cache = get_embedding_cache()
+        cache.put("a", np.zeros(4, dtype=np.float32))
+
+        manager = ModelManager()
+        manager.get_model()
+        manager.release_memory()
+
+        assert len(cache) == 0
+        reset_embedding_cache()
+
+    def test_monitor_unloads_idle_model(self, mock_sentence_transformers) -> None:
+        """Test the background monitor unloads an idle model."""
+        manager = ModelManager(timeout_minutes=0.001)  # 60ms
+        manager.get_model()
+
+        manager.start_monitor(interval_seconds=0.05)
+        try:
+            for _ in range(40):
+                if not manager.is_loaded():
+                    break
+                sleep(0.05)
+        finally:
+            manager.stop_monitor()
+
+        assert manager.is_loaded() is False
+        assert manager.stats["monitor_running"] is False
+
+    def test_preload_loads_in_background(self, mock_sentence_transformers) -> None:
+        """Test preload loads the model on a background thread."""
+        manager = ModelManager()
+
+        thread = manager.preload()
+        thread.join(timeout=5)
+
+        assert manager.is_loaded() is True
+
+    def test_preload_failure_is_logged(self) -> None:
+        """Test preload does not raise when the model cannot load."""
+        manager = ModelManager()
+        original = sys.modules.pop("sentence_transformers", None)
+        try:
+            thread = manager.preload()
+            thread.join(timeout=5)
+        finally:
+            if original is not None:
+                sys.modules["sentence_transformers"] = original
+
+        assert manager.is_loaded() is False
+
+
+class TestModelManagerSingleOwner:
+    """Test the manager as the single owner of the embedding model."""
+
+    def setup_method(self) -> None:
+        """Reset singletons before each test."""
+        from rekall.embeddings import reset_embedding_service
+
+        reset_embedding_service()
+        reset_model_manager()
+
+    def teardown_method(self) -> None:
+        """Reset singletons after each test."""
+        from rekall.embeddings import reset_embedding_service
+
+        reset_embedding_service()
+        reset_model_manager()
+
+    def test_different_model_replaces_manager(self) -> None:
+        """Test requesting another model unloads and replaces the manager."""
+        first = get_model_manager(model_name="hashing", target_dimensions=128)
+        first.get_model()
+
+        second = get_model_manager(model_name="hashing", target_dimensions=384)
+
+        assert second is not first
+        assert first.is_loaded() is False
+        assert get_model_manager(model_name="hashing", target_dimensions=384) is second
+
+    def test_service_uses_manager_model(self) -> None:
+        """Test EmbeddingService encodes with the manager's model."""
+        from rekall.embeddings import EmbeddingService
+
+        service = EmbeddingService(model_name="hashing", dimensions=128)
+        assert service.calculate("sqlite connection pool") is not None
+
+        manager = get_model_manager(model_name="hashing", target_dimensions=128)
+        assert manager.is_loaded() is True
+        assert service._model is None
+        assert service.get_model_status()["model_loaded"] is True
+
+    def test_unload_releases_service_model(self) -> None:
+        """Test unloading through the manager is visible to the service."""
+        from rekall.embeddings import EmbeddingService
+
+        service = EmbeddingService(model_name="hashing", dimensions=128)
+        service.calculate("sqlite connection pool")
+
+        get_model_manager(model_name="hashing", target_dimensions=128).unload()
+
+        assert service.get_model_status()["model_loaded"] is False
+        # Reloaded transparently on next use
+        assert service.calculate("sqlite connection pool") is not None
@@ -0,0 +1,176 @@
+"""Tests for the generation-keyed MCP response cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from rekall.response_cache import ResponseCache, normalize_arguments
+
+
+@pytest.fixture
+def db(temp_db_path: Path):
+    """Initialized database."""
+    from rekall.db import Database
+
+    db = Database(temp_db_path)
+    db.init()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def cache(db):
+    """Response cache on the test database."""
+    cache = ResponseCache(db.db_path, maxsize=2)
+    yield cache
+    cache.close()
+
+
+def _add_entry(db, title: str = "Entry") -> None:
+    from rekall.models import Entry, generate_ulid
+
+    db.add(Entry(id=generate_ulid(), title=title, type="bug"))
+
+
+class TestNormalizeArguments:
+    """Tests for argument normalization."""
+
+    def test_key_order_and_none_ignored(self):
+        assert normalize_arguments({"b": 1, "a": 2}) == normalize_arguments(
+            {"a": 2, "b": 1, "c": None}
+        )
+
+    def test_empty(self):
+        assert normalize_arguments(None) == normalize_arguments({})
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_hit_after_put(self, cache):
+        generation = cache.generation()
+        assert cache.get("rekall_show", {"id": "x"}) is None
+        assert cache.put("rekall_show", {"id": "x"}, ["response"], generation)
+
+        assert cache.get("rekall_show", {"id": "x"}) == ["response"]
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_invalidated_by_commit_on_other_connection(self, cache, db):
+        cache.put("rekall_info", {}, ["before"], cache.generation())
+
+        _add_entry(db)
+
+        assert cache.get("rekall_info", {}) is None
+        assert cache.stats["stale"] == 1
+
+    def test_invalidated_by_in_process_write(self, cache):
+        cache.put("rekall_info", {}, ["before"], cache.generation())
+
+        cache.note_write()
+
+        assert cache.get("rekall_info", {}) is None
+
+    def test_put_dropped_when_write_happened_meanwhile(self, cache):
+        generation = cache.generation()
+        cache.note_write()
+
+        assert cache.put("rekall_info", {}, ["racy"], generation) is False
+        assert cache.get("rekall_info", {}) is None
+
+    def test_lru_eviction(self, cache):
+        for i in range(3):
+            cache.put("rekall_show", {"id": i}, [i], cache.generation())
+
+        assert cache.get("rekall_show", {"id": 0}) is None
+        assert cache.get("rekall_show", {"id": 2}) == [2]
+        assert cache.stats["size"] == 2
+
+    def test_put_dropped_when_database_changed_meanwhile(self, cache, db):
+        generation = cache.generation()
+        _add_entry(db)
+
+        assert cache.put("rekall_info", {}, ["racy"], generation) is False
+        assert cache.get("rekall_info", {}) is None
+
+    def test_access_tracking_keeps_cache_valid(self, cache, db):
+        from rekall.models import Entry, generate_ulid
+
+        entry = Entry(id=generate_ulid(), title="Tracked", type="bug")
+        db.add(entry)
+        cache.put("rekall_show", {"id": entry.id}, ["shown"], cache.generation())
+
+        cache.record_access([entry.id])
+
+        assert cache.get("rekall_show", {"id": entry.id}) == ["shown"]
+        assert db.get(entry.id, update_access=False).access_count == 1
+
+
+class TestCachedDispatch:
+    """Tests for the response cache in MCP tool dispatch."""
+
+    @pytest.fixture
+    def server_cache(self, db):
+        from rekall.response_cache import start_response_cache, stop_response_cache
+
+        pytest.importorskip("mcp")
+        cache = start_response_cache(db.db_path)
+        yield cache
+        stop_response_cache()
+
+    def _text(self, text: str) -> list:
+        from mcp.types import TextContent
+
+        return [TextContent(type="text", text=text)]
+
+    def test_errors_are_not_cached(self, server_cache):
+        import asyncio
+
+        from rekall.mcp_server import _dispatch
+
+        calls = []
+
+        async def failing(args):
+            calls.append(args)
+            return self._text("Error: database is locked")
+
+        asyncio.run(_dispatch("rekall_info", failing, {}))
+        asyncio.run(_dispatch("rekall_info", failing, {}))
+
+        assert len(calls) == 2
+
+    def test_cache_hit_records_access(self, server_cache, db):
+        import asyncio
+
+        from rekall.mcp_server import _dispatch, _record_access
+        from rekall.models import Entry, generate_ulid
+
+        entry = Entry(id=generate_ulid(), title="Shown", type="bug")
+        db.add(entry)
+        calls = []
+
+        async def show(args):
+            calls.append(args)
+            _record_access(db, [args["id"]])
+            return self._text(entry.title)
+
+        for _ in range(3):
+            asyncio.run(_dispatch("rekall_show", show, {"id": entry.id}))
+
+        assert len(calls) == 1
+        assert db.get(entry.id, update_access=False).access_count == 3
+
+    def test_uncached_reads_keep_cache(self, server_cache):
+        import asyncio
+
+        from rekall.mcp_server import _dispatch
+
+        async def read(args):
+            return self._text("ok")
+
+        asyncio.run(_dispatch("rekall_info", read, {}))
+        asyncio.run(_dispatch("rekall_suggest", read, {}))
+
+        assert server_cache.get("rekall_info", {}) is not None
@@ -32,6 +32,17 @@ from rekall.transcript.parser_base import ParserError
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def transcript_index(tmp_path, monkeypatch):
+    """Keep transcript cursors in a temporary directory."""
+    from rekall.transcript import index
+
+    store = index.TranscriptIndex(tmp_path / "transcript_index")
+    monkeypatch.setattr(index, "_transcript_index", store)
+    return store
+
+
+
 @pytest.fixture
 def claude_jsonl_content():
     """Sample Claude Code JSONL transcript."""
@@ -158,6 +169,282 @@ class TestClaudeTranscriptParser:
         assert parser.normalize_role("claude") == "assistant"
 
 
+# =============================================================================
+# JSONL tail reader Tests
+# =============================================================================
+
+
+class TestJsonlTailReader:
+    """Tests for the reverse-seeking tail reader and the line index cache."""
+
+    def test_iter_lines_reversed_small_blocks(self, tmp_path):
+        from rekall.transcript.tail import iter_lines_reversed
+
+        data = b"first\n\nsecond line\n" + b"x" * 50 + b"\nlast"
+        file = tmp_path / "lines.txt"
+        file.write_bytes(data)
+
+        with open(file, "rb") as f:
+            lines = list(iter_lines_reversed(f, len(data), block_size=7))
+
+        assert [line for _, line in reversed(lines)] == data.split(b"\n")
+        for offset, line in lines:
+            assert data[offset:offset + len(line)] == line
+
+    def test_parse_last_n_matches_full_parse(self, tmp_path):
+        parser = ClaudeTranscriptParser()
+        lines = []
+        for i in range(300):
+            lines.append(json.dumps({"type": "human", "message": {"content": f"question {i} " + "x" * (i % 97)}}))
+            if i % 10 == 0:
+                lines.append("not json")
+                lines.append(json.dumps({"type": "summary", "summary": "skipped"}))
+            lines.append(json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": f"answer {i}"}]}}))
+        file = tmp_path / "transcript.jsonl"
+        file.write_text("\n".join(lines) + "\n")
+
+        full = parser.parse(file)
+        messages, total = parser.parse_last_n(file, n=25)
+
+        assert total == len(full) == 600
+        assert messages == full[-25:]
+
+    def test_count_resumes_after_append(self, tmp_path, monkeypatch):
+        parser = ClaudeTranscriptParser()
+        file = tmp_path / "transcript.jsonl"
+        file.write_text(json.dumps({"type": "human", "message": {"content": "one"}}) + "\n")
+        assert parser.parse_last_n(file, n=5)[1] == 1
+
+        parsed_lines = []
+        original = parser._parse_line
+        monkeypatch.setattr(parser, "_parse_line", lambda line, *args: parsed_lines.append(line) or original(line, *args))
+
+        with open(file, "a") as f:
+            f.write(json.dumps({"type": "assistant", "message": {"content": "two"}}))
+        messages, total = parser.parse_last_n(file, n=5)
+
+        assert total == 2
+        assert [m.content for m in messages] == ["one", "two"]
+        assert [m.index for m in messages] == [0, 1]
+        # The count only read the appended (incomplete) line
+        assert sum(b"one" in line for line in parsed_lines) == 1
+
+    def test_truncated_transcript_is_recounted(self, tmp_path):
+        parser = ClaudeTranscriptParser()
+        file = tmp_path / "transcript.jsonl"
+        file.write_text("".join(
+            json.dumps({"type": "human", "message": {"content": f"m{i}"}}) + "\n" for i in range(10)
+        ))
+        assert parser.parse_last_n(file, n=3)[1] == 10
+
+        file.write_text(json.dumps({"type": "human", "message": {"content": "new"}}) + "\n")
+        messages, total = parser.parse_last_n(file, n=3)
+
+        assert total == 1
+        assert messages[0].content == "new"
+
+
+class TestTranscriptCursors:
+    """Tests for the persisted incremental transcript cursors."""
+
+    @staticmethod
+    def _line(i):
+        return json.dumps({"type": "human", "message": {"content": f"m{i}"}}) + "\n"
+
+    def _count_parsed(self, parser, monkeypatch):
+        parsed = []
+        original = parser._parse_line
+        monkeypatch.setattr(parser, "_parse_line", lambda line, *args: parsed.append(line) or original(line, *args))
+        return parsed
+
+    def test_cursor_survives_restart(self, tmp_path, transcript_index, monkeypatch):
+        from rekall.transcript import index
+
+        file = tmp_path / "transcript.jsonl"
+        file.write_text("".join(self._line(i) for i in range(100)))
+        ClaudeTranscriptParser().parse_last_n(file, n=5)
+
+        # New process: empty memory, cursor read back from disk
+        monkeypatch.setattr(index, "_transcript_index", index.TranscriptIndex(transcript_index.directory))
+        with open(file, "a") as f:
+            f.write(self._line(100))
+        parser = ClaudeTranscriptParser()
+        parsed = self._count_parsed(parser, monkeypatch)
+
+        messages, total = parser.parse_last_n(file, n=3)
+
+        assert total == 101
+        assert [m.content for m in messages] == ["m98", "m99", "m100"]
+        assert [m.index for m in messages] == [98, 99, 100]
+        # Appended line + the three recent lines read by offset
+        assert len(parsed) == 4
+
+    def test_unchanged_transcript_is_not_reparsed(self, tmp_path, monkeypatch):
+        parser = ClaudeTranscriptParser()
+        file = tmp_path / "transcript.jsonl"
+        file.write_text("".join(self._line(i) for i in range(10)))
+        first = parser.parse(file)
+        parsed = self._count_parsed(parser, monkeypatch)
+
+        assert parser.parse(file) == first
+        assert parsed == []
+
+        with open(file, "a") as f:
+            f.write(self._line(10))
+        messages = parser.parse(file)
+
+        assert len(messages) == 11
+        assert messages[-1].index == 10
+        assert len(parsed) == 1
+
+    def test_rotation_falls_back_to_full_parse(self, tmp_path):
+        parser = ClaudeTranscriptParser()
+        file = tmp_path / "transcript.jsonl"
+        file.write_text("".join(self._line(i) for i in range(10)))
+        parser.parse_last_n(file, n=3)
+
+        rotated = tmp_path / "rotated.jsonl"
+        rotated.write_text("".join(self._line(i) for i in range(50, 62)))
+        rotated.replace(file)
+        messages, total = parser.parse_last_n(file, n=2)
+
+        assert total == 12
+        assert [m.content for m in messages] == ["m60", "m61"]
+
+    def test_rewrite_in_place_is_detected(self, tmp_path):
+        parser = ClaudeTranscriptParser()
+        file = tmp_path / "transcript.jsonl"
+        file.write_text("".join(self._line(i) for i in range(5)))
+        parser.parse_last_n(file, n=3)
+
+        # Same inode, longer content, different bytes before the old offset
+        with open(file, "r+") as f:
+            f.write("".join(self._line(i) for i in range(100, 108)))
+        messages, total = parser.parse_last_n(file, n=1)
+
+        assert total == 8
+        assert messages[0].content == "m107"
+
+    def test_n_larger_than_ring_reads_backwards(self, tmp_path):
+        from rekall.transcript.index import RECENT_SIZE
+
+        parser = ClaudeTranscriptParser()
+        file = tmp_path / "transcript.jsonl"
+        file.write_text("".join(self._line(i) for i in range(RECENT_SIZE + 30)))
+
+        messages, total = parser.parse_last_n(file, n=RECENT_SIZE + 10)
+
+        assert total == RECENT_SIZE + 30
+        assert messages == parser.parse(file)[-(RECENT_SIZE + 10):]
+
+
+# =============================================================================
+# Streaming JSON reader Tests
+# =============================================================================
+
+
+class TestJsonStreamReader:
+    """Tests for the streaming JSON reader used by the JSON parsers."""
+
+    def test_walks_structure_across_small_chunks(self):
+        import io
+
+        from rekall.transcript.json_stream import JsonStreamReader
+
+        text = '{"meta": {"a": [1, 2]}, "messages": [ {"x": "\\u00e9\\"q"}, 12345, "s" , true ] }  '
+        reader = JsonStreamReader(io.StringIO(text), chunk_size=3)
+
+        seen = {}
+        for key in reader.iter_object():
+            if key == "messages":
+                seen[key] = [reader.read_value() for _ in reader.iter_array()]
+            else:
+                reader.skip_value()
+        reader.finish()
+
+        assert seen == {"messages": [{"x": "\u00e9\"q"}, 12345, "s", True]}
+
+    @pytest.mark.parametrize("text", ['[1, 2', '{"a" 1}', '[1] [2]', '{"a": tru}'])
+    def test_invalid_json(self, text):
+        import io
+
+        from rekall.transcript.json_stream import JsonStreamError, JsonStreamReader
+
+        reader = JsonStreamReader(io.StringIO(text), chunk_size=2)
+        with pytest.raises(JsonStreamError):
+            if reader.peek() == "[":
+                for _ in reader.iter_array():
+                    reader.skip_value()
+            else:
+                for _ in reader.iter_object():
+                    reader.skip_value()
+            reader.finish()
+
+    def test_parse_last_n_keeps_bounded_tail(self, tmp_path):
+        parser = ClineTranscriptParser()
+        conversation = [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"}
+            for i in range(1000)
+        ]
+        conversation.insert(10, {"role": "system", "content": "ignored"})
+        file = tmp_path / "api_conversation_history.json"
+        file.write_text(json.dumps({"metadata": {"task": "x"}, "conversation": conversation}))
+
+        messages, total = parser.parse_last_n(file, n=3)
+
+        assert total == 1000
+        assert [m.content for m in messages] == ["message 997", "message 998", "message 999"]
+        # Index is the position in the raw array (system message included)
+        assert messages[-1].index == 1000
+        assert parser.parse(file)[-3:] == messages
+
+    def test_cline_key_priority(self, tmp_path):
+        parser = ClineTranscriptParser()
+        file = tmp_path / "conversation.json"
+        file.write_text(json.dumps({
+            "history": [{"role": "user", "content": "from history"}],
+            "messages": [{"role": "user", "content": "from messages"}],
+        }))
+
+        assert [m.content for m in parser.parse(file)] == ["from messages"]
+
+    def test_invalid_json_raises_parser_error(self, tmp_path):
+        file = tmp_path / "broken.json"
+        file.write_text('{"messages": [{"role": "user", "content": "x"}')
+
+        for parser in (ClineTranscriptParser(), ContinueTranscriptParser(), GenericJsonParser()):
+            with pytest.raises(ParserError, match="Invalid JSON"):
+                parser.parse_last_n(file, n=2)
+
+    def test_continue_indices_span_sessions(self, continue_json_content, tmp_path):
+        parser = ContinueTranscriptParser()
+        file = tmp_path / "session.json"
+        file.write_text(continue_json_content)
+
+        messages, total = parser.parse_last_n(file, n=3)
+
+        assert total == 4
+        assert [m.index for m in messages] == [1, 2, 3]
+
+    def test_generic_search_order(self, tmp_path):
+        parser = GenericJsonParser()
+        file = tmp_path / "export.json"
+        file.write_text(json.dumps({
+            "meta": {"messages": [{"role": "user", "text": "nested"}]},
+            "items": [1, 2, 3],
+            "chat": [{"role": "user", "text": "chat"}],
+        }))
+
+        # Priority keys at the top level win over nested arrays
+        assert [m.content for m in parser.parse(file)] == ["chat"]
+
+        file.write_text(json.dumps({
+            "meta": {"messages": [{"role": "user", "text": "nested"}]},
+            "other": {"history": [{"role": "user", "text": "later"}]},
+        }))
+        assert [m.content for m in parser.parse(file)] == ["nested"]
+
+
 # =============================================================================
 # ClineTranscriptParser Tests
 # =============================================================================
@@ -0,0 +1,173 @@
+"""Tests for the MCP server's background warm-up."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from rekall.warmup import (
+    ServerWarmup,
+    get_server_warmup,
+    prepare_server_warmup,
+    reset_server_warmup,
+    semantic_ready,
+    start_server_warmup,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_warmup():
+    """No server warm-up outside each test."""
+    reset_server_warmup()
+    yield
+    reset_server_warmup()
+
+
+class FakeService:
+    """Embedding service stand-in whose vector load can be held back."""
+
+    available = True
+    model_name = "fake-model"
+    dimensions = 128
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def preload_vectors(self, db) -> int:
+        self.release.wait(5.0)
+        return 3
+
+
+class TestServerWarmup:
+    """Tests for ServerWarmup."""
+
+    def test_without_service_skips_semantic_stages(self, tmp_path: Path):
+        """Only the database stage should run when embeddings are off."""
+        db_path = tmp_path / "knowledge.db"
+        db_path.write_bytes(b"x" * 4096)
+        warmup = ServerWarmup(db_path, get_db=lambda: None)
+
+        assert not warmup.semantic_ready()
+        assert warmup.start()
+        assert not warmup.start()
+        assert warmup.wait(5.0)
+
+        status = warmup.status()
+        assert status["database"]["state"] == "done"
+        assert status["database"]["detail"] == "4 KiB read"
+        assert status["model"]["state"] == "skipped"
+        assert warmup.semantic_ready()
+
+    def test_semantic_ready_after_vectors(self, tmp_path: Path, monkeypatch):
+        """Semantic search should wait for the model and vector stages."""
+        from rekall import model_manager
+
+        class FakeManager:
+            def get_model(self):
+                return object()
+
+        monkeypatch.setattr(model_manager, "get_model_manager", lambda **kw: FakeManager())
+        service = FakeService()
+        progress = []
+        warmup = ServerWarmup(
+            tmp_path / "missing.db", lambda: None, service, on_progress=lambda: progress.append(1)
+        )
+
+        warmup.start()
+        assert not warmup.wait(0.2)
+        assert not warmup.semantic_ready()
+
+        service.release.set()
+        assert warmup.wait(5.0)
+        assert warmup.semantic_ready()
+        assert warmup.status()["vectors"]["detail"] == "3 vectors"
+        assert len(progress) == 3
+
+    def test_failed_stage_does_not_block(self, tmp_path: Path, monkeypatch):
+        """A failing stage should be reported and not hold back search."""
+        from rekall import model_manager
+
+        def broken(**kwargs):
+            raise RuntimeError("no model")
+
+        monkeypatch.setattr(model_manager, "get_model_manager", broken)
+        service = FakeService()
+        service.release.set()
+        warmup = ServerWarmup(tmp_path / "missing.db", lambda: None, service)
+
+        warmup.start()
+        assert warmup.wait(5.0)
+        assert warmup.status()["model"] == {
+            "state": "failed", "seconds": pytest.approx(0.0, abs=1.0), "detail": "no model",
+        }
+        assert warmup.semantic_ready()
+
+    def test_module_singleton(self, tmp_path: Path):
+        """semantic_ready() should be True when no warm-up is prepared."""
+        assert semantic_ready()
+        start_server_warmup()  # No-op without a prepared warm-up
+
+        warmup = prepare_server_warmup(tmp_path / "missing.db", lambda: None)
+        assert get_server_warmup() is warmup
+        assert not semantic_ready()
+
+        start_server_warmup()
+        assert warmup.wait(5.0)
+        assert semantic_ready()
+
+
+class TestWarmupInTools:
+    """Tests for warm-up aware MCP handlers."""
+
+    @pytest.fixture
+    def db(self, temp_db_path: Path):
+        pytest.importorskip("mcp")
+        from conftest import make_config_with_db_path
+
+        from rekall.config import set_config
+        from rekall.db import Database
+
+        config = make_config_with_db_path(temp_db_path)
+        config.smart_embeddings_enabled = True
+        set_config(config)
+        db = Database(temp_db_path)
+        db.init()
+        yield db
+        db.close()
+
+    def test_search_degrades_to_fts_while_warming(self, db, monkeypatch):
+        """A search with context should not wait on the model mid-warm-up."""
+        from rekall import embeddings
+        from rekall.mcp_server import _handle_search
+        from rekall.models import Entry, generate_ulid
+
+        def no_hybrid(*args, **kwargs):
+            raise AssertionError("hybrid search must not run while warming up")
+
+        monkeypatch.setattr(embeddings, "get_embedding_service", no_hybrid)
+        db.add(Entry(id=generate_ulid(), title="nginx timeout", type="bug"))
+        prepare_server_warmup(db.db_path, lambda: db)
+
+        text = asyncio.run(
+            _handle_search({"query": "nginx", "context": "proxy errors"})
+        )[0].text
+
+        assert "nginx timeout" in text
+        assert "warming up" in text
+
+    def test_info_shows_warmup_status(self, db):
+        """rekall_info should list every warm-up stage."""
+        from rekall.mcp_server import _handle_info
+
+        warmup = prepare_server_warmup(db.db_path, lambda: db)
+        warmup.start()
+        warmup.wait(5.0)
+
+        text = asyncio.run(_handle_info({}))[0].text
+
+        assert "## Server warm-up" in text
+        assert "- database: done" in text
+        assert "- vectors: skipped - embeddings disabled" in text
@@ -0,0 +1,285 @@
+"""Tests for the sources watcher (rekall sources watch) and lock files."""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+WEBFETCH = '{{"type": "tool_use", "name": "WebFetch", "input": {{"url": "{}"}}}}\n'
+
+
+@pytest.fixture
+def conv_dir(tmp_path: Path) -> Path:
+    conv_dir = tmp_path / ".claude" / "projects" / "test-project" / "conversations"
+    conv_dir.mkdir(parents=True)
+    return conv_dir
+
+
+@pytest.fixture
+def connector(tmp_path: Path, conv_dir: Path):
+    from rekall.connectors.claude_cli import ClaudeCLIConnector
+
+    connector = ClaudeCLIConnector()
+    connector.PROJECTS_DIR = tmp_path / ".claude" / "projects"
+    return connector
+
+
+class FakeWatcher:
+    """Watcher replaying scripted events."""
+
+    def __init__(self, clock, events):
+        self.clock = clock
+        self.events = list(events)  # (time, tags)
+        self.paths = set()
+
+    def add(self, path, tag):
+        self.paths.add(path)
+        return True
+
+    def watched(self):
+        return set(self.paths)
+
+    def wait(self, timeout):
+        if self.events and self.events[0][0] <= self.clock.now + timeout:
+            at, tags = self.events.pop(0)
+            self.clock.now = max(self.clock.now, at)
+            return set(tags)
+        self.clock.now += timeout
+        return set()
+
+    def close(self):
+        pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFileLock:
+    """Tests for FileLock."""
+
+    def test_single_holder(self, tmp_path: Path):
+        """A second lock on the same file should fail until the first is released."""
+        from rekall.filelock import FileLock
+
+        first = FileLock(tmp_path / "x.lock")
+        second = FileLock(tmp_path / "x.lock")
+        assert first.acquire()
+        assert not second.acquire()
+        assert second.is_held()
+        assert second.owner_pid() == first.owner_pid()
+
+        first.release()
+        assert not second.is_held()
+        assert second.acquire()
+        second.release()
+
+    def test_context_manager_raises_when_held(self, tmp_path: Path):
+        """The context manager should not wait for the lock."""
+        from rekall.filelock import FileLock
+
+        with FileLock(tmp_path / "x.lock"):
+            with pytest.raises(BlockingIOError):
+                with FileLock(tmp_path / "x.lock"):
+                    pass
+
+    def test_one_watcher_per_database(self, temp_db_path: Path):
+        """acquire_watch_lock should refuse a second watcher."""
+        from rekall.watcher import acquire_watch_lock
+
+        lock = acquire_watch_lock(temp_db_path)
+        try:
+            with pytest.raises(BlockingIOError):
+                acquire_watch_lock(temp_db_path)
+        finally:
+            lock.release()
+        acquire_watch_lock(temp_db_path).release()
+
+
+class TestPollingWatcher:
+    """Tests for PollingWatcher."""
+
+    def test_reports_changed_directories(self, tmp_path: Path):
+        """Created and modified files should report the directory tag."""
+        from rekall.watcher import PollingWatcher
+
+        a, b = tmp_path / "a", tmp_path / "b"
+        a.mkdir()
+        b.mkdir()
+        watcher = PollingWatcher(interval=0)
+        assert watcher.add(a, "claude")
+        assert watcher.add(b, "cursor")
+        assert watcher.poll() == set()
+
+        (a / "conv.jsonl").write_text("{}\n")
+        assert watcher.poll() == {"claude"}
+        assert watcher.poll() == set()
+
+    def test_missing_directory(self, tmp_path: Path):
+        """Directories that cannot be read should not be watched."""
+        from rekall.watcher import PollingWatcher
+
+        assert not PollingWatcher().add(tmp_path / "missing", "claude")
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+class TestInotifyWatcher:
+    """Tests for InotifyWatcher."""
+
+    def test_reports_writes(self, tmp_path: Path):
+        """Appending to a file should be reported with the directory tag."""
+        from rekall.watcher import InotifyWatcher
+
+        watcher = InotifyWatcher()
+        try:
+            assert watcher.add(tmp_path, "claude")
+            assert watcher.wait(0) == set()
+
+            with open(tmp_path / "conv.jsonl", "a") as f:
+                f.write("{}\n")
+            assert watcher.wait(2.0) == {"claude"}
+        finally:
+            watcher.close()
+
+    def test_deleted_directory_is_forgotten(self, tmp_path: Path):
+        """A removed directory should leave the watched set."""
+        from rekall.watcher import InotifyWatcher
+
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        watcher = InotifyWatcher()
+        try:
+            watcher.add(sub, "claude")
+            sub.rmdir()
+            assert watcher.wait(2.0) == {"claude"}
+            watcher.wait(0.1)
+            assert sub not in watcher.watched()
+        finally:
+            watcher.close()
+
+
+class TestSourcesWatcher:
+    """Tests for the debounced watch loop."""
+
+    def _run(self, events, debounce=2.0, max_delay=30.0, until=60.0):
+        from rekall.watcher import SourcesWatcher
+
+        clock = FakeClock()
+        scans = []
+        stop = threading.Event()
+
+        def fake_scan(names):
+            scans.append((clock.now, sorted(names)))
+            return []
+
+        daemon = SourcesWatcher(
+            db=None,
+            connectors=["claude", "cursor"],
+            debounce=debounce,
+            max_delay=max_delay,
+            watcher=FakeWatcher(clock, events),
+            clock=clock,
+        )
+        daemon.refresh_watches = lambda: 0
+        daemon.scan = fake_scan
+
+        original_wait = daemon.watcher.wait
+
+        def wait(timeout):
+            if clock.now >= until:
+                stop.set()
+            return original_wait(timeout)
+
+        daemon.watcher.wait = wait
+        daemon.run(stop)
+        return scans
+
+    def test_burst_is_debounced(self):
+        """A burst of writes should trigger a single scan after the quiet period."""
+        scans = self._run([(5.0, {"claude"}), (5.5, {"claude"}), (6.0, {"cursor"})])
+
+        assert scans[0] == (0.0, ["claude", "cursor"])  # initial scan
+        assert scans[1:] == [(8.0, ["claude", "cursor"])]
+
+    def test_continuous_writes_hit_max_delay(self):
+        """Writes that never stop should still be scanned after max_delay."""
+        events = [(1.0 + i, {"claude"}) for i in range(20)]
+        scans = self._run(events, debounce=2.0, max_delay=5.0, until=10.0)
+
+        assert scans[1] == (6.0, ["claude"])
+
+    def test_scan_imports_new_urls(self, connector, conv_dir: Path, temp_db_path: Path):
+        """scan() should import URLs written since the last scan."""
+        from rekall.connectors.resolver import HostResolver
+        from rekall.db import Database
+        from rekall.watcher import PollingWatcher, SourcesWatcher
+
+        db = Database(temp_db_path)
+        db.init()
+        conv = conv_dir / "conv.jsonl"
+        conv.write_text(WEBFETCH.format("https://one.com/"))
+
+        results = []
+        watcher = PollingWatcher(interval=0)
+        daemon = SourcesWatcher(db, ["claude"], watcher=watcher, on_scan=results.append)
+        resolver = HostResolver(resolve=lambda hostname: ["93.184.216.34"])
+        with patch("rekall.connectors.get_connector", return_value=connector), patch(
+            "rekall.connectors.resolver._host_resolver", resolver
+        ):
+            daemon.refresh_watches()
+            assert conv_dir in watcher.watched()
+            assert daemon.scan({"claude"})[0].imported == 1
+
+            with open(conv, "a") as f:
+                f.write(WEBFETCH.format("https://two.com/"))
+            assert watcher.poll() == {"claude"}
+            assert daemon.scan({"claude"})[0].imported == 1
+
+        assert [r[0].imported for r in results] == [1, 1]
+        db.close()
+
+    def test_failing_connector_does_not_stop_the_loop(self, temp_db_path: Path):
+        """A connector raising should be reported as failed and others still scanned."""
+        from rekall.autoscan import ScanResult
+        from rekall.watcher import PollingWatcher, SourcesWatcher
+
+        def scan_connector(db, name, force=False):
+            if name == "claude":
+                raise RuntimeError("database is locked")
+            return ScanResult(connector=name, success=True, imported=2)
+
+        results = []
+        daemon = SourcesWatcher(
+            None, ["claude", "cursor"], watcher=PollingWatcher(interval=0),
+            on_scan=results.append,
+        )
+        daemon.refresh_watches = lambda: 0
+        stop = threading.Event()
+        stop.set()
+        with patch("rekall.autoscan.scan_connector", side_effect=scan_connector):
+            daemon.run(stop)
+
+        failed, scanned = results[0]
+        assert (failed.connector, failed.success, failed.error) == (
+            "claude", False, "database is locked"
+        )
+        assert scanned.imported == 2
+
+    def test_no_background_autoscan_while_watching(self, temp_db_path: Path):
+        """The watcher scans on its own: autoscan should not start a second scanner."""
+        from rekall.autoscan import launch_background_autoscan
+        from rekall.watcher import acquire_watch_lock
+
+        lock = acquire_watch_lock(temp_db_path)
+        try:
+            with patch("rekall.autoscan.subprocess.Popen") as popen:
+                assert launch_background_autoscan(temp_db_path, ["cursor"], 5.0) is None
+            popen.assert_not_called()
+        finally:
+            lock.release()